@@ -0,0 +1,232 @@
+#!/usr/bin/env python
+"""
+Benchmark for the markup preprocessors.
+
+Times the Jira markup <-> Markdown converters and the Confluence storage
+format -> Markdown pipeline against the original implementations kept in
+tests/fixtures/legacy_markup.py, checks that both produce identical output, and
+reports throughput in MB/s.
+
+Usage:
+    python scripts/benchmark_preprocessing.py [--size-kb 100] [--html-size-kb 2048]
+                                              [--repeat 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections.abc import Callable
+
+# Add the parent directory to the path so we can import the test fixtures
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mcp_atlassian.preprocessing.confluence import ConfluencePreprocessor
+from mcp_atlassian.preprocessing.jira import JiraPreprocessor
+from tests.fixtures.legacy_markup import (
+    legacy_jira_to_markdown,
+    legacy_markdown_to_jira,
+    legacy_process_html_content,
+)
+
+JIRA_SAMPLE = """h2. Summary
+The *import job* fails for _large_ tenants. See [runbook|https://example.com/runbook]
+and {{ImportWorker}} for details. Owner: [~jdoe], tracked in PROJ-123.
+
+# Reproduce with a tenant over 10k items
+## Wait for the nightly run
+* Check the dashboard !graph.png|width=300!
+- Compare with {color:red}yesterday{color}
+
+||Step||Result||
+|import|failed|
+
+{code:python}
+def run(job):
+    return job.execute(batch_size=500)
+{code}
+
+bq. Reported by support.
+"""
+
+MARKDOWN_SAMPLE = """## Summary
+The **import job** fails for *large* tenants. See [runbook](https://example.com/runbook)
+and `ImportWorker` for details, or <https://example.com/status>.
+
+- Reproduce with a tenant over 10k items
+  - Wait for the nightly run
+1. Check the dashboard ![graph](graph.png)
+    1. Compare with <span style="color:#ff0000">yesterday</span>
+
+| Step | Result |
+|------|--------|
+| import | ~~passed~~ <ins>failed</ins> |
+
+```python
+def run(job):
+    return job.execute(batch_size=500)
+```
+"""
+
+MARKDOWN_CODE_LINE = "    if len(items) < limit{n} and items[{n}].size < max_size:"
+
+STORAGE_FORMAT_SECTION = """<h2>Section {n}</h2>\
+<p>Owner: <ac:link><ri:user ri:account-id="account-{n}" /></ac:link>, reviewed by \
+<ac:structured-macro ac:name="profile"><ac:parameter ac:name="user">\
+<ri:user ri:account-id="reviewer-{n}" /></ac:parameter></ac:structured-macro>.</p>\
+<p>Some <strong>bold</strong> and <em>italic</em> text &amp; a \
+<a href="https://example.com/{n}">link</a>.</p>\
+<ul><li>one</li><li>two <code>snake_case</code></li></ul>\
+<table><tbody><tr><th>Step</th><th>Result</th></tr>\
+<tr><td>import</td><td>failed</td></tr></tbody></table>\
+<ac:structured-macro ac:name="code"><ac:parameter ac:name="language">python\
+</ac:parameter><ac:plain-text-body><![CDATA[def run(job):
+    return job.execute() < 1]]></ac:plain-text-body></ac:structured-macro>"""
+
+JIRA_LOG_LINE = (
+    "2024-01-01 12:00:00,123 INFO [worker-{n}] request id=abc{n} "
+    "path=/api/v2/items?page={n} status=200 elapsed=12ms [cache=miss]"
+)
+
+
+def build_jira_corpus(size_bytes: int) -> dict[str, str]:
+    """Build Jira markup documents of roughly size_bytes each."""
+    mixed_parts: list[str] = []
+    while sum(map(len, mixed_parts)) < size_bytes:
+        mixed_parts.append(JIRA_SAMPLE)
+    log_lines: list[str] = []
+    n = 0
+    while sum(map(len, log_lines)) < size_bytes:
+        log_lines.append(JIRA_LOG_LINE.format(n=n))
+        n += 1
+    return {
+        "mixed markup": "\n".join(mixed_parts),
+        "noformat log": "{noformat}\n" + "\n".join(log_lines) + "\n{noformat}",
+    }
+
+
+def build_markdown_corpus(size_bytes: int) -> dict[str, str]:
+    """Build Markdown documents of roughly size_bytes each."""
+    mixed_parts: list[str] = []
+    while sum(map(len, mixed_parts)) < size_bytes:
+        mixed_parts.append(MARKDOWN_SAMPLE)
+    code_lines: list[str] = []
+    n = 0
+    while sum(map(len, code_lines)) < size_bytes:
+        code_lines.append(MARKDOWN_CODE_LINE.format(n=n))
+        n += 1
+    return {
+        "mixed markdown": "\n".join(mixed_parts),
+        "pasted code": "\n".join(code_lines),
+    }
+
+
+def build_storage_format_page(size_bytes: int) -> str:
+    """Build a Confluence storage-format page of roughly size_bytes."""
+    sections: list[str] = []
+    total = 0
+    while total < size_bytes:
+        sections.append(STORAGE_FORMAT_SECTION.format(n=len(sections)))
+        total += len(sections[-1])
+    return "".join(sections)
+
+
+class StubConfluenceClient:
+    """Resolves user lookups locally so only preprocessing is timed."""
+
+    def get_user_details_by_accountid(self, account_id: str) -> dict[str, str]:
+        return {"displayName": f"User {account_id}"}
+
+    def get_user_details_by_username(self, username: str) -> dict[str, str]:
+        return {"displayName": f"User {username}"}
+
+
+def time_call(func: Callable[[str], str], text: str, repeat: int) -> float:
+    """Return the best wall time in seconds over repeat runs."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def format_timing(seconds: float, megabytes: float) -> str:
+    """Format a timing as milliseconds and throughput."""
+    return f"{seconds * 1000:>9.2f} ms ({megabytes / seconds:>7.2f} MB/s)"
+
+
+def report(
+    name: str,
+    text: str,
+    current: Callable[[str], object],
+    legacy: Callable[[str], object],
+    repeat: int,
+) -> None:
+    """Print timings for one document and fail if outputs differ."""
+    if current(text) != legacy(text):
+        print(f"{name}: OUTPUT MISMATCH between current and legacy converter")
+        sys.exit(1)
+    megabytes = len(text.encode("utf-8")) / 1_000_000
+    current_time = time_call(current, text, repeat)
+    legacy_time = time_call(legacy, text, repeat)
+    print(
+        f"{name:<28} {len(text) / 1024:>8.1f} KB  "
+        f"legacy {format_timing(legacy_time, megabytes)}  "
+        f"current {format_timing(current_time, megabytes)}  "
+        f"x{legacy_time / current_time:.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark markup preprocessors")
+    parser.add_argument(
+        "--size-kb", type=int, default=100, help="Approximate size of each document"
+    )
+    parser.add_argument(
+        "--html-size-kb",
+        type=int,
+        default=2048,
+        help="Approximate size of the Confluence storage-format page",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="Runs per measurement (best is kept)"
+    )
+    args = parser.parse_args()
+
+    preprocessor = JiraPreprocessor(base_url="https://example.atlassian.net")
+    print("Jira markup -> Markdown")
+    for name, text in build_jira_corpus(args.size_kb * 1024).items():
+        report(
+            name,
+            text,
+            preprocessor.jira_to_markdown,
+            lambda t: legacy_jira_to_markdown(preprocessor, t),
+            args.repeat,
+        )
+    print("Markdown -> Jira markup")
+    for name, text in build_markdown_corpus(args.size_kb * 1024).items():
+        report(
+            name,
+            text,
+            preprocessor.markdown_to_jira,
+            legacy_markdown_to_jira,
+            args.repeat,
+        )
+
+    confluence = ConfluencePreprocessor(
+        base_url="https://example.atlassian.net",
+        confluence_client=StubConfluenceClient(),
+    )
+    print("Confluence storage format -> HTML + Markdown")
+    report(
+        "storage-format page",
+        build_storage_format_page(args.html_size_kb * 1024),
+        confluence.process_html_content,
+        lambda html: legacy_process_html_content(confluence, html),
+        args.repeat,
+    )
+
+
+if __name__ == "__main__":
+    main()
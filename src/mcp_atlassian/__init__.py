@@ -108,6 +108,26 @@ logger = setup_logging(logging_level)
     "--enabled-tools",
     help="Comma-separated list of tools to enable (enables all if not specified)",
 )
+@click.option(
+    "--worker-pool-size",
+    type=int,
+    help="Maximum number of worker threads running Jira/Confluence API calls (default: 32)",
+)
+@click.option(
+    "--jira-max-concurrency",
+    type=int,
+    help="Maximum number of concurrent Jira API calls (default: 16)",
+)
+@click.option(
+    "--confluence-max-concurrency",
+    type=int,
+    help="Maximum number of concurrent Confluence API calls (default: 16)",
+)
+@click.option(
+    "--cache-dir",
+    type=click.Path(file_okay=False),
+    help="Directory for persistent caches (Jira metadata, converted Confluence content) that survive restarts",
+)
 @click.option(
     "--oauth-client-id",
     help="OAuth 2.0 client ID for Atlassian Cloud",
@@ -150,6 +170,10 @@ def main(
     jira_projects_filter: str | None,
     read_only: bool,
     enabled_tools: str | None,
+    worker_pool_size: int | None,
+    jira_max_concurrency: int | None,
+    confluence_max_concurrency: int | None,
+    cache_dir: str | None,
     oauth_client_id: str | None,
     oauth_client_secret: str | None,
     oauth_redirect_uri: str | None,
@@ -283,6 +307,14 @@ def main(
         os.environ["JIRA_SSL_VERIFY"] = str(jira_ssl_verify).lower()
     if click_ctx and was_option_provided(click_ctx, "jira_projects_filter"):
         os.environ["JIRA_PROJECTS_FILTER"] = jira_projects_filter
+    if click_ctx and was_option_provided(click_ctx, "worker_pool_size"):
+        os.environ["WORKER_POOL_SIZE"] = str(worker_pool_size)
+    if click_ctx and was_option_provided(click_ctx, "jira_max_concurrency"):
+        os.environ["JIRA_MAX_CONCURRENCY"] = str(jira_max_concurrency)
+    if click_ctx and was_option_provided(click_ctx, "confluence_max_concurrency"):
+        os.environ["CONFLUENCE_MAX_CONCURRENCY"] = str(confluence_max_concurrency)
+    if click_ctx and was_option_provided(click_ctx, "cache_dir"):
+        os.environ["ATLASSIAN_CACHE_DIR"] = cache_dir
 
     from mcp_atlassian.servers import main_mcp
 
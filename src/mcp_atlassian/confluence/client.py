@@ -7,24 +7,70 @@ from atlassian import Confluence
 from requests import Session
 
 from ..exceptions import MCPAtlassianAuthenticationError
+from ..utils.async_http import AsyncAtlassianClient
+from ..utils.http_pool import mount_connection_pool
 from ..utils.logging import log_config_param, mask_sensitive
 from ..utils.oauth import configure_oauth_session
+from ..utils.rate_limit import RateLimiter
+from ..utils.request_coalescing import RequestCoalescer
+from ..utils.response_cache import ResponseCache
 from ..utils.ssl import configure_ssl_verification
 from .config import ConfluenceConfig
+from .content_cache import ContentConversionCache
 
 # Configure logging
 logger = logging.getLogger("mcp-atlassian")
 
+# Response cache tag of all cached child page listings
+PAGE_CHILDREN_CACHE_TAG = "children"
+
+
+def page_cache_tag(page_id: object) -> str:
+    """Return the response cache tag of a page.
+
+    Args:
+        page_id: The page ID
+
+    Returns:
+        The tag
+    """
+    return f"page:{page_id}"
+
 
 class ConfluenceClient:
     """Base client for Confluence API interactions."""
 
-    def __init__(self, config: ConfluenceConfig | None = None) -> None:
+    # Only set when config.http_backend is "httpx"
+    async_client: AsyncAtlassianClient | None = None
+    # Shared across fetchers when provided; otherwise bodies are converted on every read
+    content_cache: ContentConversionCache | None = None
+    # Shared across fetchers when provided; otherwise every read goes upstream
+    response_cache: ResponseCache | None = None
+    # Shared across fetchers when provided; identical concurrent GETs go upstream once
+    request_coalescer: RequestCoalescer | None = None
+    # Shared across fetchers when provided; paces and retries requests per site
+    rate_limiter: RateLimiter | None = None
+
+    def __init__(
+        self,
+        config: ConfluenceConfig | None = None,
+        content_cache: ContentConversionCache | None = None,
+        response_cache: ResponseCache | None = None,
+        request_coalescer: RequestCoalescer | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
         """Initialize the Confluence client with given or environment config.
 
         Args:
             config: Configuration for Confluence client. If None, will load from
                 environment.
+            content_cache: Optional cache of converted page and comment bodies,
+                keyed by content ID and version
+            response_cache: Optional cache of read responses, invalidated by writes
+            request_coalescer: Optional coalescer that shares one upstream request
+                between identical concurrent GETs
+            rate_limiter: Optional per-site limiter that paces requests and
+                retries throttled reads
 
         Raises:
             ValueError: If configuration is invalid or environment variables are missing
@@ -92,6 +138,13 @@ class ConfluenceClient:
             ssl_verify=self.config.ssl_verify,
         )
 
+        # Share one tuned connection pool with every client of the same site
+        mount_connection_pool(
+            session=self.confluence._session,
+            url=api_url if self.config.auth_type == "oauth" else self.config.url,
+            ssl_verify=self.config.ssl_verify,
+        )
+
         # Proxy configuration
         proxies = {}
         if self.config.http_proxy:
@@ -110,12 +163,32 @@ class ConfluenceClient:
             os.environ["NO_PROXY"] = self.config.no_proxy
             log_config_param(logger, "Confluence", "NO_PROXY", self.config.no_proxy)
 
+        # The limiter goes first so coalesced requests never count against it
+        if rate_limiter is not None:
+            rate_limiter.install(self.confluence._session)
+        self.rate_limiter = rate_limiter
+        if request_coalescer is not None:
+            request_coalescer.install(self.confluence._session)
+        self.request_coalescer = request_coalescer
+
+        # Async transport shares the credentials resolved on the sync session
+        if self.config.http_backend == "httpx":
+            self.async_client = AsyncAtlassianClient.from_rest_client(
+                "Confluence",
+                self.confluence,
+                self.config,
+                coalescer=request_coalescer,
+                rate_limiter=rate_limiter,
+            )
+
         # Import here to avoid circular imports
         from ..preprocessing.confluence import ConfluencePreprocessor
 
         self.preprocessor = ConfluencePreprocessor(
             base_url=self.config.url, confluence_client=self.confluence
         )
+        self.content_cache = content_cache
+        self.response_cache = response_cache
 
     def _process_html_content(
         self, html_content: str, space_key: str
@@ -130,3 +203,39 @@ class ConfluenceClient:
             Tuple of (processed_html, processed_markdown)
         """
         return self.preprocessor.process_html_content(html_content, space_key)
+
+    def _process_versioned_content(
+        self,
+        content: dict,
+        html_content: str,
+        space_key: str,
+        representation: str = "storage",
+    ) -> tuple[str, str]:
+        """Process a page or comment body, reusing the conversion of its version.
+
+        Falls back to converting every time when no content cache is configured
+        or the content carries no ID or version number.
+
+        Args:
+            content: The raw page or comment data (needs 'id' and 'version')
+            html_content: The body to convert
+            space_key: The key of the space containing the content
+            representation: The body representation, e.g. 'storage' or 'view'
+
+        Returns:
+            Tuple of (processed_html, processed_markdown)
+        """
+        version = (content.get("version") or {}).get("number")
+        if self.content_cache is None or not content.get("id") or version is None:
+            return self.preprocessor.process_html_content(
+                html_content, space_key=space_key
+            )
+        key = self.content_cache.make_key(
+            self.config.url, content["id"], version, representation, html_content
+        )
+        return self.content_cache.get_or_convert(
+            key,
+            lambda: self.preprocessor.process_html_content(
+                html_content, space_key=space_key
+            ),
+        )
@@ -5,7 +5,8 @@ import logging
 import requests
 
 from ..models.confluence import ConfluenceComment
-from .client import ConfluenceClient
+from ..utils.response_cache import invalidates_responses
+from .client import ConfluenceClient, page_cache_tag
 
 logger = logging.getLogger("mcp-atlassian")
 
@@ -42,8 +43,8 @@ class CommentsMixin(ConfluenceClient):
             for comment_data in comments_response.get("results", []):
                 # Get the content based on format
                 body = comment_data["body"]["view"]["value"]
-                processed_html, processed_markdown = (
-                    self.preprocessor.process_html_content(body, space_key=space_key)
+                processed_html, processed_markdown = self._process_versioned_content(
+                    comment_data, body, space_key, representation="view"
                 )
 
                 # Create a copy of the comment data to modify
@@ -84,6 +85,7 @@ class CommentsMixin(ConfluenceClient):
             logger.debug("Full exception details for comments:", exc_info=True)
             return []
 
+    @invalidates_responses(lambda args: (page_cache_tag(args["page_id"]),))
     def add_comment(self, page_id: str, content: str) -> ConfluenceComment | None:
         """
         Add a comment to a Confluence page.
@@ -5,6 +5,7 @@ import os
 from dataclasses import dataclass
 from typing import Literal
 
+from ..utils.async_http import HttpBackend, parse_http_backend
 from ..utils.oauth import OAuthConfig
 from ..utils.urls import is_atlassian_cloud_url
 
@@ -30,6 +31,7 @@ class ConfluenceConfig:
     https_proxy: str | None = None  # HTTPS proxy URL
     no_proxy: str | None = None  # Comma-separated list of hosts to bypass proxy
     socks_proxy: str | None = None  # SOCKS proxy URL (optional)
+    http_backend: HttpBackend = "requests"  # HTTP transport ("requests" or "httpx")
 
     @property
     def is_cloud(self) -> bool:
@@ -109,6 +111,11 @@ class ConfluenceConfig:
         no_proxy = os.getenv("CONFLUENCE_NO_PROXY", os.getenv("NO_PROXY"))
         socks_proxy = os.getenv("CONFLUENCE_SOCKS_PROXY", os.getenv("SOCKS_PROXY"))
 
+        # HTTP transport backend
+        http_backend = parse_http_backend(
+            os.getenv("CONFLUENCE_HTTP_BACKEND", os.getenv("ATLASSIAN_HTTP_BACKEND"))
+        )
+
         return cls(
             url=url,
             auth_type=auth_type,
@@ -122,6 +129,7 @@ class ConfluenceConfig:
             https_proxy=https_proxy,
             no_proxy=no_proxy,
             socks_proxy=socks_proxy,
+            http_backend=http_backend,
         )
 
     def is_auth_configured(self) -> bool:
@@ -0,0 +1,276 @@
+"""Version-keyed cache of converted Confluence content bodies.
+
+A Confluence page or comment body never changes for a given version, yet every
+read converted it from storage/view HTML to Markdown again. ``ContentConversionCache``
+keeps the processed HTML and Markdown in a bounded in-memory LRU shared by all
+fetchers, so repeated reads of the same version cost a dictionary lookup.
+
+Keys also carry a fingerprint of the body, so a body rendered differently for
+another user (e.g. the ``view`` representation) never reuses someone else's
+conversion. With a ``ContentStore`` conversions are also written to SQLite and
+survive restarts.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from cachetools import LRUCache
+
+from mcp_atlassian.utils.environment import get_positive_int_env
+
+logger = logging.getLogger("mcp-atlassian")
+
+DEFAULT_CONTENT_CACHE_SIZE_MB = 64
+DEFAULT_CONTENT_STORE_MAX_ENTRIES = 2000
+
+CONTENT_STORE_FILENAME = "confluence_content.sqlite3"
+
+# (site, content id, version, representation, body fingerprint)
+ContentKey = tuple[str, str, str, str, str]
+ProcessedContent = tuple[str, str]
+
+
+def _content_size(value: ProcessedContent) -> int:
+    return len(value[0]) + len(value[1])
+
+
+class ContentStore:
+    """SQLite-backed tier for converted content bodies.
+
+    Storing a version removes older versions of the same content, and the table
+    is trimmed to ``max_entries`` rows, oldest first. Every operation opens its
+    own short-lived connection, so the store can be used from any thread.
+    """
+
+    def __init__(
+        self, path: str | Path, max_entries: int = DEFAULT_CONTENT_STORE_MAX_ENTRIES
+    ) -> None:
+        """Initialize the store, creating the database file if needed.
+
+        Args:
+            path: Path of the SQLite database file.
+            max_entries: Maximum number of stored conversions.
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS content ("
+                "site TEXT NOT NULL, content_id TEXT NOT NULL, "
+                "version TEXT NOT NULL, representation TEXT NOT NULL, "
+                "fingerprint TEXT NOT NULL, html TEXT NOT NULL, "
+                "markdown TEXT NOT NULL, stored_at REAL NOT NULL, "
+                "PRIMARY KEY (site, content_id, version, representation, fingerprint))"
+            )
+
+    @classmethod
+    def from_env(cls) -> ContentStore | None:
+        """Create a store in ATLASSIAN_CACHE_DIR, if that variable is set.
+
+        Returns:
+            ContentStore, or None when no cache directory is configured or it
+            cannot be used.
+        """
+        cache_dir = os.getenv("ATLASSIAN_CACHE_DIR")
+        if not cache_dir:
+            return None
+        try:
+            return cls(Path(cache_dir).expanduser() / CONTENT_STORE_FILENAME)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(
+                f"Cannot use content cache directory '{cache_dir}', "
+                f"continuing without persistence: {e}"
+            )
+            return None
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key: ContentKey) -> ProcessedContent | None:
+        """Return the stored conversion for key, or None."""
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT html, markdown FROM content WHERE site = ? AND "
+                "content_id = ? AND version = ? AND representation = ? AND "
+                "fingerprint = ?",
+                key,
+            ).fetchone()
+        return (row[0], row[1]) if row else None
+
+    def save(self, key: ContentKey, value: ProcessedContent) -> None:
+        """Store a conversion and drop superseded versions of the same content.
+
+        Args:
+            key: The content key.
+            value: The (processed_html, processed_markdown) pair.
+        """
+        site, content_id, version, representation, _ = key
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM content WHERE site = ? AND content_id = ? AND "
+                "representation = ? AND version != ?",
+                (site, content_id, representation, version),
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO content VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (*key, *value, time.time()),
+            )
+            conn.execute(
+                "DELETE FROM content WHERE rowid NOT IN ("
+                "SELECT rowid FROM content ORDER BY stored_at DESC LIMIT ?)",
+                (self.max_entries,),
+            )
+
+
+class ContentConversionCache:
+    """Thread-safe LRU of converted content bodies, bounded by total size.
+
+    Entries are looked up in memory first, then in the optional ContentStore.
+    Conversions larger than the whole memory budget are only written to the store.
+    """
+
+    def __init__(
+        self,
+        max_size_mb: int = DEFAULT_CONTENT_CACHE_SIZE_MB,
+        store: ContentStore | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_size_mb: Memory budget in megabytes (counted as characters of
+                processed HTML plus Markdown).
+            store: Optional persistent tier to read through and write to.
+        """
+        self.max_size_mb = max_size_mb
+        self._cache: LRUCache[ContentKey, ProcessedContent] = LRUCache(
+            maxsize=max_size_mb * 1024 * 1024, getsizeof=_content_size
+        )
+        self._store = store
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> ContentConversionCache:
+        """Create a cache configured from the environment.
+
+        Uses CONFLUENCE_CONTENT_CACHE_SIZE_MB for the memory budget (default 64)
+        and persists to ATLASSIAN_CACHE_DIR when that is set.
+
+        Returns:
+            The configured ContentConversionCache.
+        """
+        return cls(
+            max_size_mb=get_positive_int_env(
+                "CONFLUENCE_CONTENT_CACHE_SIZE_MB", DEFAULT_CONTENT_CACHE_SIZE_MB
+            ),
+            store=ContentStore.from_env(),
+        )
+
+    @staticmethod
+    def make_key(
+        site: str,
+        content_id: str,
+        version: int | str,
+        representation: str,
+        body: str,
+    ) -> ContentKey:
+        """Build the cache key for a content body.
+
+        Args:
+            site: The Confluence site URL.
+            content_id: The page or comment ID.
+            version: The content version number.
+            representation: The body representation (e.g. 'storage', 'view').
+            body: The raw body; only its SHA-256 fingerprint is kept.
+
+        Returns:
+            The cache key.
+        """
+        return (
+            site.rstrip("/"),
+            str(content_id),
+            str(version),
+            representation,
+            hashlib.sha256(body.encode("utf-8")).hexdigest(),
+        )
+
+    def get_or_convert(
+        self, key: ContentKey, convert: Callable[[], ProcessedContent]
+    ) -> ProcessedContent:
+        """Return the cached conversion for key, converting and storing on a miss.
+
+        Args:
+            key: Key from ``make_key``.
+            convert: Produces (processed_html, processed_markdown) for the body.
+
+        Returns:
+            The (processed_html, processed_markdown) pair.
+        """
+        with self._lock:
+            value = self._cache.get(key)
+            if value is not None:
+                self.hits += 1
+                return value
+
+        if self._store is not None:
+            try:
+                value = self._store.get(key)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not read cached Confluence content: {e}")
+            if value is not None:
+                with self._lock:
+                    self.disk_hits += 1
+                    self._remember(key, value)
+                return value
+
+        value = convert()
+        with self._lock:
+            self.misses += 1
+            self._remember(key, value)
+        if self._store is not None:
+            try:
+                self._store.save(key, value)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not persist converted Confluence content: {e}")
+        return value
+
+    def _remember(self, key: ContentKey, value: ProcessedContent) -> None:
+        try:
+            self._cache[key] = value
+        except ValueError:
+            logger.debug(
+                f"Converted content {key[1]} v{key[2]} exceeds the memory budget"
+            )
+
+    def stats(self) -> dict[str, int]:
+        """Return hit and miss counters.
+
+        Returns:
+            Dictionary with entries, size_bytes, hits, disk_hits and misses.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "size_bytes": int(self._cache.currsize),
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+            }
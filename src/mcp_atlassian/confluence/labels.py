@@ -3,7 +3,8 @@
 import logging
 
 from ..models.confluence import ConfluenceLabel
-from .client import ConfluenceClient
+from ..utils.response_cache import invalidates_responses
+from .client import ConfluenceClient, page_cache_tag
 
 logger = logging.getLogger("mcp-atlassian")
 
@@ -47,6 +48,7 @@ class LabelsMixin(ConfluenceClient):
                 f"Failed fetching labels from page {page_id}: {str(e)}"
             ) from e
 
+    @invalidates_responses(lambda args: (page_cache_tag(args["page_id"]),))
     def add_page_label(self, page_id: str, name: str) -> list[ConfluenceLabel]:
         """
         Add a label to a Confluence page.
@@ -1,20 +1,30 @@
 """Module for Confluence page operations."""
 
+import functools
 import logging
+from typing import Any
 
+import anyio.to_thread
+import httpx
 import requests
 from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.confluence import ConfluencePage
-from .client import ConfluenceClient
+from ..utils.response_cache import cached_response, invalidates_responses
+from .client import PAGE_CHILDREN_CACHE_TAG, ConfluenceClient, page_cache_tag
 
 logger = logging.getLogger("mcp-atlassian")
 
+PAGE_CONTENT_EXPAND = "body.storage,version,space,children.attachment"
+
 
 class PagesMixin(ConfluenceClient):
     """Mixin for Confluence page operations."""
 
+    @cached_response(
+        "get_page_content", lambda args: (page_cache_tag(args["page_id"]),)
+    )
     def get_page_content(
         self, page_id: str, *, convert_to_markdown: bool = True
     ) -> ConfluencePage:
@@ -35,26 +45,10 @@ class PagesMixin(ConfluenceClient):
         """
         try:
             page = self.confluence.get_page_by_id(
-                page_id=page_id, expand="body.storage,version,space,children.attachment"
+                page_id=page_id, expand=PAGE_CONTENT_EXPAND
             )
-            space_key = page.get("space", {}).get("key", "")
-            content = page["body"]["storage"]["value"]
-            processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key
-            )
-
-            # Use the appropriate content format based on the convert_to_markdown flag
-            page_content = processed_markdown if convert_to_markdown else processed_html
-
-            # Create and return the ConfluencePage model
-            return ConfluencePage.from_api_response(
-                page,
-                base_url=self.config.url,
-                include_body=True,
-                # Override content with our processed version
-                content_override=page_content,
-                content_format="storage" if not convert_to_markdown else "markdown",
-                is_cloud=self.config.is_cloud,
+            return self._build_page_content_model(
+                page, convert_to_markdown=convert_to_markdown
             )
         except HTTPError as http_err:
             if http_err.response is not None and http_err.response.status_code in [
@@ -76,6 +70,96 @@ class PagesMixin(ConfluenceClient):
             )
             raise Exception(f"Error retrieving page content: {str(e)}") from e
 
+    def _build_page_content_model(
+        self, page: dict[str, Any], *, convert_to_markdown: bool
+    ) -> ConfluencePage:
+        """
+        Convert a page response with a storage body into a ConfluencePage model.
+
+        Args:
+            page: The page data returned by the content API
+            convert_to_markdown: When True, the model content is markdown,
+                               otherwise processed HTML (keyword-only)
+
+        Returns:
+            ConfluencePage model with the processed content
+        """
+        space_key = page.get("space", {}).get("key", "")
+        content = page["body"]["storage"]["value"]
+        processed_html, processed_markdown = self._process_versioned_content(
+            page, content, space_key
+        )
+
+        # Use the appropriate content format based on the convert_to_markdown flag
+        page_content = processed_markdown if convert_to_markdown else processed_html
+
+        # Create and return the ConfluencePage model
+        return ConfluencePage.from_api_response(
+            page,
+            base_url=self.config.url,
+            include_body=True,
+            # Override content with our processed version
+            content_override=page_content,
+            content_format="storage" if not convert_to_markdown else "markdown",
+            is_cloud=self.config.is_cloud,
+        )
+
+    @cached_response(
+        "get_page_content", lambda args: (page_cache_tag(args["page_id"]),)
+    )
+    async def get_page_content_async(
+        self, page_id: str, *, convert_to_markdown: bool = True
+    ) -> ConfluencePage:
+        """
+        Get content of a specific page over the async (httpx) transport.
+
+        Behaves like `get_page_content` but awaits the upstream request. The
+        HTML-to-markdown conversion is CPU-bound and runs in a worker thread.
+        Requires `http_backend="httpx"` in the config.
+
+        Args:
+            page_id: The ID of the page to retrieve
+            convert_to_markdown: When True, returns content in markdown format,
+                               otherwise returns raw HTML (keyword-only)
+
+        Returns:
+            ConfluencePage model containing the page content and metadata
+
+        Raises:
+            ValueError: If the async transport is not enabled
+            MCPAtlassianAuthenticationError: If authentication fails with the Confluence API (401/403)
+            Exception: If there is an error retrieving the page
+        """
+        client = self.async_client
+        if client is None:
+            error_msg = (
+                "Async HTTP backend is not enabled for Confluence. "
+                "Set CONFLUENCE_HTTP_BACKEND=httpx to use it."
+            )
+            raise ValueError(error_msg)
+
+        try:
+            page = await client.get(
+                f"rest/api/content/{page_id}", params={"expand": PAGE_CONTENT_EXPAND}
+            )
+            return await anyio.to_thread.run_sync(
+                functools.partial(
+                    self._build_page_content_model,
+                    page,
+                    convert_to_markdown=convert_to_markdown,
+                )
+            )
+        except MCPAtlassianAuthenticationError:
+            raise
+        except httpx.HTTPStatusError as http_err:
+            logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
+            raise
+        except Exception as e:
+            logger.error(
+                f"Error retrieving page content for page ID {page_id}: {str(e)}"
+            )
+            raise Exception(f"Error retrieving page content: {str(e)}") from e
+
     def get_page_ancestors(self, page_id: str) -> list[ConfluencePage]:
         """
         Get ancestors (parent pages) of a specific page.
@@ -164,8 +248,8 @@ class PagesMixin(ConfluenceClient):
                 return None
 
             content = page["body"]["storage"]["value"]
-            processed_html, processed_markdown = self.preprocessor.process_html_content(
-                content, space_key=space_key
+            processed_html, processed_markdown = self._process_versioned_content(
+                page, content, space_key
             )
 
             # Use the appropriate content format based on the convert_to_markdown flag
@@ -254,6 +338,7 @@ class PagesMixin(ConfluenceClient):
 
         return page_models
 
+    @invalidates_responses(lambda args: (PAGE_CHILDREN_CACHE_TAG,))
     def create_page(
         self,
         space_key: str,
@@ -310,6 +395,9 @@ class PagesMixin(ConfluenceClient):
                 f"Failed to create page '{title}' in space {space_key}: {str(e)}"
             ) from e
 
+    @invalidates_responses(
+        lambda args: (page_cache_tag(args["page_id"]), PAGE_CHILDREN_CACHE_TAG)
+    )
     def update_page(
         self,
         page_id: str,
@@ -370,6 +458,7 @@ class PagesMixin(ConfluenceClient):
             logger.error(f"Error updating page {page_id}: {str(e)}")
             raise Exception(f"Failed to update page {page_id}: {str(e)}") from e
 
+    @cached_response("get_page_children", lambda args: (PAGE_CHILDREN_CACHE_TAG,))
     def get_page_children(
         self,
         page_id: str,
@@ -421,8 +510,8 @@ class PagesMixin(ConfluenceClient):
                 if "body" in page and convert_to_markdown:
                     content = page.get("body", {}).get("storage", {}).get("value", "")
                     if content:
-                        _, processed_markdown = self.preprocessor.process_html_content(
-                            content, space_key=space_key
+                        _, processed_markdown = self._process_versioned_content(
+                            page, content, space_key
                         )
                         content_override = processed_markdown
 
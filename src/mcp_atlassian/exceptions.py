@@ -2,3 +2,17 @@ class MCPAtlassianAuthenticationError(Exception):
     """Raised when Atlassian API authentication fails (401/403)."""
 
     pass
+
+
+class MCPAtlassianRateLimitError(Exception):
+    """Raised when an Atlassian site is rate limiting us for longer than we wait."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        """Initialize the error.
+
+        Args:
+            message: Error message
+            retry_after: Seconds until the site accepts requests again
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -1,28 +1,116 @@
 """Attachment operations for Jira API."""
 
+import json
 import logging
 import os
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from types import TracebackType
 from typing import Any
 
 from ..models.jira import JiraAttachment
-from .client import JiraClient
+from ..utils.response_cache import invalidates_responses
+from .client import SEARCH_CACHE_TAG, JiraClient, issue_cache_tags
 from .protocols import AttachmentsOperationsProto
 
 # Configure logging
 logger = logging.getLogger("mcp-jira")
 
+# Records, per target directory, which attachment each downloaded file holds
+ATTACHMENT_MANIFEST_FILENAME = ".jira-attachments.json"
+
+# Called with (filename, bytes_sent, total_bytes) while a file is uploaded
+UploadProgressCallback = Callable[[str, int, int], None]
+
+
+class _MultipartFileStream:
+    """A multipart/form-data request body that reads its file while it is sent.
+
+    Handing an open file to requests via ``files=`` encodes the whole body in
+    memory first. This object is a readable stream of known length instead, so
+    requests sends it with a Content-Length header one block at a time.
+    """
+
+    def __init__(
+        self, file_path: str, progress: Callable[[int, int], None] | None = None
+    ) -> None:
+        self.boundary = uuid.uuid4().hex
+        filename = os.path.basename(file_path).replace('"', "%22")
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="file"; filename="{filename}"'
+            "\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode()
+        self.file_size = os.path.getsize(file_path)
+        self.bytes_sent = 0
+        self._progress = progress
+        self._file = open(file_path, "rb")  # closed by close()
+        self._segment = 0  # 0: head, 1: file, 2: tail, 3: done
+        self._offset = 0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return len(self._head) + self.file_size + len(self._tail)
+
+    def read(self, size: int | None = -1) -> bytes:
+        if size is None or size < 0:
+            size = len(self)
+        data = bytearray()
+        while len(data) < size and self._segment < 3:
+            wanted = size - len(data)
+            if self._segment == 1:
+                chunk = self._file.read(wanted)
+                if chunk:
+                    self.bytes_sent += len(chunk)
+                    if self._progress:
+                        self._progress(self.bytes_sent, self.file_size)
+            else:
+                source = self._head if self._segment == 0 else self._tail
+                chunk = source[self._offset : self._offset + wanted]
+                self._offset += len(chunk)
+            if chunk:
+                data += chunk
+            else:
+                self._segment += 1
+                self._offset = 0
+        return bytes(data)
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "_MultipartFileStream":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
 
 class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
     """Mixin for Jira attachment operations."""
 
-    def download_attachment(self, url: str, target_path: str) -> bool:
+    def download_attachment(
+        self, url: str, target_path: str, resume: bool = False
+    ) -> bool:
         """
         Download a Jira attachment to the specified path.
 
         Args:
             url: The URL of the attachment to download
             target_path: The path where the attachment should be saved
+            resume: Whether a file already at target_path is an interrupted
+                download of this attachment to continue with an HTTP Range request
 
         Returns:
             True if successful, False otherwise
@@ -41,13 +129,25 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             # Create the directory if it doesn't exist
             os.makedirs(os.path.dirname(target_path), exist_ok=True)
 
+            offset = 0
+            if resume and os.path.exists(target_path):
+                offset = os.path.getsize(target_path)
+
             # Use the Jira session to download the file
-            response = self.jira._session.get(url, stream=True)
+            if offset:
+                logger.info(f"Resuming download of {target_path} at byte {offset}")
+                response = self.jira._session.get(
+                    url, stream=True, headers={"Range": f"bytes={offset}-"}
+                )
+            else:
+                response = self.jira._session.get(url, stream=True)
             response.raise_for_status()
 
-            # Write the file to disk
-            with open(target_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
+            # Append only if the server honoured the range; otherwise start over
+            mode = "ab" if offset and response.status_code == 206 else "wb"
+            chunk_size = self.config.attachment_chunk_size_kb * 1024
+            with open(target_path, mode) as f:
+                for chunk in response.iter_content(chunk_size=chunk_size):
                     f.write(chunk)
 
             # Verify the file was created
@@ -71,12 +171,18 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
         """
         Download all attachments for a Jira issue.
 
+        Up to JiraConfig.attachment_concurrency files are downloaded at once. A
+        manifest in target_dir records which attachment each file holds, so
+        files whose attachment ID and size are unchanged are skipped and
+        interrupted downloads are resumed.
+
         Args:
             issue_key: The Jira issue key (e.g., 'PROJ-123')
             target_dir: The directory where attachments should be saved
 
         Returns:
-            A dictionary with download results
+            A dictionary with download results, including skipped files and
+            throughput
         """
         # Convert to absolute path if relative
         if not os.path.isabs(target_dir):
@@ -123,9 +229,14 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             if isinstance(attachment, dict):
                 attachments.append(JiraAttachment.from_api_response(attachment))
 
-        # Download each attachment
+        manifest_path = target_path / ATTACHMENT_MANIFEST_FILENAME
+        manifest = self._load_attachment_manifest(manifest_path)
+
         downloaded = []
         failed = []
+        skipped = []
+        # Attachments sharing a filename are downloaded in order by one worker
+        jobs: dict[Path, list[tuple[JiraAttachment, bool]]] = {}
 
         for attachment in attachments:
             if not attachment.url:
@@ -138,38 +249,153 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             # Create a safe filename
             safe_filename = Path(attachment.filename).name
             file_path = target_path / safe_filename
-
-            # Download the attachment
-            success = self.download_attachment(attachment.url, str(file_path))
-
-            if success:
-                downloaded.append(
+            entry = manifest.get(safe_filename)
+            same_attachment = (
+                isinstance(entry, dict)
+                and entry.get("id") == str(attachment.id)
+                and entry.get("size") == attachment.size
+            )
+            local_size = file_path.stat().st_size if file_path.is_file() else -1
+
+            if (
+                same_attachment
+                and entry.get("complete")
+                and local_size == attachment.size
+                and file_path not in jobs
+            ):
+                logger.info(f"Skipping unchanged attachment {attachment.filename}")
+                skipped.append(
                     {
                         "filename": attachment.filename,
                         "path": str(file_path),
                         "size": attachment.size,
                     }
                 )
-            else:
-                failed.append(
-                    {"filename": attachment.filename, "error": "Download failed"}
-                )
+                continue
+
+            resume = same_attachment and 0 < local_size < attachment.size
+            jobs.setdefault(file_path, []).append((attachment, resume))
+            manifest[safe_filename] = {
+                "id": str(attachment.id),
+                "size": attachment.size,
+                "complete": False,
+            }
 
+        def download(
+            file_path: Path, group: list[tuple[JiraAttachment, bool]]
+        ) -> list[bool]:
+            return [
+                self.download_attachment(
+                    attachment.url or "", str(file_path), resume=resume
+                )
+                for attachment, resume in group
+            ]
+
+        started = time.monotonic()
+        if jobs:
+            # Record pending downloads first so an interrupted run can resume them
+            self._save_attachment_manifest(manifest_path, manifest)
+            with ThreadPoolExecutor(
+                max_workers=min(self.config.attachment_concurrency, len(jobs)),
+                thread_name_prefix="jira-attachment-download",
+            ) as pool:
+                outcomes = list(pool.map(download, jobs.keys(), jobs.values()))
+        else:
+            outcomes = []
+        elapsed = time.monotonic() - started
+
+        for (file_path, group), results in zip(jobs.items(), outcomes, strict=True):
+            for (attachment, _), success in zip(group, results, strict=True):
+                if success:
+                    downloaded.append(
+                        {
+                            "filename": attachment.filename,
+                            "path": str(file_path),
+                            "size": attachment.size,
+                        }
+                    )
+                    manifest[file_path.name]["complete"] = True
+                else:
+                    failed.append(
+                        {"filename": attachment.filename, "error": "Download failed"}
+                    )
+                    manifest[file_path.name]["complete"] = False
+        if jobs:
+            self._save_attachment_manifest(manifest_path, manifest)
+
+        downloaded_bytes = sum(item["size"] or 0 for item in downloaded)
         return {
             "success": True,
             "issue_key": issue_key,
             "total": len(attachments),
             "downloaded": downloaded,
             "failed": failed,
+            "skipped": skipped,
+            "bytes_downloaded": downloaded_bytes,
+            "elapsed_seconds": round(elapsed, 3),
+            "throughput_mb_per_second": round(downloaded_bytes / elapsed / 1e6, 2)
+            if elapsed > 0
+            else 0.0,
         }
 
-    def upload_attachment(self, issue_key: str, file_path: str) -> dict[str, Any]:
+    def _load_attachment_manifest(self, manifest_path: Path) -> dict[str, Any]:
+        """
+        Read the download manifest of a target directory.
+
+        Args:
+            manifest_path: Path of the manifest file
+
+        Returns:
+            Manifest entries keyed by filename, or an empty dict if there is none
+        """
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable attachment manifest: {str(e)}")
+            return {}
+        return manifest if isinstance(manifest, dict) else {}
+
+    def _save_attachment_manifest(
+        self, manifest_path: Path, manifest: dict[str, Any]
+    ) -> None:
+        """
+        Write the download manifest of a target directory.
+
+        Args:
+            manifest_path: Path of the manifest file
+            manifest: Manifest entries keyed by filename
+        """
+        temp_path = manifest_path.with_name(f"{manifest_path.name}.tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(manifest, f, indent=2)
+            os.replace(temp_path, manifest_path)
+        except OSError as e:
+            logger.warning(f"Could not write attachment manifest: {str(e)}")
+
+    @invalidates_responses(
+        lambda args: (*issue_cache_tags(args["issue_key"]), SEARCH_CACHE_TAG)
+    )
+    def upload_attachment(
+        self,
+        issue_key: str,
+        file_path: str,
+        progress_callback: UploadProgressCallback | None = None,
+    ) -> dict[str, Any]:
         """
         Upload a single attachment to a Jira issue.
 
+        The file is streamed from disk as the request body is sent, so it is
+        never held in memory as a whole.
+
         Args:
             issue_key: The Jira issue key (e.g., 'PROJ-123')
             file_path: The path to the file to upload
+            progress_callback: Optional function called with the filename, the
+                bytes sent so far and the file size as the upload progresses
 
         Returns:
             A dictionary with upload result information
@@ -194,15 +420,44 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
 
             logger.info(f"Uploading attachment from {file_path} to issue {issue_key}")
 
-            # Use the Jira API to upload the file
             filename = os.path.basename(file_path)
-            with open(file_path, "rb") as file:
-                attachment = self.jira.add_attachment(
-                    issue_key=issue_key, filename=file_path
+            next_report = 25
+
+            def report_progress(sent: int, total: int) -> None:
+                nonlocal next_report
+                percent = sent * 100 // total if total else 100
+                if percent >= next_report:
+                    logger.debug(
+                        f"Uploading {filename} to {issue_key}: {percent}% "
+                        f"({sent} of {total} bytes)"
+                    )
+                    next_report = percent - percent % 25 + 25
+                if progress_callback:
+                    progress_callback(filename, sent, total)
+
+            # Use the Jira session to stream the file as a multipart body
+            url = self.jira.url_joiner(
+                self.jira.url,
+                f"{self.jira.resource_url('issue')}/{issue_key}/attachments",
+            )
+            with _MultipartFileStream(file_path, report_progress) as body:
+                response = self.jira._session.post(
+                    url,
+                    data=body,
+                    headers={
+                        **self.jira.no_check_headers,
+                        "Content-Type": body.content_type,
+                    },
+                    timeout=self.jira.timeout,
                 )
+                file_size = body.file_size
+            self.jira.raise_for_status(response)
+            attachment = response.json() if response.content else None
+            # Jira answers with the list of attachments created by the request
+            if isinstance(attachment, list):
+                attachment = attachment[0] if attachment else None
 
             if attachment:
-                file_size = os.path.getsize(file_path)
                 logger.info(
                     f"Successfully uploaded attachment {filename} to {issue_key} (size: {file_size} bytes)"
                 )
@@ -227,15 +482,26 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
             logger.error(f"Error uploading attachment: {error_msg}")
             return {"success": False, "error": error_msg}
 
+    @invalidates_responses(
+        lambda args: (*issue_cache_tags(args["issue_key"]), SEARCH_CACHE_TAG)
+    )
     def upload_attachments(
-        self, issue_key: str, file_paths: list[str]
+        self,
+        issue_key: str,
+        file_paths: list[str],
+        progress_callback: UploadProgressCallback | None = None,
     ) -> dict[str, Any]:
         """
         Upload multiple attachments to a Jira issue.
 
+        Files are uploaded in parallel, up to the configured attachment
+        concurrency at a time.
+
         Args:
             issue_key: The Jira issue key (e.g., 'PROJ-123')
             file_paths: List of paths to files to upload
+            progress_callback: Optional function called with the filename, the
+                bytes sent so far and the file size as each upload progresses
 
         Returns:
             A dictionary with upload results
@@ -250,13 +516,23 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
 
         logger.info(f"Uploading {len(file_paths)} attachments to issue {issue_key}")
 
-        # Upload each attachment
+        def upload(file_path: str) -> dict[str, Any]:
+            return self.upload_attachment(
+                issue_key, file_path, progress_callback=progress_callback
+            )
+
+        started = time.monotonic()
+        with ThreadPoolExecutor(
+            max_workers=min(self.config.attachment_concurrency, len(file_paths)),
+            thread_name_prefix="jira-attachment-upload",
+        ) as pool:
+            results = list(pool.map(upload, file_paths))
+        elapsed = time.monotonic() - started
+
         uploaded = []
         failed = []
 
-        for file_path in file_paths:
-            result = self.upload_attachment(issue_key, file_path)
-
+        for file_path, result in zip(file_paths, results, strict=True):
             if result.get("success"):
                 uploaded.append(
                     {
@@ -273,10 +549,16 @@ class AttachmentsMixin(JiraClient, AttachmentsOperationsProto):
                     }
                 )
 
+        uploaded_bytes = sum(item["size"] or 0 for item in uploaded)
         return {
             "success": True,
             "issue_key": issue_key,
             "total": len(file_paths),
             "uploaded": uploaded,
             "failed": failed,
+            "bytes_uploaded": uploaded_bytes,
+            "elapsed_seconds": round(elapsed, 3),
+            "throughput_mb_per_second": round(uploaded_bytes / elapsed / 1e6, 2)
+            if elapsed > 0
+            else 0.0,
         }
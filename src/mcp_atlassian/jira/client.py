@@ -9,15 +9,40 @@ from requests import Session
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.preprocessing import JiraPreprocessor
+from mcp_atlassian.utils.async_http import AsyncAtlassianClient
+from mcp_atlassian.utils.cache_backend import CacheBackend
+from mcp_atlassian.utils.http_pool import mount_connection_pool
 from mcp_atlassian.utils.logging import log_config_param, mask_sensitive
 from mcp_atlassian.utils.oauth import configure_oauth_session
+from mcp_atlassian.utils.rate_limit import RateLimiter
+from mcp_atlassian.utils.request_coalescing import RequestCoalescer
+from mcp_atlassian.utils.response_cache import ResponseCache
 from mcp_atlassian.utils.ssl import configure_ssl_verification
 
 from .config import JiraConfig
+from .metadata import JiraMetadataRegistry
 
 # Configure logging
 logger = logging.getLogger("mcp-jira")
 
+# Response cache tags: all cached issue reads and all cached searches
+ISSUE_CACHE_TAG = "issue"
+SEARCH_CACHE_TAG = "search"
+
+
+def issue_cache_tags(*issue_keys: Any) -> tuple[str, ...]:
+    """Return the response cache tags of the given issues.
+
+    Args:
+        issue_keys: Issue keys or IDs; empty values are skipped
+
+    Returns:
+        One tag per issue
+    """
+    return tuple(
+        f"{ISSUE_CACHE_TAG}:{str(key).strip().upper()}" for key in issue_keys if key
+    )
+
 
 class JiraClient:
     """Base client for Jira API interactions."""
@@ -27,12 +52,40 @@ class JiraClient:
 
     config: JiraConfig
     preprocessor: JiraPreprocessor
-
-    def __init__(self, config: JiraConfig | None = None) -> None:
+    # Only set when config.http_backend is "httpx"
+    async_client: AsyncAtlassianClient | None = None
+    # Shared across fetchers when provided; otherwise metadata is cached per instance
+    metadata_registry: JiraMetadataRegistry | None = None
+    # Shared across fetchers when provided; otherwise every read goes upstream
+    response_cache: ResponseCache | None = None
+    # Shared across fetchers when provided; identical concurrent GETs go upstream once
+    request_coalescer: RequestCoalescer | None = None
+    # Shared with other server replicas when configured (resolved account IDs)
+    cache_backend: CacheBackend | None = None
+    # Shared across fetchers when provided; paces and retries requests per site
+    rate_limiter: RateLimiter | None = None
+
+    def __init__(
+        self,
+        config: JiraConfig | None = None,
+        metadata_registry: JiraMetadataRegistry | None = None,
+        response_cache: ResponseCache | None = None,
+        request_coalescer: RequestCoalescer | None = None,
+        cache_backend: CacheBackend | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
         """Initialize the Jira client with configuration options.
 
         Args:
             config: Optional configuration object (will use env vars if not provided)
+            metadata_registry: Optional registry for sharing site metadata
+                (fields, link types, issue types, priorities) across fetchers
+            response_cache: Optional cache of read responses, invalidated by writes
+            request_coalescer: Optional coalescer that shares one upstream request
+                between identical concurrent GETs
+            cache_backend: Optional cache tier shared with other server replicas
+            rate_limiter: Optional per-site limiter that paces requests and
+                retries throttled reads
 
         Raises:
             ValueError: If configuration is invalid or required credentials are missing
@@ -103,6 +156,13 @@ class JiraClient:
             ssl_verify=self.config.ssl_verify,
         )
 
+        # Share one tuned connection pool with every client of the same site
+        mount_connection_pool(
+            session=self.jira._session,
+            url=api_url if self.config.auth_type == "oauth" else self.config.url,
+            ssl_verify=self.config.ssl_verify,
+        )
+
         # Proxy configuration
         proxies = {}
         if self.config.http_proxy:
@@ -121,10 +181,31 @@ class JiraClient:
             os.environ["NO_PROXY"] = self.config.no_proxy
             log_config_param(logger, "Jira", "NO_PROXY", self.config.no_proxy)
 
+        # The limiter goes first so coalesced requests never count against it
+        if rate_limiter is not None:
+            rate_limiter.install(self.jira._session)
+        self.rate_limiter = rate_limiter
+        if request_coalescer is not None:
+            request_coalescer.install(self.jira._session)
+        self.request_coalescer = request_coalescer
+
+        # Async transport shares the credentials resolved on the sync session
+        if self.config.http_backend == "httpx":
+            self.async_client = AsyncAtlassianClient.from_rest_client(
+                "Jira",
+                self.jira,
+                self.config,
+                coalescer=request_coalescer,
+                rate_limiter=rate_limiter,
+            )
+
         # Initialize the text preprocessor for text processing capabilities
         self.preprocessor = JiraPreprocessor(base_url=self.config.url)
         self._field_ids_cache = None
         self._current_user_account_id = None
+        self.metadata_registry = metadata_registry
+        self.response_cache = response_cache
+        self.cache_backend = cache_backend
 
     def _clean_text(self, text: str) -> str:
         """Clean text content by:
@@ -4,7 +4,8 @@ import logging
 from typing import Any
 
 from ..utils import parse_date
-from .client import JiraClient
+from ..utils.response_cache import invalidates_responses
+from .client import SEARCH_CACHE_TAG, JiraClient, issue_cache_tags
 
 logger = logging.getLogger("mcp-jira")
 
@@ -52,6 +53,9 @@ class CommentsMixin(JiraClient):
             logger.error(f"Error getting comments for issue {issue_key}: {str(e)}")
             raise Exception(f"Error getting comments: {str(e)}") from e
 
+    @invalidates_responses(
+        lambda args: (*issue_cache_tags(args["issue_key"]), SEARCH_CACHE_TAG)
+    )
     def add_comment(self, issue_key: str, comment: str, visibility: str | None = None) -> dict[str, Any]:
         """
         Add a comment to an issue.
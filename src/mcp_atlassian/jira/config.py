@@ -5,6 +5,8 @@ import os
 from dataclasses import dataclass
 from typing import Literal
 
+from ..utils.async_http import HttpBackend, parse_http_backend
+from ..utils.environment import get_positive_int_env
 from ..utils.oauth import OAuthConfig
 from ..utils.urls import is_atlassian_cloud_url
 
@@ -30,7 +32,14 @@ class JiraConfig:
     https_proxy: str | None = None  # HTTPS proxy URL
     no_proxy: str | None = None  # Comma-separated list of hosts to bypass proxy
     socks_proxy: str | None = None  # SOCKS proxy URL (optional)
+    http_backend: HttpBackend = "requests"  # HTTP transport ("requests" or "httpx")
     force_internal_comments: bool = False  # Whether to force all comments to be internal
+    search_concurrency: int = 1  # Pages fetched in parallel by paginated Server/DC searches
+    search_count_ttl: int = 30  # Seconds a Cloud search total is reused for the same JQL
+    batch_concurrency: int = 4  # Requests run in parallel by batch issue creation
+    epic_search_concurrency: int = 1  # Epic issue strategies searched at once
+    attachment_concurrency: int = 4  # Attachments transferred in parallel
+    attachment_chunk_size_kb: int = 1024  # Read size for attachment downloads
 
     @property
     def is_cloud(self) -> bool:
@@ -110,10 +119,27 @@ class JiraConfig:
         no_proxy = os.getenv("JIRA_NO_PROXY", os.getenv("NO_PROXY"))
         socks_proxy = os.getenv("JIRA_SOCKS_PROXY", os.getenv("SOCKS_PROXY"))
 
+        # HTTP transport backend
+        http_backend = parse_http_backend(
+            os.getenv("JIRA_HTTP_BACKEND", os.getenv("ATLASSIAN_HTTP_BACKEND"))
+        )
+
         # Force internal comments setting
         force_internal_comments_env = os.getenv("JIRA_FORCE_INTERNAL_COMMENTS", "false").lower()
         force_internal_comments = force_internal_comments_env in ("true", "1", "yes")
 
+        # Parallel page prefetch for paginated Server/DC searches
+        search_concurrency = get_positive_int_env("JIRA_SEARCH_CONCURRENCY", 1)
+        search_count_ttl = get_positive_int_env("JIRA_SEARCH_COUNT_TTL", 30)
+        batch_concurrency = get_positive_int_env("JIRA_BATCH_CONCURRENCY", 4)
+        epic_search_concurrency = get_positive_int_env(
+            "JIRA_EPIC_SEARCH_CONCURRENCY", 1
+        )
+        attachment_concurrency = get_positive_int_env("JIRA_ATTACHMENT_CONCURRENCY", 4)
+        attachment_chunk_size_kb = get_positive_int_env(
+            "JIRA_ATTACHMENT_CHUNK_SIZE_KB", 1024
+        )
+
         return cls(
             url=url,
             auth_type=auth_type,
@@ -127,7 +153,14 @@ class JiraConfig:
             https_proxy=https_proxy,
             no_proxy=no_proxy,
             socks_proxy=socks_proxy,
+            http_backend=http_backend,
             force_internal_comments=force_internal_comments,
+            search_concurrency=search_concurrency,
+            search_count_ttl=search_count_ttl,
+            batch_concurrency=batch_concurrency,
+            epic_search_concurrency=epic_search_concurrency,
+            attachment_concurrency=attachment_concurrency,
+            attachment_chunk_size_kb=attachment_chunk_size_kb,
         )
 
     def is_auth_configured(self) -> bool:
@@ -1,10 +1,13 @@
 """Module for Jira epic operations."""
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from ..models.jira import JiraIssue
-from .client import JiraClient
+from ..utils.response_cache import invalidates_responses
+from .client import SEARCH_CACHE_TAG, JiraClient, issue_cache_tags
 from .protocols import (
     FieldsOperationsProto,
     IssueOperationsProto,
@@ -14,6 +17,27 @@ from .protocols import (
 
 logger = logging.getLogger("mcp-jira")
 
+# Epic Link field IDs common across Jira instances, tried when discovery fails
+COMMON_EPIC_LINK_FIELDS = [
+    "customfield_10014",
+    "customfield_10008",
+    "customfield_10100",
+    "customfield_10001",
+    "customfield_10002",
+    "customfield_10003",
+    "customfield_10004",
+    "customfield_10005",
+    "customfield_10006",
+    "customfield_10007",
+    "customfield_11703",
+]
+
+_epic_strategies_lock = threading.Lock()
+# Runs the epic type check and concurrent epic issue searches
+_epic_search_executor = ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="jira-epic-search"
+)
+
 
 class EpicsMixin(
     JiraClient,
@@ -24,6 +48,8 @@ class EpicsMixin(
 ):
     """Mixin for Jira epic operations."""
 
+    _epic_strategies: dict[str, str] | None = None
+
     def _try_discover_fields_from_existing_epic(
         self, field_ids: dict[str, str]
     ) -> None:
@@ -253,6 +279,12 @@ class EpicsMixin(
         logger.debug("Could not determine Epic Color field ID")
         return None
 
+    @invalidates_responses(
+        lambda args: (
+            *issue_cache_tags(args["issue_key"], args["epic_key"]),
+            SEARCH_CACHE_TAG,
+        )
+    )
     def link_issue_to_epic(self, issue_key: str, epic_key: str) -> JiraIssue:
         """
         Link an existing issue to an epic.
@@ -397,6 +429,11 @@ class EpicsMixin(
         """
         Get all issues linked to a specific epic.
 
+        Several JQL strategies are tried in turn, starting with the one that last
+        worked for the epic's project. With JiraConfig.epic_search_concurrency
+        above 1, that many candidates are searched at once and the first one in
+        order that finds issues wins.
+
         Args:
             epic_key: The key of the epic (e.g. 'PROJ-123')
             start: Starting index for pagination
@@ -410,177 +447,43 @@ class EpicsMixin(
             Exception: If there is an error getting epic issues
         """
         try:
-            # First, check if the issue is an Epic
-            epic = self.jira.get_issue(epic_key)
-            if not isinstance(epic, dict):
-                msg = (
-                    f"Unexpected return value type from `jira.get_issue`: {type(epic)}"
-                )
-                logger.error(msg)
-                raise TypeError(msg)
-            fields_data = epic.get("fields", {})
-
-            # Safely check if the issue is an Epic
-            issue_type = None
-            issuetype_data = fields_data.get("issuetype")
-            if issuetype_data is not None:
-                issue_type = issuetype_data.get("name", "")
-
-            if issue_type != "Epic":
-                error_msg = (
-                    f"Issue {epic_key} is not an Epic, it is a "
-                    f"{issue_type or 'unknown type'}"
-                )
-                raise ValueError(error_msg)
-
-            # Track which methods we've tried
-            tried_methods = set()
-            issues = []
-
-            # Find the Epic Link field
-            field_ids = self.get_field_ids_to_epic()
-            epic_link_field = self._find_epic_link_field(field_ids)
-
-            # METHOD 1: Try with 'issueFunction in issuesScopedToEpic' - this works in many Jira instances
-            if "issueFunction" not in tried_methods:
-                tried_methods.add("issueFunction")
-                try:
-                    jql = f'issueFunction in issuesScopedToEpic("{epic_key}")'
-                    logger.info(f"Trying to get epic issues with issueFunction: {jql}")
-
-                    search_result = self.search_issues(jql, start=start, limit=limit)
-                    if search_result:
-                        logger.info(
-                            f"Successfully found {len(search_result.issues)} issues for epic {epic_key} using issueFunction"
-                        )
-                        return search_result.issues
-                except Exception as e:
-                    # Log exception but continue with fallback
-                    logger.warning(
-                        f"Error searching epic issues with issueFunction: {str(e)}"
-                    )
-
-            # METHOD 2: Try using parent relationship - common in many Jira setups
-            if "parent" not in tried_methods:
-                tried_methods.add("parent")
-                try:
-                    jql = f'parent = "{epic_key}"'
-                    logger.info(
-                        f"Trying to get epic issues with parent relationship: {jql}"
-                    )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, start, limit)
-                    if issues:
-                        logger.info(
-                            f"Successfully found {len(issues)} issues for epic {epic_key} using parent relationship"
-                        )
-                        return issues
-                except Exception as parent_error:
-                    logger.warning(
-                        f"Error with parent relationship approach: {str(parent_error)}"
-                    )
-
-            # METHOD 3: If we found an Epic Link field, try using it
-            if epic_link_field and "epicLinkField" not in tried_methods:
-                tried_methods.add("epicLinkField")
-                try:
-                    jql = f'"{epic_link_field}" = "{epic_key}"'
-                    logger.info(
-                        f"Trying to get epic issues with epic link field: {jql}"
-                    )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, start, limit)
-                    if issues:
-                        logger.info(
-                            f"Successfully found {len(issues)} issues for epic {epic_key} using epic link field {epic_link_field}"
-                        )
-                        return issues
-                except Exception as e:
-                    logger.warning(
-                        f"Error using epic link field {epic_link_field}: {str(e)}"
-                    )
+            # Check the issue type alongside the first search instead of before it
+            type_check = _epic_search_executor.submit(
+                self.jira.get_issue, epic_key, fields="issuetype"
+            )
+            try:
+                candidates = self._get_epic_issue_candidates(epic_key)
+            except Exception:
+                self._ensure_epic(epic_key, type_check.result())
+                raise
+
+            project_key = epic_key.rsplit("-", 1)[0].upper()
+            learned = self._epic_strategy_cache().get(project_key)
+            candidates.sort(key=lambda candidate: candidate[0] != learned)
+
+            width = max(1, self.config.epic_search_concurrency)
+            for offset in range(0, len(candidates), width):
+                wave = candidates[offset : offset + width]
+                found = self._search_epic_issue_candidates(epic_key, wave, start, limit)
+                if offset == 0:
+                    self._ensure_epic(epic_key, type_check.result())
+                if found is None:
+                    continue
 
-            # METHOD 4: Try using 'Epic Link' as a textual field name
-            if "epicLinkName" not in tried_methods:
-                tried_methods.add("epicLinkName")
-                try:
-                    jql = f'"Epic Link" = "{epic_key}"'
-                    logger.info(
-                        f"Trying to get epic issues with 'Epic Link' field name: {jql}"
+                (name, _, common_field_id), issues = found
+                logger.info(
+                    f"Successfully found {len(issues)} issues for epic {epic_key} using {name}"
+                )
+                with _epic_strategies_lock:
+                    self._epic_strategy_cache()[project_key] = name
+                if common_field_id:
+                    # Cache this successful field ID for future use
+                    if self._field_ids_cache is None:
+                        self._field_ids_cache = []
+                    self._field_ids_cache.append(
+                        {"id": common_field_id, "name": "epic_link"}
                     )
-                    issues = self._get_epic_issues_by_jql(epic_key, jql, start, limit)
-                    if issues:
-                        logger.info(
-                            f"Successfully found {len(issues)} issues for epic {epic_key} using 'Epic Link' field name"
-                        )
-                        return issues
-                except Exception as e:
-                    logger.warning(f"Error using 'Epic Link' field name: {str(e)}")
-
-            # METHOD 5: Try using issue links with a specific link type
-            if "issueLinks" not in tried_methods:
-                tried_methods.add("issueLinks")
-                try:
-                    # Try to find issues linked to this epic with standard link types
-                    link_types = ["relates to", "blocks", "is blocked by", "is part of"]
-                    for link_type in link_types:
-                        jql = f'issueLink = "{link_type}" and issueLink = "{epic_key}"'
-                        logger.info(
-                            f"Trying to get epic issues with issue links: {jql}"
-                        )
-                        try:
-                            issues = self._get_epic_issues_by_jql(
-                                epic_key, jql, start, limit
-                            )
-                            if issues:
-                                logger.info(
-                                    f"Successfully found {len(issues)} issues for epic {epic_key} using issue links with type '{link_type}'"
-                                )
-                                return issues
-                        except Exception:
-                            # Just try the next link type
-                            continue
-                except Exception as e:
-                    logger.warning(f"Error using issue links approach: {str(e)}")
-
-            # METHOD 6: Last resort - try each common Epic Link field ID directly
-            if "commonFields" not in tried_methods:
-                tried_methods.add("commonFields")
-                common_epic_fields = [
-                    "customfield_10014",
-                    "customfield_10008",
-                    "customfield_10100",
-                    "customfield_10001",
-                    "customfield_10002",
-                    "customfield_10003",
-                    "customfield_10004",
-                    "customfield_10005",
-                    "customfield_10006",
-                    "customfield_10007",
-                    "customfield_11703",
-                ]
-
-                for field_id in common_epic_fields:
-                    try:
-                        jql = f'"{field_id}" = "{epic_key}"'
-                        logger.info(
-                            f"Trying to get epic issues with common field ID: {jql}"
-                        )
-                        issues = self._get_epic_issues_by_jql(
-                            epic_key, jql, start, limit
-                        )
-                        if issues:
-                            logger.info(
-                                f"Successfully found {len(issues)} issues for epic {epic_key} using field ID {field_id}"
-                            )
-                            # Cache this successful field ID for future use
-                            if self._field_ids_cache is None:
-                                self._field_ids_cache = []
-                            self._field_ids_cache.append(
-                                {"id": field_id, "name": "epic_link"}
-                            )
-                            return issues
-                    except Exception:
-                        # Just try the next field ID
-                        continue
+                return issues
 
             # If we've tried everything and found no issues, return an empty list
             logger.warning(
@@ -596,6 +499,143 @@ class EpicsMixin(
             logger.error(f"Error getting issues for epic {epic_key}: {str(e)}")
             raise Exception(f"Error getting epic issues: {str(e)}") from e
 
+    def _ensure_epic(self, epic_key: str, epic: Any) -> None:
+        """
+        Check that an issue returned by the API is an Epic.
+
+        Args:
+            epic_key: The issue key
+            epic: The issue data
+
+        Raises:
+            TypeError: If the issue data is not a dictionary
+            ValueError: If the issue is not an Epic
+        """
+        if not isinstance(epic, dict):
+            msg = f"Unexpected return value type from `jira.get_issue`: {type(epic)}"
+            logger.error(msg)
+            raise TypeError(msg)
+        fields_data = epic.get("fields", {})
+
+        # Safely check if the issue is an Epic
+        issue_type = None
+        issuetype_data = fields_data.get("issuetype")
+        if issuetype_data is not None:
+            issue_type = issuetype_data.get("name", "")
+
+        if issue_type != "Epic":
+            error_msg = (
+                f"Issue {epic_key} is not an Epic, it is a "
+                f"{issue_type or 'unknown type'}"
+            )
+            raise ValueError(error_msg)
+
+    def _get_epic_issue_candidates(
+        self, epic_key: str
+    ) -> list[tuple[str, str, str | None]]:
+        """
+        List the JQL strategies for finding an epic's issues, in default order.
+
+        Args:
+            epic_key: The key of the epic
+
+        Returns:
+            List of (strategy name, JQL, common epic link field ID or None)
+        """
+        # Find the Epic Link field
+        field_ids = self.get_field_ids_to_epic()
+        epic_link_field = self._find_epic_link_field(field_ids)
+
+        candidates: list[tuple[str, str, str | None]] = [
+            # Works in many Jira instances
+            (
+                "issueFunction",
+                f'issueFunction in issuesScopedToEpic("{epic_key}")',
+                None,
+            ),
+            # Common in many Jira setups
+            ("parent relationship", f'parent = "{epic_key}"', None),
+        ]
+        if epic_link_field:
+            candidates.append(
+                (
+                    f"epic link field {epic_link_field}",
+                    f'"{epic_link_field}" = "{epic_key}"',
+                    None,
+                )
+            )
+        candidates.append(
+            ("'Epic Link' field name", f'"Epic Link" = "{epic_key}"', None)
+        )
+        # Issues linked to this epic with standard link types
+        for link_type in ["relates to", "blocks", "is blocked by", "is part of"]:
+            candidates.append(
+                (
+                    f"issue links with type '{link_type}'",
+                    f'issueLink = "{link_type}" and issueLink = "{epic_key}"',
+                    None,
+                )
+            )
+        # Last resort - each common Epic Link field ID directly
+        for field_id in COMMON_EPIC_LINK_FIELDS:
+            if field_id != epic_link_field:
+                candidates.append(
+                    (f"field ID {field_id}", f'"{field_id}" = "{epic_key}"', field_id)
+                )
+        return candidates
+
+    def _search_epic_issue_candidates(
+        self,
+        epic_key: str,
+        candidates: list[tuple[str, str, str | None]],
+        start: int,
+        limit: int,
+    ) -> tuple[tuple[str, str, str | None], list[JiraIssue]] | None:
+        """
+        Search with several strategies at once and keep the first that finds issues.
+
+        Args:
+            epic_key: The key of the epic
+            candidates: Strategies from _get_epic_issue_candidates
+            start: Starting index for pagination
+            limit: Maximum number of issues to return
+
+        Returns:
+            The winning candidate and its issues, or None if none found any
+        """
+
+        def search(candidate: tuple[str, str, str | None]) -> list[JiraIssue]:
+            name, jql, _ = candidate
+            logger.info(f"Trying to get epic issues with {name}: {jql}")
+            try:
+                return self._get_epic_issues_by_jql(epic_key, jql, start, limit)
+            except Exception as e:
+                logger.warning(f"Error searching epic issues with {name}: {str(e)}")
+                return []
+
+        if len(candidates) == 1:
+            issues = search(candidates[0])
+            return (candidates[0], issues) if issues else None
+
+        futures = [
+            _epic_search_executor.submit(search, candidate) for candidate in candidates
+        ]
+        try:
+            for candidate, future in zip(candidates, futures, strict=True):
+                issues = future.result()
+                if issues:
+                    return candidate, issues
+            return None
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _epic_strategy_cache(self) -> dict[str, str]:
+        """Return the strategy that last found epic issues, per project key."""
+        if self._epic_strategies is None:
+            self._epic_strategies = {}
+        return self._epic_strategies
+
     def _find_epic_link_field(self, field_ids: dict[str, str]) -> str | None:
         """
         Find the Epic Link field with fallback mechanisms.
@@ -794,6 +834,9 @@ class EpicsMixin(
             logger.warning(f"No issues found for epic {epic_key} with query: {jql}")
         return search_result.issues
 
+    @invalidates_responses(
+        lambda args: (*issue_cache_tags(args["issue_key"]), SEARCH_CACHE_TAG)
+    )
     def update_epic_fields(self, issue_key: str, kwargs: dict[str, Any]) -> JiraIssue:
         """
         Update Epic-specific fields after Epic creation.
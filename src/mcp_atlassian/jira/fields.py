@@ -6,6 +6,7 @@ from typing import Any
 from thefuzz import fuzz
 
 from .client import JiraClient
+from .metadata import FieldIndex
 from .protocols import EpicOperationsProto, UsersOperationsProto
 
 logger = logging.getLogger("mcp-jira")
@@ -32,6 +33,10 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             List of field definitions
         """
         try:
+            # Use the shared registry when available
+            if self.metadata_registry is not None:
+                return self._get_field_index(refresh=refresh).fields
+
             # Use cached field data if available and refresh is not requested
             if self._field_ids_cache is not None and not refresh:
                 return self._field_ids_cache
@@ -63,8 +68,37 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             logger.error(f"Error getting Jira fields: {str(e)}")
             return []
 
+    def _load_all_fields(self) -> list[dict[str, Any]]:
+        """Fetch all field definitions from Jira for the metadata registry."""
+        fields = self.jira.get_all_fields()
+        if not isinstance(fields, list):
+            msg = f"Unexpected return value type from `jira.get_all_fields`: {type(fields)}"
+            logger.error(msg)
+            raise TypeError(msg)
+        self._log_available_fields(fields)
+        return fields
+
+    def _get_field_index(self, refresh: bool = False) -> FieldIndex:
+        """Get the indexed field definitions from the shared metadata registry."""
+        if self.metadata_registry is None:
+            return FieldIndex.build(self.get_fields(refresh=refresh))
+        return self.metadata_registry.get(
+            self.config.url,
+            "fields",
+            self._load_all_fields,
+            refresh=refresh,
+            transform=FieldIndex.build,
+        )
+
     def _generate_field_map(self, force_regenerate: bool = False) -> dict[str, str]:
         """Generates and caches a map of lowercase field names to field IDs."""
+        if self.metadata_registry is not None:
+            try:
+                return self._get_field_index(refresh=force_regenerate).name_to_id
+            except Exception as e:
+                logger.error(f"Error getting Jira fields: {str(e)}")
+                return {}
+
         if self._field_name_to_id_map is not None and not force_regenerate:
             return self._field_name_to_id_map
 
@@ -140,6 +174,13 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             Field definition if found, None otherwise
         """
         try:
+            if self.metadata_registry is not None:
+                field = self._get_field_index(refresh=refresh).by_id.get(field_id)
+                if field is not None:
+                    return field
+                logger.warning(f"Field with ID '{field_id}' not found")
+                return None
+
             fields = self.get_fields(refresh=refresh)
 
             for field in fields:
@@ -177,6 +218,60 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
             logger.error(f"Error getting custom fields: {str(e)}")
             return []
 
+    def get_fields_by_schema_type(
+        self, schema_type: str, refresh: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        Get all fields whose schema has the given type.
+
+        Args:
+            schema_type: The schema type (e.g., 'user', 'array', 'option')
+            refresh: When True, forces a refresh from the server
+
+        Returns:
+            List of matching field definitions
+        """
+        try:
+            return list(
+                self._get_field_index(refresh=refresh).by_schema_type.get(
+                    schema_type, []
+                )
+            )
+        except Exception as e:
+            logger.error(
+                f"Error getting fields of schema type '{schema_type}': {str(e)}"
+            )
+            return []
+
+    def get_priorities(self, refresh: bool = False) -> list[dict[str, Any]]:
+        """
+        Get all issue priorities defined on the Jira site.
+
+        Args:
+            refresh: When True, forces a refresh from the server
+
+        Returns:
+            List of priority definitions (id, name, ...)
+        """
+
+        def load_priorities() -> list[dict[str, Any]]:
+            priorities = self.jira.get_all_priorities()
+            if not isinstance(priorities, list):
+                msg = f"Unexpected return value type from `jira.get_all_priorities`: {type(priorities)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            return priorities
+
+        try:
+            if self.metadata_registry is None:
+                return load_priorities()
+            return self.metadata_registry.get(
+                self.config.url, "priorities", load_priorities, refresh=refresh
+            )
+        except Exception as e:
+            logger.error(f"Error getting Jira priorities: {str(e)}")
+            return []
+
     def get_required_fields(self, issue_type: str, project_key: str) -> dict[str, Any]:
         """
         Get required fields for creating an issue of a specific type in a project.
@@ -250,11 +345,34 @@ class FieldsMixin(JiraClient, EpicOperationsProto, UsersOperationsProto):
         Dynamically discover Jira field IDs relevant to Epic linking.
         This method queries the Jira API to find the correct custom field IDs
         for Epic-related fields, which can vary between different Jira instances.
+        With a metadata registry, the discovered IDs are shared and persisted.
 
         Returns:
             Dictionary mapping field names to their IDs
             (e.g., {'epic_link': 'customfield_10014', 'epic_name': 'customfield_10011'})
         """
+        if self.metadata_registry is None:
+            return self._discover_field_ids_to_epic()
+
+        def load_epic_field_ids() -> dict[str, str]:
+            field_ids = self._discover_field_ids_to_epic()
+            if not field_ids:
+                # Raising keeps a failed discovery out of the registry
+                raise ValueError("Epic field discovery returned no fields")
+            return field_ids
+
+        try:
+            return dict(
+                self.metadata_registry.get(
+                    self.config.url, "epic_field_ids", load_epic_field_ids
+                )
+            )
+        except Exception as e:
+            logger.error(f"Error discovering Jira field IDs: {str(e)}")
+            return {}
+
+    def _discover_field_ids_to_epic(self) -> dict[str, str]:
+        """Discover epic-related field IDs from the field list and existing epics."""
         try:
             # Ensure field list and map are cached/generated
             self._generate_field_map()  # Generates map and ensures fields are cached
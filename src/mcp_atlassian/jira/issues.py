@@ -2,6 +2,7 @@
 
 import logging
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from requests.exceptions import HTTPError
@@ -10,7 +11,13 @@ from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.jira import JiraIssue
 from ..models.jira.common import JiraChangelog
 from ..utils import parse_date
-from .client import JiraClient
+from ..utils.response_cache import cached_response, invalidates_responses
+from .client import (
+    ISSUE_CACHE_TAG,
+    SEARCH_CACHE_TAG,
+    JiraClient,
+    issue_cache_tags,
+)
 from .constants import DEFAULT_READ_JIRA_FIELDS
 from .protocols import (
     AttachmentsOperationsProto,
@@ -22,6 +29,17 @@ from .protocols import (
 
 logger = logging.getLogger("mcp-jira")
 
+# Keys requested per bulk issue request; Cloud's bulkfetch accepts at most 100
+BULK_ISSUE_CHUNK_SIZE = 100
+
+# Issues per bulk create request; Jira accepts at most 50
+BULK_CREATE_CHUNK_SIZE = 50
+
+# Runs the comment page request of get_issue alongside the issue request
+_issue_comments_executor = ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="jira-issue-comments"
+)
+
 
 class IssuesMixin(
     JiraClient,
@@ -33,6 +51,10 @@ class IssuesMixin(
 ):
     """Mixin for Jira issue operations."""
 
+    @cached_response(
+        "get_issue",
+        lambda args: (ISSUE_CACHE_TAG, *issue_cache_tags(args["issue_key"])),
+    )
     def get_issue(
         self,
         issue_key: str,
@@ -118,14 +140,37 @@ class IssuesMixin(
             if properties and isinstance(properties, list | tuple | set):
                 properties_param = ",".join(properties)
 
-            # Get the issue data with all parameters
-            issue = self.jira.get_issue(
-                issue_key,
-                expand=expand_param,
-                fields=fields_param,
-                properties=properties_param,
-                update_history=update_history,
+            # Comments are requested as their own bounded page, alongside the
+            # issue request, instead of embedding every comment in the issue
+            requested_fields = [f.strip() for f in fields_param.split(",")]
+            comments_requested = (
+                "comment" in requested_fields or "*all" in requested_fields
             )
+            comment_limit_int = self._normalize_comment_limit(comment_limit)
+            if comments_requested:
+                requested_fields = [f for f in requested_fields if f != "comment"]
+                if "*all" in requested_fields:
+                    requested_fields.append("-comment")
+                fields_param = ",".join(requested_fields)
+            comments_future = None
+            if comments_requested and comment_limit_int != 0:
+                comments_future = _issue_comments_executor.submit(
+                    self._get_issue_comments_if_needed, issue_key, comment_limit_int
+                )
+
+            # Get the issue data with all parameters
+            try:
+                issue = self.jira.get_issue(
+                    issue_key,
+                    expand=expand_param,
+                    fields=fields_param,
+                    properties=properties_param,
+                    update_history=update_history,
+                )
+            except Exception:
+                if comments_future is not None:
+                    comments_future.cancel()
+                raise
             if not issue:
                 msg = f"Issue {issue_key} not found"
                 raise ValueError(msg)
@@ -139,14 +184,12 @@ class IssuesMixin(
             # Extract fields data, safely handling None
             fields_data = issue.get("fields", {}) or {}
 
-            # Get comments if needed
-            if "comment" in fields_data:
-                comment_limit_int = self._normalize_comment_limit(comment_limit)
-                comments = self._get_issue_comments_if_needed(
-                    issue_key, comment_limit_int
+            # Add comments to the issue data for processing by the model
+            if comments_requested:
+                comments = (
+                    comments_future.result() if comments_future is not None else []
                 )
-                # Add comments to the issue data for processing by the model
-                fields_data["comment"]["comments"] = comments
+                fields_data["comment"] = {"comments": comments}
 
             # Extract epic information
             try:
@@ -206,6 +249,219 @@ class IssuesMixin(
             logger.error(f"Error retrieving issue {issue_key}: {error_msg}")
             raise Exception(f"Error retrieving issue {issue_key}: {error_msg}") from e
 
+    def get_issues(
+        self,
+        issue_keys: list[str],
+        fields: str | list[str] | tuple[str, ...] | set[str] | None = None,
+        comment_limit: int | str | None = 10,
+        expand: str | None = None,
+    ) -> dict[str, JiraIssue | str]:
+        """
+        Get several Jira issues by key using a few bulk requests.
+
+        Keys are fetched in chunks of BULK_ISSUE_CHUNK_SIZE, through the issue
+        bulkfetch endpoint on Cloud and a `key in (...)` search on Server/DC.
+        Comments are taken from each issue's comment field instead of one request
+        per issue, and linked epics are looked up together.
+
+        Args:
+            issue_keys: The issue keys (e.g., ['PROJECT-123', 'PROJECT-124'])
+            fields: Fields to return (comma-separated string, list, tuple, set, or "*all")
+            comment_limit: Maximum number of most recent comments to include per
+                issue, or "all"
+            expand: Fields to expand in the response
+
+        Returns:
+            Dictionary mapping each requested key, in input order, to its JiraIssue
+            or to an error message if it could not be retrieved
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+        """
+        fields_param = fields
+        if fields_param is None:
+            fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
+        elif isinstance(fields_param, list | tuple | set):
+            fields_param = ",".join(fields_param)
+
+        keys = list(dict.fromkeys(key.strip() for key in issue_keys if key.strip()))
+        raw_issues: dict[str, dict] = {}
+        errors: dict[str, str] = {}
+        for offset in range(0, len(keys), BULK_ISSUE_CHUNK_SIZE):
+            chunk = keys[offset : offset + BULK_ISSUE_CHUNK_SIZE]
+            try:
+                chunk_issues, chunk_errors = self._fetch_issue_chunk(
+                    chunk, fields_param, expand
+                )
+            except MCPAtlassianAuthenticationError:
+                raise
+            except Exception as e:
+                logger.error(f"Error retrieving issues {', '.join(chunk)}: {str(e)}")
+                for key in chunk:
+                    errors[key.upper()] = f"Error retrieving issue {key}: {str(e)}"
+                continue
+            for issue in chunk_issues:
+                raw_issues[str(issue.get("key", "")).upper()] = issue
+            errors.update(chunk_errors)
+
+        epic_names = self._get_linked_epic_names(list(raw_issues.values()))
+        comment_limit_int = self._normalize_comment_limit(comment_limit)
+
+        results: dict[str, JiraIssue | str] = {}
+        for key in keys:
+            issue = raw_issues.get(key.upper())
+            if issue is None:
+                results[key] = errors.get(
+                    key.upper(),
+                    f"Issue {key} does not exist or you do not have permission to see it",
+                )
+                continue
+
+            fields_data = issue.get("fields", {}) or {}
+            comment_field = fields_data.get("comment")
+            if isinstance(comment_field, dict):
+                comments = comment_field.get("comments") or []
+                # The embedded comments are oldest first; keep the newest ones
+                if comment_limit_int is not None:
+                    comments = (
+                        comments[-comment_limit_int:] if comment_limit_int > 0 else []
+                    )
+                comment_field["comments"] = comments
+
+            epic_key, epic_name_field, epic_name = epic_names.get(
+                key.upper(), (None, None, None)
+            )
+            if epic_key and epic_name and epic_name_field not in fields_data:
+                fields_data[epic_name_field] = epic_name
+            issue["fields"] = fields_data
+
+            results[key] = JiraIssue.from_api_response(
+                issue, base_url=self.config.url, requested_fields=fields
+            )
+        return results
+
+    def _fetch_issue_chunk(
+        self, keys: list[str], fields_param: str, expand: str | None
+    ) -> tuple[list[dict], dict[str, str]]:
+        """
+        Fetch up to BULK_ISSUE_CHUNK_SIZE issues with a single request.
+
+        Args:
+            keys: The issue keys
+            fields_param: Comma-separated fields to return
+            expand: Fields to expand in the response
+
+        Returns:
+            Tuple of (raw issues, error messages keyed by upper-cased issue key)
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            Exception: If the request fails
+        """
+        try:
+            if self.config.is_cloud:
+                payload: dict[str, Any] = {
+                    "issueIdsOrKeys": keys,
+                    "fields": fields_param.split(","),
+                }
+                if expand:
+                    payload["expand"] = expand.split(",")
+                response = self.jira.post(
+                    self.jira.resource_url("issue/bulkfetch"), json=payload
+                )
+            else:
+                quoted_keys = ", ".join(
+                    '"{}"'.format(key.replace('"', '\\"')) for key in keys
+                )
+                params: dict[str, Any] = {
+                    "jql": f"key in ({quoted_keys})",
+                    "fields": fields_param,
+                    "maxResults": len(keys),
+                    # Report unknown keys as warnings instead of failing the query
+                    "validateQuery": "warn",
+                }
+                if expand:
+                    params["expand"] = expand
+                response = self.jira.get(
+                    self.jira.resource_url("search"), params=params
+                )
+        except HTTPError as http_err:
+            if http_err.response is not None and http_err.response.status_code in [
+                401,
+                403,
+            ]:
+                error_msg = (
+                    f"Authentication failed for Jira API ({http_err.response.status_code}). "
+                    "Token may be expired or invalid. Please verify credentials."
+                )
+                logger.error(error_msg)
+                raise MCPAtlassianAuthenticationError(error_msg) from http_err
+            raise
+        if not isinstance(response, dict):
+            msg = f"Unexpected return value type from bulk issue request: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)
+
+        errors: dict[str, str] = {}
+        for error in response.get("issueErrors") or []:
+            key = str(error.get("issueIdOrKey") or error.get("key") or "")
+            message = error.get("errorMessage") or "; ".join(
+                error.get("errorMessages") or []
+            )
+            if key and message:
+                errors[key.upper()] = message
+        return response.get("issues") or [], errors
+
+    def _get_linked_epic_names(
+        self, issues: list[dict]
+    ) -> dict[str, tuple[str, str, str | None]]:
+        """
+        Look up the names of the epics that a batch of issues links to.
+
+        Args:
+            issues: Raw issue data
+
+        Returns:
+            Dictionary mapping upper-cased issue keys to
+            (epic key, epic name field ID, epic name)
+        """
+        try:
+            field_ids = self.get_field_ids_to_epic()
+        except Exception as e:
+            logger.warning(f"Error getting Jira fields: {str(e)}")
+            return {}
+        link_field = field_ids.get("epic_link")
+        name_field = field_ids.get("epic_name")
+        if not link_field or not name_field:
+            return {}
+
+        links: dict[str, str] = {}
+        names: dict[str, str | None] = {}
+        for issue in issues:
+            issue_fields = issue.get("fields", {}) or {}
+            key = str(issue.get("key", "")).upper()
+            names[key] = issue_fields.get(name_field)
+            epic_key = issue_fields.get(link_field)
+            if isinstance(epic_key, str) and epic_key:
+                links[key] = epic_key
+        missing = sorted({epic.upper() for epic in links.values()} - names.keys())
+        for offset in range(0, len(missing), BULK_ISSUE_CHUNK_SIZE):
+            chunk = missing[offset : offset + BULK_ISSUE_CHUNK_SIZE]
+            try:
+                epics, _ = self._fetch_issue_chunk(chunk, f"summary,{name_field}", None)
+            except Exception as e:
+                logger.warning(f"Error getting epic details for {chunk}: {str(e)}")
+                continue
+            for epic in epics:
+                names[str(epic.get("key", "")).upper()] = (
+                    epic.get("fields", {}) or {}
+                ).get(name_field)
+
+        return {
+            key: (epic_key, name_field, names.get(epic_key.upper()))
+            for key, epic_key in links.items()
+        }
+
     def _normalize_comment_limit(self, comment_limit: int | str | None) -> int | None:
         """
         Normalize the comment limit to an integer or None.
@@ -238,26 +494,35 @@ class IssuesMixin(
         """
         Get comments for an issue if needed.
 
+        With a limit, only the newest comment_limit comments are requested
+        (newest first, limited server-side) and returned in chronological order.
+
         Args:
             issue_key: The issue key
-            comment_limit: Maximum number of comments to include
+            comment_limit: Maximum number of comments to include, or None for all
 
         Returns:
             List of comments
         """
         if comment_limit is None or comment_limit > 0:
             try:
-                response = self.jira.issue_get_comments(issue_key)
+                if comment_limit is None:
+                    response = self.jira.issue_get_comments(issue_key)
+                else:
+                    response = self.jira.get(
+                        self.jira.resource_url(f"issue/{issue_key}/comment"),
+                        params={"maxResults": comment_limit, "orderBy": "-created"},
+                    )
                 if not isinstance(response, dict):
-                    msg = f"Unexpected return value type from `jira.issue_get_comments`: {type(response)}"
+                    msg = f"Unexpected return value type from issue comments request: {type(response)}"
                     logger.error(msg)
                     raise TypeError(msg)
 
-                comments = response["comments"]
+                comments = response.get("comments") or []
 
                 # Limit comments if needed
                 if comment_limit is not None:
-                    comments = comments[:comment_limit]
+                    comments = comments[:comment_limit][::-1]
 
                 return comments
             except Exception as e:
@@ -477,6 +742,7 @@ class IssuesMixin(
 
         return metadata
 
+    @invalidates_responses(lambda args: (SEARCH_CACHE_TAG,))
     def create_issue(
         self,
         project_key: str,
@@ -864,6 +1130,9 @@ class IssuesMixin(
         else:
             logger.error(f"Error creating {issue_type}: {error_msg}")
 
+    @invalidates_responses(
+        lambda args: (*issue_cache_tags(args["issue_key"]), SEARCH_CACHE_TAG)
+    )
     def update_issue(
         self,
         issue_key: str,
@@ -1209,129 +1478,290 @@ class IssuesMixin(
             List of created JiraIssue objects
 
         Raises:
-            ValueError: If any required fields are missing or invalid
+            ValueError: If the first issue is missing required fields
             MCPAtlassianAuthenticationError: If authentication fails
+            Exception: If no issue could be created
         """
         if not issues:
             return []
 
-        # Prepare issues for bulk creation
-        issue_updates = []
-        for issue_data in issues:
-            try:
-                # Extract and validate required fields
-                project_key = issue_data.pop("project_key", None)
-                summary = issue_data.pop("summary", None)
-                issue_type = issue_data.pop("issue_type", None)
-                description = issue_data.pop("description", "")
-                assignee = issue_data.pop("assignee", None)
-                components = issue_data.pop("components", None)
-
-                # Validate required fields
-                if not all([project_key, summary, issue_type]):
-                    raise ValueError(
-                        f"Missing required fields for issue: {project_key=}, {summary=}, {issue_type=}"
-                    )
+        # An invalid first issue fails the call; later ones are skipped
+        self._validate_batch_issue(issues[0])
 
-                # Prepare fields dictionary
-                fields = {
-                    "project": {"key": project_key},
-                    "summary": summary,
-                    "issuetype": {"name": issue_type},
-                }
+        report = self.batch_create_issues_with_report(
+            issues, validate_only=validate_only
+        )
+        failed = [item for item in report if item["status"] == "failed"]
+        if not validate_only and len(failed) == len(report):
+            errors = list(dict.fromkeys(item.get("error", "") for item in failed))
+            error_msg = (
+                f"Error in bulk issue creation: none of the {len(report)} issues "
+                f"were created: {'; '.join(errors)}"
+            )
+            logger.error(error_msg)
+            raise Exception(error_msg)
+        return [item["issue"] for item in report if item.get("issue") is not None]
 
-                # Add optional fields
-                if description:
-                    fields["description"] = description
+    @invalidates_responses(lambda args: (SEARCH_CACHE_TAG,))
+    def batch_create_issues_with_report(
+        self,
+        issues: list[dict[str, Any]],
+        validate_only: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Create multiple Jira issues and report the outcome of each one.
 
-                # Add assignee if provided
-                if assignee:
-                    try:
-                        # _get_account_id now returns the correct identifier (accountId for cloud, name for server)
-                        assignee_identifier = self._get_account_id(assignee)
-                        self._add_assignee_to_fields(fields, assignee_identifier)
-                    except ValueError as e:
-                        logger.warning(f"Could not assign issue: {str(e)}")
-
-                # Add components if provided
-                if components:
-                    if isinstance(components, list):
-                        valid_components = [
-                            comp_name.strip()
-                            for comp_name in components
-                            if isinstance(comp_name, str) and comp_name.strip()
-                        ]
-                        if valid_components:
-                            fields["components"] = [
-                                {"name": comp_name} for comp_name in valid_components
-                            ]
+        Distinct assignees are resolved once, concurrently. Issues are submitted
+        to the bulk create endpoint in chunks of BULK_CREATE_CHUNK_SIZE, up to
+        JiraConfig.batch_concurrency chunks at a time, and the created issues
+        are then fetched with bulk requests.
 
-                # Add any remaining custom fields
-                self._process_additional_fields(fields, issue_data)
+        Args:
+            issues: List of issue dictionaries, as for batch_create_issues
+            validate_only: If True, only validates the issues without creating them
 
-                if validate_only:
-                    # For validation, just log the issue that would be created
-                    logger.info(
-                        f"Validated issue creation: {project_key} - {summary} ({issue_type})"
-                    )
-                    continue
+        Returns:
+            One entry per input issue, in input order, with 'index', 'status'
+            ('created', 'validated' or 'failed') and either 'key' and 'issue'
+            (the created JiraIssue, or None if it could not be fetched) or 'error'.
+            Issues whose assignee could not be resolved are created unassigned
+            and have a 'warning'
 
-                # Add to bulk creation list
-                issue_updates.append({"fields": fields})
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails before any
+                issue was created; after that, the affected issues are reported
+                as failed
+        """
+        report: list[dict[str, Any]] = [
+            {"index": index, "status": "failed"} for index in range(len(issues))
+        ]
+        if not issues:
+            return report
 
+        account_ids = self.resolve_account_ids(
+            str(issue_data["assignee"])
+            for issue_data in issues
+            if issue_data.get("assignee")
+        )
+
+        # Prepare issues for bulk creation
+        pending: list[tuple[int, dict[str, Any]]] = []
+        for index, issue_data in enumerate(issues):
+            try:
+                fields = self._prepare_batch_issue(issue_data, account_ids)
             except Exception as e:
                 logger.error(f"Failed to prepare issue for creation: {str(e)}")
-                if not issue_updates:
-                    raise
+                report[index]["error"] = str(e)
+                continue
+            assignee = issue_data.get("assignee")
+            if assignee and not account_ids.get(str(assignee)):
+                logger.warning(f"Could not assign issue to {assignee}")
+                report[index]["warning"] = f"Could not assign {assignee}"
+            if validate_only:
+                # For validation, just log the issue that would be created
+                logger.info(
+                    f"Validated issue creation: {fields['project']['key']} - "
+                    f"{fields['summary']} ({fields['issuetype']['name']})"
+                )
+                report[index]["status"] = "validated"
+                continue
+            pending.append((index, {"fields": fields}))
 
-        if validate_only:
-            return []
+        chunks = [
+            pending[offset : offset + BULK_CREATE_CHUNK_SIZE]
+            for offset in range(0, len(pending), BULK_CREATE_CHUNK_SIZE)
+        ]
+        auth_error: MCPAtlassianAuthenticationError | None = None
+        if chunks:
+            with ThreadPoolExecutor(
+                max_workers=min(self.config.batch_concurrency, len(chunks)),
+                thread_name_prefix="jira-batch-create",
+            ) as pool:
+                futures = [
+                    pool.submit(self._create_issue_chunk, chunk) for chunk in chunks
+                ]
+                # Results are collected per chunk so that an authentication
+                # failure in one chunk keeps the report of those already created
+                for chunk, future in zip(chunks, futures, strict=True):
+                    try:
+                        chunk_report = future.result()
+                    except MCPAtlassianAuthenticationError as e:
+                        auth_error = auth_error or e
+                        chunk_report = {index: {"error": str(e)} for index, _ in chunk}
+                    for index, outcome in chunk_report.items():
+                        report[index].update(outcome)
+        if auth_error is not None and not any(
+            item["status"] == "created" for item in report
+        ):
+            raise auth_error
 
-        try:
-            # Call Jira's bulk create endpoint
-            response = self.jira.create_issues(issue_updates)
-            if not isinstance(response, dict):
-                msg = f"Unexpected return value type from `jira.create_issues`: {type(response)}"
-                logger.error(msg)
-                raise TypeError(msg)
+        # Fetch the created issues with bulk requests instead of one by one
+        created = [item for item in report if item["status"] == "created"]
+        if created:
+            try:
+                fetched = self.get_issues(
+                    [item["key"] for item in created], comment_limit=0
+                )
+            except Exception as e:
+                logger.error(f"Error fetching created issues: {str(e)}")
+                fetched = {}
+            for item in created:
+                issue = fetched.get(item["key"])
+                if isinstance(issue, JiraIssue):
+                    item["issue"] = issue
+                else:
+                    logger.error(f"Error fetching created issue {item['key']}: {issue}")
+                    item["issue"] = None
+        return report
 
-            # Process results
-            created_issues = []
-            for issue_info in response.get("issues", []):
-                issue_key = issue_info.get("key")
-                if issue_key:
-                    try:
-                        # Fetch the full issue data
-                        issue_data = self.jira.get_issue(issue_key)
-                        if not isinstance(issue_data, dict):
-                            msg = f"Unexpected return value type from `jira.get_issue`: {type(issue_data)}"
-                            logger.error(msg)
-                            raise TypeError(msg)
+    def _validate_batch_issue(self, issue_data: dict[str, Any]) -> None:
+        """
+        Check that a batch issue has its required fields.
 
-                        created_issues.append(
-                            JiraIssue.from_api_response(
-                                issue_data,
-                                base_url=self.config.url
-                                if hasattr(self, "config")
-                                else None,
-                            )
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Error fetching created issue {issue_key}: {str(e)}"
-                        )
+        Args:
+            issue_data: The issue dictionary
 
-            # Log any errors from the bulk creation
-            errors = response.get("errors", [])
-            if errors:
-                for error in errors:
-                    logger.error(f"Bulk creation error: {error}")
+        Raises:
+            ValueError: If project_key, summary or issue_type is missing
+        """
+        project_key = issue_data.get("project_key")
+        summary = issue_data.get("summary")
+        issue_type = issue_data.get("issue_type")
+        if not all([project_key, summary, issue_type]):
+            raise ValueError(
+                f"Missing required fields for issue: {project_key=}, {summary=}, {issue_type=}"
+            )
+
+    def _prepare_batch_issue(
+        self, issue_data: dict[str, Any], account_ids: dict[str, str | None]
+    ) -> dict[str, Any]:
+        """
+        Build the fields payload of one batch issue.
+
+        Args:
+            issue_data: The issue dictionary; it is not modified
+            account_ids: Resolved identifiers keyed by assignee
+
+        Returns:
+            The fields dictionary for the create request
+
+        Raises:
+            ValueError: If any required fields are missing or invalid
+        """
+        self._validate_batch_issue(issue_data)
+        issue_data = dict(issue_data)
+        project_key = issue_data.pop("project_key")
+        summary = issue_data.pop("summary")
+        issue_type = issue_data.pop("issue_type")
+        description = issue_data.pop("description", "")
+        assignee = issue_data.pop("assignee", None)
+        components = issue_data.pop("components", None)
+
+        # Prepare fields dictionary
+        fields: dict[str, Any] = {
+            "project": {"key": project_key},
+            "summary": summary,
+            "issuetype": {"name": issue_type},
+        }
 
-            return created_issues
+        # Add optional fields
+        if description:
+            fields["description"] = description
+
+        # Add assignee if it could be resolved
+        assignee_identifier = account_ids.get(str(assignee)) if assignee else None
+        if assignee_identifier:
+            self._add_assignee_to_fields(fields, assignee_identifier)
+
+        # Add components if provided
+        if components and isinstance(components, list):
+            valid_components = [
+                comp_name.strip()
+                for comp_name in components
+                if isinstance(comp_name, str) and comp_name.strip()
+            ]
+            if valid_components:
+                fields["components"] = [
+                    {"name": comp_name} for comp_name in valid_components
+                ]
+
+        # Add any remaining custom fields
+        self._process_additional_fields(fields, issue_data)
+        return fields
 
+    def _create_issue_chunk(
+        self, chunk: list[tuple[int, dict[str, Any]]]
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Submit one chunk of issues to the bulk create endpoint.
+
+        Args:
+            chunk: (input index, issue update) pairs
+
+        Returns:
+            Outcome for each input index, with 'status' and 'key' or 'error'
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails
+        """
+        try:
+            response = self.jira.create_issues([update for _, update in chunk])
+            if not isinstance(response, dict):
+                msg = f"Unexpected return value type from `jira.create_issues`: {type(response)}"
+                logger.error(msg)
+                raise TypeError(msg)
+        except HTTPError as http_err:
+            if http_err.response is not None and http_err.response.status_code in [
+                401,
+                403,
+            ]:
+                error_msg = (
+                    f"Authentication failed for Jira API ({http_err.response.status_code}). "
+                    "Token may be expired or invalid. Please verify credentials."
+                )
+                logger.error(error_msg)
+                raise MCPAtlassianAuthenticationError(error_msg) from http_err
+            logger.error(f"Error in bulk issue creation: {str(http_err)}")
+            return {index: {"error": str(http_err)} for index, _ in chunk}
         except Exception as e:
             logger.error(f"Error in bulk issue creation: {str(e)}")
-            raise
+            return {index: {"error": str(e)} for index, _ in chunk}
+
+        outcomes: dict[int, dict[str, Any]] = {}
+        unplaced_errors: list[str] = []
+        # Errors name the failed element by its position in the chunk
+        for error in response.get("errors") or []:
+            logger.error(f"Bulk creation error: {error}")
+            position = error.get("failedElementNumber")
+            if isinstance(position, int) and 0 <= position < len(chunk):
+                outcomes[chunk[position][0]] = {
+                    "error": self._format_bulk_create_error(error)
+                }
+            else:
+                unplaced_errors.append(self._format_bulk_create_error(error))
+
+        # Created issues are returned in submission order, without failed elements
+        remaining = [index for index, _ in chunk if index not in outcomes]
+        for index, issue_info in zip(
+            remaining, response.get("issues") or [], strict=False
+        ):
+            if issue_info.get("key"):
+                outcomes[index] = {"status": "created", "key": issue_info["key"]}
+        for index in remaining:
+            outcomes.setdefault(
+                index, {"error": "; ".join(unplaced_errors) or "Issue was not created"}
+            )
+        return outcomes
+
+    @staticmethod
+    def _format_bulk_create_error(error: dict[str, Any]) -> str:
+        """Turn a bulk create error entry into a readable message."""
+        element_errors = error.get("elementErrors") or {}
+        messages = list(element_errors.get("errorMessages") or [])
+        messages.extend(
+            f"{field}: {message}"
+            for field, message in (element_errors.get("errors") or {}).items()
+        )
+        return "; ".join(messages) or str(error.get("error") or error)
 
     def batch_get_changelogs(
         self, issue_ids_or_keys: list[str], fields: list[str] | None = None
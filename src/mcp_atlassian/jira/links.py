@@ -7,7 +7,13 @@ from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models.jira import JiraIssueLinkType
-from .client import JiraClient
+from ..utils.response_cache import invalidates_responses
+from .client import (
+    ISSUE_CACHE_TAG,
+    SEARCH_CACHE_TAG,
+    JiraClient,
+    issue_cache_tags,
+)
 
 logger = logging.getLogger("mcp-jira")
 
@@ -15,6 +21,15 @@ logger = logging.getLogger("mcp-jira")
 class LinksMixin(JiraClient):
     """Mixin for Jira issue link operations."""
 
+    def _load_issue_link_types(self) -> list[dict[str, Any]]:
+        """Fetch the raw issue link type definitions from Jira."""
+        link_types_response = self.jira.get("rest/api/2/issueLinkType")
+        if not isinstance(link_types_response, dict):
+            msg = f"Unexpected return value type from `jira.get`: {type(link_types_response)}"
+            logger.error(msg)
+            raise TypeError(msg)
+        return link_types_response.get("issueLinkTypes", [])
+
     def get_issue_link_types(self) -> list[JiraIssueLinkType]:
         """
         Get all available issue link types.
@@ -28,13 +43,12 @@ class LinksMixin(JiraClient):
             Exception: If there is an error retrieving issue link types
         """
         try:
-            link_types_response = self.jira.get("rest/api/2/issueLinkType")
-            if not isinstance(link_types_response, dict):
-                msg = f"Unexpected return value type from `jira.get`: {type(link_types_response)}"
-                logger.error(msg)
-                raise TypeError(msg)
-
-            link_types_data = link_types_response.get("issueLinkTypes", [])
+            if self.metadata_registry is not None:
+                link_types_data = self.metadata_registry.get(
+                    self.config.url, "link_types", self._load_issue_link_types
+                )
+            else:
+                link_types_data = self._load_issue_link_types()
 
             link_types = [
                 JiraIssueLinkType.from_api_response(link_type)
@@ -65,6 +79,15 @@ class LinksMixin(JiraClient):
             logger.error(f"Error getting issue link types: {error_msg}", exc_info=True)
             raise Exception(f"Error getting issue link types: {error_msg}") from e
 
+    @invalidates_responses(
+        lambda args: (
+            *issue_cache_tags(
+                (args["data"].get("inwardIssue") or {}).get("key"),
+                (args["data"].get("outwardIssue") or {}).get("key"),
+            ),
+            SEARCH_CACHE_TAG,
+        )
+    )
     def create_issue_link(self, data: dict[str, Any]) -> dict[str, Any]:
         """
         Create a link between two issues.
@@ -135,6 +158,7 @@ class LinksMixin(JiraClient):
             logger.error(f"Error creating issue link: {error_msg}", exc_info=True)
             raise Exception(f"Error creating issue link: {error_msg}") from e
 
+    @invalidates_responses(lambda args: (ISSUE_CACHE_TAG, SEARCH_CACHE_TAG))
     def remove_issue_link(self, link_id: str) -> dict[str, Any]:
         """
         Remove a link between two issues.
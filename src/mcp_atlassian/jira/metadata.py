@@ -0,0 +1,447 @@
+"""Shared, TTL-based registry for Jira site metadata.
+
+Fields, issue link types, project issue types and priorities change rarely but
+are needed on many requests. ``JiraMetadataRegistry`` keeps one copy per Jira
+site that every fetcher (global or user-specific) can read. Once an entry
+exists, lookups never wait on the network: an expired entry is still returned
+while a background worker fetches a fresh copy.
+
+With a ``MetadataStore`` the registry also persists what it loads to SQLite, so a
+restarted server starts warm and revalidates the restored entries lazily. With a
+shared ``CacheBackend`` a value loaded by one replica is reused by the others
+until it is older than the TTL.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+from mcp_atlassian.utils.cache_backend import CacheBackend, CacheBackendError
+from mcp_atlassian.utils.environment import get_positive_int_env
+
+logger = logging.getLogger("mcp-jira")
+
+T = TypeVar("T")
+
+DEFAULT_METADATA_TTL = 3600
+# Delay before retrying after a failed background refresh.
+METADATA_RETRY_DELAY = 60
+
+METADATA_STORE_FILENAME = "jira_metadata.sqlite3"
+
+MetadataKey = tuple[str, str, str]
+
+# Marks an entry restored from disk whose transform has not been applied yet.
+_UNSET: Any = object()
+
+
+@dataclass(frozen=True)
+class FieldIndex:
+    """Field definitions with precomputed lookups.
+
+    Attributes:
+        fields: Field definitions as returned by the Jira API.
+        by_id: Field definition by field ID.
+        name_to_id: Field ID by lowercase field name, plus each ID mapped to itself.
+        by_schema_type: Field definitions grouped by ``schema.type``.
+    """
+
+    fields: list[dict[str, Any]]
+    by_id: dict[str, dict[str, Any]] = field(default_factory=dict)
+    name_to_id: dict[str, str] = field(default_factory=dict)
+    by_schema_type: dict[str, list[dict[str, Any]]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, fields: list[dict[str, Any]]) -> FieldIndex:
+        """Build the lookups for a list of field definitions.
+
+        Args:
+            fields: Field definitions as returned by ``get_all_fields``.
+
+        Returns:
+            FieldIndex over the given fields.
+        """
+        by_id: dict[str, dict[str, Any]] = {}
+        name_map: dict[str, str] = {}
+        by_schema_type: dict[str, list[dict[str, Any]]] = {}
+        for field_def in fields:
+            field_id = field_def.get("id")
+            if not field_id:
+                continue
+            by_id[field_id] = field_def
+            field_name = field_def.get("name")
+            if field_name:
+                name_map.setdefault(field_name.lower(), field_id)
+            schema_type = (field_def.get("schema") or {}).get("type")
+            if schema_type:
+                by_schema_type.setdefault(schema_type, []).append(field_def)
+        # IDs can also be looked up directly, matching FieldsMixin._generate_field_map
+        id_map = {field_id: field_id for field_id in by_id}
+        return cls(
+            fields=fields,
+            by_id=by_id,
+            name_to_id=name_map | id_map,
+            by_schema_type=by_schema_type,
+        )
+
+
+@dataclass
+class _Entry:
+    raw: Any
+    value: Any
+    expires_at: float
+
+
+class MetadataStore:
+    """SQLite-backed persistence for registry entries.
+
+    Values are stored as JSON along with the wall-clock time they were fetched.
+    Every operation opens its own short-lived connection, so the store can be
+    used from the background refresh worker and request threads alike.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Initialize the store, creating the database file if needed.
+
+        Args:
+            path: Path of the SQLite database file.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS metadata ("
+                "site TEXT NOT NULL, kind TEXT NOT NULL, scope TEXT NOT NULL, "
+                "value TEXT NOT NULL, fetched_at REAL NOT NULL, "
+                "PRIMARY KEY (site, kind, scope))"
+            )
+
+    @classmethod
+    def from_env(cls) -> MetadataStore | None:
+        """Create a store in ATLASSIAN_CACHE_DIR, if that variable is set.
+
+        Returns:
+            MetadataStore, or None when no cache directory is configured or it
+            cannot be used.
+        """
+        cache_dir = os.getenv("ATLASSIAN_CACHE_DIR")
+        if not cache_dir:
+            return None
+        try:
+            return cls(Path(cache_dir).expanduser() / METADATA_STORE_FILENAME)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(
+                f"Cannot use metadata cache directory '{cache_dir}', "
+                f"continuing without persistence: {e}"
+            )
+            return None
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def load_all(self) -> list[tuple[MetadataKey, Any, float]]:
+        """Read every persisted entry.
+
+        Returns:
+            List of (key, value, fetched_at) tuples. Unreadable rows are skipped.
+        """
+        entries: list[tuple[MetadataKey, Any, float]] = []
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT site, kind, scope, value, fetched_at FROM metadata"
+            ).fetchall()
+        for site, kind, scope, value, fetched_at in rows:
+            try:
+                entries.append(((site, kind, scope), json.loads(value), fetched_at))
+            except ValueError:
+                logger.warning(f"Skipping unreadable cached metadata {kind!r}")
+        return entries
+
+    def save(self, key: MetadataKey, value: Any) -> None:
+        """Persist a value, replacing any previous one for the key.
+
+        Args:
+            key: The (site, kind, scope) key.
+            value: A JSON-serializable value.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?)",
+                (*key, json.dumps(value), time.time()),
+            )
+
+    def delete(self, site: str, kind: str | None = None) -> None:
+        """Delete persisted entries for a site, optionally only one kind."""
+        with self._connect() as conn:
+            if kind is None:
+                conn.execute("DELETE FROM metadata WHERE site = ?", (site,))
+            else:
+                conn.execute(
+                    "DELETE FROM metadata WHERE site = ? AND kind = ?", (site, kind)
+                )
+
+
+class JiraMetadataRegistry:
+    """Process-wide cache of Jira metadata, partitioned by site URL.
+
+    The first lookup of a key loads it synchronously. Afterwards the cached value
+    is always returned immediately; once it is older than the TTL, a single
+    background refresh is started and its result replaces the entry. Entries
+    restored from a MetadataStore count as expired, so they are served at once
+    and revalidated on first use.
+    """
+
+    def __init__(
+        self,
+        ttl: int = DEFAULT_METADATA_TTL,
+        timer: Callable[[], float] = time.monotonic,
+        store: MetadataStore | None = None,
+        backend: CacheBackend | None = None,
+    ) -> None:
+        """Initialize the registry.
+
+        Args:
+            ttl: Seconds before an entry is refreshed in the background.
+            timer: Clock used for expiry.
+            store: Optional persistent store to restore from and write through to.
+            backend: Optional cache tier shared with other server replicas.
+        """
+        self.ttl = ttl
+        self._timer = timer
+        self._store = store
+        self._backend = backend
+        self._entries: dict[MetadataKey, _Entry] = {}
+        self._load_locks: dict[MetadataKey, threading.Lock] = {}
+        self._refreshing: dict[MetadataKey, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        if store is not None:
+            self._restore(store)
+
+    @classmethod
+    def from_env(cls, backend: CacheBackend | None = None) -> JiraMetadataRegistry:
+        """Create a registry configured from the environment.
+
+        Uses JIRA_METADATA_TTL for the TTL (default 3600 seconds) and persists to
+        ATLASSIAN_CACHE_DIR when that is set.
+
+        Args:
+            backend: Optional shared tier, see ``CacheBackend.from_env``.
+
+        Returns:
+            The configured JiraMetadataRegistry.
+        """
+        return cls(
+            ttl=get_positive_int_env("JIRA_METADATA_TTL", DEFAULT_METADATA_TTL),
+            store=MetadataStore.from_env(),
+            backend=backend,
+        )
+
+    def _restore(self, store: MetadataStore) -> None:
+        started = time.perf_counter()
+        try:
+            persisted = store.load_all()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not read persisted Jira metadata: {e}")
+            return
+        now = self._timer()
+        for key, raw, _fetched_at in persisted:
+            self._entries[key] = _Entry(raw=raw, value=_UNSET, expires_at=now)
+        logger.info(
+            f"Restored {len(persisted)} Jira metadata entries from {store.path} "
+            f"in {(time.perf_counter() - started) * 1000:.1f} ms"
+        )
+
+    def get(
+        self,
+        site: str,
+        kind: str,
+        loader: Callable[[], T],
+        *,
+        scope: str = "",
+        refresh: bool = False,
+        transform: Callable[[Any], T] | None = None,
+    ) -> T:
+        """Return cached metadata, loading it on first use.
+
+        Args:
+            site: The Jira site URL.
+            kind: The metadata kind (e.g. 'fields', 'link_types').
+            loader: Fetches the value from Jira. It must return JSON-serializable
+                data when a store is configured. Exceptions propagate on the
+                first (synchronous) load and are logged on background refreshes.
+            scope: Optional sub-key, such as a project key.
+            refresh: When True, reload synchronously from Jira regardless of age.
+            transform: Optional function applied once to each loaded or restored
+                value (e.g. to build an index); its result is what is returned.
+
+        Returns:
+            The cached or freshly loaded value.
+        """
+        key: MetadataKey = (site.rstrip("/"), kind, scope)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or refresh:
+            return self._load(key, loader, transform, force=refresh, shared=not refresh)
+        if entry.value is _UNSET:
+            entry.value = transform(entry.raw) if transform else entry.raw
+        if self._timer() >= entry.expires_at:
+            self._schedule_refresh(key, loader, transform)
+        return entry.value
+
+    def invalidate(self, site: str, kind: str | None = None) -> None:
+        """Drop cached metadata for a site, optionally only one kind.
+
+        Args:
+            site: The Jira site URL.
+            kind: The metadata kind to drop, or None for all kinds.
+        """
+        site = site.rstrip("/")
+        with self._lock:
+            dropped = [
+                key
+                for key in self._entries
+                if key[0] == site and (kind is None or key[1] == kind)
+            ]
+            for key in dropped:
+                del self._entries[key]
+        if self._store is not None:
+            try:
+                self._store.delete(site, kind)
+            except sqlite3.Error as e:
+                logger.warning(f"Could not delete persisted Jira metadata: {e}")
+        if self._backend is not None:
+            try:
+                for key in dropped:
+                    self._backend.delete(_shared_key(key))
+            except CacheBackendError as e:
+                logger.warning(f"Could not delete shared Jira metadata: {e}")
+
+    def close(self) -> None:
+        """Stop the background refresh worker."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _load(
+        self,
+        key: MetadataKey,
+        loader: Callable[[], Any],
+        transform: Callable[[Any], Any] | None,
+        force: bool,
+        shared: bool = True,
+    ) -> Any:
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        # Concurrent cold lookups of the same key share a single upstream request.
+        with load_lock:
+            if not force:
+                with self._lock:
+                    entry = self._entries.get(key)
+                if entry is not None and entry.value is not _UNSET:
+                    return entry.value
+            if shared and self._backend is not None:
+                found = self._load_shared(key)
+                if found is not None:
+                    raw, age = found
+                    value = transform(raw) if transform else raw
+                    with self._lock:
+                        self._entries[key] = _Entry(
+                            raw, value, self._timer() + self.ttl - age
+                        )
+                    return value
+            raw = loader()
+            value = transform(raw) if transform else raw
+            with self._lock:
+                self._entries[key] = _Entry(raw, value, self._timer() + self.ttl)
+            logger.debug(f"Loaded Jira metadata {key[1]!r} for {key[0]} {key[2]}")
+            if self._backend is not None:
+                try:
+                    self._backend.set(
+                        _shared_key(key),
+                        {"value": raw, "fetched_at": time.time()},
+                        ttl=self.ttl,
+                    )
+                except (TypeError, ValueError, CacheBackendError) as e:
+                    logger.warning(f"Could not share Jira metadata {key[1]!r}: {e}")
+            if self._store is not None:
+                try:
+                    self._store.save(key, raw)
+                except (TypeError, ValueError, sqlite3.Error) as e:
+                    logger.warning(f"Could not persist Jira metadata {key[1]!r}: {e}")
+            return value
+
+    def _load_shared(self, key: MetadataKey) -> tuple[Any, float] | None:
+        """Return (value, age in seconds) loaded by another replica, if fresh."""
+        try:
+            shared = self._backend.get(_shared_key(key))  # type: ignore[union-attr]
+            if shared is None:
+                return None
+            age = max(0.0, time.time() - shared["fetched_at"])
+            if age >= self.ttl:
+                return None
+            logger.debug(f"Using shared Jira metadata {key[1]!r} for {key[0]}")
+            return shared["value"], age
+        except (CacheBackendError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Could not read shared Jira metadata {key[1]!r}: {e}")
+            return None
+
+    def _schedule_refresh(
+        self,
+        key: MetadataKey,
+        loader: Callable[[], Any],
+        transform: Callable[[Any], Any] | None,
+    ) -> Future | None:
+        with self._lock:
+            if key in self._refreshing:
+                return self._refreshing[key]
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2, thread_name_prefix="jira-metadata"
+                )
+            future = self._executor.submit(self._refresh, key, loader, transform)
+            self._refreshing[key] = future
+            return future
+
+    def _refresh(
+        self,
+        key: MetadataKey,
+        loader: Callable[[], Any],
+        transform: Callable[[Any], Any] | None,
+    ) -> None:
+        try:
+            self._load(key, loader, transform, force=True)
+        except Exception as e:
+            logger.warning(
+                f"Background refresh of Jira metadata {key[1]!r} failed, "
+                f"keeping cached value: {e}"
+            )
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    entry.expires_at = self._timer() + METADATA_RETRY_DELAY
+        finally:
+            with self._lock:
+                self._refreshing.pop(key, None)
+
+
+def _shared_key(key: MetadataKey) -> str:
+    return f"jira-metadata:{json.dumps(key)}"
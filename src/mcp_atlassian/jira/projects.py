@@ -1,5 +1,6 @@
 """Module for Jira project operations."""
 
+import hashlib
 import logging
 from typing import Any
 
@@ -29,18 +30,52 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
         Returns:
             List of project data dictionaries
         """
-        try:
-            params = {}
-            if include_archived:
-                params["includeArchived"] = "true"
 
+        def load_projects() -> list[dict[str, Any]]:
             projects = self.jira.projects(included_archived=include_archived)
-            return projects if isinstance(projects, list) else []
+            if not isinstance(projects, list):
+                msg = f"Unexpected return value type from `jira.projects`: {type(projects)}"
+                logger.error(msg)
+                raise TypeError(msg)
+            return projects
+
+        try:
+            if self.metadata_registry is None:
+                return load_projects()
+            principal = self._metadata_principal()
+            if principal is None:
+                return load_projects()
+            # Project visibility depends on the caller, so the list is cached per principal
+            return self.metadata_registry.get(
+                self.config.url,
+                "projects",
+                load_projects,
+                scope=f"{principal}:{'archived' if include_archived else 'active'}",
+            )
 
         except Exception as e:
             logger.error(f"Error getting all projects: {str(e)}")
             return []
 
+    def _metadata_principal(self) -> str | None:
+        """Identify whose view of the site this fetcher has, for per-user metadata.
+
+        Returns:
+            A stable, non-secret identifier, or None when there is none (OAuth
+            access tokens without a refresh token rotate with every user session).
+        """
+        config = self.config
+        if config.auth_type == "basic" and config.username:
+            return f"basic:{config.username}"
+        if config.auth_type == "pat" and config.personal_token:
+            digest = hashlib.sha256(config.personal_token.encode("utf-8")).hexdigest()
+            return f"pat:{digest}"
+        if config.auth_type == "oauth" and config.oauth_config:
+            oauth_config = config.oauth_config
+            if oauth_config.refresh_token:
+                return f"oauth:{oauth_config.client_id}"
+        return None
+
     def get_project(self, project_key: str) -> dict[str, Any] | None:
         """
         Get project information by key.
@@ -249,7 +284,8 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
         Returns:
             List of issue type data dictionaries
         """
-        try:
+
+        def load_issue_types() -> list[dict[str, Any]]:
             meta = self.jira.issue_createmeta(project=project_key)
             if not isinstance(meta, dict):
                 msg = f"Unexpected return value type from `jira.issue_createmeta`: {type(meta)}"
@@ -265,6 +301,20 @@ class ProjectsMixin(JiraClient, SearchOperationsProto):
 
             return issue_types
 
+        try:
+            if self.metadata_registry is None:
+                return load_issue_types()
+            principal = self._metadata_principal()
+            if principal is None:
+                return load_issue_types()
+            # createmeta only lists the issue types the caller may create
+            return self.metadata_registry.get(
+                self.config.url,
+                "issue_types",
+                load_issue_types,
+                scope=f"{principal}:{project_key}",
+            )
+
         except Exception as e:
             logger.error(
                 f"Error getting issue types for project {project_key}: {str(e)}"
@@ -1,6 +1,7 @@
 """Module for Jira protocol definitions."""
 
 from abc import abstractmethod
+from collections.abc import Callable, Iterable
 from typing import Any, Protocol, runtime_checkable
 
 from ..models.jira import JiraIssue
@@ -12,7 +13,10 @@ class AttachmentsOperationsProto(Protocol):
 
     @abstractmethod
     def upload_attachments(
-        self, issue_key: str, file_paths: list[str]
+        self,
+        issue_key: str,
+        file_paths: list[str],
+        progress_callback: Callable[[str, int, int], None] | None = None,
     ) -> dict[str, Any]:
         """
         Upload multiple attachments to a Jira issue.
@@ -20,6 +24,8 @@ class AttachmentsOperationsProto(Protocol):
         Args:
             issue_key: The Jira issue key (e.g., 'PROJ-123')
             file_paths: List of paths to files to upload
+            progress_callback: Optional function called with the filename, the
+                bytes sent so far and the file size as each upload progresses
 
         Returns:
             A dictionary with upload results
@@ -171,3 +177,14 @@ class UsersOperationsProto(Protocol):
         Raises:
             ValueError: If the account ID could not be found
         """
+
+    @abstractmethod
+    def resolve_account_ids(self, identifiers: Iterable[str]) -> dict[str, str | None]:
+        """Resolve several usernames or emails to account IDs at once.
+
+        Args:
+            identifiers: Usernames, emails, display names or account IDs
+
+        Returns:
+            Dict mapping each distinct identifier to its account ID, or None
+        """
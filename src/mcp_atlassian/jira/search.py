@@ -1,22 +1,74 @@
 """Module for Jira search operations."""
 
 import logging
-
+import re
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from itertools import islice
+from urllib.parse import urlparse
+
+import anyio
+import httpx
 import requests
+from cachetools import TTLCache
 from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
-from ..models.jira import JiraSearchResult
-from .client import JiraClient
+from ..models.jira import JiraIssue, JiraSearchResult
+from ..utils.async_http import AsyncAtlassianClient
+from ..utils.response_cache import cached_response
+from .client import SEARCH_CACHE_TAG, JiraClient
 from .constants import DEFAULT_READ_JIRA_FIELDS
 from .protocols import IssueOperationsProto
 
 logger = logging.getLogger("mcp-jira")
 
+# Issues requested per page by iter_issues; Cloud returns at most 100 when fields are requested
+DEFAULT_SEARCH_PAGE_SIZE = 100
+
+# Recent Cloud search totals kept per fetcher, keyed by normalized JQL
+SEARCH_TOTAL_CACHE_SIZE = 256
+_search_totals_lock = threading.Lock()
+# Runs Cloud count requests alongside the issue request of blocking searches
+_search_total_executor = ThreadPoolExecutor(
+    max_workers=8, thread_name_prefix="jira-search-total"
+)
+
+_JQL_WHITESPACE_PATTERN = re.compile(r"(\"(?:[^\"\\]|\\.)*\"|'(?:[^'\\]|\\.)*')|\s+")
+
+
+def _normalize_jql(jql: str) -> str:
+    """Collapse whitespace outside quoted values so equivalent queries match."""
+    return _JQL_WHITESPACE_PATTERN.sub(lambda match: match.group(1) or " ", jql).strip()
+
+
+# Caps parallel page prefetches per Jira host across all concurrent searches
+_host_search_limiters: dict[tuple[str, int], threading.BoundedSemaphore] = {}
+_host_search_limiters_lock = threading.Lock()
+
+
+def _host_search_limiter(url: str, concurrency: int) -> threading.BoundedSemaphore:
+    """Return the semaphore shared by prefetches to the host of url."""
+    key = (urlparse(url).netloc, concurrency)
+    with _host_search_limiters_lock:
+        limiter = _host_search_limiters.get(key)
+        if limiter is None:
+            limiter = _host_search_limiters[key] = threading.BoundedSemaphore(
+                concurrency
+            )
+        return limiter
+
 
 class SearchMixin(JiraClient, IssueOperationsProto):
     """Mixin for Jira search operations."""
 
+    # Created on first use with config.search_count_ttl
+    _search_totals: TTLCache | None = None
+
+    @cached_response("search_issues", lambda args: (SEARCH_CACHE_TAG,))
     def search_issues(
         self,
         jql: str,
@@ -25,6 +77,7 @@ class SearchMixin(JiraClient, IssueOperationsProto):
         limit: int = 50,
         expand: str | None = None,
         projects_filter: str | None = None,
+        include_total: bool = True,
     ) -> JiraSearchResult:
         """
         Search for issues using JQL (Jira Query Language).
@@ -38,6 +91,8 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             limit: Maximum issues to return
             expand: Optional items to expand (comma-separated)
             projects_filter: Optional comma-separated list of project keys to filter by, overrides config
+            include_total: On Cloud, whether to look up the total number of matches,
+                  which needs a separate count request (total is -1 when False)
 
         Returns:
             JiraSearchResult object containing issues and metadata (total, start_at, max_results)
@@ -47,73 +102,24 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             Exception: If there is an error searching for issues
         """
         try:
-            # Use projects_filter parameter if provided, otherwise fall back to config
-            filter_to_use = projects_filter or self.config.projects_filter
-
-            # Apply projects filter if present
-            if filter_to_use:
-                # Split projects filter by commas and handle possible whitespace
-                projects = [p.strip() for p in filter_to_use.split(",")]
-
-                # Build the project filter query part
-                if len(projects) == 1:
-                    project_query = f"project = {projects[0]}"
-                else:
-                    quoted_projects = [f'"{p}"' for p in projects]
-                    projects_list = ", ".join(quoted_projects)
-                    project_query = f"project IN ({projects_list})"
-
-                # Add the project filter to existing query
-                if jql and project_query:
-                    if "project = " not in jql and "project IN" not in jql:
-                        # Only add if not already filtering by project
-                        jql = f"({jql}) AND {project_query}"
-                else:
-                    jql = project_query
-
-                logger.info(f"Applied projects filter to query: {jql}")
-
-            # Convert fields to proper format if it's a list/tuple/set
-            fields_param: str | None
-            if fields is None:  # Use default if None
-                fields_param = ",".join(DEFAULT_READ_JIRA_FIELDS)
-            elif isinstance(fields, list | tuple | set):
-                fields_param = ",".join(fields)
-            else:
-                fields_param = fields
+            jql = self._apply_projects_filter(jql, projects_filter)
+            fields_param = self._normalize_search_fields(fields)
 
             if self.config.is_cloud:
-                actual_total = -1
-                try:
-                    # Call 1: Get metadata (including total) using standard search API
-                    metadata_params = {"jql": jql, "maxResults": 0}
-                    metadata_response = self.jira.get(
-                        self.jira.resource_url("search"), params=metadata_params
+                # The total needs its own request; unless it is cached, run it
+                # alongside the issue request instead of before it
+                actual_total = self._cached_search_total(jql) if include_total else -1
+                total_future = None
+                if actual_total is None:
+                    total_future = _search_total_executor.submit(
+                        self._fetch_search_total, jql
                     )
 
-                    if (
-                        isinstance(metadata_response, dict)
-                        and "total" in metadata_response
-                    ):
-                        try:
-                            actual_total = int(metadata_response["total"])
-                        except (ValueError, TypeError):
-                            logger.warning(
-                                f"Could not parse 'total' from metadata response for JQL: {jql}. Received: {metadata_response.get('total')}"
-                            )
-                    else:
-                        logger.warning(
-                            f"Could not retrieve total count from metadata response for JQL: {jql}. Response type: {type(metadata_response)}"
-                        )
-                except Exception as meta_err:
-                    logger.error(
-                        f"Error fetching metadata for JQL '{jql}': {str(meta_err)}"
-                    )
-
-                # Call 2: Get the actual issues using the enhanced method
                 issues_response_list = self.jira.enhanced_jql_get_list_of_tickets(
                     jql, fields=fields_param, limit=limit, expand=expand
                 )
+                if total_future is not None:
+                    actual_total = total_future.result()
 
                 if not isinstance(issues_response_list, list):
                     msg = f"Unexpected return value type from `jira.enhanced_jql_get_list_of_tickets`: {type(issues_response_list)}"
@@ -169,6 +175,512 @@ class SearchMixin(JiraClient, IssueOperationsProto):
             logger.error(f"Error searching issues with JQL '{jql}': {str(e)}")
             raise Exception(f"Error searching issues: {str(e)}") from e
 
+    def iter_issues(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        page_size: int = DEFAULT_SEARCH_PAGE_SIZE,
+        expand: str | None = None,
+        projects_filter: str | None = None,
+        start: int = 0,
+    ) -> Iterator[JiraIssue]:
+        """
+        Iterate over every issue matching a JQL query, one page at a time.
+
+        Follows `startAt` on Server/DC and `nextPageToken` on Cloud. Only one page
+        of raw results is held at a time, and the next page is requested once the
+        previous one has been consumed, so stopping early skips the remaining
+        requests.
+
+        Args:
+            jql: JQL query string
+            fields: Fields to return (comma-separated string, list, tuple, set, or "*all")
+            page_size: Issues requested per page (the server may return fewer)
+            expand: Optional items to expand (comma-separated)
+            projects_filter: Optional comma-separated list of project keys to filter by, overrides config
+            start: Starting index (ignored in Cloud environments)
+
+        Yields:
+            JiraIssue models in search order
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            Exception: If there is an error searching for issues
+        """
+        jql = self._apply_projects_filter(jql, projects_filter)
+        fields_param = self._normalize_search_fields(fields)
+        expand = expand or None
+
+        if self.config.is_cloud:
+            pages = self._iter_token_pages(jql, fields_param, page_size, expand)
+        else:
+            pages = self._iter_offset_pages(jql, fields_param, page_size, expand, start)
+        with closing(pages):
+            for page in pages:
+                for issue_data in page.get("issues") or []:
+                    if issue_data:
+                        yield JiraIssue.from_api_response(
+                            issue_data, requested_fields=fields_param
+                        )
+
+    def _iter_token_pages(
+        self, jql: str, fields_param: str | None, page_size: int, expand: str | None
+    ) -> Iterator[dict]:
+        """
+        Yield raw Cloud search pages by following `nextPageToken`.
+
+        Args:
+            jql: JQL query string, with the projects filter applied
+            fields_param: Comma-separated fields to return
+            page_size: Issues requested per page
+            expand: Optional items to expand (comma-separated)
+
+        Yields:
+            Decoded search responses in order
+        """
+        params: dict[str, str | int] = {"jql": jql, "maxResults": page_size}
+        if fields_param is not None:
+            params["fields"] = fields_param
+        if expand is not None:
+            params["expand"] = expand
+        while True:
+            page = self._fetch_search_page(
+                jql, self.jira.get, self.jira.resource_url("search/jql"), params
+            )
+            yield page
+            next_page_token = page.get("nextPageToken")
+            if not next_page_token:
+                return
+            params["nextPageToken"] = next_page_token
+
+    def _iter_offset_pages(
+        self,
+        jql: str,
+        fields_param: str | None,
+        page_size: int,
+        expand: str | None,
+        start: int,
+    ) -> Iterator[dict]:
+        """
+        Yield raw Server/DC search pages by following `startAt`.
+
+        Once the first page reveals `total`, the remaining offsets are known. With
+        `config.search_concurrency` above 1 they are then fetched by a pool of that
+        many threads, at most that many pages ahead of the caller, and yielded in
+        offset order. Prefetch requests to the same host share one cap across all
+        concurrent searches. If a page comes back shorter than the first one (the
+        result set changed underneath), prefetching stops and the rest is read
+        sequentially from where that page ended.
+
+        Args:
+            jql: JQL query string, with the projects filter applied
+            fields_param: Comma-separated fields to return
+            page_size: Issues requested per page
+            expand: Optional items to expand (comma-separated)
+            start: Starting index
+
+        Yields:
+            Decoded search responses in order
+        """
+
+        def fetch(offset: int) -> dict:
+            return self._fetch_search_page(
+                jql,
+                self.jira.jql,
+                jql,
+                fields=fields_param,
+                start=offset,
+                limit=page_size,
+                expand=expand,
+            )
+
+        page = fetch(start)
+        yield page
+        step = len(page.get("issues") or [])
+        total = page.get("total")
+        start += step
+
+        concurrency = self.config.search_concurrency
+        if step and concurrency > 1 and isinstance(total, int) and start < total:
+            host_limiter = _host_search_limiter(self.config.url, concurrency)
+
+            def prefetch(offset: int) -> dict:
+                with host_limiter:
+                    return fetch(offset)
+
+            offsets = iter(range(start, total, step))
+            pool = ThreadPoolExecutor(
+                max_workers=concurrency, thread_name_prefix="jira-search"
+            )
+            pending = deque(
+                (offset, pool.submit(prefetch, offset))
+                for offset in islice(offsets, concurrency)
+            )
+            try:
+                while pending:
+                    offset, future = pending.popleft()
+                    page = future.result()
+                    next_offset = next(offsets, None)
+                    if next_offset is not None:
+                        pending.append(
+                            (next_offset, pool.submit(prefetch, next_offset))
+                        )
+                    yield page
+                    received = len(page.get("issues") or [])
+                    start = offset + received
+                    if received < step:
+                        break
+                else:
+                    return
+            finally:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        while step:
+            if isinstance(total, int) and start >= total:
+                return
+            page = fetch(start)
+            yield page
+            step = len(page.get("issues") or [])
+            total = page.get("total")
+            start += step
+
+    def _fetch_search_page(
+        self, jql: str, request: Callable[..., object], *args: object, **kwargs: object
+    ) -> dict:
+        """
+        Request one page of search results for iter_issues.
+
+        Args:
+            jql: The JQL query, for error messages
+            request: The client method performing the request
+            *args: Positional arguments for request
+            **kwargs: Keyword arguments for request
+
+        Returns:
+            The decoded search response, or an empty dict if there was no body
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            Exception: If there is an error searching for issues
+        """
+        try:
+            response = request(*args, **kwargs)
+        except HTTPError as http_err:
+            if http_err.response is not None and http_err.response.status_code in [
+                401,
+                403,
+            ]:
+                error_msg = (
+                    f"Authentication failed for Jira API ({http_err.response.status_code}). "
+                    "Token may be expired or invalid. Please verify credentials."
+                )
+                logger.error(error_msg)
+                raise MCPAtlassianAuthenticationError(error_msg) from http_err
+            logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
+            raise
+        except Exception as e:
+            logger.error(f"Error searching issues with JQL '{jql}': {str(e)}")
+            raise Exception(f"Error searching issues: {str(e)}") from e
+        if not response:
+            return {}
+        if not isinstance(response, dict):
+            msg = f"Unexpected return value type from Jira search API: {type(response)}"
+            logger.error(msg)
+            raise TypeError(msg)
+        return response
+
+    def _apply_projects_filter(self, jql: str, projects_filter: str | None) -> str:
+        """
+        Restrict a JQL query to the configured or requested projects.
+
+        Args:
+            jql: JQL query string
+            projects_filter: Optional comma-separated list of project keys, overrides config
+
+        Returns:
+            The JQL query with the project filter applied, if any
+        """
+        # Use projects_filter parameter if provided, otherwise fall back to config
+        filter_to_use = projects_filter or self.config.projects_filter
+        if not filter_to_use:
+            return jql
+
+        # Split projects filter by commas and handle possible whitespace
+        projects = [p.strip() for p in filter_to_use.split(",")]
+
+        # Build the project filter query part
+        if len(projects) == 1:
+            project_query = f"project = {projects[0]}"
+        else:
+            quoted_projects = [f'"{p}"' for p in projects]
+            projects_list = ", ".join(quoted_projects)
+            project_query = f"project IN ({projects_list})"
+
+        # Add the project filter to existing query
+        if jql and project_query:
+            if "project = " not in jql and "project IN" not in jql:
+                # Only add if not already filtering by project
+                jql = f"({jql}) AND {project_query}"
+        else:
+            jql = project_query
+
+        logger.info(f"Applied projects filter to query: {jql}")
+        return jql
+
+    def _normalize_search_fields(
+        self, fields: list[str] | tuple[str, ...] | set[str] | str | None
+    ) -> str | None:
+        """
+        Convert the fields argument of a search into the API's comma-separated form.
+
+        Args:
+            fields: Fields to return (comma-separated string, list, tuple, set, or "*all")
+
+        Returns:
+            Comma-separated field string, using the default fields when None
+        """
+        if fields is None:  # Use default if None
+            return ",".join(DEFAULT_READ_JIRA_FIELDS)
+        if isinstance(fields, list | tuple | set):
+            return ",".join(fields)
+        return fields
+
+    def _parse_search_total(self, metadata_response: object, jql: str) -> int:
+        """
+        Extract the total issue count from a `maxResults=0` search response.
+
+        Args:
+            metadata_response: The decoded search response
+            jql: The JQL query, for logging
+
+        Returns:
+            The total number of matching issues, or -1 if it is unavailable
+        """
+        if isinstance(metadata_response, dict) and "total" in metadata_response:
+            try:
+                return int(metadata_response["total"])
+            except (ValueError, TypeError):
+                logger.warning(
+                    f"Could not parse 'total' from metadata response for JQL: {jql}. Received: {metadata_response.get('total')}"
+                )
+        else:
+            logger.warning(
+                f"Could not retrieve total count from metadata response for JQL: {jql}. Response type: {type(metadata_response)}"
+            )
+        return -1
+
+    def _search_total_cache(self) -> TTLCache:
+        """Return this fetcher's cache of recent search totals, creating it if needed."""
+        if self._search_totals is None:
+            self._search_totals = TTLCache(
+                maxsize=SEARCH_TOTAL_CACHE_SIZE, ttl=self.config.search_count_ttl
+            )
+        return self._search_totals
+
+    def _cached_search_total(self, jql: str) -> int | None:
+        """
+        Return the total for a JQL query counted within the last few seconds.
+
+        Args:
+            jql: The JQL query, with the projects filter applied
+
+        Returns:
+            The cached total, or None if it has to be requested
+        """
+        with _search_totals_lock:
+            return self._search_total_cache().get(_normalize_jql(jql))
+
+    def _store_search_total(self, jql: str, total: int) -> None:
+        """Remember a total returned by the count request."""
+        if total < 0:
+            return
+        with _search_totals_lock:
+            self._search_total_cache()[_normalize_jql(jql)] = total
+
+    def _fetch_search_total(self, jql: str) -> int:
+        """
+        Request the total number of issues matching a JQL query.
+
+        Args:
+            jql: The JQL query, with the projects filter applied
+
+        Returns:
+            The total, or -1 if the count request failed
+        """
+        try:
+            metadata_response = self.jira.get(
+                self.jira.resource_url("search"), params={"jql": jql, "maxResults": 0}
+            )
+        except Exception as meta_err:
+            logger.error(f"Error fetching metadata for JQL '{jql}': {str(meta_err)}")
+            return -1
+        total = self._parse_search_total(metadata_response, jql)
+        self._store_search_total(jql, total)
+        return total
+
+    @cached_response("search_issues", lambda args: (SEARCH_CACHE_TAG,))
+    async def search_issues_async(
+        self,
+        jql: str,
+        fields: list[str] | tuple[str, ...] | set[str] | str | None = None,
+        start: int = 0,
+        limit: int = 50,
+        expand: str | None = None,
+        projects_filter: str | None = None,
+        include_total: bool = True,
+    ) -> JiraSearchResult:
+        """
+        Search for issues using JQL over the async (httpx) transport.
+
+        Behaves like `search_issues` but awaits the upstream requests instead of
+        blocking a worker thread. Requires `http_backend="httpx"` in the config.
+
+        Args:
+            jql: JQL query string
+            fields: Fields to return (comma-separated string, list, tuple, set, or "*all")
+            start: Starting index (ignored in Cloud environments)
+            limit: Maximum issues to return
+            expand: Optional items to expand (comma-separated)
+            projects_filter: Optional comma-separated list of project keys to filter by, overrides config
+            include_total: On Cloud, whether to look up the total number of matches
+
+        Returns:
+            JiraSearchResult object containing issues and metadata (total, start_at, max_results)
+
+        Raises:
+            ValueError: If the async transport is not enabled
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+            Exception: If there is an error searching for issues
+        """
+        client = self.async_client
+        if client is None:
+            error_msg = (
+                "Async HTTP backend is not enabled for Jira. "
+                "Set JIRA_HTTP_BACKEND=httpx to use it."
+            )
+            raise ValueError(error_msg)
+
+        try:
+            jql = self._apply_projects_filter(jql, projects_filter)
+            fields_param = self._normalize_search_fields(fields)
+
+            if self.config.is_cloud:
+                params: dict[str, str | int] = {"jql": jql, "maxResults": limit}
+                if fields_param is not None:
+                    params["fields"] = fields_param
+                if expand is not None:
+                    params["expand"] = expand
+
+                actual_total = self._cached_search_total(jql) if include_total else -1
+                totals: list[int] = []
+                issues: list[dict] = []
+                failures: list[Exception] = []
+
+                async def fetch_total() -> None:
+                    try:
+                        totals.append(await self._fetch_search_total_async(client, jql))
+                    except MCPAtlassianAuthenticationError as e:
+                        failures.append(e)
+
+                # Run the count request, when needed, alongside the issue request
+                async with anyio.create_task_group() as task_group:
+                    if actual_total is None:
+                        task_group.start_soon(fetch_total)
+                    try:
+                        issues = await self._fetch_cloud_issues_async(
+                            client, params, limit
+                        )
+                    except Exception as e:
+                        failures.append(e)
+                        task_group.cancel_scope.cancel()
+                if failures:
+                    raise failures[0]
+                if actual_total is None:
+                    actual_total = totals[0]
+
+                response: dict = {"issues": issues, "total": actual_total}
+            else:
+                limit = min(limit, 50)
+                params = {"jql": jql, "startAt": start, "maxResults": limit}
+                if fields_param is not None:
+                    params["fields"] = fields_param
+                if expand is not None:
+                    params["expand"] = expand
+                response = await client.get(
+                    client.resource_url("search"), params=params
+                )
+                if not isinstance(response, dict):
+                    msg = f"Unexpected return value type from Jira search API: {type(response)}"
+                    logger.error(msg)
+                    raise TypeError(msg)
+
+            return JiraSearchResult.from_api_response(
+                response, base_url=self.config.url, requested_fields=fields_param
+            )
+        except MCPAtlassianAuthenticationError:
+            raise
+        except httpx.HTTPStatusError as http_err:
+            logger.error(f"HTTP error during API call: {http_err}", exc_info=False)
+            raise
+        except Exception as e:
+            logger.error(f"Error searching issues with JQL '{jql}': {str(e)}")
+            raise Exception(f"Error searching issues: {str(e)}") from e
+
+    async def _fetch_search_total_async(
+        self, client: AsyncAtlassianClient, jql: str
+    ) -> int:
+        """
+        Request the total number of issues matching a JQL query over httpx.
+
+        Args:
+            client: The async transport
+            jql: The JQL query, with the projects filter applied
+
+        Returns:
+            The total, or -1 if the count request failed
+
+        Raises:
+            MCPAtlassianAuthenticationError: If authentication fails with the Jira API (401/403)
+        """
+        try:
+            metadata_response = await client.get(
+                client.resource_url("search"), params={"jql": jql, "maxResults": 0}
+            )
+        except MCPAtlassianAuthenticationError:
+            raise
+        except Exception as meta_err:
+            logger.error(f"Error fetching metadata for JQL '{jql}': {str(meta_err)}")
+            return -1
+        total = self._parse_search_total(metadata_response, jql)
+        self._store_search_total(jql, total)
+        return total
+
+    async def _fetch_cloud_issues_async(
+        self, client: AsyncAtlassianClient, params: dict[str, str | int], limit: int
+    ) -> list[dict]:
+        """
+        Collect up to `limit` issues from Cloud's search/jql by following `nextPageToken`.
+
+        Args:
+            client: The async transport
+            params: Query parameters for the first page
+            limit: Maximum issues to collect
+
+        Returns:
+            The raw issue dicts
+        """
+        issues: list[dict] = []
+        while True:
+            page = await client.get(client.resource_url("search/jql"), params=params)
+            if not page:
+                break
+            issues.extend(page.get("issues", []))
+            next_page_token = page.get("nextPageToken")
+            if not next_page_token or len(issues) >= limit:
+                break
+            params["nextPageToken"] = next_page_token
+        return issues
+
     def get_board_issues(
         self,
         board_id: str,
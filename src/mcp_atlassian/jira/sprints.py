@@ -8,7 +8,8 @@ import requests
 
 from ..models.jira import JiraSprint
 from ..utils import parse_date
-from .client import JiraClient
+from ..utils.response_cache import invalidates_responses
+from .client import ISSUE_CACHE_TAG, SEARCH_CACHE_TAG, JiraClient
 
 logger = logging.getLogger("mcp-jira")
 
@@ -71,6 +72,7 @@ class SprintsMixin(JiraClient):
         )
         return [JiraSprint.from_api_response(sprint) for sprint in sprints]
 
+    @invalidates_responses(lambda args: (ISSUE_CACHE_TAG, SEARCH_CACHE_TAG))
     def update_sprint(
         self,
         sprint_id: str,
@@ -7,7 +7,8 @@ from requests.exceptions import HTTPError
 
 from ..exceptions import MCPAtlassianAuthenticationError
 from ..models import JiraIssue, JiraTransition
-from .client import JiraClient
+from ..utils.response_cache import cached_response, invalidates_responses
+from .client import SEARCH_CACHE_TAG, JiraClient, issue_cache_tags
 from .protocols import IssueOperationsProto, UsersOperationsProto
 
 logger = logging.getLogger("mcp-jira")
@@ -16,6 +17,10 @@ logger = logging.getLogger("mcp-jira")
 class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
     """Mixin for Jira transition operations."""
 
+    @cached_response(
+        "get_available_transitions",
+        lambda args: issue_cache_tags(args["issue_key"]),
+    )
     def get_available_transitions(self, issue_key: str) -> list[dict[str, Any]]:
         """
         Get the available status transitions for an issue.
@@ -114,6 +119,9 @@ class TransitionsMixin(JiraClient, IssueOperationsProto, UsersOperationsProto):
 
         return result
 
+    @invalidates_responses(
+        lambda args: (*issue_cache_tags(args["issue_key"]), SEARCH_CACHE_TAG)
+    )
     def transition_issue(
         self,
         issue_key: str,
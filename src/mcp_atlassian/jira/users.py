@@ -2,13 +2,19 @@
 
 import logging
 import re
-from typing import TYPE_CHECKING, TypeVar
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import requests
+from cachetools import TTLCache
 from requests.exceptions import HTTPError
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.models.jira.common import JiraUser
+from mcp_atlassian.utils.cache_backend import CacheBackendError
+from mcp_atlassian.utils.response_cache import credential_fingerprint
 
 from .client import JiraClient
 
@@ -19,10 +25,23 @@ JiraUserType = TypeVar("JiraUserType", bound="JiraUser")
 
 logger = logging.getLogger("mcp-jira")
 
+# Resolved identifiers kept per fetcher, and for how many seconds; unknown users
+# are remembered for a shorter time so newly added users are found soon
+ACCOUNT_ID_CACHE_SIZE = 1024
+ACCOUNT_ID_CACHE_TTL = 3600
+ACCOUNT_ID_NEGATIVE_TTL = 60
+_account_ids_lock = threading.Lock()
+# Set by the lookup helpers when a request fails rather than finding no match,
+# so the failure is not cached as an unknown user
+_lookup_state = threading.local()
+
 
 class UsersMixin(JiraClient):
     """Mixin for Jira user operations."""
 
+    _account_ids: TTLCache | None = None
+    _missing_account_ids: TTLCache | None = None
+
     def get_current_user_account_id(self) -> str:
         """
         Get the account ID of the current user.
@@ -105,17 +124,136 @@ class UsersMixin(JiraClient):
         if assignee.startswith("5") and len(assignee) >= 10:
             return assignee
 
-        account_id = self._lookup_user_directly(assignee)
+        error_msg = f"Could not find account ID for user: {assignee}"
+        cache_key = assignee.strip().casefold()
+        with _account_ids_lock:
+            account_id = self._account_id_cache().get(cache_key)
+            missing = cache_key in self._missing_account_id_cache()
         if account_id:
             return account_id
+        if missing:
+            raise ValueError(error_msg)
 
-        account_id = self._lookup_user_by_permissions(assignee)
+        shared = self._shared_account_id(cache_key)
+        if shared is not None:
+            account_id = shared["account_id"]
+        else:
+            _lookup_state.failed = False
+            account_id = self._lookup_user_directly(
+                assignee
+            ) or self._lookup_user_by_permissions(assignee)
+            if not account_id and _lookup_state.failed:
+                logger.warning(f"Lookup of user {assignee} failed; not caching it")
+                raise ValueError(error_msg)
+            self._share_account_id(cache_key, account_id)
+        with _account_ids_lock:
+            if account_id:
+                self._account_id_cache()[cache_key] = account_id
+            else:
+                self._missing_account_id_cache()[cache_key] = True
         if account_id:
             return account_id
-
-        error_msg = f"Could not find account ID for user: {assignee}"
         raise ValueError(error_msg)
 
+    def resolve_account_ids(self, identifiers: Iterable[str]) -> dict[str, str | None]:
+        """
+        Resolve several usernames, emails or display names at once.
+
+        Identifiers are de-duplicated and the uncached ones are looked up
+        concurrently, up to JiraConfig.batch_concurrency at a time.
+
+        Args:
+            identifiers: Usernames, emails, display names or account IDs.
+
+        Returns:
+            Dict mapping each distinct identifier to its account ID (name or key
+            on Server/DC), or None if the user could not be found.
+        """
+        unique = list(dict.fromkeys(i for i in identifiers if i))
+        if not unique:
+            return {}
+
+        def resolve(identifier: str) -> str | None:
+            try:
+                return self._get_account_id(identifier)
+            except Exception as e:
+                logger.warning(f"Could not resolve user {identifier}: {str(e)}")
+                return None
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.config.batch_concurrency, len(unique)),
+            thread_name_prefix="jira-user-lookup",
+        ) as pool:
+            return dict(zip(unique, pool.map(resolve, unique), strict=True))
+
+    def _account_id_cache(self) -> TTLCache:
+        """Return this fetcher's identifier to account ID cache, creating it if needed."""
+        if self._account_ids is None:
+            self._account_ids = TTLCache(
+                maxsize=ACCOUNT_ID_CACHE_SIZE, ttl=ACCOUNT_ID_CACHE_TTL
+            )
+        return self._account_ids
+
+    def _missing_account_id_cache(self) -> TTLCache:
+        """Return this fetcher's cache of identifiers that matched no user."""
+        if self._missing_account_ids is None:
+            self._missing_account_ids = TTLCache(
+                maxsize=ACCOUNT_ID_CACHE_SIZE, ttl=ACCOUNT_ID_NEGATIVE_TTL
+            )
+        return self._missing_account_ids
+
+    def _remember_user_aliases(self, user: dict[str, Any], account_id: str) -> None:
+        """Cache the account ID under the user's display name, username and email."""
+        aliases = {
+            alias.strip().casefold()
+            for alias in (
+                user.get("displayName"),
+                user.get("name"),
+                user.get("emailAddress"),
+            )
+            if isinstance(alias, str) and alias.strip()
+        }
+        with _account_ids_lock:
+            cache = self._account_id_cache()
+            for alias in aliases:
+                cache[alias] = account_id
+        for alias in aliases:
+            self._share_account_id(alias, account_id)
+
+    def _shared_account_id_key(self, cache_key: str) -> str:
+        return (
+            f"jira-account-id:{self.config.url.rstrip('/')}:"
+            f"{credential_fingerprint(self.config)}:{cache_key}"
+        )
+
+    def _shared_account_id(self, cache_key: str) -> dict[str, Any] | None:
+        """Return the lookup another replica made for this user, if any.
+
+        Returns:
+            {"account_id": str | None}, or None if nothing is shared.
+        """
+        if self.cache_backend is None:
+            return None
+        try:
+            shared = self.cache_backend.get(self._shared_account_id_key(cache_key))
+        except (CacheBackendError, ValueError) as e:
+            logger.warning(f"Could not read shared account ID cache: {e}")
+            return None
+        return shared if isinstance(shared, dict) and "account_id" in shared else None
+
+    def _share_account_id(self, cache_key: str, account_id: str | None) -> None:
+        """Publish a lookup result to the shared cache backend, if configured."""
+        if self.cache_backend is None:
+            return
+        try:
+            self.cache_backend.set(
+                self._shared_account_id_key(cache_key),
+                {"account_id": account_id},
+                ttl=ACCOUNT_ID_CACHE_TTL if account_id else ACCOUNT_ID_NEGATIVE_TTL,
+            )
+        except CacheBackendError as e:
+            logger.warning(f"Could not write shared account ID cache: {e}")
+
     def _lookup_user_directly(self, username: str) -> str | None:
         """
         Look up a user account ID directly.
@@ -137,6 +275,7 @@ class UsersMixin(JiraClient):
             if not isinstance(response, list):
                 msg = f"Unexpected return value type from `jira.user_find_by_user_string`: {type(response)}"
                 logger.error(msg)
+                _lookup_state.failed = True
                 return None
 
             for user in response:
@@ -145,23 +284,14 @@ class UsersMixin(JiraClient):
                     or user.get("name", "").lower() == username.lower()
                     or user.get("emailAddress", "").lower() == username.lower()
                 ):
-                    if self.config.is_cloud:
-                        if "accountId" in user:
-                            return user["accountId"]
-                    else:
-                        if "name" in user:
-                            logger.info(
-                                "Using 'name' for assignee field in Jira Data Center/Server"
-                            )
-                            return user["name"]
-                        elif "key" in user:
-                            logger.info(
-                                "Using 'key' as fallback for assignee name in Jira Data Center/Server"
-                            )
-                            return user["key"]
+                    account_id = self._user_identifier(user)
+                    if account_id:
+                        self._remember_user_aliases(user, account_id)
+                        return account_id
             return None
         except Exception as e:
             logger.info(f"Error looking up user directly: {str(e)}")
+            _lookup_state.failed = True
             return None
 
     def _lookup_user_by_permissions(self, username: str) -> str | None:
@@ -196,25 +326,40 @@ class UsersMixin(JiraClient):
             if response.status_code == 200:
                 data = response.json()
                 for user in data.get("users", []):
-                    if self.config.is_cloud:
-                        if "accountId" in user:
-                            return user["accountId"]
-                    else:
-                        if "name" in user:
-                            logger.info(
-                                "Using 'name' for assignee field in Jira Data Center/Server"
-                            )
-                            return user["name"]
-                        elif "key" in user:
-                            logger.info(
-                                "Using 'key' as fallback for assignee name in Jira Data Center/Server"
-                            )
-                            return user["key"]
+                    account_id = self._user_identifier(user)
+                    if account_id:
+                        self._remember_user_aliases(user, account_id)
+                        return account_id
+            elif response.status_code >= 429:
+                _lookup_state.failed = True
             return None
         except Exception as e:
             logger.info(f"Error looking up user by permissions: {str(e)}")
+            _lookup_state.failed = True
             return None
 
+    def _user_identifier(self, user: dict[str, Any]) -> str | None:
+        """
+        Return the identifier used to assign issues to a user.
+
+        Args:
+            user (dict): User data returned by the Jira API.
+
+        Returns:
+            Optional[str]: accountId on Cloud, name (or key) on Server/DC.
+        """
+        if self.config.is_cloud:
+            return user.get("accountId")
+        if "name" in user:
+            logger.info("Using 'name' for assignee field in Jira Data Center/Server")
+            return user["name"]
+        if "key" in user:
+            logger.info(
+                "Using 'key' as fallback for assignee name in Jira Data Center/Server"
+            )
+            return user["key"]
+        return None
+
     def _determine_user_api_params(self, identifier: str) -> dict[str, str]:
         """
         Determines the correct API parameter and value for the jira.user() call based on the identifier and instance type.
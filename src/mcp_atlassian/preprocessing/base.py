@@ -6,6 +6,7 @@ import warnings
 from typing import Any, Protocol
 
 from bs4 import BeautifulSoup, Tag
+from markdownify import MarkdownConverter
 from markdownify import markdownify as md
 
 logger = logging.getLogger("mcp-atlassian")
@@ -60,9 +61,12 @@ class BasePreprocessor:
             self._process_user_mentions_in_soup(soup)
             self._process_user_profile_macros_in_soup(soup)
 
-            # Convert to string and markdown
+            # Convert to string and markdown. Merging adjacent strings leaves the
+            # tree as re-parsing processed_html would, so the Markdown can be
+            # emitted from it directly instead of parsing the page a second time.
             processed_html = str(soup)
-            processed_markdown = md(processed_html)
+            soup.smooth()
+            processed_markdown = MarkdownConverter().convert_soup(soup)
 
             return processed_html, processed_markdown
 
@@ -8,6 +8,187 @@ from .base import BasePreprocessor
 
 logger = logging.getLogger("mcp-atlassian")
 
+# Patterns for jira_to_markdown, compiled once and applied in order.
+_BLOCKQUOTE_PATTERN = re.compile(r"^bq\.(.*?)$", re.MULTILINE)
+_BOLD_ITALIC_PATTERN = re.compile(r"([*_])(.*?)\1")
+_LIST_PATTERN = re.compile(r"^((?:#|-|\+|\*)+) (.*)$", re.MULTILINE)
+_HEADER_PATTERN = re.compile(r"^h([0-6])\.(.*)$", re.MULTILINE)
+_INLINE_CODE_PATTERN = re.compile(r"\{\{([^}]+)\}\}")
+# Matches the same text as ``\?\?((?:.[^?]|[^?].)+)\?\?``. Every two-character
+# unit except "??" and "\n\n" is accepted; splitting the alternatives on the first
+# character keeps them disjoint, which avoids exponential backtracking.
+_CITATION_PATTERN = re.compile(r"\?\?((?:[^?\n][\s\S]|\?[^?]|\n[^\n])+)\?\?")
+_INSERTED_PATTERN = re.compile(r"\+([^+]*)\+")
+_SUPERSCRIPT_PATTERN = re.compile(r"\^([^^]*)\^")
+_SUBSCRIPT_PATTERN = re.compile(r"~([^~]*)~")
+_CODE_BLOCK_PATTERN = re.compile(r"\{code(?::([a-z]+))?\}([\s\S]*?)\{code\}")
+_NOFORMAT_PATTERN = re.compile(r"\{noformat\}([\s\S]*?)\{noformat\}")
+_QUOTE_BLOCK_PATTERN = re.compile(r"\{quote\}([\s\S]*)\{quote\}")
+_IMAGE_ALT_PATTERN = re.compile(
+    r"!([^|\n\s]+)\|([^\n!]*)alt=([^\n!\,]+?)(,([^\n!]*))?!"
+)
+_IMAGE_PARAMS_PATTERN = re.compile(r"!([^|\n\s]+)\|([^\n!]*)!")
+_IMAGE_PATTERN = re.compile(r"!([^\n\s!]+)!")
+_LINK_TARGET_PATTERN = re.compile(r"(.+?)\]")
+_BARE_LINK_PATTERN = re.compile(r"\[(.+?)\]([^\(]+)")
+_COLOR_PATTERN = re.compile(r"\{color:([^}]+)\}([\s\S]*?)\{color\}")
+
+
+# Patterns for markdown_to_jira, compiled once and applied in order.
+_MD_CODE_BLOCK_PATTERN = re.compile(r"```(\w*)\n([\s\S]+?)```")
+_MD_INLINE_CODE_PATTERN = re.compile(r"`([^`]+)`")
+_MD_SETEXT_HEADER_PATTERN = re.compile(r"^(.*?)\n([=-])+$", re.MULTILINE)
+_MD_ATX_HEADER_PATTERN = re.compile(r"^([#]+)(.*?)$", re.MULTILINE)
+_MD_BOLD_ITALIC_PATTERN = re.compile(r"([*_]+)(.*?)\1")
+_MD_BULLET_LIST_PATTERN = re.compile(r"^(\s*)- (.*)$", re.MULTILINE)
+_MD_NUMBERED_LIST_PATTERN = re.compile(r"^(\s+)1\. (.*)$", re.MULTILINE)
+_MD_HTML_TAG_PATTERNS = tuple(
+    (tag, re.compile(rf"<{tag}>(.*?)<\/{tag}>"), rf"{replacement}\1{replacement}")
+    for tag, replacement in (
+        ("cite", "??"),
+        ("del", "-"),
+        ("ins", "+"),
+        ("sup", "^"),
+        ("sub", "~"),
+    )
+)
+_MD_COLOR_PATTERN = re.compile(r"<span style=\"color:(#[^\"]+)\">([\s\S]*?)</span>")
+_MD_STRIKETHROUGH_PATTERN = re.compile(r"~~(.*?)~~")
+_MD_IMAGE_PATTERN = re.compile(r"!\[\]\(([^)\n\s]+)\)")
+_MD_IMAGE_ALT_PATTERN = re.compile(r"!\[([^\]\n]+)\]\(([^)\n\s]+)\)")
+_MD_LINK_PATTERN = re.compile(r"\[([^\]]+)\]\(([^)]+)\)")
+_MD_ANGLE_LINK_PATTERN = re.compile(r"<([^>]+)>")
+_MD_TABLE_SEPARATOR_PATTERN = re.compile(r"\|[-\s|]+\|")
+
+
+def _convert_bold_italic(match: re.Match) -> str:
+    marker = "**" if match.group(1) == "*" else "*"
+    return f"{marker}{match.group(2)}{marker}"
+
+
+def _convert_header(match: re.Match) -> str:
+    return "#" * int(match.group(1)) + match.group(2)
+
+
+def _convert_quote_block(match: re.Match) -> str:
+    return "\n".join(f"> {line}" for line in match.group(1).split("\n"))
+
+
+def _convert_pipe_links(text: str) -> str:
+    r"""Convert ``[text|url]`` links to Markdown in one linear scan.
+
+    Produces the same result as ``re.sub(r"\[([^|]+)\|(.+?)\]", r"[\1](\2)", text)``.
+    The regex retries from every "[" and rescans up to the next "|", which is
+    quadratic on long text with brackets but no link (e.g. pasted logs). Every
+    "[" before a given "|" succeeds or fails together, so the scan can skip
+    straight past that "|" when the link target does not match.
+
+    Args:
+        text: Text that may contain Jira links
+
+    Returns:
+        Text with ``[text|url]`` replaced by ``[text](url)``
+    """
+    parts: list[str] = []
+    copied_up_to = 0
+    search_from = 0
+    while True:
+        open_pos = text.find("[", search_from)
+        if open_pos < 0:
+            break
+        pipe_pos = text.find("|", open_pos + 1)
+        if pipe_pos < 0:
+            break
+        if pipe_pos == open_pos + 1:
+            # Empty link text; try the next "["
+            search_from = open_pos + 1
+            continue
+        target = _LINK_TARGET_PATTERN.match(text, pipe_pos + 1)
+        if target is None:
+            search_from = pipe_pos + 1
+            continue
+        parts.append(text[copied_up_to:open_pos])
+        parts.append(f"[{text[open_pos + 1 : pipe_pos]}]({target.group(1)})")
+        copied_up_to = search_from = target.end()
+    if not parts:
+        return text
+    parts.append(text[copied_up_to:])
+    return "".join(parts)
+
+
+def _convert_table_headers(text: str) -> str:
+    """Turn Jira header rows (``||a||b||``) into Markdown rows plus separators."""
+    lines: list[str] = []
+    for line in text.split("\n"):
+        if "||" not in line:
+            lines.append(line)
+            continue
+        line = line.replace("||", "|")
+        lines.append(line)
+        header_cells = line.count("|") - 1
+        if header_cells > 0:
+            lines.append("|" + "---|" * header_cells)
+    return "\n".join(lines)
+
+
+def _sub_through_last(pattern: re.Pattern, repl: str, text: str, closer: str) -> str:
+    """Apply pattern only to the text up to the last occurrence of closer.
+
+    Every match of pattern ends with closer, so nothing after its last
+    occurrence can match. Skipping that tail stops unbounded character classes
+    such as ``<([^>]+)>`` from rescanning to the end of the text from every
+    opening delimiter (e.g. comparisons in pasted code with no closing ">").
+    """
+    end = text.rfind(closer) + 1
+    if not end:
+        return text
+    return pattern.sub(repl, text[:end]) + text[end:]
+
+
+def _convert_md_code_block(match: re.Match) -> str:
+    syntax = match.group(1)
+    code = "{code:" + syntax + "}" if syntax else "{code}"
+    return code + match.group(2) + "{code}"
+
+
+def _convert_md_setext_header(match: re.Match) -> str:
+    return f"h{1 if match.group(2)[0] == '=' else 2}. {match.group(1)}"
+
+
+def _convert_md_atx_header(match: re.Match) -> str:
+    return f"h{len(match.group(1))}." + match.group(2)
+
+
+def _convert_md_bold_italic(match: re.Match) -> str:
+    marker = "_" if len(match.group(1)) == 1 else "*"
+    return f"{marker}{match.group(2)}{marker}"
+
+
+def _convert_md_bullet_item(match: re.Match) -> str:
+    indent = match.group(1)
+    if not indent:
+        return "* " + match.group(2)
+    return "  " * (len(indent) // 2) + "* " + match.group(2)
+
+
+def _convert_md_numbered_item(match: re.Match) -> str:
+    return "#" * (len(match.group(1)) // 4 + 2) + " " + match.group(2)
+
+
+def _convert_md_tables(text: str) -> str:
+    """Turn Markdown header rows into Jira ``||`` rows and drop separator rows."""
+    lines = text.split("\n")
+    converted: list[str] = []
+    i = 0
+    while i < len(lines):
+        if i + 1 < len(lines) and _MD_TABLE_SEPARATOR_PATTERN.match(lines[i + 1]):
+            converted.append(lines[i].replace("|", "||"))
+            i += 2
+        else:
+            converted.append(lines[i])
+            i += 1
+    return "\n".join(converted)
+
 
 class JiraPreprocessor(BasePreprocessor):
     """Handles text preprocessing for Jira content."""
@@ -114,119 +295,79 @@ class JiraPreprocessor(BasePreprocessor):
         if not input_text:
             return ""
 
-        # Block quotes
-        output = re.sub(r"^bq\.(.*?)$", r"> \1\n", input_text, flags=re.MULTILINE)
+        output = input_text
+
+        # Each pass only runs when the text contains the markup it converts.
+        if "bq." in output:
+            output = _BLOCKQUOTE_PATTERN.sub(r"> \1\n", output)
 
         # Text formatting (bold, italic)
-        output = re.sub(
-            r"([*_])(.*?)\1",
-            lambda match: ("**" if match.group(1) == "*" else "*")
-            + match.group(2)
-            + ("**" if match.group(1) == "*" else "*"),
-            output,
-        )
+        if "*" in output or "_" in output:
+            output = _BOLD_ITALIC_PATTERN.sub(_convert_bold_italic, output)
 
         # Multi-level numbered list
-        output = re.sub(
-            r"^((?:#|-|\+|\*)+) (.*)$",
-            lambda match: self._convert_jira_list_to_markdown(match),
-            output,
-            flags=re.MULTILINE,
-        )
+        if "#" in output or "-" in output or "+" in output or "*" in output:
+            output = _LIST_PATTERN.sub(self._convert_jira_list_to_markdown, output)
 
         # Headers
-        output = re.sub(
-            r"^h([0-6])\.(.*)$",
-            lambda match: "#" * int(match.group(1)) + match.group(2),
-            output,
-            flags=re.MULTILINE,
-        )
+        output = _HEADER_PATTERN.sub(_convert_header, output)
 
         # Inline code
-        output = re.sub(r"\{\{([^}]+)\}\}", r"`\1`", output)
+        if "{{" in output:
+            output = _INLINE_CODE_PATTERN.sub(r"`\1`", output)
 
         # Citation
-        output = re.sub(r"\?\?((?:.[^?]|[^?].)+)\?\?", r"<cite>\1</cite>", output)
+        if "??" in output:
+            output = _CITATION_PATTERN.sub(r"<cite>\1</cite>", output)
 
         # Inserted text
-        output = re.sub(r"\+([^+]*)\+", r"<ins>\1</ins>", output)
+        if "+" in output:
+            output = _INSERTED_PATTERN.sub(r"<ins>\1</ins>", output)
 
         # Superscript
-        output = re.sub(r"\^([^^]*)\^", r"<sup>\1</sup>", output)
+        if "^" in output:
+            output = _SUPERSCRIPT_PATTERN.sub(r"<sup>\1</sup>", output)
 
         # Subscript
-        output = re.sub(r"~([^~]*)~", r"<sub>\1</sub>", output)
+        if "~" in output:
+            output = _SUBSCRIPT_PATTERN.sub(r"<sub>\1</sub>", output)
 
-        # Strikethrough
-        output = re.sub(r"-([^-]*)-", r"-\1-", output)
+        # Strikethrough (-text-) is identical in both syntaxes and left as is.
 
         # Code blocks with optional language specification
-        output = re.sub(
-            r"\{code(?::([a-z]+))?\}([\s\S]*?)\{code\}",
-            r"```\1\n\2\n```",
-            output,
-            flags=re.MULTILINE,
-        )
+        if "{code" in output:
+            output = _CODE_BLOCK_PATTERN.sub(r"```\1\n\2\n```", output)
 
         # No format
-        output = re.sub(r"\{noformat\}([\s\S]*?)\{noformat\}", r"```\n\1\n```", output)
+        if "{noformat}" in output:
+            output = _NOFORMAT_PATTERN.sub(r"```\n\1\n```", output)
 
         # Quote blocks
-        output = re.sub(
-            r"\{quote\}([\s\S]*)\{quote\}",
-            lambda match: "\n".join(
-                [f"> {line}" for line in match.group(1).split("\n")]
-            ),
-            output,
-            flags=re.MULTILINE,
-        )
-
-        # Images with alt text
-        output = re.sub(
-            r"!([^|\n\s]+)\|([^\n!]*)alt=([^\n!\,]+?)(,([^\n!]*))?!",
-            r"![\3](\1)",
-            output,
-        )
-
-        # Images with other parameters (ignore them)
-        output = re.sub(r"!([^|\n\s]+)\|([^\n!]*)!", r"![](\1)", output)
-
-        # Images without parameters
-        output = re.sub(r"!([^\n\s!]+)!", r"![](\1)", output)
+        if "{quote}" in output:
+            output = _QUOTE_BLOCK_PATTERN.sub(_convert_quote_block, output)
+
+        if "!" in output:
+            # Images with alt text
+            output = _IMAGE_ALT_PATTERN.sub(r"![\3](\1)", output)
+
+            # Images with other parameters (ignore them)
+            output = _IMAGE_PARAMS_PATTERN.sub(r"![](\1)", output)
+
+            # Images without parameters
+            output = _IMAGE_PATTERN.sub(r"![](\1)", output)
 
         # Links
-        output = re.sub(r"\[([^|]+)\|(.+?)\]", r"[\1](\2)", output)
-        output = re.sub(r"\[(.+?)\]([^\(]+)", r"<\1>\2", output)
+        if "[" in output:
+            output = _convert_pipe_links(output)
+            output = _BARE_LINK_PATTERN.sub(r"<\1>\2", output)
 
         # Colored text
-        output = re.sub(
-            r"\{color:([^}]+)\}([\s\S]*?)\{color\}",
-            r"<span style=\"color:\1\">\2</span>",
-            output,
-            flags=re.MULTILINE,
-        )
+        if "{color:" in output:
+            output = _COLOR_PATTERN.sub(r"<span style=\"color:\1\">\2</span>", output)
 
         # Convert Jira table headers (||) to markdown table format
-        lines = output.split("\n")
-        i = 0
-        while i < len(lines):
-            line = lines[i]
-
-            if "||" in line:
-                # Replace Jira table headers
-                lines[i] = lines[i].replace("||", "|")
-
-                # Add a separator line for markdown tables
-                header_cells = lines[i].count("|") - 1
-                if header_cells > 0:
-                    separator_line = "|" + "---|" * header_cells
-                    lines.insert(i + 1, separator_line)
-                    i += 1  # Skip the newly inserted line in next iteration
-
-            i += 1
-
-        # Rejoin the lines
-        output = "\n".join(lines)
+        if "||" in output:
+            output = _convert_table_headers(output)
 
         return output
 
@@ -243,139 +384,64 @@ class JiraPreprocessor(BasePreprocessor):
         if not input_text:
             return ""
 
-        # Save code blocks to prevent recursive processing
-        code_blocks = []
-        inline_codes = []
-
-        # Extract code blocks
-        def save_code_block(match: re.Match) -> str:
-            """
-            Process and save a code block.
-
-            Args:
-                match: Regex match object containing the code block
-
-            Returns:
-                Jira-formatted code block
-            """
-            syntax = match.group(1) or ""
-            content = match.group(2)
-            code = "{code"
-            if syntax:
-                code += ":" + syntax
-            code += "}" + content + "{code}"
-            code_blocks.append(code)
-            return str(code)  # Ensure we return a string
-
-        # Extract inline code
-        def save_inline_code(match: re.Match) -> str:
-            """
-            Process and save inline code.
-
-            Args:
-                match: Regex match object containing the inline code
-
-            Returns:
-                Jira-formatted inline code
-            """
-            content = match.group(1)
-            code = "{{" + content + "}}"
-            inline_codes.append(code)
-            return str(code)  # Ensure we return a string
-
-        # Save code sections temporarily
-        output = re.sub(r"```(\w*)\n([\s\S]+?)```", save_code_block, input_text)
-        output = re.sub(r"`([^`]+)`", save_inline_code, output)
+        output = input_text
+
+        # Code sections
+        if "```" in output:
+            output = _MD_CODE_BLOCK_PATTERN.sub(_convert_md_code_block, output)
+        if "`" in output:
+            output = _MD_INLINE_CODE_PATTERN.sub(r"{{\1}}", output)
 
         # Headers with = or - underlines
-        output = re.sub(
-            r"^(.*?)\n([=-])+$",
-            lambda match: f"h{1 if match.group(2)[0] == '=' else 2}. {match.group(1)}",
-            output,
-            flags=re.MULTILINE,
-        )
+        if "\n=" in output or "\n-" in output:
+            output = _MD_SETEXT_HEADER_PATTERN.sub(_convert_md_setext_header, output)
 
         # Headers with # prefix
-        output = re.sub(
-            r"^([#]+)(.*?)$",
-            lambda match: f"h{len(match.group(1))}." + match.group(2),
-            output,
-            flags=re.MULTILINE,
-        )
+        if "#" in output:
+            output = _MD_ATX_HEADER_PATTERN.sub(_convert_md_atx_header, output)
 
         # Bold and italic
-        output = re.sub(
-            r"([*_]+)(.*?)\1",
-            lambda match: ("_" if len(match.group(1)) == 1 else "*")
-            + match.group(2)
-            + ("_" if len(match.group(1)) == 1 else "*"),
-            output,
-        )
+        if "*" in output or "_" in output:
+            output = _MD_BOLD_ITALIC_PATTERN.sub(_convert_md_bold_italic, output)
 
         # Multi-level bulleted list
-        output = re.sub(
-            r"^(\s*)- (.*)$",
-            lambda match: (
-                "* " + match.group(2)
-                if not match.group(1)
-                else "  " * (len(match.group(1)) // 2) + "* " + match.group(2)
-            ),
-            output,
-            flags=re.MULTILINE,
-        )
+        if "- " in output:
+            output = _MD_BULLET_LIST_PATTERN.sub(_convert_md_bullet_item, output)
 
         # Multi-level numbered list
-        output = re.sub(
-            r"^(\s+)1\. (.*)$",
-            lambda match: "#" * (int(len(match.group(1)) / 4) + 2)
-            + " "
-            + match.group(2),
-            output,
-            flags=re.MULTILINE,
-        )
+        if "1. " in output:
+            output = _MD_NUMBERED_LIST_PATTERN.sub(_convert_md_numbered_item, output)
 
         # HTML formatting tags to Jira markup
-        tag_map = {"cite": "??", "del": "-", "ins": "+", "sup": "^", "sub": "~"}
-
-        for tag, replacement in tag_map.items():
-            output = re.sub(
-                rf"<{tag}>(.*?)<\/{tag}>", rf"{replacement}\1{replacement}", output
-            )
+        if "</" in output:
+            for tag, pattern, replacement in _MD_HTML_TAG_PATTERNS:
+                if f"<{tag}>" in output:
+                    output = pattern.sub(replacement, output)
 
         # Colored text
-        output = re.sub(
-            r"<span style=\"color:(#[^\"]+)\">([\s\S]*?)</span>",
-            r"{color:\1}\2{color}",
-            output,
-            flags=re.MULTILINE,
-        )
+        if '<span style="color:' in output:
+            output = _MD_COLOR_PATTERN.sub(r"{color:\1}\2{color}", output)
 
         # Strikethrough
-        output = re.sub(r"~~(.*?)~~", r"-\1-", output)
+        if "~~" in output:
+            output = _MD_STRIKETHROUGH_PATTERN.sub(r"-\1-", output)
 
-        # Images without alt text
-        output = re.sub(r"!\[\]\(([^)\n\s]+)\)", r"!\1!", output)
+        if "![" in output:
+            # Images without alt text
+            output = _MD_IMAGE_PATTERN.sub(r"!\1!", output)
 
-        # Images with alt text
-        output = re.sub(r"!\[([^\]\n]+)\]\(([^)\n\s]+)\)", r"!\2|alt=\1!", output)
+            # Images with alt text
+            output = _MD_IMAGE_ALT_PATTERN.sub(r"!\2|alt=\1!", output)
 
         # Links
-        output = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"[\1|\2]", output)
-        output = re.sub(r"<([^>]+)>", r"[\1]", output)
+        if "](" in output:
+            output = _sub_through_last(_MD_LINK_PATTERN, r"[\1|\2]", output, ")")
+        if "<" in output:
+            output = _sub_through_last(_MD_ANGLE_LINK_PATTERN, r"[\1]", output, ">")
 
         # Convert markdown tables to Jira table format
-        lines = output.split("\n")
-        i = 0
-        while i < len(lines):
-            if i < len(lines) - 1 and re.match(r"\|[-\s|]+\|", lines[i + 1]):
-                # Convert header row to Jira format
-                lines[i] = lines[i].replace("|", "||")
-                # Remove the separator line
-                lines.pop(i + 1)
-            i += 1
-
-        # Rejoin the lines
-        output = "\n".join(lines)
+        if "|" in output:
+            output = _convert_md_tables(output)
 
         return output
 
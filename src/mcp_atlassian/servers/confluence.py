@@ -8,6 +8,8 @@ from fastmcp import Context, FastMCP
 from pydantic import Field
 
 from mcp_atlassian.servers.dependencies import get_confluence_fetcher
+from mcp_atlassian.servers.dispatch import run_fetcher_call
+from mcp_atlassian.utils.async_http import AsyncAtlassianClient
 from mcp_atlassian.utils.decorators import (
     check_write_access,
     convert_empty_defaults_to_none,
@@ -92,19 +94,34 @@ async def search(
             logger.info(
                 f"Converting simple search term to CQL using siteSearch: {query}"
             )
-            pages = confluence_fetcher.search(
-                query, limit=limit, spaces_filter=spaces_filter
+            pages = await run_fetcher_call(
+                ctx,
+                "confluence",
+                confluence_fetcher.search,
+                query,
+                limit=limit,
+                spaces_filter=spaces_filter,
             )
         except Exception as e:
             logger.warning(f"siteSearch failed ('{e}'), falling back to text search.")
             query = f'text ~ "{original_query}"'
             logger.info(f"Falling back to text search with CQL: {query}")
-            pages = confluence_fetcher.search(
-                query, limit=limit, spaces_filter=spaces_filter
+            pages = await run_fetcher_call(
+                ctx,
+                "confluence",
+                confluence_fetcher.search,
+                query,
+                limit=limit,
+                spaces_filter=spaces_filter,
             )
     else:
-        pages = confluence_fetcher.search(
-            query, limit=limit, spaces_filter=spaces_filter
+        pages = await run_fetcher_call(
+            ctx,
+            "confluence",
+            confluence_fetcher.search,
+            query,
+            limit=limit,
+            spaces_filter=spaces_filter,
         )
     search_results = [page.to_simplified_dict() for page in pages]
     return json.dumps(search_results, indent=2, ensure_ascii=False)
@@ -185,9 +202,18 @@ async def get_page(
                 "page_id was provided; title and space_key parameters will be ignored."
             )
         try:
-            page_object = confluence_fetcher.get_page_content(
-                page_id, convert_to_markdown=convert_to_markdown
-            )
+            if isinstance(confluence_fetcher.async_client, AsyncAtlassianClient):
+                page_object = await confluence_fetcher.get_page_content_async(
+                    page_id, convert_to_markdown=convert_to_markdown
+                )
+            else:
+                page_object = await run_fetcher_call(
+                    ctx,
+                    "confluence",
+                    confluence_fetcher.get_page_content,
+                    page_id,
+                    convert_to_markdown=convert_to_markdown,
+                )
         except Exception as e:
             logger.error(f"Error fetching page by ID '{page_id}': {e}")
             return json.dumps(
@@ -196,8 +222,13 @@ async def get_page(
                 ensure_ascii=False,
             )
     elif title and space_key:
-        page_object = confluence_fetcher.get_page_by_title(
-            space_key, title, convert_to_markdown=convert_to_markdown
+        page_object = await run_fetcher_call(
+            ctx,
+            "confluence",
+            confluence_fetcher.get_page_by_title,
+            space_key,
+            title,
+            convert_to_markdown=convert_to_markdown,
         )
         if not page_object:
             return json.dumps(
@@ -290,7 +321,10 @@ async def get_page_children(
         expand = f"{expand},body.storage" if expand else "body.storage"
 
     try:
-        pages = confluence_fetcher.get_page_children(
+        pages = await run_fetcher_call(
+            ctx,
+            "confluence",
+            confluence_fetcher.get_page_children,
             page_id=parent_id,
             start=start,
             limit=limit,
@@ -339,7 +373,9 @@ async def get_comments(
         JSON string representing a list of comment objects.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    comments = confluence_fetcher.get_page_comments(page_id)
+    comments = await run_fetcher_call(
+        ctx, "confluence", confluence_fetcher.get_page_comments, page_id
+    )
     formatted_comments = [comment.to_simplified_dict() for comment in comments]
     return json.dumps(formatted_comments, indent=2, ensure_ascii=False)
 
@@ -368,7 +404,9 @@ async def get_labels(
         JSON string representing a list of label objects.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    labels = confluence_fetcher.get_page_labels(page_id)
+    labels = await run_fetcher_call(
+        ctx, "confluence", confluence_fetcher.get_page_labels, page_id
+    )
     formatted_labels = [label.to_simplified_dict() for label in labels]
     return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
 
@@ -394,7 +432,9 @@ async def add_label(
         ValueError: If in read-only mode or Confluence client is unavailable.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    labels = confluence_fetcher.add_page_label(page_id, name)
+    labels = await run_fetcher_call(
+        ctx, "confluence", confluence_fetcher.add_page_label, page_id, name
+    )
     formatted_labels = [label.to_simplified_dict() for label in labels]
     return json.dumps(formatted_labels, indent=2, ensure_ascii=False)
 
@@ -441,7 +481,10 @@ async def create_page(
         ValueError: If in read-only mode or Confluence client is unavailable.
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
-    page = confluence_fetcher.create_page(
+    page = await run_fetcher_call(
+        ctx,
+        "confluence",
+        confluence_fetcher.create_page,
         space_key=space_key,
         title=title,
         body=content,
@@ -498,7 +541,10 @@ async def update_page(
     # TODO: revert this once Cursor IDE handles optional parameters with Union types correctly.
     actual_parent_id = parent_id if parent_id else None
 
-    updated_page = confluence_fetcher.update_page(
+    updated_page = await run_fetcher_call(
+        ctx,
+        "confluence",
+        confluence_fetcher.update_page,
         page_id=page_id,
         title=title,
         body=content,
@@ -541,7 +587,13 @@ async def add_comment(
     """
     confluence_fetcher = await get_confluence_fetcher(ctx)
     try:
-        comment = confluence_fetcher.add_comment(page_id=page_id, content=content)
+        comment = await run_fetcher_call(
+            ctx,
+            "confluence",
+            confluence_fetcher.add_comment,
+            page_id=page_id,
+            content=content,
+        )
         if comment:
             comment_data = comment.to_simplified_dict()
             response = {
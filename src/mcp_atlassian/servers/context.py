@@ -4,8 +4,18 @@ from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from mcp_atlassian.confluence import ConfluenceFetcher
     from mcp_atlassian.confluence.config import ConfluenceConfig
+    from mcp_atlassian.confluence.content_cache import ContentConversionCache
+    from mcp_atlassian.jira import JiraFetcher
     from mcp_atlassian.jira.config import JiraConfig
+    from mcp_atlassian.jira.metadata import JiraMetadataRegistry
+    from mcp_atlassian.servers.dispatch import FetcherDispatcher
+    from mcp_atlassian.servers.fetcher_cache import UserFetcherCache
+    from mcp_atlassian.utils.cache_backend import CacheBackend
+    from mcp_atlassian.utils.rate_limit import RateLimiter
+    from mcp_atlassian.utils.request_coalescing import RequestCoalescer
+    from mcp_atlassian.utils.response_cache import ResponseCache
 
 
 @dataclass(frozen=True)
@@ -14,9 +24,21 @@ class MainAppContext:
     Context holding fully configured Jira and Confluence configurations
     loaded from environment variables at server startup.
     These configurations include any global/default authentication details.
+    The global fetchers are built once from those configurations and shared by
+    every request that has no user-specific credentials.
     """
 
     full_jira_config: JiraConfig | None = None
     full_confluence_config: ConfluenceConfig | None = None
     read_only: bool = False
     enabled_tools: list[str] | None = None
+    dispatcher: FetcherDispatcher | None = None
+    jira_fetcher: JiraFetcher | None = None
+    confluence_fetcher: ConfluenceFetcher | None = None
+    user_fetcher_cache: UserFetcherCache | None = None
+    jira_metadata_registry: JiraMetadataRegistry | None = None
+    confluence_content_cache: ContentConversionCache | None = None
+    response_cache: ResponseCache | None = None
+    request_coalescer: RequestCoalescer | None = None
+    cache_backend: CacheBackend | None = None
+    rate_limiter: RateLimiter | None = None
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import dataclasses
 import logging
+import threading
 from typing import TYPE_CHECKING, Any
 
 from fastmcp import Context
@@ -14,9 +15,12 @@ from fastmcp.server.dependencies import get_http_request
 from starlette.requests import Request
 
 from mcp_atlassian.confluence import ConfluenceConfig, ConfluenceFetcher
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira import JiraConfig, JiraFetcher
 from mcp_atlassian.servers.context import MainAppContext
-from mcp_atlassian.utils.oauth import OAuthConfig
+from mcp_atlassian.servers.dispatch import run_fetcher_call
+from mcp_atlassian.servers.fetcher_cache import CachedUserFetcher, UserFetcherCache
+from mcp_atlassian.utils.oauth import OAuthConfig, configure_oauth_session
 
 if TYPE_CHECKING:
     from mcp_atlassian.confluence.config import (
@@ -26,6 +30,48 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("mcp-atlassian.servers.dependencies")
 
+# Serializes OAuth token refreshes on the shared global fetchers.
+_global_oauth_refresh_lock = threading.Lock()
+
+
+def _refresh_global_oauth_session(
+    fetcher: JiraFetcher | ConfluenceFetcher, session: Any
+) -> None:
+    """Refresh the OAuth token of a shared fetcher's session if it has expired.
+
+    A per-call fetcher picked up a fresh token on construction. The global fetcher
+    lives for the whole process, so an expiring token is refreshed here before
+    the fetcher is reused. Access-token-only OAuth (no refresh token) and other
+    auth types are left untouched.
+
+    Args:
+        fetcher: The shared JiraFetcher or ConfluenceFetcher.
+        session: The requests session of the fetcher's REST client.
+
+    Raises:
+        MCPAtlassianAuthenticationError: If the token could not be refreshed.
+    """
+    oauth_config = fetcher.config.oauth_config
+    if (
+        fetcher.config.auth_type != "oauth"
+        or not oauth_config
+        or not oauth_config.refresh_token
+        or not oauth_config.is_token_expired
+    ):
+        return
+    with _global_oauth_refresh_lock:
+        # Another request may have refreshed the token while we waited.
+        if not oauth_config.is_token_expired:
+            return
+        if not configure_oauth_session(session, oauth_config):
+            raise MCPAtlassianAuthenticationError(
+                f"Failed to refresh OAuth token for global {type(fetcher).__name__}"
+            )
+        if fetcher.async_client is not None:
+            fetcher.async_client.update_headers(
+                {"Authorization": session.headers["Authorization"]}
+            )
+
 
 def _create_user_config_for_fetcher(
     base_config: JiraConfig | ConfluenceConfig,
@@ -183,6 +229,17 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
                 raise ValueError(
                     "Jira global configuration (URL, SSL) is not available from lifespan context."
                 )
+            cache_key = UserFetcherCache.make_key("jira", user_auth_type, user_token)
+            user_fetcher_cache = app_lifespan_ctx.user_fetcher_cache
+            cached = user_fetcher_cache.get(cache_key) if user_fetcher_cache else None
+            if user_fetcher_cache:
+                await user_fetcher_cache.close_retired()
+            if cached:
+                logger.debug(
+                    "get_jira_fetcher: Reusing cached user-specific JiraFetcher."
+                )
+                request.state.jira_fetcher = cached.fetcher
+                return cached.fetcher
             logger.info(
                 f"Creating user-specific JiraFetcher (type: {user_auth_type}) for user {user_email or 'unknown'} (token ...{str(user_token)[-8:]})"
             )
@@ -192,12 +249,28 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
                 credentials=credentials,
             )
             try:
-                user_jira_fetcher = JiraFetcher(config=user_specific_config)
-                current_user_id = user_jira_fetcher.get_current_user_account_id()
+                user_jira_fetcher = await run_fetcher_call(
+                    ctx,
+                    "jira",
+                    JiraFetcher,
+                    config=user_specific_config,
+                    metadata_registry=app_lifespan_ctx.jira_metadata_registry,
+                    response_cache=app_lifespan_ctx.response_cache,
+                    request_coalescer=app_lifespan_ctx.request_coalescer,
+                    cache_backend=app_lifespan_ctx.cache_backend,
+                    rate_limiter=app_lifespan_ctx.rate_limiter,
+                )
+                current_user_id = await run_fetcher_call(
+                    ctx, "jira", user_jira_fetcher.get_current_user_account_id
+                )
                 logger.debug(
                     f"get_jira_fetcher: Validated Jira token for user ID: {current_user_id}"
                 )
                 request.state.jira_fetcher = user_jira_fetcher
+                if user_fetcher_cache:
+                    user_fetcher_cache.put(
+                        cache_key, CachedUserFetcher(fetcher=user_jira_fetcher)
+                    )
                 return user_jira_fetcher
             except Exception as e:
                 logger.error(
@@ -220,12 +293,35 @@ async def get_jira_fetcher(ctx: Context) -> JiraFetcher:
         if isinstance(lifespan_ctx_dict_global, dict)
         else None
     )
+    if app_lifespan_ctx_global and app_lifespan_ctx_global.jira_fetcher:
+        global_jira_fetcher = app_lifespan_ctx_global.jira_fetcher
+        logger.debug(
+            "get_jira_fetcher: Using shared global JiraFetcher from lifespan_context."
+        )
+        await run_fetcher_call(
+            ctx,
+            "jira",
+            _refresh_global_oauth_session,
+            global_jira_fetcher,
+            global_jira_fetcher.jira._session,
+        )
+        return global_jira_fetcher
     if app_lifespan_ctx_global and app_lifespan_ctx_global.full_jira_config:
         logger.debug(
-            "get_jira_fetcher: Using global JiraFetcher from lifespan_context. "
+            "get_jira_fetcher: Creating JiraFetcher from global config in lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx_global.full_jira_config.auth_type}"
         )
-        return JiraFetcher(config=app_lifespan_ctx_global.full_jira_config)
+        return await run_fetcher_call(
+            ctx,
+            "jira",
+            JiraFetcher,
+            config=app_lifespan_ctx_global.full_jira_config,
+            metadata_registry=app_lifespan_ctx_global.jira_metadata_registry,
+            response_cache=app_lifespan_ctx_global.response_cache,
+            request_coalescer=app_lifespan_ctx_global.request_coalescer,
+            cache_backend=app_lifespan_ctx_global.cache_backend,
+            rate_limiter=app_lifespan_ctx_global.rate_limiter,
+        )
     logger.error("Jira configuration could not be resolved.")
     raise ValueError(
         "Jira client (fetcher) not available. Ensure server is configured correctly."
@@ -285,6 +381,21 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
                 raise ValueError(
                     "Confluence global configuration (URL, SSL) is not available from lifespan context."
                 )
+            cache_key = UserFetcherCache.make_key(
+                "confluence", user_auth_type, user_token
+            )
+            user_fetcher_cache = app_lifespan_ctx.user_fetcher_cache
+            cached = user_fetcher_cache.get(cache_key) if user_fetcher_cache else None
+            if user_fetcher_cache:
+                await user_fetcher_cache.close_retired()
+            if cached:
+                logger.debug(
+                    "get_confluence_fetcher: Reusing cached user-specific ConfluenceFetcher."
+                )
+                request.state.confluence_fetcher = cached.fetcher
+                if not user_email and cached.user_email:
+                    request.state.user_atlassian_email = cached.user_email
+                return cached.fetcher
             logger.info(
                 f"Creating user-specific ConfluenceFetcher (type: {user_auth_type}) for user {user_email or 'unknown'} (token ...{str(user_token)[-8:]})"
             )
@@ -294,8 +405,19 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
                 credentials=credentials,
             )
             try:
-                user_confluence_fetcher = ConfluenceFetcher(config=user_specific_config)
-                current_user_data = user_confluence_fetcher.get_current_user_info()
+                user_confluence_fetcher = await run_fetcher_call(
+                    ctx,
+                    "confluence",
+                    ConfluenceFetcher,
+                    config=user_specific_config,
+                    content_cache=app_lifespan_ctx.confluence_content_cache,
+                    response_cache=app_lifespan_ctx.response_cache,
+                    request_coalescer=app_lifespan_ctx.request_coalescer,
+                    rate_limiter=app_lifespan_ctx.rate_limiter,
+                )
+                current_user_data = await run_fetcher_call(
+                    ctx, "confluence", user_confluence_fetcher.get_current_user_info
+                )
                 # Try to get email from Confluence if not provided (can happen with PAT)
                 derived_email = (
                     current_user_data.get("email")
@@ -319,6 +441,13 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
                     and current_user_data.get("email")
                 ):
                     request.state.user_atlassian_email = current_user_data["email"]
+                if user_fetcher_cache:
+                    user_fetcher_cache.put(
+                        cache_key,
+                        CachedUserFetcher(
+                            fetcher=user_confluence_fetcher, user_email=derived_email
+                        ),
+                    )
                 return user_confluence_fetcher
             except Exception as e:
                 logger.error(
@@ -339,12 +468,34 @@ async def get_confluence_fetcher(ctx: Context) -> ConfluenceFetcher:
         if isinstance(lifespan_ctx_dict_global, dict)
         else None
     )
+    if app_lifespan_ctx_global and app_lifespan_ctx_global.confluence_fetcher:
+        global_confluence_fetcher = app_lifespan_ctx_global.confluence_fetcher
+        logger.debug(
+            "get_confluence_fetcher: Using shared global ConfluenceFetcher from lifespan_context."
+        )
+        await run_fetcher_call(
+            ctx,
+            "confluence",
+            _refresh_global_oauth_session,
+            global_confluence_fetcher,
+            global_confluence_fetcher.confluence._session,
+        )
+        return global_confluence_fetcher
     if app_lifespan_ctx_global and app_lifespan_ctx_global.full_confluence_config:
         logger.debug(
-            "get_confluence_fetcher: Using global ConfluenceFetcher from lifespan_context. "
+            "get_confluence_fetcher: Creating ConfluenceFetcher from global config in lifespan_context. "
             f"Global config auth_type: {app_lifespan_ctx_global.full_confluence_config.auth_type}"
         )
-        return ConfluenceFetcher(config=app_lifespan_ctx_global.full_confluence_config)
+        return await run_fetcher_call(
+            ctx,
+            "confluence",
+            ConfluenceFetcher,
+            config=app_lifespan_ctx_global.full_confluence_config,
+            content_cache=app_lifespan_ctx_global.confluence_content_cache,
+            response_cache=app_lifespan_ctx_global.response_cache,
+            request_coalescer=app_lifespan_ctx_global.request_coalescer,
+            rate_limiter=app_lifespan_ctx_global.rate_limiter,
+        )
     logger.error("Confluence configuration could not be resolved.")
     raise ValueError(
         "Confluence client (fetcher) not available. Ensure server is configured correctly."
@@ -0,0 +1,159 @@
+"""Worker-pool dispatch for blocking fetcher calls made from async tool handlers.
+
+The Jira and Confluence fetchers are synchronous (they sit on ``requests``), so
+calling them directly from an ``async def`` tool blocks the event loop for the
+full duration of the upstream request. ``run_fetcher_call`` moves that work onto
+a bounded pool of worker threads, with a separate concurrency cap per service.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+import anyio
+import anyio.to_thread
+
+from mcp_atlassian.utils.environment import get_positive_int_env
+
+if TYPE_CHECKING:
+    from fastmcp import Context
+
+    from mcp_atlassian.servers.context import MainAppContext
+
+logger = logging.getLogger("mcp-atlassian.servers.dispatch")
+
+ServiceName = Literal["jira", "confluence"]
+T = TypeVar("T")
+
+DEFAULT_WORKER_POOL_SIZE = 32
+DEFAULT_SERVICE_MAX_CONCURRENCY = 16
+
+
+@dataclass(frozen=True)
+class DispatchConfig:
+    """Sizing for the worker pool that runs blocking fetcher calls.
+
+    Attributes:
+        worker_pool_size: Maximum number of worker threads across all services.
+        jira_max_concurrency: Maximum in-flight Jira fetcher calls.
+        confluence_max_concurrency: Maximum in-flight Confluence fetcher calls.
+    """
+
+    worker_pool_size: int = DEFAULT_WORKER_POOL_SIZE
+    jira_max_concurrency: int = DEFAULT_SERVICE_MAX_CONCURRENCY
+    confluence_max_concurrency: int = DEFAULT_SERVICE_MAX_CONCURRENCY
+
+    @classmethod
+    def from_env(cls) -> DispatchConfig:
+        """Create dispatch configuration from environment variables.
+
+        Returns:
+            DispatchConfig with values from WORKER_POOL_SIZE,
+            JIRA_MAX_CONCURRENCY and CONFLUENCE_MAX_CONCURRENCY.
+        """
+        return cls(
+            worker_pool_size=get_positive_int_env(
+                "WORKER_POOL_SIZE", DEFAULT_WORKER_POOL_SIZE
+            ),
+            jira_max_concurrency=get_positive_int_env(
+                "JIRA_MAX_CONCURRENCY", DEFAULT_SERVICE_MAX_CONCURRENCY
+            ),
+            confluence_max_concurrency=get_positive_int_env(
+                "CONFLUENCE_MAX_CONCURRENCY", DEFAULT_SERVICE_MAX_CONCURRENCY
+            ),
+        )
+
+
+class FetcherDispatcher:
+    """Runs blocking fetcher calls on a bounded pool of worker threads.
+
+    A call first takes a slot from its service limiter and then a slot from the
+    shared pool limiter, so one busy service cannot starve the other of workers
+    beyond its own cap.
+    """
+
+    def __init__(self, config: DispatchConfig | None = None) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            config: Pool sizing. Defaults to DispatchConfig().
+        """
+        self.config = config or DispatchConfig()
+        self._pool_limiter = anyio.CapacityLimiter(self.config.worker_pool_size)
+        self._service_limiters: dict[str, anyio.CapacityLimiter] = {
+            "jira": anyio.CapacityLimiter(self.config.jira_max_concurrency),
+            "confluence": anyio.CapacityLimiter(self.config.confluence_max_concurrency),
+        }
+
+    async def run(
+        self,
+        service: ServiceName,
+        func: Callable[..., T],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Run ``func(*args, **kwargs)`` in a worker thread.
+
+        Args:
+            service: The service the call belongs to ('jira' or 'confluence').
+            func: The blocking callable, usually a bound fetcher method.
+            *args: Positional arguments for func.
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            The return value of func. Exceptions raised by func propagate.
+        """
+        service_limiter = self._service_limiters[service]
+        async with service_limiter:
+            return await anyio.to_thread.run_sync(
+                functools.partial(func, *args, **kwargs),
+                limiter=self._pool_limiter,
+            )
+
+
+def _get_dispatcher(ctx: Context) -> FetcherDispatcher | None:
+    """Return the dispatcher held on the lifespan context, if any."""
+    try:
+        lifespan_ctx_dict = ctx.request_context.lifespan_context
+    except (AttributeError, LookupError):
+        return None
+    app_lifespan_ctx: MainAppContext | None = (
+        lifespan_ctx_dict.get("app_lifespan_context")
+        if isinstance(lifespan_ctx_dict, dict)
+        else None
+    )
+    return getattr(app_lifespan_ctx, "dispatcher", None)
+
+
+async def run_fetcher_call(
+    ctx: Context,
+    service: ServiceName,
+    func: Callable[..., T],
+    /,
+    *args: Any,
+    **kwargs: Any,
+) -> T:
+    """Run a blocking fetcher call off the event loop.
+
+    Uses the dispatcher from the lifespan context when one is configured,
+    otherwise falls back to anyio's default worker thread limiter.
+
+    Args:
+        ctx: The FastMCP context.
+        service: The service the call belongs to ('jira' or 'confluence').
+        func: The blocking callable, usually a bound fetcher method.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        The return value of func.
+    """
+    dispatcher = _get_dispatcher(ctx)
+    if dispatcher is not None:
+        return await dispatcher.run(service, func, *args, **kwargs)
+    return await anyio.to_thread.run_sync(functools.partial(func, *args, **kwargs))
@@ -0,0 +1,235 @@
+"""Cache of validated user-specific fetchers for multi-user HTTP deployments.
+
+Without a cache, every request carrying a user token builds a new fetcher and
+spends an extra round trip validating the token. ``UserFetcherCache`` keeps
+validated fetchers in a bounded LRU+TTL cache keyed by a fingerprint of the
+token, so repeat calls from the same user skip both steps. Fetchers that are
+evicted or expire are closed after a grace period, so their connection pools
+are released without cutting off a tool call that is still using them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from cachetools import TTLCache
+
+from mcp_atlassian.utils.environment import get_positive_int_env
+from mcp_atlassian.utils.http_pool import close_session
+
+logger = logging.getLogger("mcp-atlassian.servers.fetcher_cache")
+
+DEFAULT_USER_FETCHER_CACHE_SIZE = 100
+DEFAULT_USER_FETCHER_CACHE_TTL = 300
+# Longer than a tool call holds on to the fetcher it was handed
+RETIRED_FETCHER_GRACE = 120
+
+FetcherCacheKey = tuple[str, str, str]
+
+
+def token_fingerprint(token: str) -> str:
+    """Return a SHA-256 fingerprint of a token so raw tokens are never cache keys.
+
+    Args:
+        token: The user's OAuth access token or PAT.
+
+    Returns:
+        Hex digest of the token.
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+async def close_fetcher(fetcher: Any) -> None:
+    """Release the connections held by a user-specific fetcher.
+
+    Closes the fetcher's async client and its REST session, leaving the shared
+    site pools to the fetchers that are still cached.
+
+    Args:
+        fetcher: The JiraFetcher or ConfluenceFetcher to close.
+    """
+    try:
+        if getattr(fetcher, "async_client", None) is not None:
+            await fetcher.async_client.aclose()
+        rest_client = getattr(fetcher, "jira", None) or getattr(
+            fetcher, "confluence", None
+        )
+        if rest_client is not None:
+            close_session(rest_client._session)
+    except Exception as e:  # noqa: BLE001 - closing must not fail the caller
+        logger.warning(f"Error closing {type(fetcher).__name__}: {e}")
+
+
+@dataclass(frozen=True)
+class CachedUserFetcher:
+    """A validated user-specific fetcher and what was learned while validating it.
+
+    Attributes:
+        fetcher: The JiraFetcher or ConfluenceFetcher built for the user.
+        user_email: Email derived during validation, if any.
+    """
+
+    fetcher: Any
+    user_email: str | None = None
+
+
+class _MeteredTTLCache(TTLCache):
+    """TTLCache that counts capacity evictions and expirations.
+
+    Evicted and expired values are passed to on_remove.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        timer: Callable[[], float] = time.monotonic,
+        on_remove: Callable[[Any], None] = lambda value: None,
+    ) -> None:
+        super().__init__(maxsize=maxsize, ttl=ttl, timer=timer)
+        self.evictions = 0
+        self.expirations = 0
+        self._on_remove = on_remove
+
+    def popitem(self) -> tuple[Any, Any]:
+        key, value = super().popitem()
+        self.evictions += 1
+        logger.debug(f"Evicted least recently used user fetcher ({key[0]}).")
+        self._on_remove(value)
+        return key, value
+
+    def expire(self, time: float | None = None) -> list[tuple[Any, Any]]:
+        expired = super().expire(time)
+        self.expirations += len(expired)
+        for _, value in expired:
+            self._on_remove(value)
+        return expired
+
+
+class UserFetcherCache:
+    """Thread-safe LRU+TTL cache of validated user-specific fetchers.
+
+    Entries are keyed by service, auth type and token fingerprint. The TTL bounds
+    how long a token revoked upstream keeps working through a cached fetcher.
+    Evicted and expired fetchers are retired and closed by ``close_retired``
+    once RETIRED_FETCHER_GRACE seconds have passed, or by ``aclose``.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_USER_FETCHER_CACHE_SIZE,
+        ttl: int = DEFAULT_USER_FETCHER_CACHE_TTL,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached fetchers across both services.
+            ttl: Seconds a validated fetcher stays cached.
+            timer: Clock used for expiry.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._cache = _MeteredTTLCache(
+            maxsize=maxsize, ttl=ttl, timer=timer, on_remove=self._retire
+        )
+        self._retired: list[tuple[float, Any]] = []
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def from_env(cls) -> UserFetcherCache:
+        """Create a cache sized from USER_FETCHER_CACHE_SIZE and USER_FETCHER_CACHE_TTL.
+
+        Returns:
+            UserFetcherCache with values from the environment or defaults.
+        """
+        return cls(
+            maxsize=get_positive_int_env(
+                "USER_FETCHER_CACHE_SIZE", DEFAULT_USER_FETCHER_CACHE_SIZE
+            ),
+            ttl=get_positive_int_env(
+                "USER_FETCHER_CACHE_TTL", DEFAULT_USER_FETCHER_CACHE_TTL
+            ),
+        )
+
+    @staticmethod
+    def make_key(service: str, auth_type: str, token: str) -> FetcherCacheKey:
+        """Build the cache key for a user token.
+
+        Args:
+            service: 'jira' or 'confluence'.
+            auth_type: 'oauth' or 'pat'.
+            token: The raw user token (only its fingerprint is kept).
+
+        Returns:
+            The cache key.
+        """
+        return (service, auth_type, token_fingerprint(token))
+
+    def get(self, key: FetcherCacheKey) -> CachedUserFetcher | None:
+        """Return the cached entry for key, or None on a miss."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return entry
+
+    def put(self, key: FetcherCacheKey, entry: CachedUserFetcher) -> None:
+        """Store a validated fetcher."""
+        with self._lock:
+            previous = self._cache.get(key)
+            if previous is not None and previous.fetcher is not entry.fetcher:
+                self._retire(previous)
+            self._cache[key] = entry
+
+    def _retire(self, entry: CachedUserFetcher) -> None:
+        # Called with the lock held
+        self._retired.append((self._timer(), entry.fetcher))
+
+    async def close_retired(self) -> None:
+        """Close retired fetchers whose grace period has passed."""
+        with self._lock:
+            cutoff = self._timer() - RETIRED_FETCHER_GRACE
+            due = [fetcher for retired, fetcher in self._retired if retired <= cutoff]
+            self._retired = [item for item in self._retired if item[0] > cutoff]
+        for fetcher in due:
+            await close_fetcher(fetcher)
+
+    async def aclose(self) -> None:
+        """Close every cached and retired fetcher, e.g. on server shutdown."""
+        with self._lock:
+            # Clearing pops every entry, which retires its fetcher
+            self._cache.clear()
+            fetchers = [fetcher for _, fetcher in self._retired]
+            self._retired = []
+        for fetcher in fetchers:
+            await close_fetcher(fetcher)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss and eviction counters.
+
+        Returns:
+            Dictionary with size, maxsize, hits, misses, evictions, expirations
+            and the number of retired fetchers not yet closed.
+        """
+        with self._lock:
+            return {
+                "size": len(self._cache),
+                "maxsize": self.maxsize,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self._cache.evictions,
+                "expirations": self._cache.expirations,
+                "retired": len(self._retired),
+            }
@@ -2,6 +2,7 @@
 
 import json
 import logging
+from itertools import islice
 from typing import Annotated, Any
 
 from fastmcp import Context, FastMCP
@@ -10,9 +11,13 @@ from requests.exceptions import HTTPError
 
 from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira.constants import DEFAULT_READ_JIRA_FIELDS
+from mcp_atlassian.jira.search import DEFAULT_SEARCH_PAGE_SIZE
+from mcp_atlassian.models.jira import JiraSearchResult
 from mcp_atlassian.models.jira.common import JiraUser
 from mcp_atlassian.servers.dependencies import get_jira_fetcher
+from mcp_atlassian.servers.dispatch import run_fetcher_call
 from mcp_atlassian.utils import convert_empty_defaults_to_none
+from mcp_atlassian.utils.async_http import AsyncAtlassianClient
 from mcp_atlassian.utils.decorators import check_write_access
 
 logger = logging.getLogger(__name__)
@@ -48,7 +53,9 @@ async def get_user_profile(
     """
     jira = await get_jira_fetcher(ctx)
     try:
-        user: JiraUser = jira.get_user_profile_by_identifier(user_identifier)
+        user: JiraUser = await run_fetcher_call(
+            ctx, "jira", jira.get_user_profile_by_identifier, user_identifier
+        )
         result = user.to_simplified_dict()
         response_data = {"success": True, "user": result}
     except Exception as e:
@@ -110,7 +117,7 @@ async def get_issue(
     comment_limit: Annotated[
         int | None,
         Field(
-            description="Maximum number of comments to include (0 for no comments, null for all comments)",
+            description="Maximum number of most recent comments to include (0 for no comments, null for all comments)",
             default=None,
             ge=0,
             le=100,
@@ -153,7 +160,10 @@ async def get_issue(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    issue = jira.get_issue(
+    issue = await run_fetcher_call(
+        ctx,
+        "jira",
+        jira.get_issue,
         issue_key=issue_key,
         fields=fields_list,
         expand=expand,
@@ -165,6 +175,82 @@ async def get_issue(
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
+@convert_empty_defaults_to_none
+@jira_mcp.tool(tags={"jira", "read"})
+async def get_issues(
+    ctx: Context,
+    issue_keys: Annotated[
+        list[str],
+        Field(description="List of Jira issue keys, e.g. ['PROJ-123', 'PROJ-124']"),
+    ],
+    fields: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Comma-separated list of fields to return (e.g., 'summary,status,customfield_10010'). "
+                "Use '*all' for all fields (including custom fields), or omit for essential fields only."
+            ),
+            default=",".join(DEFAULT_READ_JIRA_FIELDS),
+        ),
+    ] = ",".join(DEFAULT_READ_JIRA_FIELDS),
+    comment_limit: Annotated[
+        int | None,
+        Field(
+            description="Maximum number of most recent comments to include per issue (0 for no comments, null for all comments)",
+            default=10,
+            ge=0,
+            le=100,
+        ),
+    ] = 10,
+    expand: Annotated[
+        str,
+        Field(
+            description=(
+                "(Optional) Fields to expand. Examples: 'renderedFields', 'changelog'"
+            ),
+            default="",
+        ),
+    ] = "",
+) -> str:
+    """Get several Jira issues by key in a few bulk requests.
+
+    Args:
+        ctx: The FastMCP context.
+        issue_keys: List of issue keys.
+        fields: Comma-separated list of fields to return, '*all' for all fields, or omitted for essentials.
+        comment_limit: Maximum number of comments per issue.
+        expand: Optional fields to expand.
+
+    Returns:
+        JSON string with the issues in request order; keys that could not be
+        retrieved have an 'error' entry instead.
+
+    Raises:
+        ValueError: If the Jira client is not configured or available.
+    """
+    jira = await get_jira_fetcher(ctx)
+    fields_list: str | list[str] | None = fields
+    if fields and fields != "*all":
+        fields_list = [f.strip() for f in fields.split(",")]
+
+    issues = await run_fetcher_call(
+        ctx,
+        "jira",
+        jira.get_issues,
+        issue_keys=issue_keys,
+        fields=fields_list,
+        comment_limit=comment_limit,
+        expand=expand,
+    )
+    results = [
+        {"key": key, "error": issue}
+        if isinstance(issue, str)
+        else issue.to_simplified_dict()
+        for key, issue in issues.items()
+    ]
+    return json.dumps({"issues": results}, indent=2, ensure_ascii=False)
+
+
 @convert_empty_defaults_to_none
 @jira_mcp.tool(tags={"jira", "read"})
 async def search(
@@ -196,7 +282,11 @@ async def search(
     ] = ",".join(DEFAULT_READ_JIRA_FIELDS),
     limit: Annotated[
         int,
-        Field(description="Maximum number of results (1-50)", default=10, ge=1),
+        Field(
+            description="Maximum number of results (1-50, or more with 'paginate')",
+            default=10,
+            ge=1,
+        ),
     ] = 10,
     start_at: Annotated[
         int,
@@ -221,6 +311,18 @@ async def search(
             default="",
         ),
     ] = "",
+    paginate: Annotated[
+        bool,
+        Field(
+            description=(
+                "(Optional) Follow pagination to collect up to 'limit' issues across "
+                "as many pages as needed, beyond the single-page cap of 50. "
+                "Use for large result sets. 'total' is the number of issues returned, "
+                "or -1 when more issues remain."
+            ),
+            default=False,
+        ),
+    ] = False,
 ) -> str:
     """Search Jira issues using JQL (Jira Query Language).
 
@@ -232,6 +334,7 @@ async def search(
         start_at: Starting index for pagination.
         projects_filter: Comma-separated list of project keys to filter by.
         expand: Optional fields to expand.
+        paginate: Whether to follow pagination up to limit issues.
 
     Returns:
         JSON string representing the search results including pagination info.
@@ -241,14 +344,45 @@ async def search(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.search_issues(
-        jql=jql,
-        fields=fields_list,
-        limit=limit,
-        start=start_at,
-        expand=expand,
-        projects_filter=projects_filter,
-    )
+    if paginate:
+
+        def collect_issues() -> list:
+            issues = jira.iter_issues(
+                jql,
+                fields=fields_list,
+                page_size=min(limit + 1, DEFAULT_SEARCH_PAGE_SIZE),
+                expand=expand,
+                projects_filter=projects_filter,
+                start=start_at,
+            )
+            # One issue past the limit tells whether more issues remain
+            return list(islice(issues, limit + 1))
+
+        issues = await run_fetcher_call(ctx, "jira", collect_issues)
+        search_result = JiraSearchResult(
+            total=len(issues) if len(issues) <= limit else -1,
+            start_at=start_at,
+            max_results=limit,
+            issues=issues[:limit],
+        )
+        return json.dumps(
+            search_result.to_simplified_dict(), indent=2, ensure_ascii=False
+        )
+
+    search_kwargs: dict[str, Any] = {
+        "jql": jql,
+        "fields": fields_list,
+        "limit": limit,
+        "start": start_at,
+        "expand": expand,
+        "projects_filter": projects_filter,
+    }
+    if isinstance(jira.async_client, AsyncAtlassianClient):
+        search_result = await jira.search_issues_async(**search_kwargs)
+    else:
+        search_result = await run_fetcher_call(
+            ctx, "jira", jira.search_issues, **search_kwargs
+        )
     result = search_result.to_simplified_dict()
     return json.dumps(result, indent=2, ensure_ascii=False)
 
@@ -283,7 +417,9 @@ async def search_fields(
         JSON string representing a list of matching field definitions.
     """
     jira = await get_jira_fetcher(ctx)
-    result = jira.search_fields(keyword, limit=limit, refresh=refresh)
+    result = await run_fetcher_call(
+        ctx, "jira", jira.search_fields, keyword, limit=limit, refresh=refresh
+    )
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
@@ -312,8 +448,13 @@ async def get_project_issues(
         JSON string representing the search results including pagination info.
     """
     jira = await get_jira_fetcher(ctx)
-    search_result = jira.get_project_issues(
-        project_key=project_key, start=start_at, limit=limit
+    search_result = await run_fetcher_call(
+        ctx,
+        "jira",
+        jira.get_project_issues,
+        project_key=project_key,
+        start=start_at,
+        limit=limit,
     )
     result = search_result.to_simplified_dict()
     return json.dumps(result, indent=2, ensure_ascii=False)
@@ -335,7 +476,9 @@ async def get_transitions(
     """
     jira = await get_jira_fetcher(ctx)
     # Underlying method returns list[dict] in the desired format
-    transitions = jira.get_available_transitions(issue_key)
+    transitions = await run_fetcher_call(
+        ctx, "jira", jira.get_available_transitions, issue_key
+    )
     return json.dumps(transitions, indent=2, ensure_ascii=False)
 
 
@@ -354,7 +497,7 @@ async def get_worklog(
         JSON string representing the worklog entries.
     """
     jira = await get_jira_fetcher(ctx)
-    worklogs = jira.get_worklogs(issue_key)
+    worklogs = await run_fetcher_call(ctx, "jira", jira.get_worklogs, issue_key)
     result = {"worklogs": worklogs}
     return json.dumps(result, indent=2, ensure_ascii=False)
 
@@ -378,7 +521,13 @@ async def download_attachments(
         JSON string indicating the result of the download operation.
     """
     jira = await get_jira_fetcher(ctx)
-    result = jira.download_issue_attachments(issue_key=issue_key, target_dir=target_dir)
+    result = await run_fetcher_call(
+        ctx,
+        "jira",
+        jira.download_issue_attachments,
+        issue_key=issue_key,
+        target_dir=target_dir,
+    )
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
@@ -421,7 +570,10 @@ async def get_agile_boards(
         JSON string representing a list of board objects.
     """
     jira = await get_jira_fetcher(ctx)
-    boards = jira.get_all_agile_boards_model(
+    boards = await run_fetcher_call(
+        ctx,
+        "jira",
+        jira.get_all_agile_boards_model,
         board_name=board_name,
         project_key=project_key,
         board_type=board_type,
@@ -498,7 +650,10 @@ async def get_board_issues(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.get_board_issues(
+    search_result = await run_fetcher_call(
+        ctx,
+        "jira",
+        jira.get_board_issues,
         board_id=board_id,
         jql=jql,
         fields=fields_list,
@@ -541,8 +696,14 @@ async def get_sprints_from_board(
         JSON string representing a list of sprint objects.
     """
     jira = await get_jira_fetcher(ctx)
-    sprints = jira.get_all_sprints_from_board_model(
-        board_id=board_id, state=state, start=start_at, limit=limit
+    sprints = await run_fetcher_call(
+        ctx,
+        "jira",
+        jira.get_all_sprints_from_board_model,
+        board_id=board_id,
+        state=state,
+        start=start_at,
+        limit=limit,
     )
     result = [sprint.to_simplified_dict() for sprint in sprints]
     return json.dumps(result, indent=2, ensure_ascii=False)
@@ -590,8 +751,14 @@ async def get_sprint_issues(
     if fields and fields != "*all":
         fields_list = [f.strip() for f in fields.split(",")]
 
-    search_result = jira.get_sprint_issues(
-        sprint_id=sprint_id, fields=fields_list, start=start_at, limit=limit
+    search_result = await run_fetcher_call(
+        ctx,
+        "jira",
+        jira.get_sprint_issues,
+        sprint_id=sprint_id,
+        fields=fields_list,
+        start=start_at,
+        limit=limit,
     )
     result = search_result.to_simplified_dict()
     return json.dumps(result, indent=2, ensure_ascii=False)
@@ -608,7 +775,11 @@ async def get_link_types(ctx: Context) -> str:
         JSON string representing a list of issue link type objects.
     """
     jira = await get_jira_fetcher(ctx)
-    link_types = jira.get_issue_link_types()
+    link_types = await run_fetcher_call(
+        ctx,
+        "jira",
+        jira.get_issue_link_types,
+    )
     formatted_link_types = [link_type.to_simplified_dict() for link_type in link_types]
     return json.dumps(formatted_link_types, indent=2, ensure_ascii=False)
 
@@ -702,7 +873,10 @@ async def create_issue(
     if not isinstance(extra_fields, dict):
         raise ValueError("additional_fields must be a dictionary.")
 
-    issue = jira.create_issue(
+    issue = await run_fetcher_call(
+        ctx,
+        "jira",
+        jira.create_issue,
         project_key=project_key,
         summary=summary,
         issue_type=issue_type,
@@ -757,7 +931,8 @@ async def batch_create_issues(
         validate_only: If true, only validates without creating.
 
     Returns:
-        JSON string indicating success and listing created issues (or validation result).
+        JSON string listing created issues and the outcome of each input issue
+        (or validation result).
 
     Raises:
         ValueError: If in read-only mode, Jira client unavailable, or invalid JSON.
@@ -774,16 +949,35 @@ async def batch_create_issues(
         raise ValueError(f"Invalid input for issues: {e}") from e
 
     # Create issues in batch
-    created_issues = jira.batch_create_issues(issues_list, validate_only=validate_only)
-
-    message = (
-        "Issues validated successfully"
-        if validate_only
-        else "Issues created successfully"
+    report = await run_fetcher_call(
+        ctx,
+        "jira",
+        jira.batch_create_issues_with_report,
+        issues_list,
+        validate_only=validate_only,
     )
+
+    succeeded = sum(item["status"] != "failed" for item in report)
+    if succeeded == len(report):
+        message = (
+            "Issues validated successfully"
+            if validate_only
+            else "Issues created successfully"
+        )
+    else:
+        action = "Validated" if validate_only else "Created"
+        message = f"{action} {succeeded} of {len(report)} issues"
     result = {
         "message": message,
-        "issues": [issue.to_simplified_dict() for issue in created_issues],
+        "issues": [
+            item["issue"].to_simplified_dict()
+            for item in report
+            if item.get("issue") is not None
+        ],
+        "results": [
+            {key: value for key, value in item.items() if key != "issue"}
+            for item in report
+        ],
     }
     return json.dumps(result, indent=2, ensure_ascii=False)
 
@@ -841,8 +1035,12 @@ async def batch_get_changelogs(
         )
 
     # Call the underlying method
-    issues_with_changelogs = jira.batch_get_changelogs(
-        issue_ids_or_keys=issue_ids_or_keys, fields=fields
+    issues_with_changelogs = await run_fetcher_call(
+        ctx,
+        "jira",
+        jira.batch_get_changelogs,
+        issue_ids_or_keys=issue_ids_or_keys,
+        fields=fields,
     )
 
     # Format the response
@@ -946,7 +1144,9 @@ async def update_issue(
         all_updates["attachments"] = attachment_paths
 
     try:
-        issue = jira.update_issue(issue_key=issue_key, **all_updates)
+        issue = await run_fetcher_call(
+            ctx, "jira", jira.update_issue, issue_key=issue_key, **all_updates
+        )
         result = issue.to_simplified_dict()
         if (
             hasattr(issue, "custom_fields")
@@ -993,7 +1193,9 @@ async def add_comment(
     """
     jira = await get_jira_fetcher(ctx)
     # add_comment returns dict
-    result = jira.add_comment(issue_key, comment, visibility=visibility)
+    result = await run_fetcher_call(
+        ctx, "jira", jira.add_comment, issue_key, comment, visibility=visibility
+    )
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
@@ -1023,7 +1225,9 @@ async def link_to_epic(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    issue = jira.link_issue_to_epic(issue_key, epic_key)
+    issue = await run_fetcher_call(
+        ctx, "jira", jira.link_issue_to_epic, issue_key, epic_key
+    )
     result = {
         "message": f"Issue {issue_key} has been linked to epic {epic_key}.",
         "issue": issue.to_simplified_dict(),
@@ -1096,7 +1300,7 @@ async def create_issue_link(
                 logger.warning("Invalid comment_visibility dictionary structure.")
         link_data["comment"] = comment_obj
 
-    result = jira.create_issue_link(link_data)
+    result = await run_fetcher_call(ctx, "jira", jira.create_issue_link, link_data)
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
@@ -1122,7 +1326,9 @@ async def remove_issue_link(
     if not link_id:
         raise ValueError("link_id is required")
 
-    result = jira.remove_issue_link(link_id)  # Returns dict on success
+    result = await run_fetcher_call(
+        ctx, "jira", jira.remove_issue_link, link_id
+    )  # Returns dict on success
     return json.dumps(result, indent=2, ensure_ascii=False)
 
 
@@ -1186,7 +1392,10 @@ async def transition_issue(
     if not isinstance(update_fields, dict):
         raise ValueError("fields must be a dictionary.")
 
-    issue = jira.transition_issue(
+    issue = await run_fetcher_call(
+        ctx,
+        "jira",
+        jira.transition_issue,
         issue_key=issue_key,
         transition_id=transition_id,
         fields=update_fields,
@@ -1234,7 +1443,10 @@ async def create_sprint(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    sprint = jira.create_sprint(
+    sprint = await run_fetcher_call(
+        ctx,
+        "jira",
+        jira.create_sprint,
         board_id=board_id,
         sprint_name=sprint_name,
         start_date=start_date,
@@ -1283,7 +1495,10 @@ async def update_sprint(
         ValueError: If in read-only mode or Jira client unavailable.
     """
     jira = await get_jira_fetcher(ctx)
-    sprint = jira.update_sprint(
+    sprint = await run_fetcher_call(
+        ctx,
+        "jira",
+        jira.update_sprint,
         sprint_id=sprint_id,
         sprint_name=sprint_name,
         state=state,
@@ -1308,7 +1523,9 @@ async def get_project_versions(
 ) -> str:
     """Get all fix versions for a specific Jira project."""
     jira = await get_jira_fetcher(ctx)
-    versions = jira.get_project_versions(project_key)
+    versions = await run_fetcher_call(
+        ctx, "jira", jira.get_project_versions, project_key
+    )
     return json.dumps(versions, indent=2, ensure_ascii=False)
 
 
@@ -1344,7 +1561,10 @@ async def create_version(
     """
     jira = await get_jira_fetcher(ctx)
     try:
-        version = jira.create_project_version(
+        version = await run_fetcher_call(
+            ctx,
+            "jira",
+            jira.create_project_version,
             project_key=project_key,
             name=name,
             start_date=start_date,
@@ -5,7 +5,6 @@ from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any, Literal, Optional
 
-from cachetools import TTLCache
 from fastmcp import FastMCP
 from fastmcp.tools import Tool as FastMCPTool
 from mcp.types import Tool as MCPTool
@@ -17,15 +16,24 @@ from starlette.responses import JSONResponse
 
 from mcp_atlassian.confluence import ConfluenceFetcher
 from mcp_atlassian.confluence.config import ConfluenceConfig
+from mcp_atlassian.confluence.content_cache import ContentConversionCache
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.jira.metadata import JiraMetadataRegistry
+from mcp_atlassian.utils.cache_backend import CacheBackend
 from mcp_atlassian.utils.environment import get_available_services
+from mcp_atlassian.utils.http_pool import close_connection_pools
 from mcp_atlassian.utils.io import is_read_only_mode
 from mcp_atlassian.utils.logging import mask_sensitive
+from mcp_atlassian.utils.rate_limit import RateLimiter
+from mcp_atlassian.utils.request_coalescing import RequestCoalescer
+from mcp_atlassian.utils.response_cache import ResponseCache
 from mcp_atlassian.utils.tools import get_enabled_tools, should_include_tool
 
 from .confluence import confluence_mcp
 from .context import MainAppContext
+from .dispatch import DispatchConfig, FetcherDispatcher
+from .fetcher_cache import UserFetcherCache
 from .jira import jira_mcp
 
 logger = logging.getLogger("mcp-atlassian.server.main")
@@ -75,16 +83,118 @@ async def main_lifespan(app: FastMCP[MainAppContext]) -> AsyncIterator[dict]:
         except Exception as e:
             logger.error(f"Failed to load Confluence configuration: {e}", exc_info=True)
 
+    dispatch_config = DispatchConfig.from_env()
+    dispatcher = FetcherDispatcher(dispatch_config)
+    user_fetcher_cache = UserFetcherCache.from_env()
+    cache_backend = CacheBackend.from_env()
+    jira_metadata_registry = JiraMetadataRegistry.from_env(backend=cache_backend)
+    confluence_content_cache = ContentConversionCache.from_env()
+    response_cache = ResponseCache.from_env(backend=cache_backend)
+    request_coalescer = RequestCoalescer.from_env()
+    rate_limiter = RateLimiter.from_env()
+
+    global_jira_fetcher: JiraFetcher | None = None
+    global_confluence_fetcher: ConfluenceFetcher | None = None
+    if loaded_jira_config:
+        try:
+            global_jira_fetcher = await dispatcher.run(
+                "jira",
+                JiraFetcher,
+                config=loaded_jira_config,
+                metadata_registry=jira_metadata_registry,
+                response_cache=response_cache,
+                request_coalescer=request_coalescer,
+                cache_backend=cache_backend,
+                rate_limiter=rate_limiter,
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to create global JiraFetcher, it will be created per request: {e}",
+                exc_info=True,
+            )
+    if loaded_confluence_config:
+        try:
+            global_confluence_fetcher = await dispatcher.run(
+                "confluence",
+                ConfluenceFetcher,
+                config=loaded_confluence_config,
+                content_cache=confluence_content_cache,
+                response_cache=response_cache,
+                request_coalescer=request_coalescer,
+                rate_limiter=rate_limiter,
+            )
+        except Exception as e:
+            logger.error(
+                f"Failed to create global ConfluenceFetcher, it will be created per request: {e}",
+                exc_info=True,
+            )
+
     app_context = MainAppContext(
         full_jira_config=loaded_jira_config,
         full_confluence_config=loaded_confluence_config,
         read_only=read_only,
         enabled_tools=enabled_tools,
+        dispatcher=dispatcher,
+        jira_fetcher=global_jira_fetcher,
+        confluence_fetcher=global_confluence_fetcher,
+        user_fetcher_cache=user_fetcher_cache,
+        jira_metadata_registry=jira_metadata_registry,
+        confluence_content_cache=confluence_content_cache,
+        response_cache=response_cache,
+        request_coalescer=request_coalescer,
+        cache_backend=cache_backend,
+        rate_limiter=rate_limiter,
     )
     logger.info(f"Read-only mode: {'ENABLED' if read_only else 'DISABLED'}")
     logger.info(f"Enabled tools filter: {enabled_tools or 'All tools enabled'}")
-    yield {"app_lifespan_context": app_context}
-    logger.info("Main Atlassian MCP server lifespan shutting down.")
+    logger.info(
+        f"Worker pool size: {dispatch_config.worker_pool_size} "
+        f"(Jira max concurrency: {dispatch_config.jira_max_concurrency}, "
+        f"Confluence max concurrency: {dispatch_config.confluence_max_concurrency})"
+    )
+    logger.info(
+        f"User fetcher cache: max {user_fetcher_cache.maxsize} entries, "
+        f"TTL {user_fetcher_cache.ttl}s"
+    )
+    try:
+        yield {"app_lifespan_context": app_context}
+    finally:
+        logger.info("Main Atlassian MCP server lifespan shutting down.")
+        logger.info(f"User fetcher cache stats: {user_fetcher_cache.stats()}")
+        logger.info(
+            f"Confluence content cache stats: {confluence_content_cache.stats()}"
+        )
+        if response_cache is not None:
+            logger.info(f"Response cache stats: {response_cache.stats()}")
+            response_cache.close()
+        if request_coalescer is not None:
+            logger.info(f"Request coalescing stats: {request_coalescer.stats()}")
+        if rate_limiter is not None:
+            logger.info(f"Rate limiter stats: {rate_limiter.stats()}")
+        jira_metadata_registry.close()
+        if cache_backend is not None:
+            cache_backend.close()
+        if global_jira_fetcher:
+            await _close_fetcher(global_jira_fetcher, global_jira_fetcher.jira)
+        if global_confluence_fetcher:
+            await _close_fetcher(
+                global_confluence_fetcher, global_confluence_fetcher.confluence
+            )
+        await user_fetcher_cache.aclose()
+        # Per-user fetchers share these pools with the global fetchers
+        close_connection_pools()
+
+
+async def _close_fetcher(
+    fetcher: JiraFetcher | ConfluenceFetcher, rest_client: Any
+) -> None:
+    """Release the connection pools held by a shared fetcher."""
+    try:
+        if fetcher.async_client is not None:
+            await fetcher.async_client.aclose()
+        rest_client._session.close()
+    except Exception as e:
+        logger.warning(f"Error closing {type(fetcher).__name__}: {e}")
 
 
 class AtlassianMCP(FastMCP[MainAppContext]):
@@ -185,11 +295,6 @@ class AtlassianMCP(FastMCP[MainAppContext]):
         return app
 
 
-token_validation_cache: TTLCache[
-    int, tuple[bool, str | None, JiraFetcher | None, ConfluenceFetcher | None]
-] = TTLCache(maxsize=100, ttl=300)
-
-
 class UserTokenMiddleware(BaseHTTPMiddleware):
     """Middleware to extract Atlassian user tokens/credentials from Authorization headers."""
 
@@ -0,0 +1,366 @@
+"""Async HTTP transport for Atlassian REST APIs, built on httpx.
+
+The synchronous clients (``atlassian.Jira`` / ``atlassian.Confluence``) sit on a
+``requests.Session`` and need one worker thread per in-flight call. When a
+deployment selects the ``httpx`` backend, JiraClient and ConfluenceClient also
+build an ``AsyncAtlassianClient`` so mixins can await upstream calls directly.
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable
+from typing import TYPE_CHECKING, Any, Literal
+from urllib.parse import urljoin
+
+import httpx
+
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+
+from .http_pool import HttpPoolConfig
+from .logging import log_config_param
+from .rate_limit import RateLimiter
+from .request_coalescing import RequestCoalescer
+from .ssl import create_unverified_ssl_context
+
+if TYPE_CHECKING:
+    from atlassian.rest_client import AtlassianRestAPI
+
+    from mcp_atlassian.confluence.config import ConfluenceConfig
+    from mcp_atlassian.jira.config import JiraConfig
+
+logger = logging.getLogger("mcp-atlassian.async_http")
+
+HttpBackend = Literal["requests", "httpx"]
+HTTP_BACKENDS: tuple[HttpBackend, ...] = ("requests", "httpx")
+DEFAULT_TIMEOUT = 75.0
+
+
+def parse_http_backend(value: str | None) -> HttpBackend:
+    """Normalize an HTTP backend name from configuration.
+
+    Args:
+        value: The configured backend name (case-insensitive), or None.
+
+    Returns:
+        'requests' or 'httpx'
+
+    Raises:
+        ValueError: If the value names an unsupported backend
+    """
+    backend = (value or "requests").strip().lower()
+    if backend not in HTTP_BACKENDS:
+        error_msg = (
+            f"Unsupported HTTP backend '{value}'. Expected one of: "
+            f"{', '.join(HTTP_BACKENDS)}"
+        )
+        raise ValueError(error_msg)
+    return backend  # type: ignore[return-value]
+
+
+def _build_proxy_mounts(
+    proxies: dict[str, str],
+    no_proxy: str | None,
+    verify: bool | Any,
+) -> dict[str, httpx.AsyncBaseTransport | None]:
+    """Translate requests-style proxy settings into httpx transport mounts.
+
+    Args:
+        proxies: Mapping of 'http'/'https'/'socks' to proxy URLs
+        no_proxy: Comma-separated list of hosts that bypass the proxy
+        verify: SSL verification setting for the proxied transports
+
+    Returns:
+        Mounts for httpx.AsyncClient
+    """
+    mounts: dict[str, httpx.AsyncBaseTransport | None] = {}
+    socks_proxy = proxies.get("socks")
+    for scheme in ("http", "https"):
+        proxy_url = proxies.get(scheme) or socks_proxy
+        if proxy_url:
+            mounts[f"{scheme}://"] = httpx.AsyncHTTPTransport(
+                proxy=proxy_url, verify=verify
+            )
+    if mounts and no_proxy:
+        for host in (h.strip() for h in no_proxy.split(",")):
+            if host:
+                # Mounting None routes matching requests through the default transport.
+                mounts[
+                    f"all://*{host}" if host.startswith(".") else f"all://{host}"
+                ] = None
+    return mounts
+
+
+class AsyncAtlassianClient:
+    """Minimal async REST client mirroring the ``AtlassianRestAPI`` call surface.
+
+    Paths are resolved against the same base URL, API root and API version as the
+    synchronous client, and JSON responses are returned already decoded.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *,
+        service_name: str = "Atlassian",
+        api_root: str = "rest/api",
+        api_version: str | int = "latest",
+        headers: dict[str, str] | None = None,
+        auth: tuple[str, str] | None = None,
+        ssl_verify: bool = True,
+        proxies: dict[str, str] | None = None,
+        no_proxy: str | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        coalescer: RequestCoalescer | None = None,
+        pool_config: HttpPoolConfig | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> None:
+        """Initialize the async client.
+
+        Args:
+            url: Base URL of the REST API (the OAuth gateway URL for OAuth)
+            service_name: Service name used in log and error messages
+            api_root: Root path for resource URLs
+            api_version: API version for resource URLs
+            headers: Default headers (including Authorization for PAT/OAuth)
+            auth: (username, password) tuple for basic auth
+            ssl_verify: Whether to verify SSL certificates
+            proxies: Mapping of 'http'/'https'/'socks' to proxy URLs
+            no_proxy: Comma-separated list of hosts that bypass the proxy
+            timeout: Request timeout in seconds
+            coalescer: Optional coalescer shared with other clients; identical
+                concurrent GETs then share one upstream request
+            pool_config: Connection pool limits; read from the environment if
+                not provided
+            rate_limiter: Optional per-site limiter shared with other clients
+        """
+        self.url = url.rstrip("/")
+        self.service_name = service_name
+        self.api_root = api_root
+        self.api_version = api_version
+        self.coalescer = coalescer
+        self.rate_limiter = rate_limiter
+        self._auth = auth
+        verify: Any = True if ssl_verify else create_unverified_ssl_context()
+        if not ssl_verify:
+            logger.warning(
+                f"{service_name} async client SSL verification disabled. This is "
+                "insecure and should only be used in testing environments."
+            )
+        self._client = httpx.AsyncClient(
+            base_url=f"{self.url}/",
+            headers={"Accept": "application/json", **(headers or {})},
+            auth=auth,
+            verify=verify,
+            mounts=_build_proxy_mounts(proxies or {}, no_proxy, verify),
+            timeout=timeout,
+            limits=(pool_config or HttpPoolConfig.from_env()).httpx_limits(),
+            follow_redirects=True,
+        )
+
+    @classmethod
+    def from_rest_client(
+        cls,
+        service_name: str,
+        rest_client: AtlassianRestAPI,
+        config: JiraConfig | ConfluenceConfig,
+        coalescer: RequestCoalescer | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ) -> AsyncAtlassianClient:
+        """Build an async client that shares credentials with a configured sync client.
+
+        The sync client's session already carries the resolved credentials for
+        every auth mode (basic auth tuple, PAT bearer header, or OAuth bearer
+        header after token refresh), so they are copied rather than re-derived.
+
+        Args:
+            service_name: Service name used in log and error messages
+            rest_client: The configured atlassian-python-api client
+            config: The Jira or Confluence configuration
+            coalescer: Optional coalescer for identical concurrent GETs
+            rate_limiter: Optional per-site limiter
+
+        Returns:
+            AsyncAtlassianClient targeting the same API as rest_client
+        """
+        session = rest_client._session
+        headers = {
+            key: value
+            for key, value in session.headers.items()
+            if key.lower() in ("authorization", "accept", "content-type")
+        }
+        auth = tuple(session.auth) if isinstance(session.auth, tuple) else None
+        proxies: dict[str, str] = {}
+        if config.http_proxy:
+            proxies["http"] = config.http_proxy
+        if config.https_proxy:
+            proxies["https"] = config.https_proxy
+        if config.socks_proxy:
+            proxies["socks"] = config.socks_proxy
+        for k, v in proxies.items():
+            log_config_param(
+                logger, service_name, f"ASYNC_{k.upper()}_PROXY", v, sensitive=True
+            )
+        logger.debug(
+            f"Initializing {service_name} async client (httpx). URL: {rest_client.url}"
+        )
+        return cls(
+            rest_client.url,
+            service_name=service_name,
+            api_root=rest_client.api_root,
+            api_version=rest_client.api_version,
+            headers=headers,
+            auth=auth,  # type: ignore[arg-type]
+            ssl_verify=config.ssl_verify,
+            proxies=proxies,
+            no_proxy=config.no_proxy,
+            timeout=float(getattr(rest_client, "timeout", DEFAULT_TIMEOUT)),
+            coalescer=coalescer,
+            rate_limiter=rate_limiter,
+        )
+
+    def resource_url(
+        self,
+        resource: str,
+        api_root: str | None = None,
+        api_version: str | int | None = None,
+    ) -> str:
+        """Build a resource path the same way ``AtlassianRestAPI.resource_url`` does.
+
+        Args:
+            resource: The resource path (e.g., 'search')
+            api_root: Override for the API root
+            api_version: Override for the API version
+
+        Returns:
+            The relative resource path
+        """
+        parts = [
+            api_root if api_root is not None else self.api_root,
+            api_version if api_version is not None else self.api_version,
+            resource,
+        ]
+        return "/".join(str(s).strip("/") for s in parts if s is not None)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json: Any = None,
+        absolute: bool = False,
+    ) -> Any:
+        """Send a request and return the decoded response body.
+
+        Args:
+            method: HTTP method
+            path: Path relative to the base URL, or a full URL when absolute is True
+            params: Query parameters
+            json: JSON body
+            absolute: Whether path is a full URL
+
+        Returns:
+            Decoded JSON, the response text for non-JSON bodies, or None when empty
+
+        Raises:
+            MCPAtlassianAuthenticationError: If the API responds with 401/403
+            MCPAtlassianRateLimitError: If the site is rate limiting requests for
+                longer than the rate limiter waits
+            httpx.HTTPStatusError: For other error responses
+        """
+        url = path if absolute else path.lstrip("/")
+        if self.coalescer is not None and method.upper() == "GET" and json is None:
+            key = self.coalescer.make_key(
+                method,
+                str(self._client.build_request(method, url, params=params).url),
+                None,
+                self._client.headers,
+                self._auth,
+            )
+            return await self.coalescer.run_async(
+                key, lambda: self._send(method, url, params, json)
+            )
+        return await self._send(method, url, params, json)
+
+    async def _send(
+        self, method: str, url: str, params: dict[str, Any] | None, json: Any
+    ) -> Any:
+        def send() -> Awaitable[httpx.Response]:
+            return self._client.request(method, url, params=params, json=json)
+
+        if self.rate_limiter is not None:
+            response = await self.rate_limiter.run_async(
+                method, urljoin(f"{self.url}/", url), send
+            )
+        else:
+            response = await send()
+        if response.status_code in (401, 403):
+            error_msg = (
+                f"Authentication failed for {self.service_name} API "
+                f"({response.status_code}). Token may be expired or invalid. "
+                "Please verify credentials."
+            )
+            logger.error(error_msg)
+            raise MCPAtlassianAuthenticationError(error_msg)
+        response.raise_for_status()
+        if not response.content:
+            return None
+        try:
+            return response.json()
+        except ValueError:
+            return response.text
+
+    async def get(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        *,
+        absolute: bool = False,
+    ) -> Any:
+        """Send a GET request."""
+        return await self.request("GET", path, params=params, absolute=absolute)
+
+    async def post(
+        self,
+        path: str,
+        json: Any = None,
+        params: dict[str, Any] | None = None,
+        *,
+        absolute: bool = False,
+    ) -> Any:
+        """Send a POST request."""
+        return await self.request(
+            "POST", path, params=params, json=json, absolute=absolute
+        )
+
+    async def put(
+        self,
+        path: str,
+        json: Any = None,
+        params: dict[str, Any] | None = None,
+        *,
+        absolute: bool = False,
+    ) -> Any:
+        """Send a PUT request."""
+        return await self.request(
+            "PUT", path, params=params, json=json, absolute=absolute
+        )
+
+    async def delete(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        *,
+        absolute: bool = False,
+    ) -> Any:
+        """Send a DELETE request."""
+        return await self.request("DELETE", path, params=params, absolute=absolute)
+
+    def update_headers(self, headers: dict[str, str]) -> None:
+        """Update default headers, e.g. after the sync session refreshed a token."""
+        self._client.headers.update(headers)
+
+    async def aclose(self) -> None:
+        """Close the underlying connection pool."""
+        await self._client.aclose()
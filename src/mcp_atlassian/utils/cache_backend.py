@@ -0,0 +1,494 @@
+"""Shared cache backends for running several server replicas.
+
+Each server process keeps its caches (Jira metadata, read responses, resolved
+account IDs) in its own memory, so replicas behind a load balancer warm up
+separately. A ``CacheBackend`` adds a tier those caches share: a SQLite file for
+processes on one host or a shared volume, or a Redis server for replicas on
+different hosts.
+
+Values are stored as JSON text. Backends raise ``CacheBackendError`` when the
+store cannot be reached; the caches log it and carry on with their in-process
+tier, so an unavailable backend never fails a tool call.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import ssl
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote, urlsplit
+
+from cachetools import LRUCache
+
+logger = logging.getLogger("mcp-atlassian")
+
+CACHE_BACKENDS = ("memory", "sqlite", "redis")
+SHARED_CACHE_FILENAME = "shared_cache.sqlite3"
+DEFAULT_KEY_PREFIX = "mcp-atlassian"
+DEFAULT_MEMORY_BACKEND_SIZE = 10000
+DEFAULT_REDIS_TIMEOUT = 2.0
+# Seconds Redis is skipped after a failed connect, doubling up to the maximum
+DEFAULT_REDIS_RETRY_INTERVAL = 5.0
+MAX_REDIS_RETRY_INTERVAL = 60.0
+# Expired SQLite rows are purged after this many writes
+_SQLITE_PURGE_INTERVAL = 200
+
+
+class CacheBackendError(Exception):
+    """Raised when a cache backend cannot read or write its store."""
+
+
+class CacheBackend(ABC):
+    """Key-value store with per-key expiry shared by the server's caches.
+
+    Keys are strings; the backend prefixes them with ``key_prefix`` so several
+    deployments can share one store.
+    """
+
+    name: str
+
+    def __init__(self, key_prefix: str = DEFAULT_KEY_PREFIX) -> None:
+        """Initialize the backend.
+
+        Args:
+            key_prefix: Prefix added to every key.
+        """
+        self.key_prefix = key_prefix
+
+    @classmethod
+    def from_env(cls) -> CacheBackend | None:
+        """Create the backend selected by ATLASSIAN_CACHE_BACKEND.
+
+        'memory' (the default) keeps every cache in its own process and returns
+        None. 'sqlite' uses a database in ATLASSIAN_CACHE_DIR. 'redis' connects
+        to ATLASSIAN_CACHE_REDIS_URL (default redis://localhost:6379/0).
+
+        Returns:
+            The configured backend, or None when caches are not shared or the
+            selected store cannot be used.
+
+        Raises:
+            ValueError: If ATLASSIAN_CACHE_BACKEND names an unknown backend.
+        """
+        name = os.getenv("ATLASSIAN_CACHE_BACKEND", "memory").strip().lower()
+        if name not in CACHE_BACKENDS:
+            error_msg = (
+                f"Unsupported cache backend '{name}'. Expected one of: "
+                f"{', '.join(CACHE_BACKENDS)}"
+            )
+            raise ValueError(error_msg)
+        if name == "memory":
+            return None
+        if name == "sqlite":
+            cache_dir = os.getenv("ATLASSIAN_CACHE_DIR")
+            if not cache_dir:
+                logger.warning(
+                    "ATLASSIAN_CACHE_BACKEND=sqlite requires ATLASSIAN_CACHE_DIR; "
+                    "caches will not be shared"
+                )
+                return None
+            try:
+                return SQLiteCacheBackend(
+                    Path(cache_dir).expanduser() / SHARED_CACHE_FILENAME
+                )
+            except (OSError, sqlite3.Error, CacheBackendError) as e:
+                logger.warning(
+                    f"Cannot use shared cache in '{cache_dir}', "
+                    f"caches will not be shared: {e}"
+                )
+                return None
+        url = os.getenv("ATLASSIAN_CACHE_REDIS_URL", "redis://localhost:6379/0")
+        backend = RedisCacheBackend(url)
+        try:
+            backend.ping()
+        except CacheBackendError as e:
+            # Keep the backend: it reconnects on later calls once Redis is up
+            logger.warning(f"Shared cache at {backend.address} is unreachable: {e}")
+        return backend
+
+    def _key(self, key: str) -> str:
+        return f"{self.key_prefix}:{key}"
+
+    def get(self, key: str) -> Any | None:
+        """Return the value stored under key, or None if absent or expired."""
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: Sequence[str]) -> list[Any | None]:
+        """Return the values of several keys, None for absent or expired ones."""
+        if not keys:
+            return []
+        raws = self._get_many_raw([self._key(key) for key in keys])
+        return [None if raw is None else json.loads(raw) for raw in raws]
+
+    def set(self, key: str, value: Any, ttl: float | None = None) -> None:
+        """Store a JSON-serializable value.
+
+        Args:
+            key: The key.
+            value: The value.
+            ttl: Seconds until the value expires, or None to keep it.
+
+        Raises:
+            TypeError: If the value cannot be serialized to JSON.
+        """
+        raw = json.dumps(value, separators=(",", ":"))
+        self._set_raw(self._key(key), raw, ttl)
+
+    def delete(self, key: str) -> None:
+        """Remove a key."""
+        self._delete_raw(self._key(key))
+
+    def incr(self, key: str) -> int:
+        """Atomically increment the integer counter under key.
+
+        Returns:
+            The new value; a missing counter starts at 0.
+        """
+        return self._incr_raw(self._key(key))
+
+    def close(self) -> None:  # noqa: B027
+        """Release connections held by the backend."""
+
+    @abstractmethod
+    def _get_many_raw(self, keys: list[str]) -> list[str | None]: ...
+
+    @abstractmethod
+    def _set_raw(self, key: str, raw: str, ttl: float | None) -> None: ...
+
+    @abstractmethod
+    def _delete_raw(self, key: str) -> None: ...
+
+    @abstractmethod
+    def _incr_raw(self, key: str) -> int: ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process backend, bounded by entry count.
+
+    It shares nothing between processes; it serves tests and single-process
+    setups that want the shared-tier code path.
+    """
+
+    name = "memory"
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_MEMORY_BACKEND_SIZE,
+        key_prefix: str = DEFAULT_KEY_PREFIX,
+        timer: Any = time.time,
+    ) -> None:
+        """Initialize the backend.
+
+        Args:
+            maxsize: Maximum number of keys; least recently used keys go first.
+            key_prefix: Prefix added to every key.
+            timer: Clock used for expiry.
+        """
+        super().__init__(key_prefix)
+        self._timer = timer
+        self._data: LRUCache[str, tuple[str, float | None]] = LRUCache(maxsize)
+        self._lock = threading.Lock()
+
+    def _get_many_raw(self, keys: list[str]) -> list[str | None]:
+        now = self._timer()
+        values: list[str | None] = []
+        with self._lock:
+            for key in keys:
+                item = self._data.get(key)
+                if item is not None and item[1] is not None and item[1] <= now:
+                    del self._data[key]
+                    item = None
+                values.append(None if item is None else item[0])
+        return values
+
+    def _set_raw(self, key: str, raw: str, ttl: float | None) -> None:
+        expires_at = None if ttl is None else self._timer() + ttl
+        with self._lock:
+            self._data[key] = (raw, expires_at)
+
+    def _delete_raw(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def _incr_raw(self, key: str) -> int:
+        with self._lock:
+            raw, expires_at = self._data.get(key, ("0", None))
+            value = int(raw) + 1
+            self._data[key] = (str(value), expires_at)
+            return value
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Backend stored in a SQLite database shared by processes on one host.
+
+    The database uses write-ahead logging so readers do not block the writer.
+    Every operation opens its own short-lived connection, so the backend can be
+    used from any thread.
+    """
+
+    name = "sqlite"
+
+    def __init__(
+        self,
+        path: str | Path,
+        key_prefix: str = DEFAULT_KEY_PREFIX,
+        timer: Any = time.time,
+    ) -> None:
+        """Initialize the backend, creating the database file if needed.
+
+        Args:
+            path: Path of the SQLite database file.
+            key_prefix: Prefix added to every key.
+            timer: Clock used for expiry.
+        """
+        super().__init__(key_prefix)
+        self.path = Path(path)
+        self._timer = timer
+        self._writes = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        try:
+            conn = sqlite3.connect(self.path, timeout=5)
+        except sqlite3.Error as e:
+            raise CacheBackendError(str(e)) from e
+        try:
+            with conn:
+                yield conn
+        except sqlite3.Error as e:
+            raise CacheBackendError(str(e)) from e
+        finally:
+            conn.close()
+
+    def _get_many_raw(self, keys: list[str]) -> list[str | None]:
+        # Only "?" placeholders are interpolated into the statement
+        query = (
+            "SELECT key, value FROM cache WHERE key IN "  # noqa: S608
+            f"({','.join('?' * len(keys))}) "
+            "AND (expires_at IS NULL OR expires_at > ?)"
+        )
+        with self._connect() as conn:
+            rows = dict(
+                conn.execute(
+                    query,
+                    (*keys, self._timer()),
+                ).fetchall()
+            )
+        return [rows.get(key) for key in keys]
+
+    def _set_raw(self, key: str, raw: str, ttl: float | None) -> None:
+        now = self._timer()
+        self._writes += 1
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?)",
+                (key, raw, None if ttl is None else now + ttl),
+            )
+            if self._writes % _SQLITE_PURGE_INTERVAL == 0:
+                conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+
+    def _delete_raw(self, key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def _incr_raw(self, key: str) -> int:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO cache VALUES (?, '1', NULL) ON CONFLICT(key) DO UPDATE "
+                "SET value = CAST(value AS INTEGER) + 1",
+                (key,),
+            )
+            (value,) = conn.execute(
+                "SELECT value FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        return int(value)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Backend on a Redis server (or anything speaking its protocol).
+
+    Speaks RESP over one socket guarded by a lock, reconnecting after errors.
+    After a failed connect the backend is skipped for retry_interval seconds,
+    doubling with every further failure, so callers fail fast instead of each
+    waiting out the connect timeout in turn while Redis is down.
+
+    Supports ``redis://`` and ``rediss://`` (TLS) URLs with an optional password
+    or ``user:password`` and database number, e.g. ``redis://:secret@cache:6379/2``.
+    """
+
+    name = "redis"
+
+    def __init__(
+        self,
+        url: str,
+        key_prefix: str = DEFAULT_KEY_PREFIX,
+        timeout: float = DEFAULT_REDIS_TIMEOUT,
+        retry_interval: float = DEFAULT_REDIS_RETRY_INTERVAL,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the backend; the connection is opened on first use.
+
+        Args:
+            url: The Redis URL.
+            key_prefix: Prefix added to every key.
+            timeout: Socket timeout in seconds.
+            retry_interval: Seconds to skip Redis after the first failed connect.
+            timer: Clock used for the retry interval.
+        """
+        super().__init__(key_prefix)
+        parts = urlsplit(url)
+        if parts.scheme not in ("redis", "rediss"):
+            error_msg = f"Unsupported Redis URL scheme '{parts.scheme}'"
+            raise ValueError(error_msg)
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 6379
+        self.address = f"{self.host}:{self.port}"
+        self._tls = parts.scheme == "rediss"
+        self._username = unquote(parts.username) if parts.username else None
+        self._password = unquote(parts.password) if parts.password else None
+        self._db = int(parts.path.strip("/") or 0)
+        self._timeout = timeout
+        self._retry_interval = retry_interval
+        self._timer = timer
+        self._failures = 0
+        self._retry_at = 0.0
+        self._sock: socket.socket | None = None
+        self._reader: Any = None
+        self._lock = threading.Lock()
+
+    def ping(self) -> None:
+        """Check that the server answers."""
+        self._command("PING")
+
+    def close(self) -> None:
+        """Close the connection."""
+        with self._lock:
+            self._disconnect()
+
+    def _get_many_raw(self, keys: list[str]) -> list[str | None]:
+        return self._command("MGET", *keys)
+
+    def _set_raw(self, key: str, raw: str, ttl: float | None) -> None:
+        if ttl is None:
+            self._command("SET", key, raw)
+        else:
+            self._command("SET", key, raw, "PX", str(max(1, int(ttl * 1000))))
+
+    def _delete_raw(self, key: str) -> None:
+        self._command("DEL", key)
+
+    def _incr_raw(self, key: str) -> int:
+        return self._command("INCR", key)
+
+    def _connect(self) -> None:
+        sock = socket.create_connection((self.host, self.port), self._timeout)
+        if self._tls:
+            sock = ssl.create_default_context().wrap_socket(
+                sock, server_hostname=self.host
+            )
+        self._sock = sock
+        self._reader = sock.makefile("rb")
+        if self._password is not None:
+            if self._username is not None:
+                self._send("AUTH", self._username, self._password)
+            else:
+                self._send("AUTH", self._password)
+        if self._db:
+            self._send("SELECT", str(self._db))
+
+    def _disconnect(self) -> None:
+        if self._sock is not None:
+            try:
+                self._reader.close()
+                self._sock.close()
+            except OSError:
+                pass
+        self._sock = None
+        self._reader = None
+
+    def _command(self, *args: str) -> Any:
+        # Checked before taking the lock so callers do not queue behind a connect
+        self._check_circuit()
+        with self._lock:
+            connecting = self._sock is None
+            try:
+                if connecting:
+                    self._check_circuit()
+                    self._connect()
+                    self._failures = 0
+                return self._send(*args)
+            except (OSError, CacheBackendError) as e:
+                self._disconnect()
+                if connecting:
+                    self._open_circuit(e)
+                if isinstance(e, CacheBackendError):
+                    raise
+                error_msg = f"Redis {args[0]} failed: {e}"
+                raise CacheBackendError(error_msg) from e
+
+    def _check_circuit(self) -> None:
+        remaining = self._retry_at - self._timer()
+        if remaining > 0:
+            error_msg = (
+                f"Redis at {self.address} is unavailable, retrying in {remaining:.0f}s"
+            )
+            raise CacheBackendError(error_msg)
+
+    def _open_circuit(self, error: Exception) -> None:
+        delay = min(self._retry_interval * 2**self._failures, MAX_REDIS_RETRY_INTERVAL)
+        self._failures += 1
+        self._retry_at = self._timer() + delay
+        logger.warning(
+            f"Cannot connect to shared cache at {self.address}, "
+            f"skipping it for {delay:.0f}s: {error}"
+        )
+
+    def _send(self, *args: str) -> Any:
+        encoded = [arg.encode("utf-8") for arg in args]
+        request = b"*%d\r\n" % len(encoded) + b"".join(
+            b"$%d\r\n%s\r\n" % (len(arg), arg) for arg in encoded
+        )
+        self._sock.sendall(request)  # type: ignore[union-attr]
+        return self._read_reply()
+
+    def _read_reply(self) -> Any:
+        line = self._reader.readline()
+        if not line.endswith(b"\r\n"):
+            error_msg = "connection closed by server"
+            raise OSError(error_msg)
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode("utf-8")
+        if kind == b"-":
+            error_msg = f"Redis error: {payload.decode('utf-8')}"
+            raise CacheBackendError(error_msg)
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2].decode("utf-8")
+        if kind == b"*":
+            count = int(payload)
+            return None if count < 0 else [self._read_reply() for _ in range(count)]
+        error_msg = f"unexpected Redis reply {line!r}"
+        raise OSError(error_msg)
@@ -98,3 +98,42 @@ def get_available_services() -> dict[str, bool | None]:
         )
 
     return {"confluence": confluence_is_setup, "jira": jira_is_setup}
+
+
+def get_positive_int_env(name: str, default: int) -> int:
+    """Read a positive integer from the environment, falling back to a default.
+
+    Args:
+        name: Environment variable name.
+        default: Value to use when the variable is unset or invalid.
+
+    Returns:
+        The parsed value, or the default.
+    """
+    raw_value = os.getenv(name)
+    if not raw_value:
+        return default
+    try:
+        value = int(raw_value)
+    except ValueError:
+        logger.warning(f"Invalid {name}='{raw_value}', using default {default}.")
+        return default
+    if value < 1:
+        logger.warning(f"{name} must be >= 1 (got {value}), using default {default}.")
+        return default
+    return value
+
+
+def get_non_negative_int_env(name: str, default: int) -> int:
+    """Read an integer that may be 0 from the environment, falling back to a default.
+
+    Args:
+        name: Environment variable name.
+        default: Value to use when the variable is unset or invalid.
+
+    Returns:
+        The parsed value, or the default.
+    """
+    if os.getenv(name, "").strip() == "0":
+        return 0
+    return get_positive_int_env(name, default)
@@ -0,0 +1,273 @@
+"""Connection pooling and keep-alive for upstream Atlassian sessions.
+
+``requests`` gives each session an adapter with a pool of 10 connections per
+host, so concurrent tool calls queue behind it once the worker pool is larger.
+``mount_connection_pool`` replaces that adapter for the service's site with one
+sized from the environment, and shares it between every session that targets
+the same site: Jira and Confluence on one Atlassian Cloud site, and every
+per-user fetcher, draw on a single pool of kept-alive connections.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+from urllib.parse import urlsplit
+
+import httpx
+from requests import PreparedRequest, Response
+from requests.adapters import HTTPAdapter
+from requests.sessions import Session
+from urllib3.connection import HTTPConnection
+
+from .environment import get_non_negative_int_env, get_positive_int_env
+
+logger = logging.getLogger("mcp-atlassian.http_pool")
+
+DEFAULT_POOL_CONNECTIONS = 10
+# Matches the default per-service concurrency, so every concurrent call of a
+# service can hold its own connection to the site
+DEFAULT_POOL_MAXSIZE = 16
+DEFAULT_KEEPALIVE = 60
+DEFAULT_IDLE_TIMEOUT = 300
+
+
+@dataclass(frozen=True)
+class HttpPoolConfig:
+    """Sizing and keep-alive settings for upstream connection pools.
+
+    Attributes:
+        pool_connections: Number of per-host pools kept by an adapter
+        pool_maxsize: Connections kept open per host
+        pool_block: Wait for a free connection instead of opening an extra
+            one that is discarded afterwards, making pool_maxsize a hard
+            per-host limit
+        keepalive: Seconds a connection is idle before TCP keep-alive probes
+            are sent (0 disables the probes)
+        idle_timeout: Seconds without requests after which pooled connections
+            are closed rather than reused (0 keeps them until the server
+            closes them)
+    """
+
+    pool_connections: int = DEFAULT_POOL_CONNECTIONS
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE
+    pool_block: bool = False
+    keepalive: int = DEFAULT_KEEPALIVE
+    idle_timeout: int = DEFAULT_IDLE_TIMEOUT
+
+    @classmethod
+    def from_env(cls) -> HttpPoolConfig:
+        """Create the pool configuration from environment variables.
+
+        Returns:
+            HttpPoolConfig with defaults for unset or invalid values
+        """
+        block = os.getenv("ATLASSIAN_HTTP_POOL_BLOCK", "false")
+        return cls(
+            pool_connections=get_positive_int_env(
+                "ATLASSIAN_HTTP_POOL_CONNECTIONS", DEFAULT_POOL_CONNECTIONS
+            ),
+            pool_maxsize=get_positive_int_env(
+                "ATLASSIAN_HTTP_POOL_MAXSIZE", DEFAULT_POOL_MAXSIZE
+            ),
+            pool_block=block.lower() in ("true", "1", "yes", "y", "on"),
+            keepalive=get_non_negative_int_env(
+                "ATLASSIAN_HTTP_KEEPALIVE", DEFAULT_KEEPALIVE
+            ),
+            idle_timeout=get_non_negative_int_env(
+                "ATLASSIAN_HTTP_IDLE_TIMEOUT", DEFAULT_IDLE_TIMEOUT
+            ),
+        )
+
+    def socket_options(self) -> list[tuple[int, int, int]]:
+        """Return the socket options for new upstream connections.
+
+        Returns:
+            urllib3's default options, plus TCP keep-alive where enabled and
+            supported by the platform
+        """
+        options = list(HTTPConnection.default_socket_options)
+        if not self.keepalive:
+            return options
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # TCP_KEEPALIVE is the macOS name of the idle time option
+        idle_option = getattr(socket, "TCP_KEEPIDLE", None) or getattr(
+            socket, "TCP_KEEPALIVE", None
+        )
+        if idle_option is not None:
+            options.append((socket.IPPROTO_TCP, idle_option, self.keepalive))
+        if hasattr(socket, "TCP_KEEPINTVL"):
+            interval = max(1, self.keepalive // 4)
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, interval))
+        if hasattr(socket, "TCP_KEEPCNT"):
+            options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 4))
+        return options
+
+    def httpx_limits(self) -> httpx.Limits:
+        """Return the equivalent limits for an httpx client.
+
+        Returns:
+            httpx.Limits keeping pool_maxsize connections alive for
+            idle_timeout seconds
+        """
+        return httpx.Limits(
+            max_connections=self.pool_maxsize if self.pool_block else None,
+            max_keepalive_connections=self.pool_maxsize,
+            keepalive_expiry=self.idle_timeout or None,
+        )
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter sized by an ``HttpPoolConfig``.
+
+    Connections get TCP keep-alive probes, and the pools are cleared before a
+    request when the adapter has been idle for longer than idle_timeout, so a
+    quiet server does not reuse connections a load balancer dropped silently.
+    """
+
+    def __init__(self, pool_config: HttpPoolConfig | None = None) -> None:
+        """Initialize the adapter.
+
+        Args:
+            pool_config: Pool settings; read from the environment if not provided
+        """
+        self.pool_config = pool_config or HttpPoolConfig.from_env()
+        self._idle_lock = threading.Lock()
+        self._active = 0
+        self._last_used = time.monotonic()
+        super().__init__(
+            pool_connections=self.pool_config.pool_connections,
+            pool_maxsize=self.pool_config.pool_maxsize,
+            pool_block=self.pool_config.pool_block,
+        )
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any
+    ) -> None:
+        """Initialize the pool manager with keep-alive socket options.
+
+        Args:
+            connections: Number of connections to save in the pool
+            maxsize: Maximum number of connections in the pool
+            block: Whether to block when the pool is full
+            pool_kwargs: Additional arguments for the pool manager
+        """
+        pool_kwargs.setdefault("socket_options", self.pool_config.socket_options())
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        """Send a request, first dropping connections that sat idle too long.
+
+        Args:
+            request: The prepared request
+            args: Positional arguments for ``HTTPAdapter.send``
+            kwargs: Keyword arguments for ``HTTPAdapter.send``
+
+        Returns:
+            The response
+        """
+        idle_timeout = self.pool_config.idle_timeout
+        with self._idle_lock:
+            now = time.monotonic()
+            if idle_timeout and not self._active:
+                if now - self._last_used > idle_timeout:
+                    logger.debug(f"Closing connections idle for over {idle_timeout}s")
+                    self.poolmanager.clear()
+            self._active += 1
+            self._last_used = now
+        try:
+            return super().send(request, *args, **kwargs)
+        finally:
+            with self._idle_lock:
+                self._active -= 1
+                self._last_used = time.monotonic()
+
+
+_shared_adapters: dict[tuple[str, bool, HttpPoolConfig], HTTPAdapter] = {}
+_shared_adapters_lock = threading.Lock()
+
+
+def _site_origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+def get_shared_adapter(
+    url: str, *, ssl_verify: bool, pool_config: HttpPoolConfig | None = None
+) -> HTTPAdapter:
+    """Return the adapter shared by all sessions that target a site.
+
+    Args:
+        url: Any URL on the site
+        ssl_verify: Whether SSL certificates are verified; sessions that skip
+            verification never share connections with sessions that do not
+        pool_config: Pool settings; read from the environment if not provided
+
+    Returns:
+        The site's adapter, created on first use
+    """
+    pool_config = pool_config or HttpPoolConfig.from_env()
+    key = (_site_origin(url), ssl_verify, pool_config)
+    with _shared_adapters_lock:
+        adapter = _shared_adapters.get(key)
+        if adapter is None:
+            # Imported here because the SSL adapter is itself a pooled adapter
+            from .ssl import SSLIgnoreAdapter
+
+            adapter_class = PooledHTTPAdapter if ssl_verify else SSLIgnoreAdapter
+            adapter = _shared_adapters[key] = adapter_class(pool_config)
+            logger.debug(
+                f"Created connection pool for {key[0]} "
+                f"(maxsize={pool_config.pool_maxsize}, "
+                f"block={pool_config.pool_block})"
+            )
+        return adapter
+
+
+def mount_connection_pool(
+    session: Session,
+    url: str,
+    *,
+    ssl_verify: bool,
+    pool_config: HttpPoolConfig | None = None,
+) -> None:
+    """Route a session's requests to a site through the site's shared pool.
+
+    Args:
+        session: The requests session of an Atlassian REST client
+        url: Base URL the session sends requests to
+        ssl_verify: Whether SSL certificates are verified
+        pool_config: Pool settings; read from the environment if not provided
+    """
+    adapter = get_shared_adapter(url, ssl_verify=ssl_verify, pool_config=pool_config)
+    session.mount(_site_origin(url), adapter)
+
+
+def close_connection_pools() -> None:
+    """Close every shared pool, e.g. on server shutdown."""
+    with _shared_adapters_lock:
+        adapters = list(_shared_adapters.values())
+        _shared_adapters.clear()
+    for adapter in adapters:
+        adapter.close()
+
+
+def close_session(session: Session) -> None:
+    """Close a session's own adapters, leaving the shared site pools open.
+
+    ``Session.close`` would also clear the shared pools that other sessions
+    are still using, so per-user sessions are released with this instead.
+
+    Args:
+        session: The requests session to release
+    """
+    with _shared_adapters_lock:
+        shared = {id(adapter) for adapter in _shared_adapters.values()}
+    for adapter in session.adapters.values():
+        if id(adapter) not in shared:
+            adapter.close()
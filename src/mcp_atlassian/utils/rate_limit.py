@@ -0,0 +1,436 @@
+"""Adaptive per-site rate limiting of upstream Atlassian requests.
+
+Atlassian Cloud (and Data Center with rate limiting enabled) answers bursts
+with 429 responses and a ``Retry-After`` header. ``RateLimiter`` sits below the
+Jira and Confluence clients and keeps each site's traffic under its limit:
+
+- A token bucket paces requests at the rate the site advertises in its
+  ``X-RateLimit-*`` headers, or at ATLASSIAN_RATE_LIMIT_RPS.
+- A concurrency window grows by about one request per window of successful
+  responses and halves on a 429 (AIMD). It stops growing while the site
+  reports it is near its limit, so throughput settles just under the limit
+  instead of oscillating around it.
+- After a 429 every caller for the site waits out ``Retry-After``, and
+  idempotent requests are retried with jittered backoff.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import random
+import threading
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, TypeVar
+from urllib.parse import urlsplit
+
+import anyio
+from requests import Response, Session
+
+from mcp_atlassian.exceptions import MCPAtlassianRateLimitError
+
+from .environment import get_non_negative_int_env, get_positive_int_env
+
+logger = logging.getLogger("mcp-atlassian.rate_limit")
+
+R = TypeVar("R")
+
+DEFAULT_MAX_CONCURRENCY = 32
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_MAX_WAIT = 60
+
+# Statuses that mean "slow down"; 503 is only retried as an overload signal
+RETRY_STATUSES = frozenset({429, 503})
+# Only requests that are safe to send twice are retried
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+# Retry delay without Retry-After: full jitter over BASE * 2**attempt, capped
+BACKOFF_BASE = 1.0
+BACKOFF_MAX = 30.0
+# Callers released together after a Retry-After pause are spread over this window
+RELEASE_JITTER = 1.0
+# How often a caller re-checks a full concurrency window
+_SLOT_POLL_INTERVAL = 0.02
+
+
+def site_key(url: str) -> str:
+    """Return the rate limit key of the site a request is sent to.
+
+    Args:
+        url: Request URL
+
+    Returns:
+        The URL origin; for OAuth requests through the API gateway, the origin
+        and the cloud ID, which Jira and Confluence of one site share
+    """
+    parts = urlsplit(url)
+    origin = f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+    segments = parts.path.split("/")
+    if segments[1:2] == ["ex"] and len(segments) > 3:
+        return f"{origin}/ex/{segments[3]}"
+    return origin
+
+
+def _seconds_until(when: datetime) -> float:
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header.
+
+    Args:
+        value: Header value, in seconds or as an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return _seconds_until(parsedate_to_datetime(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_reset(value: str | None) -> float | None:
+    """Parse X-RateLimit-Reset, an ISO 8601 timestamp."""
+    if not value:
+        return None
+    try:
+        return _seconds_until(datetime.fromisoformat(value.replace("Z", "+00:00")))
+    except ValueError:
+        return None
+
+
+def _float_header(headers: Mapping[str, str], name: str) -> float | None:
+    try:
+        return float(headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class _SiteState:
+    """Limiter state of one site, guarded by the limiter's lock."""
+
+    def __init__(self, site: str, window: float, rate: float | None) -> None:
+        self.site = site
+        # AIMD concurrency window; epoch advances on every decrease so a burst
+        # of 429s for requests sent before it only halves the window once
+        self.window = window
+        self.epoch = 0
+        self.in_flight = 0
+        self.near_limit = False
+        # Token bucket; rate is None until configured or advertised
+        self.rate = rate
+        self.capacity = max(1.0, rate or 1.0)
+        self.tokens = self.capacity
+        self.refilled_at = 0.0
+        self.blocked_until = 0.0
+        self.requests = 0
+        self.throttled = 0
+        self.retried = 0
+
+
+class RateLimiter:
+    """Paces upstream requests per site and retries throttled idempotent ones.
+
+    One limiter is shared by every fetcher, so the global and per-user clients
+    of a site, and Jira and Confluence on the same site, draw from one budget.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        rps: int = 0,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            max_concurrency: Upper bound of each site's concurrency window
+            rps: Requests per second allowed per site (0 to pace only at the
+                rate a site advertises)
+            max_retries: Retries of a throttled idempotent request
+            max_wait: Longest Retry-After pause waited out; callers arriving
+                during a longer pause fail straight away
+            timer: Monotonic clock, replaceable in tests
+        """
+        self.max_concurrency = max_concurrency
+        self.rps = rps
+        self.max_retries = max_retries
+        self.max_wait = max_wait
+        self._timer = timer
+        self._lock = threading.Lock()
+        self._sites: dict[str, _SiteState] = {}
+
+    @classmethod
+    def from_env(cls) -> RateLimiter | None:
+        """Create a limiter from environment variables.
+
+        Returns:
+            RateLimiter, or None when ATLASSIAN_RATE_LIMIT is set to a false value
+        """
+        enabled = os.getenv("ATLASSIAN_RATE_LIMIT", "true")
+        if enabled.lower() in ("false", "0", "no", "n", "off"):
+            return None
+        return cls(
+            max_concurrency=get_positive_int_env(
+                "ATLASSIAN_RATE_LIMIT_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY
+            ),
+            rps=get_non_negative_int_env("ATLASSIAN_RATE_LIMIT_RPS", 0),
+            max_retries=get_non_negative_int_env(
+                "ATLASSIAN_RATE_LIMIT_MAX_RETRIES", DEFAULT_MAX_RETRIES
+            ),
+            max_wait=get_positive_int_env(
+                "ATLASSIAN_RATE_LIMIT_MAX_WAIT", DEFAULT_MAX_WAIT
+            ),
+        )
+
+    def _site(self, url: str) -> _SiteState:
+        key = site_key(url)
+        with self._lock:
+            state = self._sites.get(key)
+            if state is None:
+                state = self._sites[key] = _SiteState(
+                    key, float(self.max_concurrency), self.rps or None
+                )
+                state.refilled_at = self._timer()
+            return state
+
+    def _reserve(self, state: _SiteState) -> tuple[float, int | None]:
+        """Take a slot and a token, or return how long to wait for them.
+
+        Returns:
+            (0, epoch) when the request may be sent, else (delay, None)
+
+        Raises:
+            MCPAtlassianRateLimitError: If the site is paused for longer than
+                max_wait
+        """
+        with self._lock:
+            now = self._timer()
+            if state.blocked_until > now:
+                wait = state.blocked_until - now
+                if wait > self.max_wait:
+                    error_msg = (
+                        f"{state.site} is rate limiting requests; retry after "
+                        f"{math.ceil(wait)} seconds"
+                    )
+                    raise MCPAtlassianRateLimitError(error_msg, wait)
+                return wait + random.uniform(0, RELEASE_JITTER), None  # noqa: S311 - jitter, not security
+            if state.in_flight >= int(state.window):
+                return _SLOT_POLL_INTERVAL, None
+            if state.rate:
+                elapsed = now - state.refilled_at
+                state.tokens = min(state.capacity, state.tokens + elapsed * state.rate)
+                state.refilled_at = now
+                if state.tokens < 1:
+                    return (1 - state.tokens) / state.rate, None
+                state.tokens -= 1
+            state.in_flight += 1
+            state.requests += 1
+            return 0.0, state.epoch
+
+    def _release(self, state: _SiteState) -> None:
+        with self._lock:
+            state.in_flight -= 1
+
+    def _learn(self, state: _SiteState, headers: Mapping[str, str]) -> None:
+        """Adopt the budget a site advertises in its X-RateLimit-* headers."""
+        now = self._timer()
+        limit = _float_header(headers, "X-RateLimit-Limit")
+        fill_rate = _float_header(headers, "X-RateLimit-FillRate")
+        if fill_rate:
+            interval = _float_header(headers, "X-RateLimit-Interval-Seconds") or 1.0
+            rate = fill_rate / interval
+            if self.rps:
+                rate = min(rate, self.rps)
+            if state.rate is None:
+                state.tokens = limit or rate
+                state.refilled_at = now
+            state.rate = rate
+            state.capacity = max(1.0, limit or rate)
+        remaining = _float_header(headers, "X-RateLimit-Remaining")
+        if remaining is not None:
+            state.tokens = min(state.tokens, remaining)
+            if remaining < 1:
+                reset = _parse_reset(headers.get("X-RateLimit-Reset"))
+                if reset:
+                    state.blocked_until = max(state.blocked_until, now + reset)
+        state.near_limit = headers.get(
+            "X-RateLimit-NearLimit", ""
+        ).lower() == "true" or (
+            remaining is not None and limit is not None and remaining < limit / 5
+        )
+
+    def _settle(
+        self,
+        state: _SiteState,
+        epoch: int,
+        method: str,
+        status: int,
+        headers: Mapping[str, str],
+        attempt: int,
+    ) -> float | None:
+        """Record a response and decide whether to retry it.
+
+        Returns:
+            Delay before retrying, or None to hand the response to the caller
+        """
+        with self._lock:
+            state.in_flight -= 1
+            self._learn(state, headers)
+            if status not in RETRY_STATUSES:
+                if not state.near_limit:
+                    state.window = min(
+                        float(self.max_concurrency), state.window + 1 / state.window
+                    )
+                return None
+            retry_after = parse_retry_after(headers.get("Retry-After"))
+            state.throttled += 1
+            if epoch == state.epoch:
+                state.window = max(1.0, state.window / 2)
+                state.epoch += 1
+            if retry_after is not None:
+                state.blocked_until = max(
+                    state.blocked_until, self._timer() + retry_after
+                )
+            if method.upper() not in IDEMPOTENT_METHODS or attempt >= self.max_retries:
+                return None
+            if retry_after is not None:
+                if retry_after > self.max_wait:
+                    return None
+                # _reserve waits out the pause, spreading the released callers
+                delay = 0.0
+            else:
+                cap = min(BACKOFF_MAX, BACKOFF_BASE * 2**attempt)
+                delay = random.uniform(0, cap)  # noqa: S311 - jitter, not security
+            state.retried += 1
+            logger.info(
+                f"{state.site} answered {status} to {method.upper()}; retrying "
+                f"(attempt {attempt + 1} of {self.max_retries})"
+            )
+            return delay
+
+    def run(self, method: str, url: str, call: Callable[[], Response]) -> Response:
+        """Send a request through the site's limiter.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            call: Sends the request
+
+        Returns:
+            The first response that is not retried
+
+        Raises:
+            MCPAtlassianRateLimitError: If the site is paused for longer than
+                max_wait
+        """
+        state = self._site(url)
+        attempt = 0
+        while True:
+            while True:
+                wait, epoch = self._reserve(state)
+                if epoch is not None:
+                    break
+                time.sleep(wait)
+            try:
+                response = call()
+            except BaseException:
+                self._release(state)
+                raise
+            delay = self._settle(
+                state, epoch, method, response.status_code, response.headers, attempt
+            )
+            if delay is None:
+                return response
+            attempt += 1
+            response.close()
+            time.sleep(delay)
+
+    async def run_async(
+        self, method: str, url: str, call: Callable[[], Awaitable[R]]
+    ) -> R:
+        """Await a request through the site's limiter.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            call: Sends the request and returns an httpx response
+
+        Returns:
+            The first response that is not retried
+
+        Raises:
+            MCPAtlassianRateLimitError: If the site is paused for longer than
+                max_wait
+        """
+        state = self._site(url)
+        attempt = 0
+        while True:
+            while True:
+                wait, epoch = self._reserve(state)
+                if epoch is not None:
+                    break
+                await anyio.sleep(wait)
+            try:
+                response: Any = await call()
+            except BaseException:
+                self._release(state)
+                raise
+            delay = self._settle(
+                state, epoch, method, response.status_code, response.headers, attempt
+            )
+            if delay is None:
+                return response
+            attempt += 1
+            await anyio.sleep(delay)
+
+    def install(self, session: Session) -> None:
+        """Route all of a session's requests through the limiter.
+
+        Install before a ``RequestCoalescer`` so that coalesced requests,
+        which never go upstream, do not count against the site's budget.
+
+        Args:
+            session: The requests session of an Atlassian REST client
+        """
+        send = session.request
+
+        def request(method: str, url: str, *args: Any, **kwargs: Any) -> Response:
+            return self.run(method, url, lambda: send(method, url, *args, **kwargs))
+
+        session.request = request  # type: ignore[method-assign]
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return limiter state per site.
+
+        Returns:
+            Dictionary of site to concurrency window, paced rate (requests per
+            second, None when unpaced), and request, throttled and retry counts
+        """
+        with self._lock:
+            return {
+                site: {
+                    "window": round(state.window, 1),
+                    "rate": state.rate,
+                    "in_flight": state.in_flight,
+                    "requests": state.requests,
+                    "throttled": state.throttled,
+                    "retried": state.retried,
+                }
+                for site, state in self._sites.items()
+            }
@@ -0,0 +1,289 @@
+"""Single-flight coalescing of identical concurrent upstream GET requests.
+
+When several agents start on the same work at once, identical reads (the same
+issue, the same JQL) reach Jira or Confluence within milliseconds of each other.
+``RequestCoalescer`` lets the first of those requests go upstream and hands its
+response to every identical request that arrives while it is in flight.
+
+Requests are identical when method, URL, query parameters and credentials
+match, so a response is only ever shared between callers that would have
+received the same one. Only plain GETs are coalesced; streamed downloads and
+requests with a body always go upstream on their own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any, TypeVar
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from requests import Response, Session
+
+logger = logging.getLogger("mcp-atlassian")
+
+T = TypeVar("T")
+
+# (method, normalized URL with sorted query, credential fingerprint)
+RequestKey = tuple[str, str, str]
+
+# Path segments that identify a single resource (issue keys, numeric IDs); they
+# are folded so counters are reported per endpoint rather than per resource
+_RESOURCE_SEGMENT = re.compile(r"/(?:[A-Za-z][A-Za-z0-9_]*-\d+|\d{3,})(?=/|$)")
+
+# Keyword arguments of ``Session.request`` that make a request unsafe to share
+_UNSHAREABLE_ARGUMENTS = ("data", "json", "files", "stream", "cookies", "hooks")
+
+
+def endpoint_label(method: str, url: str) -> str:
+    """Return the counter label of a request.
+
+    Args:
+        method: HTTP method
+        url: Request URL
+
+    Returns:
+        Method and URL path with resource IDs replaced by '{id}'
+    """
+    return f"{method.upper()} {_RESOURCE_SEGMENT.sub('/{id}', urlsplit(url).path)}"
+
+
+def _credential_fingerprint(headers: Mapping[str, Any], auth: Any) -> str:
+    if isinstance(auth, tuple):
+        auth_identity = list(auth)
+    elif auth is None:
+        auth_identity = None
+    else:
+        # Unknown auth objects are never shared with another instance
+        auth_identity = f"{type(auth).__name__}:{id(auth)}"
+    material = json.dumps(
+        {
+            "headers": sorted((str(k).lower(), str(v)) for k, v in headers.items()),
+            "auth": auth_identity,
+        }
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class _InFlight:
+    """Outcome of an upstream request that followers wait on."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class RequestCoalescer:
+    """Shares one in-flight upstream GET between identical concurrent callers.
+
+    One coalescer is shared by every fetcher, so requests made through
+    different sessions with the same credentials are coalesced as well. Only
+    requests that overlap in time are merged; nothing is kept once the upstream
+    response arrives.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the coalescer."""
+        self._lock = threading.Lock()
+        self._inflight: dict[RequestKey, _InFlight] = {}
+        self._async_inflight: dict[tuple[int, RequestKey], asyncio.Future[Any]] = {}
+        self._counters: dict[str, dict[str, int]] = {}
+
+    @classmethod
+    def from_env(cls) -> RequestCoalescer | None:
+        """Create a coalescer unless disabled in the environment.
+
+        Returns:
+            RequestCoalescer, or None when ATLASSIAN_REQUEST_COALESCING is set
+            to a false value.
+        """
+        enabled = os.getenv("ATLASSIAN_REQUEST_COALESCING", "true")
+        if enabled.lower() in ("false", "0", "no", "n", "off"):
+            return None
+        return cls()
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        params: Mapping[str, Any] | None,
+        headers: Mapping[str, Any],
+        auth: Any = None,
+    ) -> RequestKey:
+        """Build the key identifying a request.
+
+        Args:
+            method: HTTP method
+            url: Request URL, possibly with a query string
+            params: Extra query parameters passed separately from the URL
+            headers: Effective request headers, including credentials
+            auth: Effective auth setting (e.g. a basic auth tuple)
+
+        Returns:
+            The request key; credentials are only kept as a fingerprint
+        """
+        parts = urlsplit(url)
+        query = parse_qsl(parts.query, keep_blank_values=True)
+        query.extend((str(k), str(v)) for k, v in (params or {}).items())
+        normalized = urlunsplit(
+            (
+                parts.scheme.lower(),
+                parts.netloc.lower(),
+                parts.path,
+                urlencode(sorted(query)),
+                "",
+            )
+        )
+        return (method.upper(), normalized, _credential_fingerprint(headers, auth))
+
+    def _join(self, key: RequestKey) -> tuple[_InFlight, bool]:
+        endpoint = endpoint_label(key[0], key[1])
+        with self._lock:
+            counters = self._counters.setdefault(
+                endpoint, {"upstream": 0, "coalesced": 0}
+            )
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                counters["coalesced"] += 1
+                return inflight, False
+            counters["upstream"] += 1
+            inflight = self._inflight[key] = _InFlight()
+            return inflight, True
+
+    def run(self, key: RequestKey, call: Callable[[], T], share: Callable[[T], T]) -> T:
+        """Run call, or wait for the identical call already in flight.
+
+        Args:
+            key: Key from ``make_key``
+            call: Performs the upstream request
+            share: Makes a follower's copy of the leader's result
+
+        Returns:
+            The result of the upstream request
+
+        Raises:
+            Exception: Whatever the upstream request raised, for every caller
+        """
+        inflight, leader = self._join(key)
+        if not leader:
+            inflight.done.wait()
+            if inflight.error is not None:
+                raise inflight.error
+            return share(inflight.result)
+        try:
+            inflight.result = call()
+            return inflight.result
+        except BaseException as e:
+            inflight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+            inflight.done.set()
+
+    async def run_async(self, key: RequestKey, call: Callable[[], Awaitable[T]]) -> T:
+        """Await call, or the identical call already in flight on this loop.
+
+        Followers receive a deep copy of the leader's decoded result. If the
+        leader is cancelled, its followers send their own request. Outside an
+        asyncio event loop (e.g. under trio) call is awaited directly.
+
+        Args:
+            key: Key from ``make_key``
+            call: Performs the upstream request
+
+        Returns:
+            The decoded result of the upstream request
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return await call()
+        loop_key = (id(loop), key)
+        endpoint = endpoint_label(key[0], key[1])
+        with self._lock:
+            counters = self._counters.setdefault(
+                endpoint, {"upstream": 0, "coalesced": 0}
+            )
+            future = self._async_inflight.get(loop_key)
+            leader = future is None
+            if leader:
+                counters["upstream"] += 1
+                future = self._async_inflight[loop_key] = loop.create_future()
+            else:
+                counters["coalesced"] += 1
+        if not leader:
+            try:
+                return copy.deepcopy(await asyncio.shield(future))
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+            return await call()
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Mark retrieved so an exception nobody waited for is not logged
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._async_inflight.pop(loop_key, None)
+
+    def install(self, session: Session) -> None:
+        """Route a session's shareable GET requests through the coalescer.
+
+        Args:
+            session: The requests session of an Atlassian REST client
+        """
+        send = session.request
+
+        def request(method: str, url: str, *args: Any, **kwargs: Any) -> Response:
+            if (
+                args
+                or method.upper() != "GET"
+                or any(kwargs.get(name) for name in _UNSHAREABLE_ARGUMENTS)
+            ):
+                return send(method, url, *args, **kwargs)
+            headers = {**session.headers, **(kwargs.get("headers") or {})}
+            key = self.make_key(
+                method,
+                url,
+                kwargs.get("params"),
+                headers,
+                kwargs.get("auth") or session.auth,
+            )
+            return self.run(key, lambda: send(method, url, **kwargs), copy.copy)
+
+        session.request = request  # type: ignore[method-assign]
+
+    def stats(self) -> dict[str, Any]:
+        """Return coalescing counters.
+
+        Returns:
+            Dictionary with in_flight, total upstream and coalesced requests,
+            and the same counters per endpoint.
+        """
+        with self._lock:
+            endpoints = {name: dict(c) for name, c in self._counters.items()}
+            in_flight = len(self._inflight) + len(self._async_inflight)
+        return {
+            "in_flight": in_flight,
+            "upstream": sum(c["upstream"] for c in endpoints.values()),
+            "coalesced": sum(c["coalesced"] for c in endpoints.values()),
+            "endpoints": endpoints,
+        }
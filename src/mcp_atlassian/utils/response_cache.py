@@ -0,0 +1,653 @@
+"""Read-through cache of fetcher responses with write-driven invalidation.
+
+Agents often read the same issue or page several times within seconds. A
+``ResponseCache`` shared by all fetchers keeps the results of read methods
+decorated with ``cached_response``, keyed by site, a fingerprint of the caller's
+credentials, the operation and its normalized arguments, so users never see each
+other's results.
+
+Fresh entries are served without a request. For a short while after the TTL an
+entry is still served while a background worker fetches a fresh copy
+(stale-while-revalidate). Every entry carries tags such as ``issue:PROJ-1``;
+write methods decorated with ``invalidates_responses`` drop the entries of the
+tags they affect for every user of the site, so the server never serves data it
+has just changed itself.
+
+With a shared ``CacheBackend`` responses are also written there for other
+replicas. Each tag then has a version counter in the backend that writes bump;
+an entry records the versions of its tags and is only served while they are
+unchanged, so a write on one replica invalidates the entry on all of them.
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import hashlib
+import importlib
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from cachetools import LRUCache
+from pydantic import BaseModel
+
+from mcp_atlassian.utils.cache_backend import CacheBackend, CacheBackendError
+from mcp_atlassian.utils.environment import get_positive_int_env
+
+logger = logging.getLogger("mcp-atlassian")
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_RESPONSE_CACHE_TTL = 30
+DEFAULT_RESPONSE_CACHE_STALE_TTL = 30
+DEFAULT_RESPONSE_CACHE_SIZE = 1000
+
+# (site, credential fingerprint, operation, normalized arguments)
+ResponseKey = tuple[str, str, str, str]
+
+_MISS: Any = object()
+
+# Only models from this package are rebuilt from shared entries
+_MODEL_PACKAGE = "mcp_atlassian.models"
+
+
+def credential_fingerprint(config: Any) -> str:
+    """Return a SHA-256 fingerprint identifying the user a fetcher acts as.
+
+    Args:
+        config: A JiraConfig or ConfluenceConfig.
+
+    Returns:
+        Hex digest over the auth type and credentials; raw secrets are never kept.
+    """
+    oauth_config = getattr(config, "oauth_config", None)
+    parts = [
+        getattr(config, "auth_type", None),
+        getattr(config, "username", None),
+        getattr(config, "api_token", None),
+        getattr(config, "personal_token", None),
+        getattr(oauth_config, "cloud_id", None),
+        getattr(oauth_config, "access_token", None),
+    ]
+    joined = "\0".join("" if part is None else str(part) for part in parts)
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _CachedResponse:
+    value: Any
+    fresh_until: float
+    stale_until: float
+    tags: frozenset[str]
+    # Versions of the tags in the shared backend when the response was fetched
+    versions: dict[str, int] | None = None
+
+
+class _TaggedLRUCache(LRUCache):
+    """LRUCache that reports evicted entries so their tags can be unindexed."""
+
+    def __init__(
+        self, maxsize: int, on_evict: Callable[[Any, _CachedResponse], None]
+    ) -> None:
+        super().__init__(maxsize=maxsize)
+        self._on_evict = on_evict
+        self.evictions = 0
+
+    def popitem(self) -> tuple[Any, Any]:
+        key, value = super().popitem()
+        self.evictions += 1
+        self._on_evict(key, value)
+        return key, value
+
+
+class ResponseCache:
+    """Thread-safe LRU of read responses with TTL and stale-while-revalidate.
+
+    Values are deep-copied on the way in and out, so callers may modify what
+    they receive. Invalidation bumps a per-site generation; a fetch that was
+    already running when its site was invalidated does not store its result.
+    """
+
+    def __init__(
+        self,
+        ttl: int = DEFAULT_RESPONSE_CACHE_TTL,
+        stale_ttl: int = DEFAULT_RESPONSE_CACHE_STALE_TTL,
+        maxsize: int = DEFAULT_RESPONSE_CACHE_SIZE,
+        timer: Callable[[], float] = time.monotonic,
+        backend: CacheBackend | None = None,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry is served without revalidation.
+            stale_ttl: Further seconds an expired entry is served while it is
+                refreshed in the background.
+            maxsize: Maximum number of cached responses.
+            timer: Clock used for expiry.
+            backend: Optional shared tier for responses and tag versions.
+        """
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        self._timer = timer
+        self._backend = backend
+        self._entries = _TaggedLRUCache(maxsize, self._unindex)
+        self._tag_index: dict[tuple[str, str], set[ResponseKey]] = {}
+        self._generations: dict[str, int] = {}
+        self._refreshing: dict[ResponseKey, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self.hits = 0
+        self.stale_hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @classmethod
+    def from_env(cls, backend: CacheBackend | None = None) -> ResponseCache | None:
+        """Create a cache configured from the environment.
+
+        The cache is opt-in through ATLASSIAN_RESPONSE_CACHE, since changes
+        made outside the server are only seen once an entry expires. Uses
+        ATLASSIAN_RESPONSE_CACHE_TTL (default 30 seconds),
+        ATLASSIAN_RESPONSE_CACHE_STALE_TTL (default 30 seconds) and
+        ATLASSIAN_RESPONSE_CACHE_SIZE (default 1000 entries).
+
+        Args:
+            backend: Optional shared tier, see ``CacheBackend.from_env``.
+
+        Returns:
+            The configured ResponseCache, or None unless ATLASSIAN_RESPONSE_CACHE
+            is set to a true value.
+        """
+        enabled = os.getenv("ATLASSIAN_RESPONSE_CACHE", "false")
+        if enabled.lower() not in ("true", "1", "yes", "y", "on"):
+            return None
+        return cls(
+            ttl=get_positive_int_env(
+                "ATLASSIAN_RESPONSE_CACHE_TTL", DEFAULT_RESPONSE_CACHE_TTL
+            ),
+            stale_ttl=get_positive_int_env(
+                "ATLASSIAN_RESPONSE_CACHE_STALE_TTL", DEFAULT_RESPONSE_CACHE_STALE_TTL
+            ),
+            maxsize=get_positive_int_env(
+                "ATLASSIAN_RESPONSE_CACHE_SIZE", DEFAULT_RESPONSE_CACHE_SIZE
+            ),
+            backend=backend,
+        )
+
+    @staticmethod
+    def make_key(
+        site: str, identity: str, operation: str, arguments: dict[str, Any]
+    ) -> ResponseKey:
+        """Build the cache key for a read.
+
+        Args:
+            site: The Jira or Confluence site URL.
+            identity: Fingerprint of the caller's credentials.
+            operation: Name of the read operation.
+            arguments: The operation's arguments, including defaults.
+
+        Returns:
+            The cache key.
+        """
+        normalized = json.dumps(
+            arguments,
+            sort_keys=True,
+            default=_normalize_argument,
+            separators=(",", ":"),
+        )
+        return (site.rstrip("/"), identity, operation, normalized)
+
+    def get_or_fetch(
+        self, key: ResponseKey, fetch: Callable[[], Any], tags: Iterable[str] = ()
+    ) -> Any:
+        """Return the cached response for key, fetching and storing on a miss.
+
+        Args:
+            key: Key from ``make_key``.
+            fetch: Performs the read; exceptions propagate and nothing is stored.
+            tags: Tags write methods use to invalidate the response.
+
+        Returns:
+            The cached or freshly fetched response.
+        """
+        value = self._lookup(key, fetch, tags, revalidate=True)
+        if value is not _MISS:
+            return value
+        generation = self._generation(key[0])
+        versions = self._tag_versions(key[0], tags)
+        value = self._load_shared(key, tags, generation, versions)
+        if value is not _MISS:
+            return value
+        value = fetch()
+        self._store(key, value, tags, generation, versions)
+        return value
+
+    async def get_or_fetch_async(
+        self, key: ResponseKey, fetch: Callable[[], Any], tags: Iterable[str] = ()
+    ) -> Any:
+        """Async variant of ``get_or_fetch`` for coroutine read methods.
+
+        Expired entries are not served here; they are fetched again directly.
+
+        Args:
+            key: Key from ``make_key``.
+            fetch: Returns an awaitable that performs the read.
+            tags: Tags write methods use to invalidate the response.
+
+        Returns:
+            The cached or freshly fetched response.
+        """
+        value = self._lookup(key, fetch, tags, revalidate=False)
+        if value is not _MISS:
+            return value
+        generation = self._generation(key[0])
+        versions = self._tag_versions(key[0], tags)
+        value = self._load_shared(key, tags, generation, versions)
+        if value is not _MISS:
+            return value
+        value = await fetch()
+        self._store(key, value, tags, generation, versions)
+        return value
+
+    def invalidate(self, site: str, tags: Iterable[str]) -> int:
+        """Drop every response of a site carrying any of the tags.
+
+        Args:
+            site: The Jira or Confluence site URL.
+            tags: Tags affected by a write.
+
+        Returns:
+            Number of responses dropped.
+        """
+        site = site.rstrip("/")
+        tags = tuple(tags)
+        dropped = 0
+        with self._lock:
+            self._generations[site] = self._generations.get(site, 0) + 1
+            for tag in tags:
+                for key in self._tag_index.pop((site, tag), set()):
+                    entry = self._entries.pop(key, None)
+                    if entry is not None:
+                        self._unindex(key, entry)
+                        dropped += 1
+            self.invalidations += dropped
+        if self._backend is not None:
+            try:
+                for tag in tags:
+                    self._backend.incr(_tag_version_key(site, tag))
+            except CacheBackendError as e:
+                logger.warning(f"Could not invalidate shared cached responses: {e}")
+        if dropped:
+            logger.debug(f"Invalidated {dropped} cached responses for {site}")
+        return dropped
+
+    def close(self) -> None:
+        """Stop the background refresh worker."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit, miss and invalidation counters.
+
+        Returns:
+            Dictionary with entries, hits, stale_hits, shared_hits, misses,
+            invalidations and evictions.
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "evictions": self._entries.evictions,
+            }
+
+    def _lookup(
+        self,
+        key: ResponseKey,
+        fetch: Callable[[], Any],
+        tags: Iterable[str],
+        *,
+        revalidate: bool,
+    ) -> Any:
+        now = self._timer()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and not self._is_current(key[0], entry):
+            # Another replica changed one of the entry's tags
+            with self._lock:
+                if self._entries.get(key) is entry:
+                    del self._entries[key]
+                    self._unindex(key, entry)
+            entry = None
+        with self._lock:
+            if entry is not None and now < entry.fresh_until:
+                self.hits += 1
+            elif entry is not None and revalidate and now < entry.stale_until:
+                self.stale_hits += 1
+                self._schedule_refresh(key, fetch, tags)
+            else:
+                self.misses += 1
+                return _MISS
+        # Stored values are never modified, so they can be copied without the lock
+        return copy.deepcopy(entry.value)
+
+    def _generation(self, site: str) -> int:
+        with self._lock:
+            return self._generations.get(site, 0)
+
+    def _store(
+        self,
+        key: ResponseKey,
+        value: Any,
+        tags: Iterable[str],
+        generation: int,
+        versions: dict[str, int] | None = None,
+    ) -> None:
+        now = self._timer()
+        entry = _CachedResponse(
+            value=copy.deepcopy(value),
+            fresh_until=now + self.ttl,
+            stale_until=now + self.ttl + self.stale_ttl,
+            tags=frozenset(tags),
+            versions=versions,
+        )
+        if not self._remember(key, entry, generation) or versions is None:
+            return
+        try:
+            self._backend.set(  # type: ignore[union-attr]
+                _shared_key(key),
+                {"value": _encode(value), "versions": versions},
+                ttl=self.ttl,
+            )
+        except TypeError as e:
+            logger.debug(f"Not sharing cached {key[2]} response: {e}")
+        except CacheBackendError as e:
+            logger.warning(f"Could not share cached {key[2]} response: {e}")
+
+    def _remember(
+        self, key: ResponseKey, entry: _CachedResponse, generation: int
+    ) -> bool:
+        with self._lock:
+            if self._generations.get(key[0], 0) != generation:
+                # A write invalidated the site while this response was fetched
+                return False
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._unindex(key, previous)
+            self._entries[key] = entry
+            for tag in entry.tags:
+                self._tag_index.setdefault((key[0], tag), set()).add(key)
+            return True
+
+    def _tag_versions(self, site: str, tags: Iterable[str]) -> dict[str, int] | None:
+        """Read the shared versions of tags, or None without a usable backend."""
+        if self._backend is None:
+            return None
+        tags = sorted(set(tags))
+        try:
+            values = self._backend.get_many([_tag_version_key(site, t) for t in tags])
+        except (CacheBackendError, ValueError) as e:
+            logger.warning(f"Could not read shared response cache versions: {e}")
+            return None
+        return {tag: int(value or 0) for tag, value in zip(tags, values, strict=True)}
+
+    def _is_current(self, site: str, entry: _CachedResponse) -> bool:
+        if entry.versions is None:
+            return True
+        versions = self._tag_versions(site, entry.tags)
+        # Without the backend the local entry is the best information available
+        return versions is None or versions == entry.versions
+
+    def _load_shared(
+        self,
+        key: ResponseKey,
+        tags: Iterable[str],
+        generation: int,
+        versions: dict[str, int] | None,
+    ) -> Any:
+        if versions is None:
+            return _MISS
+        try:
+            shared = self._backend.get(_shared_key(key))  # type: ignore[union-attr]
+            if shared is None or shared["versions"] != versions:
+                return _MISS
+            value = _decode(shared["value"])
+        except (CacheBackendError, ValueError, KeyError, TypeError, ImportError) as e:
+            logger.warning(f"Could not read shared cached {key[2]} response: {e}")
+            return _MISS
+        now = self._timer()
+        entry = _CachedResponse(
+            value=copy.deepcopy(value),
+            fresh_until=now + self.ttl,
+            stale_until=now + self.ttl + self.stale_ttl,
+            tags=frozenset(tags),
+            versions=versions,
+        )
+        self._remember(key, entry, generation)
+        with self._lock:
+            self.shared_hits += 1
+        return value
+
+    def _unindex(self, key: ResponseKey, entry: _CachedResponse) -> None:
+        for tag in entry.tags:
+            keys = self._tag_index.get((key[0], tag))
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tag_index[(key[0], tag)]
+
+    def _schedule_refresh(
+        self, key: ResponseKey, fetch: Callable[[], Any], tags: Iterable[str]
+    ) -> None:
+        # Called with self._lock held
+        if key in self._refreshing:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="response-cache"
+            )
+        generation = self._generations.get(key[0], 0)
+        self._refreshing[key] = self._executor.submit(
+            self._refresh, key, fetch, tuple(tags), generation
+        )
+
+    def _refresh(
+        self,
+        key: ResponseKey,
+        fetch: Callable[[], Any],
+        tags: tuple[str, ...],
+        generation: int,
+    ) -> None:
+        try:
+            versions = self._tag_versions(key[0], tags)
+            self._store(key, fetch(), tags, generation, versions)
+        except Exception as e:  # noqa: BLE001 - A failed refresh keeps the stale entry
+            logger.warning(
+                f"Background refresh of cached {key[2]} response failed, "
+                f"keeping it until it expires: {e}"
+            )
+        finally:
+            with self._lock:
+                self._refreshing.pop(key, None)
+
+
+def _shared_key(key: ResponseKey) -> str:
+    digest = hashlib.sha256(json.dumps(key).encode("utf-8")).hexdigest()
+    return f"response:{digest}"
+
+
+def _tag_version_key(site: str, tag: str) -> str:
+    return f"response-tag:{site}:{tag}"
+
+
+def _encode(value: Any) -> Any:
+    """Convert a response to JSON data, recording the models it contains."""
+    if isinstance(value, BaseModel):
+        model = type(value)
+        return {
+            "__model__": f"{model.__module__}:{model.__qualname__}",
+            "data": value.model_dump(mode="json"),
+        }
+    if isinstance(value, list | tuple):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        if not all(isinstance(k, str) for k in value):
+            error_msg = "dictionary keys must be strings"
+            raise TypeError(error_msg)
+        return {k: _encode(v) for k, v in value.items()}
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    error_msg = f"{type(value).__name__} is not JSON serializable"
+    raise TypeError(error_msg)
+
+
+def _decode(value: Any) -> Any:
+    """Rebuild a response encoded by ``_encode``."""
+    if isinstance(value, list):
+        return [_decode(item) for item in value]
+    if isinstance(value, dict):
+        if "__model__" in value:
+            module_name, _, qualname = value["__model__"].partition(":")
+            if not module_name.startswith(_MODEL_PACKAGE):
+                error_msg = f"refusing to rebuild {value['__model__']}"
+                raise ValueError(error_msg)
+            model = importlib.import_module(module_name)
+            for name in qualname.split("."):
+                model = getattr(model, name)
+            if not (isinstance(model, type) and issubclass(model, BaseModel)):
+                error_msg = f"{value['__model__']} is not a model"
+                raise ValueError(error_msg)
+            return model.model_validate(value["data"])
+        return {k: _decode(v) for k, v in value.items()}
+    return value
+
+
+def _normalize_argument(value: Any) -> Any:
+    if isinstance(value, set | frozenset):
+        return sorted(value, key=str)
+    return str(value)
+
+
+def _bound_arguments(
+    signature: inspect.Signature, args: tuple[Any, ...], kwargs: dict[str, Any]
+) -> dict[str, Any]:
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    arguments.pop("self", None)
+    return arguments
+
+
+def _fetcher_cache(fetcher: Any) -> ResponseCache | None:
+    return getattr(fetcher, "response_cache", None)
+
+
+def cached_response(
+    operation: str, tags: Callable[[dict[str, Any]], Iterable[str]]
+) -> Callable[[F], F]:
+    """Serve a fetcher read method through the fetcher's response cache.
+
+    The fetcher's ``response_cache`` and ``config`` decide the site and user the
+    response is cached for; without a response cache the method runs as is.
+
+    Args:
+        operation: Name of the read operation in cache keys.
+        tags: Returns the invalidation tags for the call's bound arguments.
+
+    Returns:
+        Decorator for sync or async fetcher methods.
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        def key_and_tags(
+            self: Any, args: tuple[Any, ...], kwargs: dict[str, Any]
+        ) -> tuple[ResponseKey, tuple[str, ...]]:
+            arguments = _bound_arguments(signature, (self, *args), kwargs)
+            key = ResponseCache.make_key(
+                self.config.url,
+                credential_fingerprint(self.config),
+                operation,
+                arguments,
+            )
+            return key, tuple(tags(arguments))
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+                cache = _fetcher_cache(self)
+                if cache is None:
+                    return await func(self, *args, **kwargs)
+                key, key_tags = key_and_tags(self, args, kwargs)
+                return await cache.get_or_fetch_async(
+                    key, lambda: func(self, *args, **kwargs), key_tags
+                )
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            cache = _fetcher_cache(self)
+            if cache is None:
+                return func(self, *args, **kwargs)
+            key, key_tags = key_and_tags(self, args, kwargs)
+            return cache.get_or_fetch(
+                key, lambda: func(self, *args, **kwargs), key_tags
+            )
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def invalidates_responses(
+    tags: Callable[[dict[str, Any]], Iterable[str]],
+) -> Callable[[F], F]:
+    """Drop cached responses affected by a fetcher write method.
+
+    The tags are invalidated before the write, so a write that reads the result
+    back sees fresh data, and again afterwards, so that reads which overlapped
+    the write are not kept. This happens whether or not the write succeeds.
+
+    Args:
+        tags: Returns the tags the write affects, from the call's bound arguments.
+
+    Returns:
+        Decorator for fetcher methods.
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            cache = _fetcher_cache(self)
+            if cache is None:
+                return func(self, *args, **kwargs)
+            affected = tuple(tags(_bound_arguments(signature, (self, *args), kwargs)))
+            cache.invalidate(self.config.url, affected)
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                cache.invalidate(self.config.url, affected)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -5,14 +5,35 @@ import ssl
 from typing import Any
 from urllib.parse import urlparse
 
-from requests.adapters import HTTPAdapter
 from requests.sessions import Session
 from urllib3.poolmanager import PoolManager
 
+from .http_pool import PooledHTTPAdapter
+
 logger = logging.getLogger("mcp-atlassian")
 
 
-class SSLIgnoreAdapter(HTTPAdapter):
+def create_unverified_ssl_context() -> ssl.SSLContext:
+    """Create an SSL context that skips certificate and hostname verification.
+
+    Legacy SSL renegotiation is also enabled, which may be required for some
+    older servers. This reduces security and should only be used when
+    absolutely necessary.
+
+    Returns:
+        An SSL context with verification disabled
+    """
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+
+    # Enable legacy SSL renegotiation
+    context.options |= 0x4  # SSL_OP_LEGACY_SERVER_CONNECT
+    context.options |= 0x40000  # SSL_OP_ALLOW_UNSAFE_LEGACY_RENEGOTIATION
+    return context
+
+
+class SSLIgnoreAdapter(PooledHTTPAdapter):
     """HTTP adapter that ignores SSL verification.
 
     A custom transport adapter that disables SSL certificate verification for specific domains.
@@ -21,6 +42,8 @@ class SSLIgnoreAdapter(HTTPAdapter):
 
     This adapter also enables legacy SSL renegotiation which may be required for some older servers.
     Note that this reduces security and should only be used when absolutely necessary.
+
+    Pool sizing and keep-alive follow the same ``HttpPoolConfig`` as verified sessions.
     """
 
     def init_poolmanager(
@@ -38,13 +61,8 @@ class SSLIgnoreAdapter(HTTPAdapter):
             pool_kwargs: Additional arguments for the pool manager
         """
         # Configure SSL context to disable verification completely
-        context = ssl.create_default_context()
-        context.check_hostname = False
-        context.verify_mode = ssl.CERT_NONE
-
-        # Enable legacy SSL renegotiation
-        context.options |= 0x4  # SSL_OP_LEGACY_SERVER_CONNECT
-        context.options |= 0x40000  # SSL_OP_ALLOW_UNSAFE_LEGACY_RENEGOTIATION
+        context = create_unverified_ssl_context()
+        pool_kwargs.setdefault("socket_options", self.pool_config.socket_options())
 
         self.poolmanager = PoolManager(
             num_pools=connections,
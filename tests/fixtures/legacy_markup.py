@@ -0,0 +1,290 @@
+"""Reference copies of the original markup converters.
+
+Kept verbatim so tests and ``scripts/benchmark_preprocessing.py`` can check the
+optimized converters in ``mcp_atlassian.preprocessing`` for output parity.
+The legacy citation pattern backtracks exponentially, so only feed
+``legacy_jira_to_markdown`` short inputs.
+"""
+
+import re
+
+from bs4 import BeautifulSoup
+from markdownify import markdownify as md
+
+from mcp_atlassian.preprocessing.base import BasePreprocessor
+from mcp_atlassian.preprocessing.jira import JiraPreprocessor
+
+
+def legacy_jira_to_markdown(preprocessor: JiraPreprocessor, input_text: str) -> str:
+    """Convert Jira markup to Markdown exactly as the original implementation did."""
+    if not input_text:
+        return ""
+
+    # Block quotes
+    output = re.sub(r"^bq\.(.*?)$", r"> \1\n", input_text, flags=re.MULTILINE)
+
+    # Text formatting (bold, italic)
+    output = re.sub(
+        r"([*_])(.*?)\1",
+        lambda match: (
+            ("**" if match.group(1) == "*" else "*")
+            + match.group(2)
+            + ("**" if match.group(1) == "*" else "*")
+        ),
+        output,
+    )
+
+    # Multi-level numbered list
+    output = re.sub(
+        r"^((?:#|-|\+|\*)+) (.*)$",
+        lambda match: preprocessor._convert_jira_list_to_markdown(match),
+        output,
+        flags=re.MULTILINE,
+    )
+
+    # Headers
+    output = re.sub(
+        r"^h([0-6])\.(.*)$",
+        lambda match: "#" * int(match.group(1)) + match.group(2),
+        output,
+        flags=re.MULTILINE,
+    )
+
+    # Inline code
+    output = re.sub(r"\{\{([^}]+)\}\}", r"`\1`", output)
+
+    # Citation
+    output = re.sub(r"\?\?((?:.[^?]|[^?].)+)\?\?", r"<cite>\1</cite>", output)
+
+    # Inserted text
+    output = re.sub(r"\+([^+]*)\+", r"<ins>\1</ins>", output)
+
+    # Superscript
+    output = re.sub(r"\^([^^]*)\^", r"<sup>\1</sup>", output)
+
+    # Subscript
+    output = re.sub(r"~([^~]*)~", r"<sub>\1</sub>", output)
+
+    # Strikethrough
+    output = re.sub(r"-([^-]*)-", r"-\1-", output)
+
+    # Code blocks with optional language specification
+    output = re.sub(
+        r"\{code(?::([a-z]+))?\}([\s\S]*?)\{code\}",
+        r"```\1\n\2\n```",
+        output,
+        flags=re.MULTILINE,
+    )
+
+    # No format
+    output = re.sub(r"\{noformat\}([\s\S]*?)\{noformat\}", r"```\n\1\n```", output)
+
+    # Quote blocks
+    output = re.sub(
+        r"\{quote\}([\s\S]*)\{quote\}",
+        lambda match: "\n".join([f"> {line}" for line in match.group(1).split("\n")]),
+        output,
+        flags=re.MULTILINE,
+    )
+
+    # Images with alt text
+    output = re.sub(
+        r"!([^|\n\s]+)\|([^\n!]*)alt=([^\n!\,]+?)(,([^\n!]*))?!",
+        r"![\3](\1)",
+        output,
+    )
+
+    # Images with other parameters (ignore them)
+    output = re.sub(r"!([^|\n\s]+)\|([^\n!]*)!", r"![](\1)", output)
+
+    # Images without parameters
+    output = re.sub(r"!([^\n\s!]+)!", r"![](\1)", output)
+
+    # Links
+    output = re.sub(r"\[([^|]+)\|(.+?)\]", r"[\1](\2)", output)
+    output = re.sub(r"\[(.+?)\]([^\(]+)", r"<\1>\2", output)
+
+    # Colored text
+    output = re.sub(
+        r"\{color:([^}]+)\}([\s\S]*?)\{color\}",
+        r"<span style=\"color:\1\">\2</span>",
+        output,
+        flags=re.MULTILINE,
+    )
+
+    # Convert Jira table headers (||) to markdown table format
+    lines = output.split("\n")
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+
+        if "||" in line:
+            # Replace Jira table headers
+            lines[i] = lines[i].replace("||", "|")
+
+            # Add a separator line for markdown tables
+            header_cells = lines[i].count("|") - 1
+            if header_cells > 0:
+                separator_line = "|" + "---|" * header_cells
+                lines.insert(i + 1, separator_line)
+                i += 1  # Skip the newly inserted line in next iteration
+
+        i += 1
+
+    # Rejoin the lines
+    output = "\n".join(lines)
+
+    return output
+
+
+def legacy_markdown_to_jira(input_text: str) -> str:
+    """Convert Markdown to Jira markup exactly as the original implementation did."""
+    if not input_text:
+        return ""
+
+    # Save code blocks to prevent recursive processing
+    code_blocks = []
+    inline_codes = []
+
+    # Extract code blocks
+    def save_code_block(match: re.Match) -> str:
+        """
+        Process and save a code block.
+
+        Args:
+            match: Regex match object containing the code block
+
+        Returns:
+            Jira-formatted code block
+        """
+        syntax = match.group(1) or ""
+        content = match.group(2)
+        code = "{code"
+        if syntax:
+            code += ":" + syntax
+        code += "}" + content + "{code}"
+        code_blocks.append(code)
+        return str(code)  # Ensure we return a string
+
+    # Extract inline code
+    def save_inline_code(match: re.Match) -> str:
+        """
+        Process and save inline code.
+
+        Args:
+            match: Regex match object containing the inline code
+
+        Returns:
+            Jira-formatted inline code
+        """
+        content = match.group(1)
+        code = "{{" + content + "}}"
+        inline_codes.append(code)
+        return str(code)  # Ensure we return a string
+
+    # Save code sections temporarily
+    output = re.sub(r"```(\w*)\n([\s\S]+?)```", save_code_block, input_text)
+    output = re.sub(r"`([^`]+)`", save_inline_code, output)
+
+    # Headers with = or - underlines
+    output = re.sub(
+        r"^(.*?)\n([=-])+$",
+        lambda match: f"h{1 if match.group(2)[0] == '=' else 2}. {match.group(1)}",
+        output,
+        flags=re.MULTILINE,
+    )
+
+    # Headers with # prefix
+    output = re.sub(
+        r"^([#]+)(.*?)$",
+        lambda match: f"h{len(match.group(1))}." + match.group(2),
+        output,
+        flags=re.MULTILINE,
+    )
+
+    # Bold and italic
+    output = re.sub(
+        r"([*_]+)(.*?)\1",
+        lambda match: (
+            ("_" if len(match.group(1)) == 1 else "*")
+            + match.group(2)
+            + ("_" if len(match.group(1)) == 1 else "*")
+        ),
+        output,
+    )
+
+    # Multi-level bulleted list
+    output = re.sub(
+        r"^(\s*)- (.*)$",
+        lambda match: (
+            "* " + match.group(2)
+            if not match.group(1)
+            else "  " * (len(match.group(1)) // 2) + "* " + match.group(2)
+        ),
+        output,
+        flags=re.MULTILINE,
+    )
+
+    # Multi-level numbered list
+    output = re.sub(
+        r"^(\s+)1\. (.*)$",
+        lambda match: "#" * (int(len(match.group(1)) / 4) + 2) + " " + match.group(2),
+        output,
+        flags=re.MULTILINE,
+    )
+
+    # HTML formatting tags to Jira markup
+    tag_map = {"cite": "??", "del": "-", "ins": "+", "sup": "^", "sub": "~"}
+
+    for tag, replacement in tag_map.items():
+        output = re.sub(
+            rf"<{tag}>(.*?)<\/{tag}>", rf"{replacement}\1{replacement}", output
+        )
+
+    # Colored text
+    output = re.sub(
+        r"<span style=\"color:(#[^\"]+)\">([\s\S]*?)</span>",
+        r"{color:\1}\2{color}",
+        output,
+        flags=re.MULTILINE,
+    )
+
+    # Strikethrough
+    output = re.sub(r"~~(.*?)~~", r"-\1-", output)
+
+    # Images without alt text
+    output = re.sub(r"!\[\]\(([^)\n\s]+)\)", r"!\1!", output)
+
+    # Images with alt text
+    output = re.sub(r"!\[([^\]\n]+)\]\(([^)\n\s]+)\)", r"!\2|alt=\1!", output)
+
+    # Links
+    output = re.sub(r"\[([^\]]+)\]\(([^)]+)\)", r"[\1|\2]", output)
+    output = re.sub(r"<([^>]+)>", r"[\1]", output)
+
+    # Convert markdown tables to Jira table format
+    lines = output.split("\n")
+    i = 0
+    while i < len(lines):
+        if i < len(lines) - 1 and re.match(r"\|[-\s|]+\|", lines[i + 1]):
+            # Convert header row to Jira format
+            lines[i] = lines[i].replace("|", "||")
+            # Remove the separator line
+            lines.pop(i + 1)
+        i += 1
+
+    # Rejoin the lines
+    output = "\n".join(lines)
+
+    return output
+
+
+def legacy_process_html_content(
+    preprocessor: BasePreprocessor, html_content: str
+) -> tuple[str, str]:
+    """Process HTML by serializing the rewritten tree and re-parsing it for Markdown."""
+    soup = BeautifulSoup(html_content, "html.parser")
+    preprocessor._process_user_mentions_in_soup(soup)
+    preprocessor._process_user_profile_macros_in_soup(soup)
+    processed_html = str(soup)
+    return processed_html, md(processed_html)
@@ -1,9 +1,16 @@
+import random
+
 import pytest
 
 from mcp_atlassian.preprocessing.confluence import ConfluencePreprocessor
 from mcp_atlassian.preprocessing.jira import JiraPreprocessor
 from tests.fixtures.confluence_mocks import MOCK_COMMENTS_RESPONSE, MOCK_PAGE_RESPONSE
 from tests.fixtures.jira_mocks import MOCK_JIRA_ISSUE_RESPONSE
+from tests.fixtures.legacy_markup import (
+    legacy_jira_to_markdown,
+    legacy_markdown_to_jira,
+    legacy_process_html_content,
+)
 
 
 class MockConfluenceClient:
@@ -103,6 +110,40 @@ def test_process_html_content_with_user_mentions(preprocessor_with_confluence):
     assert "@Test User 123456" in processed_markdown
 
 
+STORAGE_FORMAT_CORPUS = [
+    "<p>Simple text</p>",
+    '<p>Hi <ac:link><ri:user ri:account-id="42"/></ac:link> there</p>',
+    (
+        '<p><ac:link><ri:user ri:account-id="7"/><ac:link-body>@Someone</ac:link-body>'
+        "</ac:link>, see <strong>this</strong></p>"
+    ),
+    (
+        'Before <ac:structured-macro ac:name="profile"><ac:parameter ac:name="user">'
+        '<ri:user ri:account-id="9"/></ac:parameter></ac:structured-macro> after'
+    ),
+    '<ac:structured-macro ac:name="profile"></ac:structured-macro>  <p>x</p>',
+    "<p>a  </strong></code>  b</p><pre>keep   spacing</pre>",
+    (
+        '<ac:structured-macro ac:name="code"><ac:plain-text-body><![CDATA[a < b]]>'
+        "</ac:plain-text-body></ac:structured-macro><!-- note -->"
+    ),
+    (
+        "<ul><li>snake_case</li><li><code>*literal*</code></li></ul>"
+        "<table><tr><th>A</th></tr><tr><td>1</td></tr></table>"
+    ),
+]
+
+
+@pytest.mark.parametrize("html", STORAGE_FORMAT_CORPUS)
+def test_process_html_content_matches_reparsing_pipeline(
+    preprocessor_with_confluence, html
+):
+    """Markdown emitted from the parsed tree matches re-parsing the processed HTML."""
+    assert preprocessor_with_confluence.process_html_content(
+        html
+    ) == legacy_process_html_content(preprocessor_with_confluence, html)
+
+
 def test_clean_jira_text_empty(preprocessor_with_jira):
     """Test cleaning empty Jira text."""
     assert preprocessor_with_jira.clean_jira_text("") == ""
@@ -227,6 +268,68 @@ For more information, see [our website|https://example.com].
     assert "[our website](https://example.com)" in converted
 
 
+JIRA_MARKUP_CORPUS = [
+    "bq. quoted line\nnext",
+    "*bold* and _italic_ and *unclosed",
+    "# one\n## two\n* bullet\n-- nested\n+ plus",
+    "h1.Title\nh6. Small\nh7. not a header",
+    "{{inline}} ??citation?? +inserted+ ^sup^ ~sub~ -strike-",
+    "??multi\nline?? and ??blank\n\nline??",
+    "{code}\nplain\n{code}\n{code:java}\nint x;\n{code}",
+    "{noformat}\n[INFO] [a] b | c\n{noformat}",
+    "{quote}\nfirst\nsecond\n{quote}",
+    "!image.png! !image.png|width=300! !image.png|alt=Diagram,width=300!",
+    "[text|https://example.com] [|empty] [a|b|c] [bare] [~jdoe] [x]y",
+    "[no pipe [nested|https://example.com] after]",
+    "{color:red}warning{color} {color:#ff0000}hex{color}",
+    "||Header 1||Header 2||\n|cell|cell|\n||solo||",
+    "line with [brackets] but no pipe\n" * 5,
+]
+
+
+@pytest.mark.parametrize("markup", JIRA_MARKUP_CORPUS)
+def test_jira_to_markdown_matches_legacy_converter(preprocessor_with_jira, markup):
+    """The optimized converter produces the same output as the original."""
+    assert preprocessor_with_jira.jira_to_markdown(markup) == legacy_jira_to_markdown(
+        preprocessor_with_jira, markup
+    )
+
+
+def test_jira_to_markdown_matches_legacy_converter_fuzz(preprocessor_with_jira):
+    """Random markup fragments convert identically to the original converter."""
+    rng = random.Random(1234)
+    alphabet = list("ab *_#-+^~?!|[](){}\n.:=,h1q") + [
+        "{code}",
+        "{code:python}",
+        "{noformat}",
+        "{quote}",
+        "{color:red}",
+        "{color}",
+        "bq.",
+        "h2.",
+        "||",
+        "{{",
+        "}}",
+        "alt=",
+        "http://x.y/z",
+    ]
+    for _ in range(2000):
+        # Short inputs keep the original's backtracking citation regex bounded
+        markup = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 12)))
+        assert preprocessor_with_jira.jira_to_markdown(
+            markup
+        ) == legacy_jira_to_markdown(preprocessor_with_jira, markup), markup
+
+
+def test_jira_to_markdown_pathological_input(preprocessor_with_jira):
+    """Inputs that made the original regexes backtrack convert promptly."""
+    citation = "??" + "why? " * 2000
+    assert preprocessor_with_jira.jira_to_markdown(citation) == citation
+
+    log = "\n".join(f"[worker-{n}] request [cache=miss]" for n in range(5000))
+    assert preprocessor_with_jira.jira_to_markdown(log).startswith("<worker-0>")
+
+
 def test_markdown_to_jira(preprocessor_with_jira):
     """Test conversion of Markdown to Jira markup."""
     # Test headers
@@ -284,6 +387,70 @@ For more information, see [our website](https://example.com).
     assert "[our website|https://example.com]" in converted
 
 
+MARKDOWN_CORPUS = [
+    "```\nplain\n```\n```python\nx = 1\n```\n```js\n```",
+    "`inline` and `unclosed",
+    "Title\n=====\nSub\n---\n# One\n###Three",
+    "**bold** *italic* __under__ _single_ ***both***",
+    "- item\n  - nested\n    - deeper\n1. first\n    1. nested\n        1. deeper",
+    "<cite>c</cite> <del>d</del> <ins>i</ins> <sup>s</sup> <sub>b</sub> <b>x</b>",
+    '<span style="color:#ff0000">red</span> <span style="color:red">named</span>',
+    "~~strike~~ ~single~",
+    "![](a.png) ![alt text](b.png) ![bad](c d.png)",
+    "[link](https://example.com) [a](b) <https://example.com> [x] (y)",
+    "| A | B |\n|---|---|\n| a | b |\n|---|---|\n| c | d |",
+    "if a < b and c > d:\n    return [x](y",
+    "x < y\n" * 5,
+]
+
+
+@pytest.mark.parametrize("markdown", MARKDOWN_CORPUS)
+def test_markdown_to_jira_matches_legacy_converter(preprocessor_with_jira, markdown):
+    """The optimized converter produces the same output as the original."""
+    assert preprocessor_with_jira.markdown_to_jira(markdown) == legacy_markdown_to_jira(
+        markdown
+    )
+
+
+def test_markdown_to_jira_matches_legacy_converter_fuzz(preprocessor_with_jira):
+    """Random Markdown fragments convert identically to the original converter."""
+    rng = random.Random(4321)
+    alphabet = list("ab *_#-+^~!|[]()<>`\n=1. :/") + [
+        "```",
+        "```py\n",
+        "**",
+        "~~",
+        "](",
+        "<cite>",
+        "</cite>",
+        "<sub>",
+        "</sub>",
+        '<span style="color:#f00">',
+        "</span>",
+        "|---|",
+        "\n---",
+        "\n===",
+        "    1. ",
+        "  - ",
+    ]
+    for _ in range(2000):
+        markdown = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 16)))
+        assert preprocessor_with_jira.markdown_to_jira(
+            markdown
+        ) == legacy_markdown_to_jira(markdown), markdown
+
+
+def test_markdown_to_jira_pathological_input(preprocessor_with_jira):
+    """Unclosed "<" and "[text](" no longer rescan the rest of the text."""
+    code = "\n".join(f"if items[{n}] < limit and (x" for n in range(5000))
+    assert preprocessor_with_jira.markdown_to_jira(code) == code
+
+    tables = "\n".join("| a | b |\n|---|---|\n| c | d |" for _ in range(5000))
+    converted = preprocessor_with_jira.markdown_to_jira(tables)
+    assert converted.count("|| a || b ||") == 5000
+    assert "---" not in converted
+
+
 def test_markdown_to_confluence_storage(preprocessor_with_confluence):
     """Test conversion of Markdown to Confluence storage format."""
     markdown = """# Heading 1
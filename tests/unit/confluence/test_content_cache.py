@@ -0,0 +1,161 @@
+"""Tests for the version-keyed Confluence content conversion cache."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_atlassian.confluence.comments import CommentsMixin
+from mcp_atlassian.confluence.content_cache import (
+    CONTENT_STORE_FILENAME,
+    ContentConversionCache,
+    ContentStore,
+)
+from mcp_atlassian.confluence.pages import PagesMixin
+
+SITE = "https://example.atlassian.net/wiki"
+
+
+def _key(version=1, body="<p>body</p>", representation="storage"):
+    return ContentConversionCache.make_key(SITE, "123", version, representation, body)
+
+
+class TestContentConversionCache:
+    def test_converts_once_per_version(self):
+        cache = ContentConversionCache()
+        convert = MagicMock(return_value=("<p>html</p>", "markdown"))
+
+        assert cache.get_or_convert(_key(), convert) == ("<p>html</p>", "markdown")
+        assert cache.get_or_convert(_key(), convert) == ("<p>html</p>", "markdown")
+        convert.assert_called_once()
+
+        cache.get_or_convert(_key(version=2), convert)
+        assert convert.call_count == 2
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+
+    def test_key_covers_site_representation_and_body(self):
+        assert _key() == ContentConversionCache.make_key(
+            SITE + "/", "123", "1", "storage", "<p>body</p>"
+        )
+        assert _key() != _key(representation="view")
+        assert _key() != _key(body="<p>rendered for another user</p>")
+        assert "<p>body</p>" not in _key()
+
+    def test_bounded_by_size(self):
+        cache = ContentConversionCache(max_size_mb=1)
+        half = "x" * (1024 * 1024 // 2 + 1)
+        cache.get_or_convert(_key(version=1), lambda: (half, ""))
+        cache.get_or_convert(_key(version=2), lambda: (half, ""))
+        assert cache.stats()["entries"] == 1
+
+        # Larger than the whole budget: returned but not kept in memory
+        huge = "x" * (1024 * 1024 + 1)
+        assert cache.get_or_convert(_key(version=3), lambda: (huge, "")) == (huge, "")
+        assert cache.stats()["entries"] == 1
+
+    def test_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("CONFLUENCE_CONTENT_CACHE_SIZE_MB", "8")
+        monkeypatch.delenv("ATLASSIAN_CACHE_DIR", raising=False)
+        cache = ContentConversionCache.from_env()
+        assert cache.max_size_mb == 8
+        assert cache._store is None
+
+        monkeypatch.setenv("ATLASSIAN_CACHE_DIR", str(tmp_path))
+        store = ContentConversionCache.from_env()._store
+        assert store.path == tmp_path / CONTENT_STORE_FILENAME
+
+
+class TestContentStore:
+    def test_restarted_cache_reads_from_disk(self, tmp_path):
+        path = tmp_path / CONTENT_STORE_FILENAME
+        ContentConversionCache(store=ContentStore(path)).get_or_convert(
+            _key(), lambda: ("<p>html</p>", "markdown")
+        )
+
+        restarted = ContentConversionCache(store=ContentStore(path))
+        convert = MagicMock()
+        assert restarted.get_or_convert(_key(), convert) == ("<p>html</p>", "markdown")
+        assert restarted.get_or_convert(_key(), convert) == ("<p>html</p>", "markdown")
+        convert.assert_not_called()
+        assert restarted.stats()["disk_hits"] == 1
+        assert restarted.stats()["hits"] == 1
+
+    def test_new_version_replaces_old_and_size_is_bounded(self, tmp_path):
+        store = ContentStore(tmp_path / CONTENT_STORE_FILENAME, max_entries=2)
+        store.save(_key(version=1), ("v1", "v1"))
+        store.save(_key(version=2), ("v2", "v2"))
+        assert store.get(_key(version=1)) is None
+        assert store.get(_key(version=2)) == ("v2", "v2")
+
+        store.save(
+            ContentConversionCache.make_key(SITE, "a", 1, "view", "a"), ("a", "a")
+        )
+        store.save(
+            ContentConversionCache.make_key(SITE, "b", 1, "view", "b"), ("b", "b")
+        )
+        assert store.get(_key(version=2)) is None
+
+    def test_from_env_unusable_directory(self, monkeypatch, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        monkeypatch.setenv("ATLASSIAN_CACHE_DIR", str(blocker))
+        assert ContentStore.from_env() is None
+
+
+class TestCachedConversion:
+    @pytest.fixture
+    def content_cache(self):
+        return ContentConversionCache()
+
+    def _mixin(self, cls, confluence_client, content_cache):
+        with patch(
+            "mcp_atlassian.confluence.client.ConfluenceClient.__init__",
+            return_value=None,
+        ):
+            mixin = cls()
+        mixin.confluence = confluence_client.confluence
+        mixin.config = confluence_client.config
+        mixin.preprocessor = confluence_client.preprocessor
+        mixin.content_cache = content_cache
+        return mixin
+
+    def test_page_content_converted_once(self, confluence_client, content_cache):
+        pages = self._mixin(PagesMixin, confluence_client, content_cache)
+
+        first = pages.get_page_content("987654321")
+        second = pages.get_page_content("987654321")
+
+        assert first.content == second.content == "Processed Markdown"
+        pages.preprocessor.process_html_content.assert_called_once()
+        assert content_cache.stats()["hits"] == 1
+
+    def test_page_without_version_is_not_cached(self, confluence_client, content_cache):
+        pages = self._mixin(PagesMixin, confluence_client, content_cache)
+        page = pages.confluence.get_page_by_id.return_value
+        pages.confluence.get_page_by_id.return_value = {
+            k: v for k, v in page.items() if k != "version"
+        }
+
+        pages.get_page_content("987654321")
+        pages.get_page_content("987654321")
+
+        assert pages.preprocessor.process_html_content.call_count == 2
+        assert content_cache.stats()["entries"] == 0
+
+    def test_comments_converted_once(self, confluence_client, content_cache):
+        comments = self._mixin(CommentsMixin, confluence_client, content_cache)
+        comments.confluence.get_page_comments.side_effect = lambda **kwargs: {
+            "results": [
+                {
+                    "id": "456",
+                    "body": {"view": {"value": "<p>Comment</p>"}},
+                    "version": {"number": 3},
+                }
+            ]
+        }
+
+        comments.get_page_comments("987654321")
+        comments.get_page_comments("987654321")
+
+        comments.preprocessor.process_html_content.assert_called_once()
+        assert next(iter(content_cache._cache))[3] == "view"
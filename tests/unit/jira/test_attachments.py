@@ -1,11 +1,18 @@
 """Tests for the Jira attachments module."""
 
+import json
+import threading
 from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
 from mcp_atlassian.jira import JiraFetcher
-from mcp_atlassian.jira.attachments import AttachmentsMixin
+from mcp_atlassian.jira.attachments import (
+    ATTACHMENT_MANIFEST_FILENAME,
+    AttachmentsMixin,
+)
+from mcp_atlassian.jira.client import SEARCH_CACHE_TAG
+from mcp_atlassian.utils.response_cache import ResponseCache
 
 # Test scenarios for AttachmentsMixin
 #
@@ -27,6 +34,8 @@ from mcp_atlassian.jira.attachments import AttachmentsMixin
 #      - Issue has no fields
 #      - Some attachments fail to download
 #      - Attachment has missing URL
+#    - Unchanged files recorded in the manifest are skipped
+#    - Interrupted downloads resume with a Range request
 #
 # 3. Single Attachment Upload (upload_attachment method):
 #    - Success case: Uploads file correctly
@@ -41,6 +50,8 @@ from mcp_atlassian.jira.attachments import AttachmentsMixin
 # 4. Multiple Attachments Upload (upload_attachments method):
 #    - Success case: Uploads multiple files correctly
 #    - Partial success: Some files upload successfully, others fail
+#    - Files are uploaded concurrently
+#    - The file is streamed as a multipart body with progress reports
 #    - Error cases:
 #      - Empty list of file paths
 #      - No issue key provided
@@ -379,7 +390,9 @@ class TestAttachmentsMixin:
         # Mock the download_attachment method to succeed for first attachment and fail for second
         with (
             patch.object(
-                attachments_mixin, "download_attachment", side_effect=[True, False]
+                attachments_mixin,
+                "download_attachment",
+                side_effect=lambda url, path, **kwargs: url.endswith("1"),
             ) as mock_download,
             patch("pathlib.Path.mkdir") as mock_mkdir,
             patch(
@@ -442,6 +455,96 @@ class TestAttachmentsMixin:
             assert result["failed"][0]["filename"] == "test1.txt"
             assert "No URL available" in result["failed"][0]["error"]
 
+    def _serve_attachments(self, attachments_mixin, contents):
+        """Serve attachment bodies from the mocked session, honouring Range."""
+        requests = []
+
+        def get(url, stream=True, headers=None):
+            requests.append((url, headers))
+            body = contents[url]
+            response = MagicMock()
+            response.status_code = 200
+            if headers and "Range" in headers:
+                body = body[int(headers["Range"][6:-1]) :]
+                response.status_code = 206
+            response.iter_content.side_effect = lambda chunk_size: [
+                body[i : i + chunk_size] for i in range(0, len(body), chunk_size)
+            ]
+            return response
+
+        attachments_mixin.jira._session.get.side_effect = get
+        attachments_mixin.jira.issue.return_value = {
+            "fields": {
+                "attachment": [
+                    {
+                        "id": str(n),
+                        "filename": url.rsplit("/", 1)[1],
+                        "content": url,
+                        "size": len(body),
+                    }
+                    for n, (url, body) in enumerate(contents.items())
+                ]
+            }
+        }
+        return requests
+
+    def test_download_issue_attachments_skips_unchanged(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test a second download skips files recorded in the manifest."""
+        contents = {
+            f"https://test.url/file{n}.log": bytes([n]) * (1000 + n) for n in range(5)
+        }
+        requests = self._serve_attachments(attachments_mixin, contents)
+
+        first = attachments_mixin.download_issue_attachments("TEST-1", str(tmp_path))
+        second = attachments_mixin.download_issue_attachments("TEST-1", str(tmp_path))
+
+        assert [item["filename"] for item in first["downloaded"]] == [
+            f"file{n}.log" for n in range(5)
+        ]
+        assert first["bytes_downloaded"] == sum(map(len, contents.values()))
+        assert "throughput_mb_per_second" in first
+        assert (tmp_path / "file3.log").read_bytes() == contents[
+            "https://test.url/file3.log"
+        ]
+        assert second["downloaded"] == []
+        assert len(second["skipped"]) == 5
+        assert len(requests) == 5
+
+    def test_download_issue_attachments_resumes_partial_file(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test an interrupted download continues with a Range request."""
+        url = "https://test.url/bundle.tar"
+        body = b"0123456789" * 100
+        requests = self._serve_attachments(attachments_mixin, {url: body})
+        (tmp_path / "bundle.tar").write_bytes(body[:300])
+        (tmp_path / ATTACHMENT_MANIFEST_FILENAME).write_text(
+            json.dumps({"bundle.tar": {"id": "0", "size": 1000, "complete": False}})
+        )
+
+        result = attachments_mixin.download_issue_attachments("TEST-1", str(tmp_path))
+
+        assert result["failed"] == []
+        assert requests == [(url, {"Range": "bytes=300-"})]
+        assert (tmp_path / "bundle.tar").read_bytes() == body
+        manifest = json.loads((tmp_path / ATTACHMENT_MANIFEST_FILENAME).read_text())
+        assert manifest["bundle.tar"]["complete"] is True
+
+    def test_download_issue_attachments_replaces_changed_file(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test a file from another attachment is downloaded again, not resumed."""
+        url = "https://test.url/report.txt"
+        requests = self._serve_attachments(attachments_mixin, {url: b"new report"})
+        (tmp_path / "report.txt").write_bytes(b"old")
+
+        attachments_mixin.download_issue_attachments("TEST-1", str(tmp_path))
+
+        assert requests == [(url, None)]
+        assert (tmp_path / "report.txt").read_bytes() == b"new report"
+
     # Tests for upload_attachment method
 
     def test_upload_attachment_success(self, attachments_mixin: AttachmentsMixin):
@@ -452,7 +555,9 @@ class TestAttachmentsMixin:
             "filename": "test_file.txt",
             "size": 100,
         }
-        attachments_mixin.jira.add_attachment.return_value = mock_attachment_response
+        attachments_mixin.jira._session.post.return_value.json.return_value = [
+            mock_attachment_response
+        ]
 
         # Mock file operations
         with (
@@ -480,9 +585,12 @@ class TestAttachmentsMixin:
             assert result["filename"] == "test_file.txt"
             assert result["size"] == 100
             assert result["id"] == "12345"
-            attachments_mixin.jira.add_attachment.assert_called_once_with(
-                issue_key="TEST-123", filename="/absolute/path/test_file.txt"
+            attachments_mixin.jira._session.post.assert_called_once()
+            _, kwargs = attachments_mixin.jira._session.post.call_args
+            assert kwargs["headers"]["Content-Type"].startswith(
+                "multipart/form-data; boundary="
             )
+            assert b"test content" in kwargs["data"].read()
 
     def test_upload_attachment_relative_path(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload with a relative path."""
@@ -492,7 +600,9 @@ class TestAttachmentsMixin:
             "filename": "test_file.txt",
             "size": 100,
         }
-        attachments_mixin.jira.add_attachment.return_value = mock_attachment_response
+        attachments_mixin.jira._session.post.return_value.json.return_value = [
+            mock_attachment_response
+        ]
 
         # Mock file operations
         with (
@@ -516,9 +626,7 @@ class TestAttachmentsMixin:
             assert result["success"] is True
             mock_isabs.assert_called_once_with("test_file.txt")
             mock_abspath.assert_called_once_with("test_file.txt")
-            attachments_mixin.jira.add_attachment.assert_called_once_with(
-                issue_key="TEST-123", filename="/absolute/path/test_file.txt"
-            )
+            attachments_mixin.jira._session.post.assert_called_once()
 
     def test_upload_attachment_no_issue_key(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload with no issue key."""
@@ -527,7 +635,7 @@ class TestAttachmentsMixin:
         # Assertions
         assert result["success"] is False
         assert "No issue key provided" in result["error"]
-        attachments_mixin.jira.add_attachment.assert_not_called()
+        attachments_mixin.jira._session.post.assert_not_called()
 
     def test_upload_attachment_no_file_path(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload with no file path."""
@@ -536,7 +644,7 @@ class TestAttachmentsMixin:
         # Assertions
         assert result["success"] is False
         assert "No file path provided" in result["error"]
-        attachments_mixin.jira.add_attachment.assert_not_called()
+        attachments_mixin.jira._session.post.assert_not_called()
 
     def test_upload_attachment_file_not_found(
         self, attachments_mixin: AttachmentsMixin
@@ -560,16 +668,17 @@ class TestAttachmentsMixin:
             # Assertions
             assert result["success"] is False
             assert "File not found" in result["error"]
-            attachments_mixin.jira.add_attachment.assert_not_called()
+            attachments_mixin.jira._session.post.assert_not_called()
 
     def test_upload_attachment_api_error(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload with an API error."""
         # Mock the Jira API to raise an exception
-        attachments_mixin.jira.add_attachment.side_effect = Exception("API Error")
+        attachments_mixin.jira._session.post.side_effect = Exception("API Error")
 
         # Mock file operations
         with (
             patch("os.path.exists") as mock_exists,
+            patch("os.path.getsize", return_value=12),
             patch("os.path.isabs") as mock_isabs,
             patch("os.path.abspath") as mock_abspath,
             patch("os.path.basename") as mock_basename,
@@ -590,12 +699,13 @@ class TestAttachmentsMixin:
 
     def test_upload_attachment_no_response(self, attachments_mixin: AttachmentsMixin):
         """Test attachment upload when API returns no response."""
-        # Mock the Jira API to return None
-        attachments_mixin.jira.add_attachment.return_value = None
+        # Mock the Jira API to return an empty body
+        attachments_mixin.jira._session.post.return_value.content = b""
 
         # Mock file operations
         with (
             patch("os.path.exists") as mock_exists,
+            patch("os.path.getsize", return_value=12),
             patch("os.path.isabs") as mock_isabs,
             patch("os.path.abspath") as mock_abspath,
             patch("os.path.basename") as mock_basename,
@@ -638,7 +748,11 @@ class TestAttachmentsMixin:
         ]
 
         with patch.object(
-            attachments_mixin, "upload_attachment", side_effect=mock_results
+            attachments_mixin,
+            "upload_attachment",
+            side_effect=lambda issue_key, path, **kwargs: mock_results[
+                file_paths.index(path)
+            ],
         ) as mock_upload:
             # Call the method
             result = attachments_mixin.upload_attachments("TEST-123", file_paths)
@@ -652,9 +766,15 @@ class TestAttachmentsMixin:
 
             # Check that upload_attachment was called for each file
             assert mock_upload.call_count == 3
-            mock_upload.assert_any_call("TEST-123", "/path/to/file1.txt")
-            mock_upload.assert_any_call("TEST-123", "/path/to/file2.pdf")
-            mock_upload.assert_any_call("TEST-123", "/path/to/file3.jpg")
+            mock_upload.assert_any_call(
+                "TEST-123", "/path/to/file1.txt", progress_callback=None
+            )
+            mock_upload.assert_any_call(
+                "TEST-123", "/path/to/file2.pdf", progress_callback=None
+            )
+            mock_upload.assert_any_call(
+                "TEST-123", "/path/to/file3.jpg", progress_callback=None
+            )
 
             # Verify uploaded files details
             assert result["uploaded"][0]["filename"] == "file1.txt"
@@ -698,7 +818,11 @@ class TestAttachmentsMixin:
         ]
 
         with patch.object(
-            attachments_mixin, "upload_attachment", side_effect=mock_results
+            attachments_mixin,
+            "upload_attachment",
+            side_effect=lambda issue_key, path, **kwargs: mock_results[
+                file_paths.index(path)
+            ],
         ) as mock_upload:
             # Call the method
             result = attachments_mixin.upload_attachments("TEST-123", file_paths)
@@ -727,6 +851,85 @@ class TestAttachmentsMixin:
             assert result["failed"][0]["filename"] == "file2.pdf"
             assert "File not found" in result["failed"][0]["error"]
 
+    def test_upload_attachment_streams_file(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test the file is sent as a streamed multipart body with progress."""
+        file_path = tmp_path / "build.log"
+        content = b"line of build output\n" * 5000
+        file_path.write_bytes(content)
+        sent = {}
+
+        def post(url, data, headers, timeout):
+            sent["length"] = len(data)
+            sent["body"] = b"".join(iter(lambda: data.read(8192), b""))
+            sent["headers"] = headers
+            response = MagicMock()
+            response.json.return_value = [{"id": "10001", "filename": "build.log"}]
+            return response
+
+        attachments_mixin.jira._session.post.side_effect = post
+        attachments_mixin.jira.no_check_headers = {"X-Atlassian-Token": "no-check"}
+        progress = []
+
+        result = attachments_mixin.upload_attachment(
+            "TEST-123",
+            str(file_path),
+            progress_callback=lambda *args: progress.append(args),
+        )
+
+        assert result["success"] is True
+        assert result["id"] == "10001"
+        assert result["size"] == len(content)
+        boundary = sent["headers"]["Content-Type"].split("boundary=")[1]
+        assert sent["headers"]["X-Atlassian-Token"] == "no-check"
+        assert sent["length"] == len(sent["body"])
+        assert sent["body"].startswith(
+            f"--{boundary}\r\n"
+            'Content-Disposition: form-data; name="file"; filename="build.log"'
+            "\r\n\r\n".encode()
+        )
+        assert sent["body"].endswith(content + f"\r\n--{boundary}--\r\n".encode())
+        assert len(progress) > 1
+        assert progress[-1] == ("build.log", len(content), len(content))
+
+    def test_upload_attachments_in_parallel(self, attachments_mixin: AttachmentsMixin):
+        """Test files are uploaded concurrently and reported in input order."""
+        file_paths = [f"/path/to/file{n}.bin" for n in range(6)]
+        barrier = threading.Barrier(attachments_mixin.config.attachment_concurrency)
+
+        def upload(issue_key, path, **kwargs):
+            barrier.wait(timeout=5)
+            return {"success": True, "filename": path[-9:], "size": 10, "id": path}
+
+        with patch.object(
+            attachments_mixin, "upload_attachment", side_effect=upload
+        ) as mock_upload:
+            result = attachments_mixin.upload_attachments("TEST-123", file_paths[:4])
+
+        assert mock_upload.call_count == 4
+        assert [item["id"] for item in result["uploaded"]] == file_paths[:4]
+        assert result["bytes_uploaded"] == 40
+        assert "throughput_mb_per_second" in result
+
+    def test_upload_attachment_invalidates_cached_issue(
+        self, attachments_mixin: AttachmentsMixin, tmp_path
+    ):
+        """Test an upload drops cached reads of the issue and of searches."""
+        cache = attachments_mixin.response_cache = ResponseCache()
+        file_path = tmp_path / "notes.txt"
+        file_path.write_bytes(b"notes")
+        attachments_mixin.jira._session.post.return_value.json.return_value = [
+            {"id": "1"}
+        ]
+
+        with patch.object(cache, "invalidate") as invalidate:
+            attachments_mixin.upload_attachment("test-123", str(file_path))
+
+        invalidate.assert_called_with(
+            attachments_mixin.config.url, ("issue:TEST-123", SEARCH_CACHE_TAG)
+        )
+
     def test_upload_attachments_empty_list(self, attachments_mixin: AttachmentsMixin):
         """Test upload with an empty list of file paths."""
         # Call the method with an empty list
@@ -101,6 +101,7 @@ def test_init_from_env():
         patch("mcp_atlassian.jira.config.JiraConfig.from_env") as mock_from_env,
         patch("mcp_atlassian.jira.client.Jira") as mock_jira,
         patch("mcp_atlassian.jira.client.configure_ssl_verification"),
+        patch("mcp_atlassian.jira.client.mount_connection_pool"),
     ):
         mock_config = MagicMock()
         mock_config.auth_type = "basic"  # needed for the if condition
@@ -6,7 +6,7 @@ import pytest
 
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.epics import EpicsMixin
-from mcp_atlassian.models.jira import JiraIssue
+from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
 
 
 class TestEpicsMixin:
@@ -551,6 +551,72 @@ class TestEpicsMixin:
         assert last_call_kwargs.get("start") == 3
         assert last_call_kwargs.get("limit") == 10
 
+    def test_get_epic_issues_remembers_strategy(self, epics_mixin: EpicsMixin):
+        """Test the strategy that worked for a project is tried first next time."""
+        epics_mixin.jira.get_issue.return_value = {
+            "key": "EPIC-123",
+            "fields": {"issuetype": {"name": "Epic"}},
+        }
+        epics_mixin.get_field_ids_to_epic = MagicMock(
+            return_value={"epic_link": "customfield_10014"}
+        )
+
+        def search_side_effect(jql, **kwargs):
+            if "customfield_10014" not in jql:
+                raise Exception("Field does not exist")
+            return JiraSearchResult(issues=[JiraIssue(key="CHILD-1")])
+
+        epics_mixin.search_issues = MagicMock(side_effect=search_side_effect)
+
+        first = epics_mixin.get_epic_issues("EPIC-123")
+        assert epics_mixin.search_issues.call_count == 3
+        epics_mixin.search_issues.reset_mock()
+        second = epics_mixin.get_epic_issues("epic-456")
+
+        assert [issue.key for issue in first] == ["CHILD-1"]
+        assert [issue.key for issue in second] == ["CHILD-1"]
+        epics_mixin.search_issues.assert_called_once_with(
+            '"customfield_10014" = "epic-456"', start=0, limit=50
+        )
+        epics_mixin.jira.get_issue.assert_called_with("epic-456", fields="issuetype")
+
+    def test_get_epic_issues_races_candidates(self, epics_mixin: EpicsMixin):
+        """Test concurrent candidates keep the default priority order."""
+        epics_mixin.config.epic_search_concurrency = 4
+        epics_mixin.jira.get_issue.return_value = {
+            "key": "EPIC-123",
+            "fields": {"issuetype": {"name": "Epic"}},
+        }
+        epics_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+        epics_mixin._find_epic_link_field = MagicMock(return_value=None)
+
+        def search_side_effect(jql, **kwargs):
+            if jql.startswith("parent") or "relates to" in jql:
+                return JiraSearchResult(issues=[JiraIssue(key=jql[:6])])
+            return JiraSearchResult(issues=[])
+
+        epics_mixin.search_issues = MagicMock(side_effect=search_side_effect)
+
+        result = epics_mixin.get_epic_issues("EPIC-123")
+
+        assert [issue.key for issue in result] == ["parent"]
+        assert epics_mixin.search_issues.call_count <= 4
+
+    def test_get_epic_issues_not_epic_after_search(self, epics_mixin: EpicsMixin):
+        """Test the type check still rejects non-epics when a search succeeds."""
+        epics_mixin.jira.get_issue.return_value = {
+            "key": "TEST-123",
+            "fields": {"issuetype": {"name": "Story"}},
+        }
+        epics_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+        epics_mixin._find_epic_link_field = MagicMock(return_value=None)
+        epics_mixin.search_issues = MagicMock(
+            return_value=JiraSearchResult(issues=[JiraIssue(key="CHILD-1")])
+        )
+
+        with pytest.raises(ValueError, match="TEST-123 is not an Epic"):
+            epics_mixin.get_epic_issues("TEST-123")
+
     def test_get_epic_issues_api_error(self, epics_mixin: EpicsMixin):
         """Test get_epic_issues with API error."""
         # Setup mocks - simulate API error
@@ -3,10 +3,13 @@
 from unittest.mock import ANY, MagicMock, patch
 
 import pytest
+from requests.exceptions import HTTPError
 
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.issues import IssuesMixin, logger
 from mcp_atlassian.models.jira import JiraIssue
+from mcp_atlassian.utils.response_cache import ResponseCache
 
 
 class TestIssuesMixin:
@@ -67,6 +70,30 @@ class TestIssuesMixin:
         assert result.status.name == "Open"
         assert result.issue_type.name == "Bug"
 
+    def test_get_issue_served_from_response_cache(self, issues_mixin: IssuesMixin):
+        """Test repeated reads hit the response cache until the issue is written."""
+        issues_mixin.response_cache = ResponseCache()
+        issues_mixin.jira.get_issue.return_value = {
+            "id": "10001",
+            "key": "TEST-123",
+            "fields": {"summary": "Test Issue", "status": {"name": "Open"}},
+        }
+        issues_mixin.jira.issue_add_comment.return_value = {
+            "id": "1",
+            "body": "Done",
+            "created": "2023-01-01T00:00:00.000+0000",
+            "author": {"displayName": "Test User"},
+        }
+
+        first = issues_mixin.get_issue("TEST-123")
+        second = issues_mixin.get_issue("TEST-123")
+        assert first.summary == second.summary == "Test Issue"
+        assert issues_mixin.jira.get_issue.call_count == 1
+
+        issues_mixin.add_comment("TEST-123", "Done")
+        issues_mixin.get_issue("TEST-123")
+        assert issues_mixin.jira.get_issue.call_count == 2
+
     def test_get_issue_with_comments(self, issues_mixin: IssuesMixin):
         """Test get_issue with comments."""
         # Mock the comments data
@@ -99,7 +126,8 @@ class TestIssuesMixin:
 
         # Set up the mocked responses
         issues_mixin.jira.get_issue.return_value = issue_data
-        issues_mixin.jira.issue_get_comments.return_value = comments_data
+        issues_mixin.jira.resource_url.side_effect = lambda path: f"rest/api/2/{path}"
+        issues_mixin.jira.get.return_value = comments_data
 
         # Call the method
         issue = issues_mixin.get_issue(
@@ -107,21 +135,68 @@ class TestIssuesMixin:
             fields="summary,description,status,assignee,reporter,labels,priority,created,updated,issuetype,comment",
         )
 
-        # Verify the API calls
+        # Verify the API calls: comments come from their own bounded request
         issues_mixin.jira.get_issue.assert_called_once_with(
             "TEST-123",
             expand=None,
-            fields="summary,description,status,assignee,reporter,labels,priority,created,updated,issuetype,comment",
+            fields="summary,description,status,assignee,reporter,labels,priority,created,updated,issuetype",
             properties=None,
             update_history=True,
         )
-        issues_mixin.jira.issue_get_comments.assert_called_once_with("TEST-123")
+        issues_mixin.jira.get.assert_called_once_with(
+            "rest/api/2/issue/TEST-123/comment",
+            params={"maxResults": 10, "orderBy": "-created"},
+        )
+        issues_mixin.jira.issue_get_comments.assert_not_called()
 
         # Verify the comments were added to the issue
         assert hasattr(issue, "comments")
         assert len(issue.comments) == 1
         assert issue.comments[0].body == "This is a comment"
 
+    def test_get_issue_limits_comments_server_side(self, issues_mixin: IssuesMixin):
+        """Test only the newest comments are requested, in chronological order."""
+        issues_mixin.jira.get_issue.return_value = {
+            "id": "12345",
+            "key": "TEST-123",
+            "fields": {"summary": "Test Issue"},
+        }
+        issues_mixin.jira.resource_url.side_effect = lambda path: f"rest/api/2/{path}"
+        issues_mixin.jira.get.return_value = {
+            "comments": [
+                {"id": str(n), "body": f"c{n}", "created": f"2023-01-0{n}"}
+                for n in (3, 2)
+            ],
+            "total": 500,
+        }
+
+        issue = issues_mixin.get_issue("TEST-123", fields="*all", comment_limit=2)
+
+        assert [comment.body for comment in issue.comments] == ["c2", "c3"]
+        assert issues_mixin.jira.get_issue.call_args.kwargs["fields"] == "*all,-comment"
+        assert issues_mixin.jira.get.call_args.kwargs["params"] == {
+            "maxResults": 2,
+            "orderBy": "-created",
+        }
+
+    def test_get_issue_without_comments_skips_comment_request(
+        self, issues_mixin: IssuesMixin
+    ):
+        """Test a comment limit of 0 or unrequested comments make no extra call."""
+        issues_mixin.jira.get_issue.return_value = {
+            "id": "12345",
+            "key": "TEST-123",
+            "fields": {"summary": "Test Issue"},
+        }
+
+        issues_mixin.get_issue("TEST-123", fields="summary,comment", comment_limit=0)
+        issues_mixin.get_issue("TEST-123", fields="summary")
+
+        issues_mixin.jira.get.assert_not_called()
+        issues_mixin.jira.issue_get_comments.assert_not_called()
+        for call in issues_mixin.jira.get_issue.call_args_list:
+            assert call.kwargs["fields"] == "summary"
+
     def test_get_issue_with_epic_info(self, issues_mixin: IssuesMixin):
         """Test retrieving issue with epic information."""
         try:
@@ -978,17 +1053,13 @@ class TestIssuesMixin:
         }
         issues_mixin.jira.create_issues.return_value = bulk_response
 
-        # Mock get_issue responses
-        def get_issue_side_effect(key):
-            if key == "TEST-1":
-                return {
-                    "id": "1",
-                    "key": "TEST-1",
-                    "fields": {"summary": "Test Issue 1"},
-                }
-            return {"id": "2", "key": "TEST-2", "fields": {"summary": "Test Issue 2"}}
-
-        issues_mixin.jira.get_issue.side_effect = get_issue_side_effect
+        # Mock the bulk fetch of the created issues
+        issues_mixin.jira.post.return_value = {
+            "issues": [
+                {"id": "2", "key": "TEST-2", "fields": {"summary": "Test Issue 2"}},
+                {"id": "1", "key": "TEST-1", "fields": {"summary": "Test Issue 1"}},
+            ]
+        }
         issues_mixin._get_account_id.return_value = "user123"
 
         # Call the method
@@ -1005,6 +1076,15 @@ class TestIssuesMixin:
         assert len(call_args) == 2
         assert call_args[0]["fields"]["summary"] == "Test Issue 1"
         assert call_args[1]["fields"]["summary"] == "Test Issue 2"
+        issues_mixin._get_account_id.assert_called_once_with("john.doe")
+
+        # Created issues are fetched together, not one by one
+        issues_mixin.jira.post.assert_called_once()
+        assert issues_mixin.jira.post.call_args.kwargs["json"]["issueIdsOrKeys"] == [
+            "TEST-1",
+            "TEST-2",
+        ]
+        issues_mixin.jira.get_issue.assert_not_called()
 
     def test_batch_create_issues_validate_only(self, issues_mixin: IssuesMixin):
         """Test batch_create_issues with validate_only=True."""
@@ -1054,6 +1134,25 @@ class TestIssuesMixin:
         assert "Missing required fields" in str(exc_info.value)
         assert not issues_mixin.jira.create_issues.called
 
+    def test_batch_create_issues_skips_later_invalid_issues(
+        self, issues_mixin: IssuesMixin
+    ):
+        """Test an invalid issue after the first is skipped, not the whole batch."""
+        issues = [
+            {"project_key": "TEST", "summary": "Test Issue 1", "issue_type": "Task"},
+            {"project_key": "TEST", "summary": "Test Issue 2"},
+        ]
+        issues_mixin.jira.create_issues.return_value = {
+            "issues": [{"key": "TEST-1"}],
+            "errors": [],
+        }
+        issues_mixin.jira.post.return_value = {"issues": [self._bulk_issue("TEST-1")]}
+
+        result = issues_mixin.batch_create_issues(issues)
+
+        assert [issue.key for issue in result] == ["TEST-1"]
+        assert len(issues_mixin.jira.create_issues.call_args.args[0]) == 1
+
     def test_batch_create_issues_partial_failure(self, issues_mixin: IssuesMixin):
         """Test batch_create_issues when some issues fail to create."""
         # Setup test data
@@ -1079,11 +1178,11 @@ class TestIssuesMixin:
         }
         issues_mixin.jira.create_issues.return_value = bulk_response
 
-        # Mock get_issue response for successful creation
-        issues_mixin.jira.get_issue.return_value = {
-            "id": "1",
-            "key": "TEST-1",
-            "fields": {"summary": "Test Issue 1"},
+        # Mock the bulk fetch of the created issue
+        issues_mixin.jira.post.return_value = {
+            "issues": [
+                {"id": "1", "key": "TEST-1", "fields": {"summary": "Test Issue 1"}}
+            ]
         }
 
         # Call the method
@@ -1095,7 +1194,20 @@ class TestIssuesMixin:
 
         # Verify error was logged
         issues_mixin.jira.create_issues.assert_called_once()
-        assert len(issues_mixin.jira.get_issue.mock_calls) == 1
+        assert len(issues_mixin.jira.post.mock_calls) == 1
+
+    def test_batch_create_issues_all_failed(self, issues_mixin: IssuesMixin):
+        """Test batch_create_issues raises when no issue could be created."""
+        issues = [
+            {"project_key": "TEST", "summary": f"Issue {n}", "issue_type": "Task"}
+            for n in range(2)
+        ]
+        issues_mixin.jira.create_issues.side_effect = Exception("Server error")
+
+        with pytest.raises(Exception, match="none of the 2 issues.*Server error"):
+            issues_mixin.batch_create_issues(issues)
+
+        issues_mixin.jira.post.assert_not_called()
 
     def test_batch_create_issues_empty_list(self, issues_mixin: IssuesMixin):
         """Test batch_create_issues with an empty list."""
@@ -1123,10 +1235,10 @@ class TestIssuesMixin:
             "errors": [],
         }
         issues_mixin.jira.create_issues.return_value = bulk_response
-        issues_mixin.jira.get_issue.return_value = {
-            "id": "1",
-            "key": "TEST-1",
-            "fields": {"summary": "Test Issue 1"},
+        issues_mixin.jira.post.return_value = {
+            "issues": [
+                {"id": "1", "key": "TEST-1", "fields": {"summary": "Test Issue 1"}}
+            ]
         }
 
         # Call the method
@@ -1143,6 +1255,128 @@ class TestIssuesMixin:
         assert components[0]["name"] == "Frontend"
         assert components[1]["name"] == "Backend"
 
+    def test_batch_create_issues_with_report_chunks(self, issues_mixin: IssuesMixin):
+        """Test issues are created in chunks and each one gets an outcome."""
+        issues = [
+            {
+                "project_key": "TEST",
+                "summary": f"Issue {n}",
+                "issue_type": "Task",
+                "assignee": "john.doe" if n % 2 else "jane.doe",
+            }
+            for n in range(60)
+        ]
+        issues.insert(1, {"project_key": "TEST", "summary": "No type"})
+
+        def create_issues(updates):
+            summaries = [update["fields"]["summary"] for update in updates]
+            failed = summaries.index("Issue 3") if "Issue 3" in summaries else None
+            return {
+                "issues": [
+                    {"key": f"TEST-{summary.split()[1]}"}
+                    for position, summary in enumerate(summaries)
+                    if position != failed
+                ],
+                "errors": []
+                if failed is None
+                else [
+                    {
+                        "failedElementNumber": failed,
+                        "elementErrors": {"errors": {"issuetype": "invalid"}},
+                    }
+                ],
+            }
+
+        issues_mixin.jira.create_issues.side_effect = create_issues
+        issues_mixin.jira.post.side_effect = lambda url, json: {
+            "issues": [
+                {"id": key.split("-")[1], "key": key, "fields": {"summary": key}}
+                for key in json["issueIdsOrKeys"]
+            ]
+        }
+
+        report = issues_mixin.batch_create_issues_with_report(issues)
+
+        assert [
+            len(call.args[0]) for call in issues_mixin.jira.create_issues.mock_calls
+        ] == [50, 10]
+        assert issues_mixin._get_account_id.call_count == 2
+        assert report[0] == {
+            "index": 0,
+            "status": "created",
+            "key": "TEST-0",
+            "issue": ANY,
+        }
+        assert report[0]["issue"].key == "TEST-0"
+        assert report[1]["status"] == "failed"
+        assert "Missing required fields" in report[1]["error"]
+        assert report[4] == {
+            "index": 4,
+            "status": "failed",
+            "error": "issuetype: invalid",
+        }
+        assert report[5]["key"] == "TEST-4"
+        assert report[60]["key"] == "TEST-59"
+        assert "warning" not in report[0]
+        assert sum(item["status"] == "created" for item in report) == 59
+        # Created issues are hydrated in bulk chunks of 100
+        assert issues_mixin.jira.post.call_count == 1
+        assert "summary" in issues[0]
+
+    def test_batch_create_issues_keeps_report_after_auth_failure(
+        self, issues_mixin: IssuesMixin
+    ):
+        """Test an authentication failure in one chunk keeps the created issues."""
+        issues = [
+            {"project_key": "TEST", "summary": f"Issue {n}", "issue_type": "Task"}
+            for n in range(60)
+        ]
+        auth_error = HTTPError(response=MagicMock(status_code=401))
+
+        def create_issues(updates):
+            if len(updates) < 50:
+                raise auth_error
+            return {"issues": [{"key": f"TEST-{n}"} for n in range(50)], "errors": []}
+
+        issues_mixin.jira.create_issues.side_effect = create_issues
+        issues_mixin.jira.post.return_value = {"issues": []}
+
+        report = issues_mixin.batch_create_issues_with_report(issues)
+
+        assert sum(item["status"] == "created" for item in report) == 50
+        assert "Authentication failed" in report[59]["error"]
+
+        issues_mixin.jira.create_issues.side_effect = auth_error
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            issues_mixin.batch_create_issues_with_report(issues)
+
+    def test_batch_create_issues_reports_unresolved_assignee(
+        self, issues_mixin: IssuesMixin
+    ):
+        """Test an issue whose assignee cannot be resolved is created with a warning."""
+        issues_mixin._get_account_id.side_effect = ValueError("Could not find")
+        issues_mixin.jira.create_issues.return_value = {
+            "issues": [{"key": "TEST-1"}],
+            "errors": [],
+        }
+        issues_mixin.jira.post.return_value = {"issues": [self._bulk_issue("TEST-1")]}
+
+        report = issues_mixin.batch_create_issues_with_report(
+            [
+                {
+                    "project_key": "TEST",
+                    "summary": "Issue",
+                    "issue_type": "Task",
+                    "assignee": "ghost",
+                }
+            ]
+        )
+
+        assert report[0]["status"] == "created"
+        assert report[0]["warning"] == "Could not assign ghost"
+        fields = issues_mixin.jira.create_issues.call_args.args[0][0]["fields"]
+        assert "assignee" not in fields
+
     def test_add_assignee_to_fields_cloud(self, issues_mixin: IssuesMixin):
         """Test _add_assignee_to_fields for Cloud instance."""
         # Set up cloud config
@@ -1502,3 +1736,102 @@ class TestIssuesMixin:
         # Verify result
         assert result.key == "TEST-123"
         assert result.labels == ["bug", "frontend"]
+
+    def _bulk_issue(self, key: str, **fields) -> dict:
+        return {
+            "id": key.split("-")[1],
+            "key": key,
+            "fields": {"summary": f"Issue {key}", "issuetype": {"name": "Task"}}
+            | fields,
+        }
+
+    def test_get_issues_server_dc(self, issues_mixin: IssuesMixin):
+        """Test get_issues fetches keys with one search and keeps input order."""
+        issues_mixin.config.url = "https://jira.example.com"
+        issues_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+        comments = {"comments": [{"id": str(n), "body": f"c{n}"} for n in range(5)]}
+        issues_mixin.jira.get.return_value = {
+            "issues": [
+                self._bulk_issue("TEST-2"),
+                self._bulk_issue("TEST-1", comment=comments),
+            ],
+            "warningMessages": ["An issue with key 'TEST-404' does not exist."],
+        }
+
+        results = issues_mixin.get_issues(
+            ["test-1", "TEST-404", "TEST-2", "test-1"], comment_limit=2
+        )
+
+        assert list(results) == ["test-1", "TEST-404", "TEST-2"]
+        assert results["test-1"].key == "TEST-1"
+        assert [c.body for c in results["test-1"].comments] == ["c3", "c4"]
+        assert "TEST-404 does not exist" in results["TEST-404"]
+        params = issues_mixin.jira.get.call_args.kwargs["params"]
+        assert params["jql"] == 'key in ("test-1", "TEST-404", "TEST-2")'
+        assert params["validateQuery"] == "warn"
+        issues_mixin.jira.get_issue.assert_not_called()
+        issues_mixin.jira.issue_get_comments.assert_not_called()
+
+    def test_get_issues_cloud_chunks_bulkfetch(self, issues_mixin: IssuesMixin):
+        """Test get_issues uses bulkfetch on Cloud in chunks and maps errors."""
+        issues_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+        keys = [f"TEST-{n}" for n in range(1, 151)]
+
+        def bulkfetch(url, json):
+            found = [key for key in json["issueIdsOrKeys"] if key != "TEST-7"]
+            errors = [
+                {"issueIdOrKey": key, "errorMessage": "Issue does not exist"}
+                for key in json["issueIdsOrKeys"]
+                if key == "TEST-7"
+            ]
+            return {
+                "issues": [self._bulk_issue(key) for key in found],
+                "issueErrors": errors,
+            }
+
+        issues_mixin.jira.post.side_effect = bulkfetch
+
+        results = issues_mixin.get_issues(keys, fields=["summary"])
+
+        assert list(results) == keys
+        assert results["TEST-7"] == "Issue does not exist"
+        assert results["TEST-150"].key == "TEST-150"
+        assert issues_mixin.jira.post.call_count == 2
+        first_payload = issues_mixin.jira.post.call_args_list[0].kwargs["json"]
+        assert len(first_payload["issueIdsOrKeys"]) == 100
+        assert first_payload["fields"] == ["summary"]
+
+    def test_get_issues_looks_up_linked_epics_together(self, issues_mixin: IssuesMixin):
+        """Test epic names for a batch are fetched with one extra request."""
+        issues_mixin.get_field_ids_to_epic = MagicMock(
+            return_value={"epic_link": "customfield_1", "epic_name": "customfield_2"}
+        )
+        issues_mixin.jira.post.side_effect = [
+            {
+                "issues": [
+                    self._bulk_issue("TEST-1", customfield_1="EPIC-1"),
+                    self._bulk_issue("TEST-2", customfield_1="EPIC-1"),
+                ]
+            },
+            {"issues": [self._bulk_issue("EPIC-1", customfield_2="Platform")]},
+        ]
+
+        results = issues_mixin.get_issues(["TEST-1", "TEST-2"], fields="*all")
+
+        assert results["TEST-1"].custom_fields["customfield_2"] == {"value": "Platform"}
+        assert results["TEST-2"].custom_fields["customfield_2"] == {"value": "Platform"}
+        assert issues_mixin.jira.post.call_count == 2
+        epic_payload = issues_mixin.jira.post.call_args.kwargs["json"]
+        assert epic_payload["issueIdsOrKeys"] == ["EPIC-1"]
+
+    def test_get_issues_failed_chunk_reports_each_key(self, issues_mixin: IssuesMixin):
+        """Test a failed request becomes an error for each of its keys."""
+        issues_mixin.get_field_ids_to_epic = MagicMock(return_value={})
+        issues_mixin.jira.post.side_effect = Exception("Service unavailable")
+
+        results = issues_mixin.get_issues(["TEST-1", "TEST-2"])
+
+        assert results == {
+            "TEST-1": "Error retrieving issue TEST-1: Service unavailable",
+            "TEST-2": "Error retrieving issue TEST-2: Service unavailable",
+        }
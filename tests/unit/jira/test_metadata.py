@@ -0,0 +1,301 @@
+"""Tests for the shared Jira metadata registry."""
+
+import dataclasses
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_atlassian.jira import JiraFetcher
+from mcp_atlassian.jira.metadata import (
+    METADATA_STORE_FILENAME,
+    FieldIndex,
+    JiraMetadataRegistry,
+    MetadataStore,
+)
+
+SITE = "https://test.atlassian.net"
+
+
+@pytest.fixture
+def clock():
+    return [1000.0]
+
+
+@pytest.fixture
+def registry(clock):
+    registry = JiraMetadataRegistry(ttl=60, timer=lambda: clock[0])
+    yield registry
+    registry.close()
+
+
+class TestFieldIndex:
+    def test_build(self):
+        fields = [
+            {"id": "summary", "name": "Summary", "schema": {"type": "string"}},
+            {"id": "customfield_1", "name": "Team", "schema": {"type": "user"}},
+            {"id": "customfield_2", "name": "summary", "schema": {"type": "string"}},
+            {"name": "No ID"},
+        ]
+        index = FieldIndex.build(fields)
+
+        assert index.fields is fields
+        assert index.by_id["customfield_1"]["name"] == "Team"
+        # First definition wins for duplicate names, IDs map to themselves
+        assert index.name_to_id["summary"] == "summary"
+        assert index.name_to_id["team"] == "customfield_1"
+        assert index.name_to_id["customfield_2"] == "customfield_2"
+        assert [f["id"] for f in index.by_schema_type["string"]] == [
+            "summary",
+            "customfield_2",
+        ]
+
+
+class TestJiraMetadataRegistry:
+    def test_first_lookup_loads_then_caches(self, registry):
+        loader = MagicMock(return_value=["a"])
+        assert registry.get(SITE, "fields", loader) == ["a"]
+        assert registry.get(SITE + "/", "fields", loader) == ["a"]
+        loader.assert_called_once()
+
+    def test_scopes_and_sites_are_separate(self, registry):
+        registry.get(SITE, "issue_types", lambda: ["bug"], scope="A")
+        assert registry.get(SITE, "issue_types", lambda: ["task"], scope="B") == [
+            "task"
+        ]
+        assert (
+            registry.get("https://other.net", "issue_types", lambda: [], scope="A")
+            == []
+        )
+
+    def test_refresh_reloads_synchronously(self, registry):
+        registry.get(SITE, "fields", lambda: ["old"])
+        assert registry.get(SITE, "fields", lambda: ["new"], refresh=True) == ["new"]
+
+    def test_stale_entry_is_served_while_refreshing(self, registry, clock):
+        registry.get(SITE, "fields", lambda: ["old"])
+        clock[0] += 61
+        release = threading.Event()
+
+        def slow_loader():
+            release.wait(5)
+            return ["new"]
+
+        # The stale value is returned without waiting for the loader
+        assert registry.get(SITE, "fields", slow_loader) == ["old"]
+        future = registry._refreshing[(SITE, "fields", "")]
+        release.set()
+        future.result(timeout=5)
+        assert registry.get(SITE, "fields", slow_loader) == ["new"]
+
+    def test_failed_refresh_keeps_cached_value(self, registry, clock):
+        registry.get(SITE, "fields", lambda: ["old"])
+        clock[0] += 61
+
+        release = threading.Event()
+
+        def failing_loader():
+            release.wait(5)
+            raise ConnectionError("down")
+
+        registry.get(SITE, "fields", failing_loader)
+        future = registry._refreshing[(SITE, "fields", "")]
+        release.set()
+        future.result(timeout=5)
+        assert registry.get(SITE, "fields", failing_loader) == ["old"]
+        assert (SITE, "fields", "") not in registry._refreshing
+
+    def test_first_load_errors_propagate(self, registry):
+        with pytest.raises(ConnectionError):
+            registry.get(SITE, "fields", MagicMock(side_effect=ConnectionError("down")))
+
+    def test_concurrent_cold_lookups_share_one_load(self, registry):
+        calls = []
+
+        def loader():
+            calls.append(1)
+            time.sleep(0.05)
+            return ["a"]
+
+        threads = [
+            threading.Thread(target=registry.get, args=(SITE, "fields", loader))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len(calls) == 1
+
+    def test_invalidate(self, registry):
+        registry.get(SITE, "fields", lambda: ["a"])
+        registry.get(SITE, "link_types", lambda: ["b"])
+        registry.invalidate(SITE, "fields")
+        assert registry.get(SITE, "fields", lambda: ["c"]) == ["c"]
+        assert registry.get(SITE, "link_types", lambda: ["d"]) == ["b"]
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("JIRA_METADATA_TTL", "120")
+        assert JiraMetadataRegistry.from_env().ttl == 120
+
+
+class TestMetadataStore:
+    def test_round_trip(self, tmp_path):
+        store = MetadataStore(tmp_path / "cache" / "meta.sqlite3")
+        store.save((SITE, "fields", ""), [{"id": "summary"}])
+        store.save((SITE, "fields", ""), [{"id": "status"}])
+        store.save((SITE, "issue_types", "TEST"), [{"name": "Bug"}])
+
+        entries = {key: value for key, value, _ in store.load_all()}
+        assert entries == {
+            (SITE, "fields", ""): [{"id": "status"}],
+            (SITE, "issue_types", "TEST"): [{"name": "Bug"}],
+        }
+
+        store.delete(SITE, "fields")
+        assert [key for key, _, _ in store.load_all()] == [
+            (SITE, "issue_types", "TEST")
+        ]
+
+    def test_from_env(self, monkeypatch, tmp_path):
+        monkeypatch.delenv("ATLASSIAN_CACHE_DIR", raising=False)
+        assert MetadataStore.from_env() is None
+        monkeypatch.setenv("ATLASSIAN_CACHE_DIR", str(tmp_path))
+        assert MetadataStore.from_env().path == tmp_path / METADATA_STORE_FILENAME
+
+    def test_from_env_unusable_directory(self, monkeypatch, tmp_path):
+        blocker = tmp_path / "file"
+        blocker.write_text("not a directory")
+        monkeypatch.setenv("ATLASSIAN_CACHE_DIR", str(blocker))
+        assert MetadataStore.from_env() is None
+
+    def test_restarted_registry_serves_persisted_value_then_revalidates(self, tmp_path):
+        store_path = tmp_path / METADATA_STORE_FILENAME
+        first = JiraMetadataRegistry(store=MetadataStore(store_path))
+        fields = [{"id": "summary", "name": "Summary"}]
+        first.get(SITE, "fields", lambda: fields, transform=FieldIndex.build)
+        first.close()
+
+        restarted = JiraMetadataRegistry(store=MetadataStore(store_path))
+        release = threading.Event()
+        loader = MagicMock(
+            side_effect=lambda: (
+                release.wait(5) and fields + [{"id": "status", "name": "Status"}]
+            )
+        )
+        index = restarted.get(SITE, "fields", loader, transform=FieldIndex.build)
+
+        # Served from disk without waiting, then refreshed in the background
+        assert isinstance(index, FieldIndex)
+        assert index.name_to_id["summary"] == "summary"
+        future = restarted._refreshing[(SITE, "fields", "")]
+        release.set()
+        future.result(timeout=5)
+        loader.assert_called_once()
+        refreshed = restarted.get(SITE, "fields", loader, transform=FieldIndex.build)
+        assert "status" in refreshed.by_id
+        restarted.close()
+
+    def test_unserializable_values_are_not_persisted(self, tmp_path):
+        store = MetadataStore(tmp_path / METADATA_STORE_FILENAME)
+        registry = JiraMetadataRegistry(store=store)
+        value = {object()}
+        assert registry.get(SITE, "odd", lambda: value) is value
+        assert store.load_all() == []
+
+
+class TestFetcherIntegration:
+    @pytest.fixture
+    def fetchers(self, jira_fetcher: JiraFetcher, registry):
+        """Two fetchers for the same site sharing one registry."""
+        jira_fetcher.metadata_registry = registry
+        second = JiraFetcher.__new__(JiraFetcher)
+        second.config = jira_fetcher.config
+        second.jira = MagicMock()
+        second.metadata_registry = registry
+        second._field_ids_cache = None
+        return jira_fetcher, second
+
+    def test_fields_are_shared_across_fetchers(self, fetchers):
+        first, second = fetchers
+        fields = first.get_fields()
+        assert second.get_fields() is fields
+        second.jira.get_all_fields.assert_not_called()
+        assert second.get_field_id("Summary") == "summary"
+        assert second.get_field_by_id("priority")["name"] == "Priority"
+        assert [f["id"] for f in second.get_fields_by_schema_type("user")] == [
+            "assignee",
+            "reporter",
+        ]
+
+    def test_link_types_issue_types_and_priorities_are_cached(self, fetchers):
+        first, second = fetchers
+        first.jira.get.return_value = {
+            "issueLinkTypes": [
+                {
+                    "id": "1",
+                    "name": "Blocks",
+                    "inward": "is blocked by",
+                    "outward": "blocks",
+                }
+            ]
+        }
+        first.jira.issue_createmeta.return_value = {
+            "projects": [{"issuetypes": [{"id": "10", "name": "Bug"}]}]
+        }
+        first.jira.get_all_priorities.return_value = [{"id": "3", "name": "Medium"}]
+
+        assert first.get_issue_link_types()[0].name == "Blocks"
+        assert second.get_issue_link_types()[0].name == "Blocks"
+        assert first.get_project_issue_types("TEST") == [{"id": "10", "name": "Bug"}]
+        assert second.get_project_issue_types("TEST") == [{"id": "10", "name": "Bug"}]
+        assert first.get_priorities() == [{"id": "3", "name": "Medium"}]
+        assert second.get_priorities() == [{"id": "3", "name": "Medium"}]
+
+        first.jira.get.assert_called_once()
+        first.jira.issue_createmeta.assert_called_once()
+        first.jira.get_all_priorities.assert_called_once()
+        second.jira.get.assert_not_called()
+
+    def test_project_lists_are_cached_per_principal(self, fetchers):
+        first, second = fetchers
+        first.jira.projects.return_value = [{"key": "A"}]
+        second.jira.projects.return_value = [{"key": "B"}]
+        second.config = dataclasses.replace(first.config, username="other_user")
+
+        assert first.get_all_projects() == [{"key": "A"}]
+        assert first.get_all_projects() == [{"key": "A"}]
+        assert second.get_all_projects() == [{"key": "B"}]
+        first.jira.projects.assert_called_once()
+
+    def test_issue_types_are_cached_per_principal(self, fetchers):
+        first, second = fetchers
+        first.jira.issue_createmeta.return_value = {
+            "projects": [{"issuetypes": [{"id": "10", "name": "Bug"}]}]
+        }
+        second.jira.issue_createmeta.return_value = {"projects": []}
+        second.config = dataclasses.replace(first.config, username="other_user")
+
+        assert first.get_project_issue_types("TEST") == [{"id": "10", "name": "Bug"}]
+        assert second.get_project_issue_types("TEST") == []
+        assert first.get_project_issue_types("TEST") == [{"id": "10", "name": "Bug"}]
+        first.jira.issue_createmeta.assert_called_once()
+
+    def test_epic_field_ids_are_shared(self, fetchers):
+        first, second = fetchers
+        first._discover_field_ids_to_epic = MagicMock(
+            return_value={"epic_link": "customfield_10014"}
+        )
+        first.get_field_ids_to_epic()["epic_link"] = "mutated"
+
+        assert second.get_field_ids_to_epic() == {"epic_link": "customfield_10014"}
+        first._discover_field_ids_to_epic.assert_called_once()
+
+    def test_failed_epic_discovery_is_not_cached(self, fetchers):
+        first, _ = fetchers
+        first._discover_field_ids_to_epic = MagicMock(
+            side_effect=[{}, {"epic_link": "customfield_10014"}]
+        )
+        assert first.get_field_ids_to_epic() == {}
+        assert first.get_field_ids_to_epic() == {"epic_link": "customfield_10014"}
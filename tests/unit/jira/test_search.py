@@ -1,10 +1,12 @@
 """Tests for the Jira Search mixin."""
 
-from unittest.mock import ANY, MagicMock
+import threading
+from unittest.mock import ANY, AsyncMock, MagicMock
 
 import pytest
 import requests
 
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
 from mcp_atlassian.jira import JiraFetcher
 from mcp_atlassian.jira.search import SearchMixin
 from mcp_atlassian.models.jira import JiraIssue, JiraSearchResult
@@ -26,6 +28,8 @@ class TestSearchMixin:
         mixin.config.is_cloud = False
         mixin.config.projects_filter = None
         mixin.config.url = "https://example.atlassian.net"
+        mixin.config.search_concurrency = 1
+        mixin.config.search_count_ttl = 30
 
         return mixin
 
@@ -672,3 +676,262 @@ class TestSearchMixin:
         api_method_mock.assert_called_with(
             "(text ~ 'test') AND project = OVERRIDE", **expected_kwargs
         )
+
+    @pytest.mark.anyio
+    async def test_search_issues_async_server_dc(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test search_issues_async on Server/DC uses the async client."""
+        search_mixin.async_client = MagicMock()
+        search_mixin.async_client.resource_url.side_effect = (
+            lambda resource: f"rest/api/2/{resource}"
+        )
+        search_mixin.async_client.get = AsyncMock(return_value=mock_issues_response)
+
+        result = await search_mixin.search_issues_async(
+            "project = TEST", fields="summary", limit=100
+        )
+
+        assert isinstance(result, JiraSearchResult)
+        assert result.issues[0].key == "TEST-123"
+        search_mixin.async_client.get.assert_awaited_once_with(
+            "rest/api/2/search",
+            params={
+                "jql": "project = TEST",
+                "startAt": 0,
+                "maxResults": 50,
+                "fields": "summary",
+            },
+        )
+        search_mixin.jira.jql.assert_not_called()
+
+    @pytest.mark.anyio
+    async def test_search_issues_async_cloud_paginates(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test search_issues_async on Cloud follows nextPageToken."""
+        search_mixin.config.is_cloud = True
+        search_mixin.async_client = MagicMock()
+        search_mixin.async_client.resource_url.side_effect = (
+            lambda resource: f"rest/api/3/{resource}"
+        )
+        second_issue = {**mock_issues_response["issues"][0], "key": "TEST-124"}
+        pages = iter(
+            [
+                {"issues": mock_issues_response["issues"], "nextPageToken": "abc"},
+                {"issues": [second_issue]},
+            ]
+        )
+
+        # The count and issue requests run concurrently, so answer by URL
+        async def get(url, params):
+            return {"total": 2} if url.endswith("/search") else next(pages)
+
+        search_mixin.async_client.get = AsyncMock(side_effect=get)
+
+        result = await search_mixin.search_issues_async("project = TEST", limit=10)
+
+        assert [issue.key for issue in result.issues] == ["TEST-123", "TEST-124"]
+        assert result.total == 2
+        last_call = [
+            call
+            for call in search_mixin.async_client.get.await_args_list
+            if call.args[0].endswith("/search/jql")
+        ][-1]
+        assert last_call.kwargs["params"]["nextPageToken"] == "abc"
+
+    @pytest.mark.anyio
+    async def test_search_issues_async_requires_async_client(
+        self, search_mixin: SearchMixin
+    ):
+        """Test search_issues_async raises when the httpx backend is disabled."""
+        search_mixin.async_client = None
+        with pytest.raises(ValueError, match="Async HTTP backend is not enabled"):
+            await search_mixin.search_issues_async("project = TEST")
+
+    def _page(self, mock_issues_response, keys, **extra) -> dict:
+        issue = mock_issues_response["issues"][0]
+        return {"issues": [{**issue, "key": key} for key in keys], **extra}
+
+    def test_iter_issues_server_dc_follows_start_at(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test iter_issues pages through Server/DC results with startAt."""
+        search_mixin.jira.jql.side_effect = [
+            self._page(mock_issues_response, ["TEST-1", "TEST-2"], total=3),
+            self._page(mock_issues_response, ["TEST-3"], total=3),
+        ]
+
+        issues = search_mixin.iter_issues("project = TEST", page_size=2)
+
+        assert [issue.key for issue in issues] == ["TEST-1", "TEST-2", "TEST-3"]
+        assert [c.kwargs["start"] for c in search_mixin.jira.jql.call_args_list] == [
+            0,
+            2,
+        ]
+        assert search_mixin.jira.jql.call_args.kwargs["limit"] == 2
+
+    def test_iter_issues_cloud_follows_next_page_token(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test iter_issues pages through Cloud results with nextPageToken."""
+        search_mixin.config.is_cloud = True
+        search_mixin.jira.resource_url.return_value = "rest/api/2/search/jql"
+        pages = iter(
+            [
+                self._page(mock_issues_response, ["TEST-1"], nextPageToken="abc"),
+                self._page(mock_issues_response, ["TEST-2"]),
+            ]
+        )
+        sent_params = []
+
+        def get(url, params):
+            sent_params.append(dict(params))
+            return next(pages)
+
+        search_mixin.jira.get.side_effect = get
+
+        issues = list(search_mixin.iter_issues("project = TEST", fields="summary"))
+
+        assert [issue.key for issue in issues] == ["TEST-1", "TEST-2"]
+        assert sent_params == [
+            {"jql": "project = TEST", "maxResults": 100, "fields": "summary"},
+            {
+                "jql": "project = TEST",
+                "maxResults": 100,
+                "fields": "summary",
+                "nextPageToken": "abc",
+            },
+        ]
+        search_mixin.jira.enhanced_jql_get_list_of_tickets.assert_not_called()
+
+    def test_iter_issues_fetches_pages_lazily(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test iter_issues does not request pages the caller never reaches."""
+        search_mixin.jira.jql.return_value = self._page(
+            mock_issues_response, ["TEST-1", "TEST-2"], total=1000
+        )
+
+        issues = search_mixin.iter_issues("project = TEST", page_size=2)
+
+        assert next(issues).key == "TEST-1"
+        assert next(issues).key == "TEST-2"
+        search_mixin.jira.jql.assert_called_once()
+
+    def test_iter_issues_authentication_error(self, search_mixin: SearchMixin):
+        """Test iter_issues raises MCPAtlassianAuthenticationError on 401."""
+        response = MagicMock(status_code=401)
+        search_mixin.jira.jql.side_effect = requests.HTTPError(response=response)
+
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            list(search_mixin.iter_issues("project = TEST"))
+
+    def test_iter_issues_server_dc_prefetches_pages_in_order(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test iter_issues fetches known offsets concurrently but yields in order."""
+        search_mixin.config.search_concurrency = 3
+        release = threading.Event()
+        in_flight = []
+
+        def jql(jql, start, limit, **kwargs):
+            if start:
+                in_flight.append(start)
+                if len(in_flight) == 3:
+                    release.set()
+                # The first prefetch answers only once all three are in flight
+                if start == 2:
+                    assert release.wait(5)
+            keys = [f"TEST-{n}" for n in range(start, min(start + limit, 7))]
+            return self._page(mock_issues_response, keys, total=7)
+
+        search_mixin.jira.jql.side_effect = jql
+
+        issues = search_mixin.iter_issues("project = TEST", page_size=2)
+
+        assert [issue.key for issue in issues] == [f"TEST-{n}" for n in range(7)]
+        assert sorted(in_flight) == [2, 4, 6]
+
+    def test_iter_issues_prefetch_resumes_sequentially_after_short_page(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test a short prefetched page falls back to reading from where it ended."""
+        search_mixin.config.search_concurrency = 2
+        pages = {
+            0: ["TEST-0", "TEST-1"],
+            2: ["TEST-2"],  # an issue disappeared while paging
+            3: ["TEST-3", "TEST-4"],
+            4: ["TEST-4", "TEST-5"],
+            5: ["TEST-5"],
+        }
+        search_mixin.jira.jql.side_effect = lambda jql, start, **kwargs: self._page(
+            mock_issues_response, pages.get(start, []), total=6
+        )
+
+        keys = [issue.key for issue in search_mixin.iter_issues("project = TEST")]
+
+        assert keys == ["TEST-0", "TEST-1", "TEST-2", "TEST-3", "TEST-4", "TEST-5"]
+
+    def test_search_issues_cloud_counts_alongside_issue_request(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test the Cloud count request overlaps the issue request."""
+        search_mixin.config.is_cloud = True
+        issues_requested = threading.Event()
+
+        def count(url, params):
+            # Only answers once the issue request has started
+            assert issues_requested.wait(5)
+            return {"total": 42}
+
+        def issues(*args, **kwargs):
+            issues_requested.set()
+            return mock_issues_response["issues"]
+
+        search_mixin.jira.get.side_effect = count
+        search_mixin.jira.enhanced_jql_get_list_of_tickets.side_effect = issues
+
+        result = search_mixin.search_issues("project = TEST")
+
+        assert result.total == 42
+
+    def test_search_issues_cloud_reuses_recent_total(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test a total counted for the same JQL is reused, and can be skipped."""
+        search_mixin.config.is_cloud = True
+        search_mixin.jira.get.return_value = {"total": 42}
+        search_mixin.jira.enhanced_jql_get_list_of_tickets.return_value = (
+            mock_issues_response["issues"]
+        )
+
+        first = search_mixin.search_issues("project = TEST AND text ~ 'a  b'")
+        second = search_mixin.search_issues("project  =  TEST AND text ~ 'a  b' ")
+        other = search_mixin.search_issues("project = TEST AND text ~ 'a b'")
+        skipped = search_mixin.search_issues("project = NEW", include_total=False)
+
+        assert (first.total, second.total, other.total) == (42, 42, 42)
+        assert skipped.total == -1
+        assert search_mixin.jira.get.call_count == 2
+
+    @pytest.mark.anyio
+    async def test_search_issues_async_cloud_without_total(
+        self, search_mixin: SearchMixin, mock_issues_response
+    ):
+        """Test search_issues_async makes a single request when the total is skipped."""
+        search_mixin.config.is_cloud = True
+        search_mixin.async_client = MagicMock()
+        search_mixin.async_client.resource_url.side_effect = (
+            lambda resource: f"rest/api/3/{resource}"
+        )
+        search_mixin.async_client.get = AsyncMock(
+            return_value={"issues": mock_issues_response["issues"]}
+        )
+
+        result = await search_mixin.search_issues_async(
+            "project = TEST", include_total=False
+        )
+
+        assert result.total == -1
+        search_mixin.async_client.get.assert_awaited_once()
@@ -7,6 +7,7 @@ import requests
 
 from mcp_atlassian.jira.config import JiraConfig
 from mcp_atlassian.jira.users import UsersMixin
+from mcp_atlassian.utils.cache_backend import MemoryCacheBackend
 
 
 class TestUsersMixin:
@@ -212,6 +213,95 @@ class TestUsersMixin:
             ):
                 users_mixin._get_account_id("testuser")
 
+    def test_get_account_id_cached(self, users_mixin):
+        """Test that resolved and unknown users are looked up only once."""
+        with (
+            patch.object(
+                users_mixin,
+                "_lookup_user_directly",
+                side_effect=lambda name: "account-id" if name == "John" else None,
+            ) as mock_direct,
+            patch.object(
+                users_mixin, "_lookup_user_by_permissions", return_value=None
+            ) as mock_permissions,
+        ):
+            assert users_mixin._get_account_id("John") == "account-id"
+            assert users_mixin._get_account_id(" john ") == "account-id"
+            for _ in range(2):
+                with pytest.raises(ValueError, match="Could not find account ID"):
+                    users_mixin._get_account_id("ghost")
+
+            assert mock_direct.call_count == 2
+            mock_permissions.assert_called_once_with("ghost")
+
+    def test_get_account_id_shared_between_replicas(self, users_mixin, jira_client):
+        """Test that a lookup made by one replica is reused through the backend."""
+        backend = MemoryCacheBackend()
+        other_replica = UsersMixin(config=jira_client.config)
+        users_mixin.cache_backend = other_replica.cache_backend = backend
+
+        with (
+            patch.object(
+                users_mixin, "_lookup_user_directly", return_value="account-id"
+            ),
+            patch.object(users_mixin, "_lookup_user_by_permissions"),
+        ):
+            assert users_mixin._get_account_id("John") == "account-id"
+        with (
+            patch.object(other_replica, "_lookup_user_directly") as mock_direct,
+            patch.object(other_replica, "_lookup_user_by_permissions"),
+        ):
+            assert other_replica._get_account_id("john") == "account-id"
+            mock_direct.assert_not_called()
+
+    def test_get_account_id_failed_lookup_is_not_cached(self, users_mixin):
+        """Test that a lookup that errors is retried instead of cached as unknown."""
+        backend = MemoryCacheBackend()
+        users_mixin.cache_backend = backend
+        users_mixin.jira.user_find_by_user_string.side_effect = [
+            requests.exceptions.Timeout("timed out"),
+            [{"accountId": "account-id", "displayName": "John"}],
+        ]
+
+        with patch("requests.get", return_value=MagicMock(status_code=503)):
+            with pytest.raises(ValueError, match="Could not find account ID"):
+                users_mixin._get_account_id("John")
+        assert backend.get(users_mixin._shared_account_id_key("john")) is None
+
+        assert users_mixin._get_account_id("John") == "account-id"
+
+    def test_lookup_caches_user_aliases(self, users_mixin):
+        """Test that a found user is cached by display name, username and email."""
+        users_mixin.jira.user_find_by_user_string.return_value = [
+            {
+                "accountId": "alias-account-id",
+                "displayName": "Test User",
+                "emailAddress": "test@example.com",
+            }
+        ]
+
+        assert users_mixin._get_account_id("Test User") == "alias-account-id"
+        assert users_mixin._get_account_id("TEST@example.com") == "alias-account-id"
+        users_mixin.jira.user_find_by_user_string.assert_called_once()
+
+    def test_resolve_account_ids(self, users_mixin):
+        """Test that bulk resolution looks up each distinct identifier once."""
+
+        def get_account_id(name):
+            if name == "ghost":
+                raise ValueError(f"Could not find account ID for user: {name}")
+            return f"id-{name}"
+
+        with patch.object(
+            users_mixin, "_get_account_id", side_effect=get_account_id
+        ) as mock_get:
+            result = users_mixin.resolve_account_ids(
+                ["alice", "bob", "", "alice", "ghost"] * 20
+            )
+
+        assert result == {"alice": "id-alice", "bob": "id-bob", "ghost": None}
+        assert mock_get.call_count == 3
+
     def test_lookup_user_directly(self, users_mixin):
         """Test _lookup_user_directly when user is found."""
         # Mock the API response
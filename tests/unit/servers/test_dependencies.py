@@ -0,0 +1,171 @@
+"""Tests for the fetcher dependency providers."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+from mcp_atlassian.jira import JiraConfig, JiraFetcher
+from mcp_atlassian.servers.context import MainAppContext
+from mcp_atlassian.servers.dependencies import (
+    _refresh_global_oauth_session,
+    get_jira_fetcher,
+)
+from mcp_atlassian.servers.fetcher_cache import UserFetcherCache
+from mcp_atlassian.utils.oauth import OAuthConfig
+
+
+def _make_ctx(app_context):
+    ctx = MagicMock()
+    ctx.request_context.lifespan_context = {"app_lifespan_context": app_context}
+    return ctx
+
+
+@pytest.fixture
+def jira_config():
+    return JiraConfig(
+        url="https://test.atlassian.net",
+        auth_type="basic",
+        username="user",
+        api_token="token",
+    )
+
+
+@pytest.fixture
+def oauth_fetcher():
+    fetcher = MagicMock()
+    fetcher.config.auth_type = "oauth"
+    fetcher.config.oauth_config = OAuthConfig(
+        client_id="id",
+        client_secret="secret",
+        redirect_uri="http://localhost",
+        scope="read:jira-work",
+        cloud_id="cloud",
+        refresh_token="refresh",
+        access_token="old",
+        expires_at=time.time() - 10,
+    )
+    fetcher.async_client = None
+    return fetcher
+
+
+@pytest.mark.anyio
+async def test_get_jira_fetcher_reuses_global_fetcher(jira_config):
+    shared_fetcher = MagicMock(spec=JiraFetcher)
+    shared_fetcher.config = jira_config
+    shared_fetcher.jira = MagicMock()
+    ctx = _make_ctx(
+        MainAppContext(full_jira_config=jira_config, jira_fetcher=shared_fetcher)
+    )
+
+    with (
+        patch(
+            "mcp_atlassian.servers.dependencies.get_http_request",
+            side_effect=RuntimeError("no request"),
+        ),
+        patch("mcp_atlassian.servers.dependencies.JiraFetcher") as mock_fetcher_cls,
+    ):
+        first = await get_jira_fetcher(ctx)
+        second = await get_jira_fetcher(ctx)
+
+    assert first is shared_fetcher
+    assert second is shared_fetcher
+    mock_fetcher_cls.assert_not_called()
+
+
+@pytest.mark.anyio
+async def test_get_jira_fetcher_builds_fetcher_without_global_instance(jira_config):
+    ctx = _make_ctx(MainAppContext(full_jira_config=jira_config))
+
+    with (
+        patch(
+            "mcp_atlassian.servers.dependencies.get_http_request",
+            side_effect=RuntimeError("no request"),
+        ),
+        patch("mcp_atlassian.servers.dependencies.JiraFetcher") as mock_fetcher_cls,
+    ):
+        fetcher = await get_jira_fetcher(ctx)
+
+    mock_fetcher_cls.assert_called_once_with(
+        config=jira_config,
+        metadata_registry=None,
+        response_cache=None,
+        request_coalescer=None,
+        cache_backend=None,
+        rate_limiter=None,
+    )
+    assert fetcher is mock_fetcher_cls.return_value
+
+
+@pytest.mark.anyio
+async def test_get_jira_fetcher_caches_validated_user_fetcher(jira_config):
+    cache = UserFetcherCache(maxsize=10, ttl=60)
+    ctx = _make_ctx(
+        MainAppContext(full_jira_config=jira_config, user_fetcher_cache=cache)
+    )
+
+    def make_request():
+        request = MagicMock()
+        request.state = type("State", (), {})()
+        request.state.user_atlassian_auth_type = "pat"
+        request.state.user_atlassian_token = "user-pat"
+        request.state.user_atlassian_email = None
+        return request
+
+    with patch("mcp_atlassian.servers.dependencies.JiraFetcher") as mock_fetcher_cls:
+        mock_fetcher_cls.return_value.get_current_user_account_id.return_value = "id"
+        for _ in range(3):
+            request = make_request()
+            with patch(
+                "mcp_atlassian.servers.dependencies.get_http_request",
+                return_value=request,
+            ):
+                fetcher = await get_jira_fetcher(ctx)
+            assert fetcher is mock_fetcher_cls.return_value
+            assert request.state.jira_fetcher is fetcher
+
+    mock_fetcher_cls.assert_called_once()
+    fetcher.get_current_user_account_id.assert_called_once()
+    assert cache.stats()["hits"] == 2
+
+
+def test_refresh_global_oauth_session_skips_valid_token(oauth_fetcher):
+    oauth_fetcher.config.oauth_config.expires_at = time.time() + 3600
+    with patch(
+        "mcp_atlassian.servers.dependencies.configure_oauth_session"
+    ) as mock_configure:
+        _refresh_global_oauth_session(oauth_fetcher, MagicMock())
+    mock_configure.assert_not_called()
+
+
+def test_refresh_global_oauth_session_refreshes_expired_token(oauth_fetcher):
+    session = MagicMock()
+    session.headers = {}
+    oauth_fetcher.async_client = MagicMock()
+
+    def refresh(session, oauth_config):
+        oauth_config.access_token = "new"
+        oauth_config.expires_at = time.time() + 3600
+        session.headers["Authorization"] = "Bearer new"
+        return True
+
+    with patch(
+        "mcp_atlassian.servers.dependencies.configure_oauth_session",
+        side_effect=refresh,
+    ) as mock_configure:
+        _refresh_global_oauth_session(oauth_fetcher, session)
+
+    mock_configure.assert_called_once()
+    oauth_fetcher.async_client.update_headers.assert_called_once_with(
+        {"Authorization": "Bearer new"}
+    )
+
+
+def test_refresh_global_oauth_session_raises_on_failure(oauth_fetcher):
+    with patch(
+        "mcp_atlassian.servers.dependencies.configure_oauth_session",
+        return_value=False,
+    ):
+        with pytest.raises(MCPAtlassianAuthenticationError):
+            _refresh_global_oauth_session(oauth_fetcher, MagicMock())
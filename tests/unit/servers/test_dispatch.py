@@ -0,0 +1,109 @@
+"""Tests for the fetcher dispatch layer."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import anyio
+import pytest
+
+from mcp_atlassian.servers.context import MainAppContext
+from mcp_atlassian.servers.dispatch import (
+    DEFAULT_SERVICE_MAX_CONCURRENCY,
+    DEFAULT_WORKER_POOL_SIZE,
+    DispatchConfig,
+    FetcherDispatcher,
+    run_fetcher_call,
+)
+
+
+def _make_ctx(app_context):
+    ctx = MagicMock()
+    ctx.request_context.lifespan_context = {"app_lifespan_context": app_context}
+    return ctx
+
+
+class TestDispatchConfig:
+    def test_defaults(self, monkeypatch):
+        for name in (
+            "WORKER_POOL_SIZE",
+            "JIRA_MAX_CONCURRENCY",
+            "CONFLUENCE_MAX_CONCURRENCY",
+        ):
+            monkeypatch.delenv(name, raising=False)
+        config = DispatchConfig.from_env()
+        assert config.worker_pool_size == DEFAULT_WORKER_POOL_SIZE
+        assert config.jira_max_concurrency == DEFAULT_SERVICE_MAX_CONCURRENCY
+        assert config.confluence_max_concurrency == DEFAULT_SERVICE_MAX_CONCURRENCY
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("WORKER_POOL_SIZE", "64")
+        monkeypatch.setenv("JIRA_MAX_CONCURRENCY", "8")
+        monkeypatch.setenv("CONFLUENCE_MAX_CONCURRENCY", "4")
+        config = DispatchConfig.from_env()
+        assert config == DispatchConfig(
+            worker_pool_size=64, jira_max_concurrency=8, confluence_max_concurrency=4
+        )
+
+    @pytest.mark.parametrize("value", ["abc", "0", "-3"])
+    def test_invalid_values_fall_back_to_default(self, monkeypatch, value):
+        monkeypatch.setenv("JIRA_MAX_CONCURRENCY", value)
+        config = DispatchConfig.from_env()
+        assert config.jira_max_concurrency == DEFAULT_SERVICE_MAX_CONCURRENCY
+
+
+@pytest.mark.anyio
+async def test_run_fetcher_call_runs_off_event_loop_thread():
+    dispatcher = FetcherDispatcher(DispatchConfig(worker_pool_size=2))
+    ctx = _make_ctx(MainAppContext(dispatcher=dispatcher))
+    loop_thread = threading.get_ident()
+
+    result = await run_fetcher_call(
+        ctx, "jira", lambda a, b=0: (threading.get_ident(), a + b), 1, b=2
+    )
+
+    worker_thread, value = result
+    assert value == 3
+    assert worker_thread != loop_thread
+
+
+@pytest.mark.anyio
+async def test_run_fetcher_call_without_dispatcher_falls_back():
+    ctx = _make_ctx(None)
+    assert await run_fetcher_call(ctx, "confluence", lambda: "ok") == "ok"
+
+
+@pytest.mark.anyio
+async def test_run_fetcher_call_propagates_exceptions():
+    ctx = _make_ctx(MainAppContext(dispatcher=FetcherDispatcher()))
+
+    def boom():
+        raise ValueError("upstream failed")
+
+    with pytest.raises(ValueError, match="upstream failed"):
+        await run_fetcher_call(ctx, "jira", boom)
+
+
+@pytest.mark.anyio
+async def test_service_concurrency_is_capped():
+    dispatcher = FetcherDispatcher(
+        DispatchConfig(worker_pool_size=8, jira_max_concurrency=2)
+    )
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def slow_call():
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+
+    async with anyio.create_task_group() as tg:
+        for _ in range(6):
+            tg.start_soon(dispatcher.run, "jira", slow_call)
+
+    assert peak == 2
@@ -0,0 +1,126 @@
+"""Tests for the user-specific fetcher cache."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from mcp_atlassian.servers.fetcher_cache import (
+    DEFAULT_USER_FETCHER_CACHE_SIZE,
+    DEFAULT_USER_FETCHER_CACHE_TTL,
+    RETIRED_FETCHER_GRACE,
+    CachedUserFetcher,
+    UserFetcherCache,
+    token_fingerprint,
+)
+
+
+def test_key_uses_token_fingerprint():
+    key = UserFetcherCache.make_key("jira", "pat", "secret-token")
+    assert key == ("jira", "pat", token_fingerprint("secret-token"))
+    assert "secret-token" not in key
+    assert key != UserFetcherCache.make_key("jira", "oauth", "secret-token")
+    assert key != UserFetcherCache.make_key("confluence", "pat", "secret-token")
+
+
+def test_hit_and_miss_counters():
+    cache = UserFetcherCache(maxsize=2, ttl=60)
+    key = UserFetcherCache.make_key("jira", "pat", "token")
+    assert cache.get(key) is None
+    entry = CachedUserFetcher(fetcher=MagicMock())
+    cache.put(key, entry)
+    assert cache.get(key) is entry
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = UserFetcherCache(maxsize=2, ttl=60)
+    keys = [UserFetcherCache.make_key("jira", "pat", f"t{i}") for i in range(3)]
+    cache.put(keys[0], CachedUserFetcher(fetcher="a"))
+    cache.put(keys[1], CachedUserFetcher(fetcher="b"))
+    cache.get(keys[0])
+    cache.put(keys[2], CachedUserFetcher(fetcher="c"))
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]).fetcher == "a"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_entries_expire_after_ttl():
+    now = [1000.0]
+    cache = UserFetcherCache(maxsize=2, ttl=60, timer=lambda: now[0])
+    key = UserFetcherCache.make_key("confluence", "oauth", "token")
+    cache.put(key, CachedUserFetcher(fetcher="a", user_email="a@example.com"))
+    now[0] += 61
+
+    assert cache.get(key) is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.delenv("USER_FETCHER_CACHE_SIZE", raising=False)
+    monkeypatch.delenv("USER_FETCHER_CACHE_TTL", raising=False)
+    cache = UserFetcherCache.from_env()
+    assert cache.maxsize == DEFAULT_USER_FETCHER_CACHE_SIZE
+    assert cache.ttl == DEFAULT_USER_FETCHER_CACHE_TTL
+
+    monkeypatch.setenv("USER_FETCHER_CACHE_SIZE", "10")
+    monkeypatch.setenv("USER_FETCHER_CACHE_TTL", "30")
+    cache = UserFetcherCache.from_env()
+    assert (cache.maxsize, cache.ttl) == (10, 30)
+
+
+@pytest.mark.parametrize("value", ["0", "abc"])
+def test_from_env_invalid_values(monkeypatch, value):
+    monkeypatch.setenv("USER_FETCHER_CACHE_SIZE", value)
+    assert UserFetcherCache.from_env().maxsize == DEFAULT_USER_FETCHER_CACHE_SIZE
+
+
+def _fetcher():
+    fetcher = MagicMock()
+    fetcher.async_client.aclose = AsyncMock()
+    return fetcher
+
+
+@pytest.mark.anyio
+async def test_evicted_and_expired_fetchers_are_closed_after_grace():
+    now = [1000.0]
+    cache = UserFetcherCache(maxsize=1, ttl=60, timer=lambda: now[0])
+    evicted, expired = _fetcher(), _fetcher()
+    cache.put(UserFetcherCache.make_key("jira", "pat", "a"), CachedUserFetcher(evicted))
+    cache.put(UserFetcherCache.make_key("jira", "pat", "b"), CachedUserFetcher(expired))
+    now[0] += 61
+    cache.get(UserFetcherCache.make_key("jira", "pat", "b"))
+    assert cache.stats()["retired"] == 2
+
+    with patch("mcp_atlassian.servers.fetcher_cache.close_session") as close_session:
+        # A tool call may still be using a fetcher that was just retired
+        await cache.close_retired()
+        evicted.async_client.aclose.assert_not_awaited()
+
+        now[0] += RETIRED_FETCHER_GRACE
+        await cache.close_retired()
+
+    evicted.async_client.aclose.assert_awaited_once()
+    expired.async_client.aclose.assert_awaited_once()
+    assert close_session.call_count == 2
+    assert cache.stats()["retired"] == 0
+
+
+@pytest.mark.anyio
+async def test_aclose_closes_cached_and_retired_fetchers():
+    cache = UserFetcherCache(maxsize=2, ttl=60)
+    key = UserFetcherCache.make_key("confluence", "oauth", "token")
+    replaced, current = _fetcher(), _fetcher()
+    cache.put(key, CachedUserFetcher(replaced))
+    cache.put(key, CachedUserFetcher(current))
+
+    with patch("mcp_atlassian.servers.fetcher_cache.close_session"):
+        await cache.aclose()
+
+    replaced.async_client.aclose.assert_awaited_once()
+    current.async_client.aclose.assert_awaited_once()
+    assert cache.get(key) is None
+    assert cache.stats()["retired"] == 0
@@ -12,6 +12,7 @@ from fastmcp.client import FastMCPTransport
 from fastmcp.exceptions import ToolError
 from starlette.requests import Request
 
+from mcp_atlassian.models.jira import JiraIssue
 from src.mcp_atlassian.jira import JiraFetcher
 from src.mcp_atlassian.jira.config import JiraConfig
 from src.mcp_atlassian.servers.context import MainAppContext
@@ -20,6 +21,7 @@ from src.mcp_atlassian.utils.oauth import OAuthConfig
 from tests.fixtures.jira_mocks import (
     MOCK_JIRA_COMMENTS_SIMPLIFIED,
     MOCK_JIRA_ISSUE_RESPONSE_SIMPLIFIED,
+    MOCK_JIRA_JQL_RESPONSE,
     MOCK_JIRA_JQL_RESPONSE_SIMPLIFIED,
 )
 
@@ -158,6 +160,21 @@ def mock_jira_fetcher():
 
     mock_fetcher.batch_create_issues.side_effect = mock_batch_create_issues
 
+    def mock_batch_create_issues_with_report(issues, validate_only=False):
+        return [
+            {
+                "index": index,
+                "status": "created",
+                "key": issue.to_simplified_dict()["key"],
+                "issue": issue,
+            }
+            for index, issue in enumerate(mock_batch_create_issues(issues))
+        ]
+
+    mock_fetcher.batch_create_issues_with_report.side_effect = (
+        mock_batch_create_issues_with_report
+    )
+
     # Configure get_epic_issues
     def mock_get_epic_issues(epic_key, start=0, limit=50):
         mock_issues = []
@@ -252,6 +269,7 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
         get_agile_boards,
         get_board_issues,
         get_issue,
+        get_issues,
         get_link_types,
         get_project_issues,
         get_project_versions,
@@ -271,6 +289,7 @@ def test_jira_mcp(mock_jira_fetcher, mock_base_jira_config):
 
     jira_sub_mcp = FastMCP(name="TestJiraSubMCP")
     jira_sub_mcp.tool()(get_issue)
+    jira_sub_mcp.tool()(get_issues)
     jira_sub_mcp.tool()(search)
     jira_sub_mcp.tool()(search_fields)
     jira_sub_mcp.tool()(get_project_issues)
@@ -389,6 +408,35 @@ async def test_get_issue(jira_client, mock_jira_fetcher):
     )
 
 
+@pytest.mark.anyio
+async def test_get_issues(jira_client, mock_jira_fetcher):
+    """Test the get_issues tool keeps request order and reports missing keys."""
+    issue = JiraIssue.from_api_response(
+        {**MOCK_JIRA_JQL_RESPONSE["issues"][0], "key": "PROJ-1"}
+    )
+    mock_jira_fetcher.get_issues.return_value = {
+        "PROJ-1": issue,
+        "PROJ-404": "Issue PROJ-404 does not exist or you do not have permission "
+        "to see it",
+    }
+
+    response = await jira_client.call_tool(
+        "jira_get_issues",
+        {"issue_keys": ["PROJ-1", "PROJ-404"], "fields": "summary,status"},
+    )
+
+    content = json.loads(response[0].text)
+    assert [item["key"] for item in content["issues"]] == ["PROJ-1", "PROJ-404"]
+    assert "error" not in content["issues"][0]
+    assert content["issues"][1]["error"].startswith("Issue PROJ-404 does not exist")
+    mock_jira_fetcher.get_issues.assert_called_once_with(
+        issue_keys=["PROJ-1", "PROJ-404"],
+        fields=["summary", "status"],
+        comment_limit=10,
+        expand="",
+    )
+
+
 @pytest.mark.anyio
 async def test_search(jira_client, mock_jira_fetcher):
     """Test the search tool with fixture data."""
@@ -424,6 +472,45 @@ async def test_search(jira_client, mock_jira_fetcher):
     )
 
 
+@pytest.mark.anyio
+async def test_search_paginate(jira_client, mock_jira_fetcher):
+    """Test the search tool collects issues across pages with paginate."""
+    issues = [
+        JiraIssue.from_api_response({**issue, "key": f"PROJ-{n}"})
+        for n, issue in enumerate(MOCK_JIRA_JQL_RESPONSE["issues"] * 3)
+    ]
+    mock_jira_fetcher.iter_issues.return_value = iter(issues)
+
+    response = await jira_client.call_tool(
+        "jira_search",
+        {"jql": "project = PROJ", "fields": "summary", "limit": 2, "paginate": True},
+    )
+
+    content = json.loads(response[0].text)
+    assert [issue["key"] for issue in content["issues"]] == ["PROJ-0", "PROJ-1"]
+    assert content["total"] == -1
+    assert content["max_results"] == 2
+    mock_jira_fetcher.iter_issues.assert_called_once_with(
+        "project = PROJ",
+        fields=["summary"],
+        page_size=3,
+        expand="",
+        projects_filter="",
+        start=0,
+    )
+    mock_jira_fetcher.search_issues.assert_not_called()
+
+    # Exactly 'limit' matching issues means none remain
+    mock_jira_fetcher.iter_issues.return_value = iter(issues[:2])
+    response = await jira_client.call_tool(
+        "jira_search",
+        {"jql": "project = PROJ", "fields": "summary", "limit": 2, "paginate": True},
+    )
+    content = json.loads(response[0].text)
+    assert len(content["issues"]) == 2
+    assert content["total"] == 2
+
+
 @pytest.mark.anyio
 async def test_create_issue(jira_client, mock_jira_fetcher):
     """Test the create_issue tool with fixture data."""
@@ -497,12 +584,39 @@ async def test_batch_create_issues(jira_client, mock_jira_fetcher):
     assert len(content["issues"]) == 2
     assert content["issues"][0]["key"] == "TEST-1"
     assert content["issues"][1]["key"] == "TEST-2"
-    call_args, call_kwargs = mock_jira_fetcher.batch_create_issues.call_args
+    assert content["results"] == [
+        {"index": 0, "status": "created", "key": "TEST-1"},
+        {"index": 1, "status": "created", "key": "TEST-2"},
+    ]
+    call_args, call_kwargs = mock_jira_fetcher.batch_create_issues_with_report.call_args
     assert call_args[0] == test_issues
     assert "validate_only" in call_kwargs
     assert call_kwargs["validate_only"] is False
 
 
+@pytest.mark.anyio
+async def test_batch_create_issues_partial_failure(jira_client, mock_jira_fetcher):
+    """Test the batch create report names the issues that failed."""
+    mock_jira_fetcher.batch_create_issues_with_report.side_effect = None
+    mock_jira_fetcher.batch_create_issues_with_report.return_value = [
+        {"index": 0, "status": "created", "key": "TEST-1", "issue": None},
+        {"index": 1, "status": "failed", "error": "issuetype: invalid"},
+    ]
+
+    response = await jira_client.call_tool(
+        "jira_batch_create_issues",
+        {"issues": json.dumps([{"project_key": "TEST"}] * 2)},
+    )
+
+    content = json.loads(response[0].text)
+    assert content["message"] == "Created 1 of 2 issues"
+    assert content["results"][1] == {
+        "index": 1,
+        "status": "failed",
+        "error": "issuetype: invalid",
+    }
+
+
 @pytest.mark.anyio
 async def test_batch_create_issues_invalid_json(jira_client):
     """Test error handling for invalid JSON in batch issue creation."""
@@ -0,0 +1,93 @@
+"""Tests for the httpx-based async Atlassian client."""
+
+import httpx
+import pytest
+
+from mcp_atlassian.exceptions import MCPAtlassianAuthenticationError
+from mcp_atlassian.utils.async_http import (
+    AsyncAtlassianClient,
+    _build_proxy_mounts,
+    parse_http_backend,
+)
+
+
+def _client_with_handler(handler) -> AsyncAtlassianClient:
+    client = AsyncAtlassianClient(
+        "https://test.atlassian.net", service_name="Jira", api_version="2"
+    )
+    client._client = httpx.AsyncClient(
+        base_url="https://test.atlassian.net/",
+        transport=httpx.MockTransport(handler),
+    )
+    return client
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, "requests"),
+        ("", "requests"),
+        ("HTTPX", "httpx"),
+        (" requests ", "requests"),
+    ],
+)
+def test_parse_http_backend(value, expected):
+    assert parse_http_backend(value) == expected
+
+
+def test_parse_http_backend_rejects_unknown():
+    with pytest.raises(ValueError, match="Unsupported HTTP backend"):
+        parse_http_backend("aiohttp")
+
+
+def test_resource_url():
+    client = AsyncAtlassianClient("https://test.atlassian.net/", api_version="2")
+    assert client.resource_url("search") == "rest/api/2/search"
+    assert client.resource_url("/search/jql", api_version=3) == "rest/api/3/search/jql"
+
+
+def test_build_proxy_mounts_with_no_proxy():
+    mounts = _build_proxy_mounts(
+        {"https": "http://proxy:8080"}, "localhost,.internal", verify=True
+    )
+    assert isinstance(mounts["https://"], httpx.AsyncHTTPTransport)
+    assert mounts["all://localhost"] is None
+    assert mounts["all://*.internal"] is None
+    assert _build_proxy_mounts({}, "localhost", verify=True) == {}
+
+
+@pytest.mark.anyio
+async def test_get_decodes_json():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/rest/api/2/search"
+        assert request.url.params["jql"] == "project = TEST"
+        return httpx.Response(200, json={"total": 1})
+
+    client = _client_with_handler(handler)
+    result = await client.get("rest/api/2/search", params={"jql": "project = TEST"})
+    assert result == {"total": 1}
+    await client.aclose()
+
+
+@pytest.mark.anyio
+async def test_empty_body_returns_none():
+    client = _client_with_handler(lambda request: httpx.Response(204))
+    assert await client.delete("rest/api/2/issue/TEST-1") is None
+    await client.aclose()
+
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("status_code", [401, 403])
+async def test_auth_errors_are_mapped(status_code):
+    client = _client_with_handler(lambda request: httpx.Response(status_code))
+    with pytest.raises(MCPAtlassianAuthenticationError):
+        await client.get("rest/api/2/myself")
+    await client.aclose()
+
+
+@pytest.mark.anyio
+async def test_other_errors_raise_http_status_error():
+    client = _client_with_handler(lambda request: httpx.Response(500, text="boom"))
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.get("rest/api/2/search")
+    await client.aclose()
@@ -0,0 +1,323 @@
+"""Tests for the shared cache backends and the caches that use them."""
+
+import socketserver
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_atlassian.jira.metadata import JiraMetadataRegistry
+from mcp_atlassian.models.jira import JiraIssue
+from mcp_atlassian.utils.cache_backend import (
+    SHARED_CACHE_FILENAME,
+    CacheBackend,
+    CacheBackendError,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    SQLiteCacheBackend,
+)
+from mcp_atlassian.utils.response_cache import ResponseCache, _shared_key
+
+SITE = "https://example.atlassian.net"
+
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+    """Answers the subset of RESP commands the backend sends."""
+
+    def _read_command(self):
+        line = self.rfile.readline()
+        if not line:
+            return None
+        args = []
+        for _ in range(int(line[1:-2])):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2].decode())
+        return args
+
+    def _bulk(self, value):
+        if value is None:
+            return b"$-1\r\n"
+        data = value.encode()
+        return b"$%d\r\n%s\r\n" % (len(data), data)
+
+    def _get(self, key):
+        value, expires_at = self.server.data.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            self.server.data.pop(key, None)
+            return None
+        return value
+
+    def handle(self):
+        while (args := self._read_command()) is not None:
+            command, *rest = args
+            self.server.commands.append(command)
+            if command == "AUTH":
+                ok = rest[-1] == self.server.password
+                reply = b"+OK\r\n" if ok else b"-WRONGPASS invalid password\r\n"
+            elif command in ("PING", "SELECT"):
+                reply = b"+PONG\r\n" if command == "PING" else b"+OK\r\n"
+            elif self.server.password and "AUTH" not in self.server.commands:
+                reply = b"-NOAUTH Authentication required\r\n"
+            elif command == "MGET":
+                reply = b"*%d\r\n" % len(rest) + b"".join(
+                    self._bulk(self._get(key)) for key in rest
+                )
+            elif command == "SET":
+                key, value, *options = rest
+                expires_at = None
+                if options:
+                    expires_at = time.monotonic() + int(options[1]) / 1000
+                self.server.data[key] = (value, expires_at)
+                reply = b"+OK\r\n"
+            elif command == "DEL":
+                reply = b":%d\r\n" % int(
+                    self.server.data.pop(rest[0], None) is not None
+                )
+            elif command == "INCR":
+                value = int(self._get(rest[0]) or 0) + 1
+                self.server.data[rest[0]] = (str(value), None)
+                reply = b":%d\r\n" % value
+            else:
+                reply = b"-ERR unknown command\r\n"
+            self.wfile.write(reply)
+
+
+@pytest.fixture
+def fake_redis():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), FakeRedisHandler)
+    server.daemon_threads = True
+    server.data = {}
+    server.commands = []
+    server.password = None
+    thread = threading.Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True
+    )
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def backend(request, tmp_path, fake_redis):
+    if request.param == "memory":
+        instance = MemoryCacheBackend()
+    elif request.param == "sqlite":
+        instance = SQLiteCacheBackend(tmp_path / SHARED_CACHE_FILENAME)
+    else:
+        port = fake_redis.server_address[1]
+        instance = RedisCacheBackend(f"redis://127.0.0.1:{port}/0")
+    yield instance
+    instance.close()
+
+
+class TestBackends:
+    def test_set_get_delete(self, backend):
+        value = {"fields": [{"id": "summary", "name": "Summary"}], "total": 1}
+        backend.set("metadata", value)
+
+        assert backend.get("metadata") == value
+        assert backend.get_many(["metadata", "absent"]) == [value, None]
+        backend.delete("metadata")
+        assert backend.get("metadata") is None
+
+    def test_values_expire(self, backend):
+        backend.set("short", "value", ttl=0.05)
+        backend.set("long", "value", ttl=60)
+        time.sleep(0.1)
+
+        assert backend.get_many(["short", "long"]) == [None, "value"]
+
+    def test_incr(self, backend):
+        assert backend.incr("counter") == 1
+        assert backend.incr("counter") == 2
+        assert backend.get("counter") == 2
+
+    def test_keys_are_prefixed(self, backend):
+        other = MemoryCacheBackend(key_prefix="other")
+        other.set("key", 1)
+        backend.set("key", 2)
+        assert backend._key("key") == "mcp-atlassian:key"
+        assert other.get("key") == 1
+
+    def test_rejects_unserializable_values(self, backend):
+        with pytest.raises(TypeError):
+            backend.set("key", object())
+
+
+class TestSQLiteBackend:
+    def test_shared_between_instances(self, tmp_path):
+        path = tmp_path / SHARED_CACHE_FILENAME
+        SQLiteCacheBackend(path).set("key", [1, 2])
+        assert SQLiteCacheBackend(path).get("key") == [1, 2]
+
+
+class TestRedisBackend:
+    def test_authenticates_and_selects_database(self, fake_redis):
+        fake_redis.password = "s3cret"
+        port = fake_redis.server_address[1]
+        backend = RedisCacheBackend(f"redis://:s3cret@127.0.0.1:{port}/2")
+        backend.set("key", "value")
+
+        assert backend.get("key") == "value"
+        assert fake_redis.commands[:2] == ["AUTH", "SELECT"]
+        backend.close()
+
+    def test_errors_are_cache_backend_errors(self, fake_redis):
+        fake_redis.password = "s3cret"
+        port = fake_redis.server_address[1]
+        with pytest.raises(CacheBackendError, match="WRONGPASS"):
+            RedisCacheBackend(f"redis://:wrong@127.0.0.1:{port}").get("key")
+
+        fake_redis.shutdown()
+        fake_redis.server_close()
+        with pytest.raises(CacheBackendError):
+            RedisCacheBackend(f"redis://127.0.0.1:{port}", timeout=0.5).ping()
+
+    def test_failed_connect_skips_redis_for_a_while(self):
+        now = [1000.0]
+        backend = RedisCacheBackend("redis://127.0.0.1:6379", timer=lambda: now[0])
+
+        with patch(
+            "mcp_atlassian.utils.cache_backend.socket.create_connection",
+            side_effect=ConnectionRefusedError("refused"),
+        ) as connect:
+            with pytest.raises(CacheBackendError, match="refused"):
+                backend.get("key")
+            with pytest.raises(CacheBackendError, match="unavailable"):
+                backend.get("key")
+            assert connect.call_count == 1
+
+            now[0] += 5
+            with pytest.raises(CacheBackendError, match="refused"):
+                backend.get("key")
+            # The interval doubles while Redis stays down
+            now[0] += 5
+            with pytest.raises(CacheBackendError, match="unavailable"):
+                backend.get("key")
+            assert connect.call_count == 2
+
+    def test_rejects_other_url_schemes(self):
+        with pytest.raises(ValueError, match="Unsupported Redis URL"):
+            RedisCacheBackend("http://localhost:6379")
+
+
+class TestFromEnv:
+    def test_memory_is_the_default(self, monkeypatch):
+        monkeypatch.delenv("ATLASSIAN_CACHE_BACKEND", raising=False)
+        assert CacheBackend.from_env() is None
+
+    def test_sqlite(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("ATLASSIAN_CACHE_BACKEND", "sqlite")
+        monkeypatch.delenv("ATLASSIAN_CACHE_DIR", raising=False)
+        assert CacheBackend.from_env() is None
+
+        monkeypatch.setenv("ATLASSIAN_CACHE_DIR", str(tmp_path))
+        backend = CacheBackend.from_env()
+        assert isinstance(backend, SQLiteCacheBackend)
+        assert backend.path == tmp_path / SHARED_CACHE_FILENAME
+
+    def test_unusable_sqlite_file_is_not_shared(self, monkeypatch, tmp_path):
+        (tmp_path / SHARED_CACHE_FILENAME).write_bytes(b"not a database" * 100)
+        monkeypatch.setenv("ATLASSIAN_CACHE_BACKEND", "sqlite")
+        monkeypatch.setenv("ATLASSIAN_CACHE_DIR", str(tmp_path))
+        assert CacheBackend.from_env() is None
+
+    def test_redis(self, monkeypatch, fake_redis):
+        port = fake_redis.server_address[1]
+        monkeypatch.setenv("ATLASSIAN_CACHE_BACKEND", "Redis")
+        monkeypatch.setenv("ATLASSIAN_CACHE_REDIS_URL", f"redis://127.0.0.1:{port}")
+        backend = CacheBackend.from_env()
+        assert isinstance(backend, RedisCacheBackend)
+        assert fake_redis.commands == ["PING"]
+        backend.close()
+
+    def test_unknown_backend(self, monkeypatch):
+        monkeypatch.setenv("ATLASSIAN_CACHE_BACKEND", "memcached")
+        with pytest.raises(ValueError, match="Unsupported cache backend"):
+            CacheBackend.from_env()
+
+
+class TestSharedResponseCache:
+    def _key(self, identity="alice"):
+        return ResponseCache.make_key(SITE, identity, "get_issue", {"key": "PROJ-1"})
+
+    def test_replica_reuses_response_fetched_elsewhere(self, backend):
+        issue = JiraIssue(id="1", key="PROJ-1", summary="Shared")
+        replica_a = ResponseCache(backend=backend)
+        replica_b = ResponseCache(backend=backend)
+
+        replica_a.get_or_fetch(self._key(), lambda: issue, ["issue:PROJ-1"])
+        fetch = MagicMock()
+        shared = replica_b.get_or_fetch(self._key(), fetch, ["issue:PROJ-1"])
+
+        fetch.assert_not_called()
+        assert isinstance(shared, JiraIssue)
+        assert shared == issue
+        assert replica_b.stats()["shared_hits"] == 1
+        assert replica_b.get_or_fetch(self._key("bob"), lambda: "bob's", []) == "bob's"
+
+    def test_write_on_one_replica_invalidates_all(self, backend):
+        replica_a = ResponseCache(backend=backend)
+        replica_b = ResponseCache(backend=backend)
+        replica_a.get_or_fetch(self._key(), lambda: "v1", ["issue:PROJ-1"])
+        replica_b.get_or_fetch(self._key(), MagicMock(), ["issue:PROJ-1"])
+
+        replica_b.invalidate(SITE, ["issue:PROJ-1"])
+
+        assert replica_a.get_or_fetch(self._key(), lambda: "v2", ["issue:PROJ-1"]) == (
+            "v2"
+        )
+        assert replica_b.get_or_fetch(self._key(), MagicMock(), ["issue:PROJ-1"]) == (
+            "v2"
+        )
+
+    def test_unreachable_backend_falls_back_to_local_cache(self):
+        backend = MagicMock(spec=CacheBackend)
+        backend.get_many.side_effect = CacheBackendError("down")
+        backend.incr.side_effect = CacheBackendError("down")
+        cache = ResponseCache(backend=backend)
+        fetch = MagicMock(return_value="value")
+
+        cache.get_or_fetch(self._key(), fetch, ["issue:PROJ-1"])
+        cache.get_or_fetch(self._key(), fetch, ["issue:PROJ-1"])
+        cache.invalidate(SITE, ["issue:PROJ-1"])
+
+        fetch.assert_called_once()
+        backend.set.assert_not_called()
+        assert cache.stats()["entries"] == 0
+
+    def test_rebuilds_only_project_models(self, backend):
+        backend.set(
+            _shared_key(self._key()),
+            {"value": {"__model__": "os:system", "data": "id"}, "versions": {}},
+        )
+        cache = ResponseCache(backend=backend)
+
+        assert cache.get_or_fetch(self._key(), lambda: "fetched", []) == "fetched"
+        assert cache.stats()["shared_hits"] == 0
+
+
+class TestSharedMetadata:
+    def test_replica_reuses_metadata_loaded_elsewhere(self, backend):
+        fields = [{"id": "summary", "name": "Summary"}]
+        JiraMetadataRegistry(backend=backend).get(SITE, "fields", lambda: fields)
+
+        loader = MagicMock()
+        replica = JiraMetadataRegistry(backend=backend)
+        assert replica.get(SITE, "fields", loader) == fields
+        loader.assert_not_called()
+
+        # An explicit refresh always goes to Jira
+        replica.get(SITE, "fields", lambda: [], refresh=True)
+        assert JiraMetadataRegistry(backend=backend).get(SITE, "fields", loader) == []
+
+    def test_invalidate_removes_shared_copy(self, backend):
+        registry = JiraMetadataRegistry(backend=backend)
+        registry.get(SITE, "fields", lambda: ["old"])
+        registry.invalidate(SITE, "fields")
+
+        assert JiraMetadataRegistry(backend=backend).get(
+            SITE, "fields", lambda: ["new"]
+        ) == ["new"]
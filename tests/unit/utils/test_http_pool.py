@@ -0,0 +1,176 @@
+"""Tests for the shared upstream connection pools."""
+
+import socket
+from unittest.mock import MagicMock, patch
+
+import pytest
+from requests import Session
+
+from mcp_atlassian.confluence.client import ConfluenceClient
+from mcp_atlassian.confluence.config import ConfluenceConfig
+from mcp_atlassian.jira.client import JiraClient
+from mcp_atlassian.jira.config import JiraConfig
+from mcp_atlassian.utils.http_pool import (
+    HttpPoolConfig,
+    PooledHTTPAdapter,
+    close_connection_pools,
+    close_session,
+    get_shared_adapter,
+    mount_connection_pool,
+)
+from mcp_atlassian.utils.ssl import SSLIgnoreAdapter
+
+SITE = "https://example.atlassian.net"
+
+
+@pytest.fixture(autouse=True)
+def _reset_pools():
+    close_connection_pools()
+    yield
+    close_connection_pools()
+
+
+def test_from_env(monkeypatch):
+    for name in (
+        "ATLASSIAN_HTTP_POOL_CONNECTIONS",
+        "ATLASSIAN_HTTP_POOL_MAXSIZE",
+        "ATLASSIAN_HTTP_POOL_BLOCK",
+        "ATLASSIAN_HTTP_KEEPALIVE",
+        "ATLASSIAN_HTTP_IDLE_TIMEOUT",
+    ):
+        monkeypatch.delenv(name, raising=False)
+    assert HttpPoolConfig.from_env() == HttpPoolConfig()
+
+    monkeypatch.setenv("ATLASSIAN_HTTP_POOL_CONNECTIONS", "4")
+    monkeypatch.setenv("ATLASSIAN_HTTP_POOL_MAXSIZE", "32")
+    monkeypatch.setenv("ATLASSIAN_HTTP_POOL_BLOCK", "true")
+    monkeypatch.setenv("ATLASSIAN_HTTP_KEEPALIVE", "0")
+    monkeypatch.setenv("ATLASSIAN_HTTP_IDLE_TIMEOUT", "-5")
+    assert HttpPoolConfig.from_env() == HttpPoolConfig(
+        pool_connections=4,
+        pool_maxsize=32,
+        pool_block=True,
+        keepalive=0,
+        idle_timeout=300,
+    )
+
+
+def test_socket_options_enable_keepalive():
+    options = HttpPoolConfig(keepalive=40).socket_options()
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        assert (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 40) in options
+
+    no_probes = HttpPoolConfig(keepalive=0).socket_options()
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in no_probes
+
+
+def test_httpx_limits():
+    limits = HttpPoolConfig(pool_maxsize=8, idle_timeout=30).httpx_limits()
+    assert limits.max_keepalive_connections == 8
+    assert limits.max_connections is None
+    assert limits.keepalive_expiry == 30
+    assert (
+        HttpPoolConfig(pool_maxsize=8, pool_block=True).httpx_limits().max_connections
+        == 8
+    )
+
+
+def test_adapter_is_sized_by_config():
+    config = HttpPoolConfig(pool_connections=3, pool_maxsize=24, pool_block=True)
+    adapter = PooledHTTPAdapter(config)
+    pool = adapter.poolmanager.connection_from_url(SITE)
+
+    assert adapter.poolmanager.pools._maxsize == 3
+    assert pool.pool.maxsize == 24
+    assert pool.block is True
+    assert pool.conn_kw["socket_options"] == config.socket_options()
+
+
+def test_ssl_ignore_adapter_uses_pool_config():
+    adapter = SSLIgnoreAdapter(HttpPoolConfig(pool_maxsize=24))
+    pool = adapter.poolmanager.connection_from_url(SITE)
+
+    assert pool.pool.maxsize == 24
+    assert "socket_options" in pool.conn_kw
+
+
+def test_idle_pools_are_cleared_before_reuse():
+    adapter = PooledHTTPAdapter(HttpPoolConfig(idle_timeout=60))
+    adapter.poolmanager = MagicMock()
+    request = MagicMock()
+
+    with patch("mcp_atlassian.utils.http_pool.time.monotonic") as clock:
+        with patch("requests.adapters.HTTPAdapter.send") as send:
+            clock.return_value = 1000.0
+            adapter._last_used = 990.0
+            adapter.send(request)
+            adapter.poolmanager.clear.assert_not_called()
+
+            clock.return_value = 1100.0
+            adapter.send(request)
+            adapter.poolmanager.clear.assert_called_once()
+
+    assert send.call_count == 2
+
+
+def test_sessions_on_one_site_share_an_adapter():
+    jira, confluence, other = Session(), Session(), Session()
+    mount_connection_pool(jira, SITE, ssl_verify=True)
+    mount_connection_pool(confluence, SITE + "/wiki", ssl_verify=True)
+    mount_connection_pool(other, "https://other.atlassian.net", ssl_verify=True)
+
+    adapter = jira.get_adapter(SITE + "/rest/api/2/issue/PROJ-1")
+    assert isinstance(adapter, PooledHTTPAdapter)
+    assert confluence.get_adapter(SITE + "/wiki/rest/api/content") is adapter
+    assert other.get_adapter("https://other.atlassian.net/rest") is not adapter
+    # Requests to other hosts keep the session's default adapter
+    assert jira.get_adapter("https://api.example.com/") is not adapter
+
+
+def test_unverified_sessions_get_their_own_pool():
+    verified = get_shared_adapter(SITE, ssl_verify=True)
+    unverified = get_shared_adapter(SITE, ssl_verify=False)
+
+    assert isinstance(unverified, SSLIgnoreAdapter)
+    assert not isinstance(verified, SSLIgnoreAdapter)
+    assert get_shared_adapter(SITE.upper(), ssl_verify=True) is verified
+
+
+def test_jira_and_confluence_clients_share_a_pool():
+    jira = JiraClient(
+        JiraConfig(
+            url=SITE,
+            auth_type="basic",
+            username="user",
+            api_token="token",
+        )
+    )
+    confluence = ConfluenceClient(
+        ConfluenceConfig(
+            url=SITE + "/wiki",
+            auth_type="basic",
+            username="user",
+            api_token="token",
+        )
+    )
+
+    assert jira.jira._session.get_adapter(SITE + "/rest") is (
+        confluence.confluence._session.get_adapter(SITE + "/wiki/rest")
+    )
+
+
+def test_close_session_keeps_shared_pools_open():
+    session = Session()
+    mount_connection_pool(session, SITE, ssl_verify=True)
+    shared = session.get_adapter(SITE + "/rest")
+    own = session.get_adapter("https://api.example.com/")
+
+    with (
+        patch.object(shared, "close") as close_shared,
+        patch.object(own, "close") as close_own,
+    ):
+        close_session(session)
+
+    close_shared.assert_not_called()
+    close_own.assert_called_once()
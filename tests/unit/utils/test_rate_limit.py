@@ -0,0 +1,231 @@
+"""Tests for the adaptive per-site rate limiter."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import patch
+
+import httpx
+import pytest
+from requests import Response, Session
+
+from mcp_atlassian.exceptions import MCPAtlassianRateLimitError
+from mcp_atlassian.utils.async_http import AsyncAtlassianClient
+from mcp_atlassian.utils.rate_limit import (
+    RateLimiter,
+    parse_retry_after,
+    site_key,
+)
+
+SITE = "https://example.atlassian.net"
+URL = SITE + "/rest/api/2/issue/PROJ-1"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock():
+    clock = FakeClock()
+    with patch("mcp_atlassian.utils.rate_limit.time.sleep", side_effect=clock.sleep):
+        yield clock
+
+
+def _response(status=200, **headers):
+    response = Response()
+    response.status_code = status
+    response._content = b"{}"
+    response._content_consumed = True
+    response.headers.update(headers)
+    return response
+
+
+def _sender(*responses):
+    queue = list(responses)
+    calls = []
+
+    def send():
+        calls.append(1)
+        return queue.pop(0)
+
+    send.calls = calls
+    return send
+
+
+def test_site_key():
+    assert site_key(URL) == SITE
+    assert site_key(SITE.upper() + "/wiki/rest/api/content") == SITE
+    gateway = "https://api.atlassian.com/ex/{}/cloud-1/rest/api/2/search"
+    assert site_key(gateway.format("jira")) == site_key(gateway.format("confluence"))
+    assert site_key(gateway.format("jira")) != site_key(
+        "https://api.atlassian.com/ex/jira/cloud-2/rest"
+    )
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("30") == 30
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    when = datetime.now(timezone.utc) + timedelta(seconds=120)
+    assert 100 < parse_retry_after(format_datetime(when, usegmt=True)) <= 120
+
+
+def test_get_waits_out_retry_after_and_retries(clock):
+    limiter = RateLimiter(timer=clock)
+    send = _sender(_response(429, **{"Retry-After": "5"}), _response(200))
+
+    response = limiter.run("GET", URL, send)
+
+    assert response.status_code == 200
+    assert len(send.calls) == 2
+    assert 5 <= sum(clock.slept) <= 6
+    stats = limiter.stats()[SITE]
+    assert (stats["throttled"], stats["retried"]) == (1, 1)
+    # Halved from 32 by the 429, then grown slightly by the successful retry
+    assert 16 < stats["window"] < 17
+
+
+def test_writes_are_not_retried_but_later_calls_wait(clock):
+    limiter = RateLimiter(timer=clock)
+    send = _sender(_response(429, **{"Retry-After": "5"}))
+
+    assert limiter.run("POST", URL, send).status_code == 429
+    assert clock.slept == []
+
+    limiter.run("GET", URL, _sender(_response(200)))
+    assert 5 <= sum(clock.slept) <= 6
+
+
+def test_backoff_without_retry_after_is_jittered_and_bounded(clock):
+    limiter = RateLimiter(max_retries=2, timer=clock)
+    send = _sender(_response(503), _response(503), _response(503))
+
+    assert limiter.run("GET", URL, send).status_code == 503
+    assert len(send.calls) == 3
+    assert 0 <= clock.slept[0] <= 1
+    assert 0 <= clock.slept[1] <= 2
+
+
+def test_long_pause_fails_fast(clock):
+    limiter = RateLimiter(max_wait=60, timer=clock)
+    send = _sender(_response(429, **{"Retry-After": "600"}))
+
+    assert limiter.run("GET", URL, send).status_code == 429
+    with pytest.raises(MCPAtlassianRateLimitError, match="retry after 600 seconds"):
+        limiter.run("GET", URL, _sender(_response(200)))
+    # Other sites are unaffected
+    limiter.run("GET", "https://other.atlassian.net/rest", _sender(_response(200)))
+
+    clock.now += 600
+    assert limiter.run("GET", URL, _sender(_response(200))).status_code == 200
+
+
+def test_paces_at_advertised_rate(clock):
+    limiter = RateLimiter(timer=clock)
+    headers = {
+        "X-RateLimit-Limit": "2",
+        "X-RateLimit-FillRate": "4",
+        "X-RateLimit-Interval-Seconds": "2",
+    }
+    limiter.run("GET", URL, _sender(_response(200, **headers)))
+    start = clock.now
+    for _ in range(6):
+        limiter.run("GET", URL, _sender(_response(200, **headers)))
+
+    # The bucket holds 2 tokens and refills at 2 per second
+    assert clock.now - start == pytest.approx(2.0)
+    assert limiter.stats()[SITE]["rate"] == 2
+
+
+def test_configured_rps_caps_pacing(clock):
+    limiter = RateLimiter(rps=1, timer=clock)
+    for _ in range(3):
+        limiter.run("GET", URL, _sender(_response(200)))
+
+    assert clock.now - 1000.0 == pytest.approx(2.0)
+
+
+def test_window_is_halved_once_per_burst_and_grows_back():
+    limiter = RateLimiter(max_concurrency=8)
+    state = limiter._site(URL)
+    epochs = [limiter._reserve(state)[1] for _ in range(4)]
+    for epoch in epochs:
+        limiter._settle(state, epoch, "POST", 429, {}, attempt=0)
+    assert state.window == 4
+
+    for _ in range(20):
+        _, epoch = limiter._reserve(state)
+        limiter._settle(state, epoch, "GET", 200, {}, attempt=0)
+    assert 6 < state.window <= 8
+
+    # Near the limit the window holds instead of growing into the next 429
+    window = state.window
+    _, epoch = limiter._reserve(state)
+    limiter._settle(state, epoch, "GET", 200, {"X-RateLimit-NearLimit": "true"}, 0)
+    assert state.window == window
+
+
+def test_full_window_makes_callers_wait(clock):
+    limiter = RateLimiter(max_concurrency=1, timer=clock)
+    state = limiter._site(URL)
+    assert limiter._reserve(state)[1] is not None
+
+    wait, epoch = limiter._reserve(state)
+    assert epoch is None
+    assert wait > 0
+
+
+def test_install_retries_session_requests(clock):
+    limiter = RateLimiter(timer=clock)
+    responses = [_response(429, **{"Retry-After": "1"}), _response(200)]
+    session = Session()
+    session.request = lambda method, url, **kwargs: responses.pop(0)
+    limiter.install(session)
+
+    assert session.request(method="GET", url=URL).status_code == 200
+    assert responses == []
+
+
+def test_async_client_retries_through_limiter():
+    limiter = RateLimiter()
+    statuses = [429, 200]
+
+    async def main():
+        async def handler(request: httpx.Request) -> httpx.Response:
+            status = statuses.pop(0)
+            return httpx.Response(
+                status, json={"ok": status}, headers={"Retry-After": "0"}
+            )
+
+        client = AsyncAtlassianClient(SITE, api_version="2", rate_limiter=limiter)
+        client._client = httpx.AsyncClient(
+            base_url=f"{SITE}/", transport=httpx.MockTransport(handler)
+        )
+        result = await client.get("rest/api/2/issue/PROJ-1")
+        await client.aclose()
+        return result
+
+    with patch("mcp_atlassian.utils.rate_limit.random.uniform", return_value=0):
+        assert asyncio.run(main()) == {"ok": 200}
+    assert limiter.stats()[SITE]["retried"] == 1
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.delenv("ATLASSIAN_RATE_LIMIT", raising=False)
+    monkeypatch.setenv("ATLASSIAN_RATE_LIMIT_RPS", "10")
+    monkeypatch.setenv("ATLASSIAN_RATE_LIMIT_MAX_RETRIES", "0")
+    limiter = RateLimiter.from_env()
+    assert (limiter.rps, limiter.max_retries, limiter.max_wait) == (10, 0, 60)
+
+    monkeypatch.setenv("ATLASSIAN_RATE_LIMIT", "false")
+    assert RateLimiter.from_env() is None
@@ -0,0 +1,208 @@
+"""Tests for single-flight coalescing of identical upstream requests."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+from requests import Response, Session
+
+from mcp_atlassian.utils.async_http import AsyncAtlassianClient
+from mcp_atlassian.utils.request_coalescing import RequestCoalescer, endpoint_label
+
+URL = "https://test.atlassian.net/rest/api/2/issue/TEST-1"
+
+
+def _response(body: bytes = b'{"key": "TEST-1"}', status: int = 200) -> Response:
+    response = Response()
+    response.status_code = status
+    response._content = body
+    return response
+
+
+def _session(coalescer, send):
+    session = Session()
+    session.request = send
+    coalescer.install(session)
+    return session
+
+
+def _wait_for_followers(coalescer, count):
+    deadline = time.monotonic() + 5
+    while coalescer.stats()["coalesced"] < count:
+        assert time.monotonic() < deadline, "followers never joined"
+        time.sleep(0.005)
+
+
+def test_endpoint_label_folds_resource_ids():
+    assert endpoint_label("get", URL) == "GET /rest/api/2/issue/{id}"
+    assert (
+        endpoint_label("GET", "https://x/wiki/rest/api/content/123456/child/page")
+        == "GET /wiki/rest/api/content/{id}/child/page"
+    )
+    assert endpoint_label("GET", "https://x/rest/api/2/search?jql=a") == (
+        "GET /rest/api/2/search"
+    )
+
+
+def test_key_normalizes_query_and_fingerprints_credentials():
+    key = RequestCoalescer.make_key(
+        "get", URL + "?b=2&a=1", None, {"Authorization": "Bearer secret"}
+    )
+    assert key == RequestCoalescer.make_key(
+        "GET", URL + "?a=1", {"b": 2}, {"authorization": "Bearer secret"}
+    )
+    assert "secret" not in "".join(key)
+    assert key != RequestCoalescer.make_key(
+        "GET", URL + "?a=1&b=2", None, {"Authorization": "Bearer other"}
+    )
+    assert RequestCoalescer.make_key(
+        "GET", URL, None, {}, ("alice", "token")
+    ) != RequestCoalescer.make_key("GET", URL, None, {}, ("bob", "token"))
+
+
+def test_concurrent_identical_gets_share_one_request():
+    coalescer = RequestCoalescer()
+    release = threading.Event()
+    calls = []
+
+    def send(method, url, **kwargs):
+        calls.append(url)
+        release.wait(5)
+        return _response()
+
+    session = _session(coalescer, send)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(session.request, method="GET", url=URL, timeout=10)
+            for _ in range(4)
+        ]
+        _wait_for_followers(coalescer, 3)
+        release.set()
+        responses = [future.result() for future in futures]
+
+    assert calls == [URL]
+    assert [r.json() for r in responses] == [{"key": "TEST-1"}] * 4
+    assert len({id(r) for r in responses}) == 4
+    assert coalescer.stats() == {
+        "in_flight": 0,
+        "upstream": 1,
+        "coalesced": 3,
+        "endpoints": {"GET /rest/api/2/issue/{id}": {"upstream": 1, "coalesced": 3}},
+    }
+
+
+def test_sessions_with_other_credentials_are_not_coalesced():
+    coalescer = RequestCoalescer()
+    release = threading.Event()
+    calls = []
+
+    def send(method, url, **kwargs):
+        calls.append(url)
+        release.wait(5)
+        return _response()
+
+    alice = _session(coalescer, send)
+    alice.headers["Authorization"] = "Bearer alice"
+    bob = _session(coalescer, send)
+    bob.headers["Authorization"] = "Bearer bob"
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(s.get, URL) for s in (alice, bob)]
+        deadline = time.monotonic() + 5
+        while len(calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        release.set()
+        [future.result() for future in futures]
+
+    assert len(calls) == 2
+    assert coalescer.stats()["coalesced"] == 0
+
+
+@pytest.mark.parametrize(
+    ("method", "kwargs"),
+    [
+        ("POST", {"data": "{}"}),
+        ("GET", {"stream": True}),
+        ("GET", {"json": {"a": 1}}),
+    ],
+)
+def test_unshareable_requests_bypass_coalescing(method, kwargs):
+    coalescer = RequestCoalescer()
+    calls = []
+
+    def send(method, url, **kwargs):
+        calls.append(method)
+        return _response()
+
+    session = _session(coalescer, send)
+    session.request(method, URL, **kwargs)
+
+    assert calls == [method]
+    assert coalescer.stats()["endpoints"] == {}
+
+
+def test_upstream_error_reaches_every_caller():
+    coalescer = RequestCoalescer()
+    release = threading.Event()
+
+    def send(method, url, **kwargs):
+        release.wait(5)
+        raise ConnectionError("upstream down")
+
+    session = _session(coalescer, send)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(session.get, URL) for _ in range(2)]
+        _wait_for_followers(coalescer, 1)
+        release.set()
+        for future in futures:
+            with pytest.raises(ConnectionError, match="upstream down"):
+                future.result()
+
+    assert coalescer.stats()["in_flight"] == 0
+
+
+def test_async_client_coalesces_identical_gets():
+    coalescer = RequestCoalescer()
+    calls = []
+
+    async def main():
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(str(request.url))
+            await release.wait()
+            return httpx.Response(200, json={"issues": []})
+
+        client = AsyncAtlassianClient(
+            "https://test.atlassian.net", api_version="2", coalescer=coalescer
+        )
+        client._client = httpx.AsyncClient(
+            base_url="https://test.atlassian.net/",
+            transport=httpx.MockTransport(handler),
+        )
+        tasks = [
+            asyncio.create_task(client.get("rest/api/2/search", params={"jql": "x"}))
+            for _ in range(3)
+        ]
+        while coalescer.stats()["coalesced"] < 2:
+            await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*tasks)
+        await client.aclose()
+        return results
+
+    results = asyncio.run(main())
+
+    assert len(calls) == 1
+    assert results == [{"issues": []}] * 3
+    assert results[0] is not results[1]
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.delenv("ATLASSIAN_REQUEST_COALESCING", raising=False)
+    assert isinstance(RequestCoalescer.from_env(), RequestCoalescer)
+
+    monkeypatch.setenv("ATLASSIAN_REQUEST_COALESCING", "off")
+    assert RequestCoalescer.from_env() is None
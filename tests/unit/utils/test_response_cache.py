@@ -0,0 +1,219 @@
+"""Tests for the read-through response cache."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_atlassian.utils.response_cache import (
+    ResponseCache,
+    cached_response,
+    credential_fingerprint,
+    invalidates_responses,
+)
+
+SITE = "https://example.atlassian.net"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _key(operation="get_issue", identity="alice", **arguments):
+    return ResponseCache.make_key(SITE, identity, operation, arguments)
+
+
+def _wait_for_refresh(cache):
+    for future in list(cache._refreshing.values()):
+        future.result(timeout=5)
+
+
+class TestResponseCache:
+    def test_fresh_entries_are_served_without_fetching(self):
+        cache = ResponseCache()
+        fetch = MagicMock(return_value={"key": "PROJ-1"})
+
+        assert cache.get_or_fetch(_key(issue_key="PROJ-1"), fetch) == {"key": "PROJ-1"}
+        assert cache.get_or_fetch(_key(issue_key="PROJ-1"), fetch) == {"key": "PROJ-1"}
+        cache.get_or_fetch(_key(issue_key="PROJ-2"), fetch)
+
+        assert fetch.call_count == 2
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 2
+
+    def test_callers_receive_copies(self):
+        cache = ResponseCache()
+        first = cache.get_or_fetch(_key(), lambda: {"labels": ["a"]})
+        first["labels"].append("b")
+        second = cache.get_or_fetch(_key(), MagicMock())
+        second["labels"].append("c")
+
+        assert cache.get_or_fetch(_key(), MagicMock()) == {"labels": ["a"]}
+
+    def test_key_normalizes_arguments(self):
+        assert _key(fields={"summary", "status"}, limit=5) == _key(
+            limit=5, fields={"status", "summary"}
+        )
+        assert _key(jql="project = A") != _key(jql="project = B")
+        assert _key(identity="alice") != _key(identity="bob")
+
+    def test_stale_entry_served_while_refreshing(self):
+        clock = FakeClock()
+        cache = ResponseCache(ttl=10, stale_ttl=20, timer=clock)
+        fetch = MagicMock(side_effect=["v1", "v2", "v3"])
+
+        assert cache.get_or_fetch(_key(), fetch) == "v1"
+        clock.now += 15
+        assert cache.get_or_fetch(_key(), fetch) == "v1"
+        _wait_for_refresh(cache)
+        assert cache.get_or_fetch(_key(), fetch) == "v2"
+        assert cache.stats()["stale_hits"] == 1
+
+        # Past the stale window the caller waits for a fresh copy
+        clock.now += 31
+        assert cache.get_or_fetch(_key(), fetch) == "v3"
+        cache.close()
+
+    def test_failed_refresh_keeps_stale_entry(self):
+        clock = FakeClock()
+        cache = ResponseCache(ttl=10, stale_ttl=20, timer=clock)
+        cache.get_or_fetch(_key(), lambda: "v1")
+        clock.now += 15
+
+        assert cache.get_or_fetch(_key(), MagicMock(side_effect=OSError)) == "v1"
+        _wait_for_refresh(cache)
+        assert cache.get_or_fetch(_key(), MagicMock()) == "v1"
+        cache.close()
+
+    def test_invalidate_drops_tagged_entries_for_every_user(self):
+        cache = ResponseCache()
+        cache.get_or_fetch(_key(issue_key="PROJ-1"), lambda: 1, ["issue:PROJ-1"])
+        cache.get_or_fetch(
+            _key(identity="bob", issue_key="PROJ-1"), lambda: 1, ["issue:PROJ-1"]
+        )
+        cache.get_or_fetch(_key(issue_key="PROJ-2"), lambda: 2, ["issue:PROJ-2"])
+        cache.get_or_fetch(_key("search_issues", jql="x"), lambda: 3, ["search"])
+
+        assert cache.invalidate(SITE + "/", ["issue:PROJ-1", "search"]) == 3
+        assert cache.stats()["entries"] == 1
+        assert cache.invalidate("https://other.atlassian.net", ["issue:PROJ-2"]) == 0
+        assert cache._tag_index.keys() == {(SITE, "issue:PROJ-2")}
+
+    def test_fetch_overlapping_invalidation_is_not_stored(self):
+        cache = ResponseCache()
+
+        def fetch():
+            cache.invalidate(SITE, ["issue:PROJ-1"])
+            return "read before the write landed"
+
+        cache.get_or_fetch(_key(), fetch, ["issue:PROJ-1"])
+        assert cache.stats()["entries"] == 0
+
+    def test_bounded_by_size(self):
+        cache = ResponseCache(maxsize=2)
+        for n in range(3):
+            cache.get_or_fetch(_key(issue_key=n), lambda n=n: n, [f"issue:{n}"])
+
+        assert cache.stats()["entries"] == 2
+        assert cache.stats()["evictions"] == 1
+        assert (SITE, "issue:0") not in cache._tag_index
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.delenv("ATLASSIAN_RESPONSE_CACHE", raising=False)
+        assert ResponseCache.from_env() is None
+
+        monkeypatch.setenv("ATLASSIAN_RESPONSE_CACHE", "true")
+        monkeypatch.setenv("ATLASSIAN_RESPONSE_CACHE_TTL", "5")
+        monkeypatch.setenv("ATLASSIAN_RESPONSE_CACHE_STALE_TTL", "7")
+        monkeypatch.setenv("ATLASSIAN_RESPONSE_CACHE_SIZE", "50")
+        cache = ResponseCache.from_env()
+        assert (cache.ttl, cache.stale_ttl, cache.maxsize) == (5, 7, 50)
+
+        monkeypatch.setenv("ATLASSIAN_RESPONSE_CACHE", "false")
+        assert ResponseCache.from_env() is None
+
+
+class FakeFetcher:
+    def __init__(self, response_cache, token="alice-token"):
+        self.response_cache = response_cache
+        self.config = SimpleNamespace(url=SITE, auth_type="pat", personal_token=token)
+        self.api = MagicMock(side_effect=lambda key: {"key": key})
+
+    @cached_response("get_issue", lambda args: (f"issue:{args['issue_key']}",))
+    def get_issue(self, issue_key, fields=None):
+        return self.api(issue_key)
+
+    @cached_response("get_issue", lambda args: (f"issue:{args['issue_key']}",))
+    async def get_issue_async(self, issue_key, fields=None):
+        return self.api(issue_key)
+
+    @invalidates_responses(lambda args: (f"issue:{args['issue_key']}",))
+    def update_issue(self, issue_key, *, fail=False):
+        if fail:
+            raise ValueError("rejected")
+        return self.get_issue(issue_key)
+
+
+class TestDecorators:
+    def test_reads_are_cached_per_user(self):
+        cache = ResponseCache()
+        alice = FakeFetcher(cache)
+        bob = FakeFetcher(cache, token="bob-token")
+
+        alice.get_issue("PROJ-1")
+        alice.get_issue("PROJ-1", fields=None)
+        bob.get_issue("PROJ-1")
+
+        assert alice.api.call_count == 1
+        assert bob.api.call_count == 1
+        assert credential_fingerprint(alice.config) != credential_fingerprint(
+            bob.config
+        )
+
+    def test_write_invalidates_and_reads_back_fresh_data(self):
+        cache = ResponseCache()
+        fetcher = FakeFetcher(cache)
+        other_user = FakeFetcher(cache, token="bob-token")
+        fetcher.get_issue("PROJ-1")
+        other_user.get_issue("PROJ-1")
+
+        fetcher.update_issue("PROJ-1")
+        assert fetcher.api.call_count == 2
+        fetcher.get_issue("PROJ-1")
+        other_user.get_issue("PROJ-1")
+
+        assert fetcher.api.call_count == 3
+        assert other_user.api.call_count == 2
+
+    def test_failed_write_still_invalidates(self):
+        cache = ResponseCache()
+        fetcher = FakeFetcher(cache)
+        fetcher.get_issue("PROJ-1")
+
+        with pytest.raises(ValueError):
+            fetcher.update_issue("PROJ-1", fail=True)
+        fetcher.get_issue("PROJ-1")
+
+        assert fetcher.api.call_count == 2
+
+    def test_without_cache_methods_run_directly(self):
+        fetcher = FakeFetcher(None)
+        fetcher.get_issue("PROJ-1")
+        fetcher.get_issue("PROJ-1")
+        fetcher.update_issue("PROJ-1")
+
+        assert fetcher.api.call_count == 3
+
+    @pytest.mark.anyio
+    async def test_async_reads_share_entries_with_sync_reads(self):
+        cache = ResponseCache()
+        fetcher = FakeFetcher(cache)
+
+        assert await fetcher.get_issue_async("PROJ-1") == {"key": "PROJ-1"}
+        assert fetcher.get_issue("PROJ-1") == {"key": "PROJ-1"}
+
+        assert fetcher.api.call_count == 1